@@ -0,0 +1,6 @@
+"""Performance benchmarks of the API
+
+Benchmarks are plain scripts, run from the `api` directory, e.g.
+
+    python -m benchmarks.bench_export_latency --help
+"""
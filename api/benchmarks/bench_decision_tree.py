@@ -0,0 +1,118 @@
+"""Time and memory of converting an influence diagram into a symmetric decision tree
+
+No database is needed: for each `--levels`, an influence diagram alternating
+uncertainty and decision nodes of `--states` states each is generated, so that the
+decision tree has states**levels leaves (10^3 to 10^6 by default). It is converted
+by the networkx engine (`convert_to_decision_tree`, one copied node per tree node)
+up to `--networkx-max-leaves` leaves, and by the array-backed engine
+(`convert_to_symmetric_decision_tree`), then serialized to nested dictionaries (the
+DecisionTreeResponse shape), or to a decision graph of its distinct subtrees. The
+peak memory is measured with tracemalloc.
+
+    python -m benchmarks.bench_decision_tree --states 10 --levels 3 4 5 6
+"""
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+
+from src.v0.models.issue import ProbabilityData
+from src.v0.services.structure_utils.decision_diagrams.edge import Edge
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    InfluenceDiagram,
+)
+from src.v0.services.structure_utils.decision_diagrams.node import (
+    DecisionNode,
+    UncertaintyNode,
+)
+from src.v0.services.structure_utils.probability.discrete_unconditional_probability import (  # noqa: E501
+    DiscreteUnconditionalProbability,
+)
+
+from .common import measure, summary
+
+
+def generate_influence_diagram(levels: int, states: int) -> InfluenceDiagram:
+    """Generate an influence diagram with `levels` nodes of `states` states each
+
+    Uncertainty and decision nodes alternate, each uncertainty node informing the
+    next decision, so that the partial order is the order of the nodes.
+
+    Args:
+        levels (int): number of nodes (levels of the decision tree)
+        states (int): number of states (outcomes or alternatives) of each node
+
+    Returns:
+        InfluenceDiagram: the influence diagram
+    """
+    nodes = []
+    for k in range(levels):
+        outcomes = [f"s{n}" for n in range(states)]
+        if k % 2 == 0:
+            probability = ProbabilityData(
+                dtype="DiscreteUnconditionalProbability",
+                probability_function=[[1 / states] * states],
+                variables={f"u{k}": outcomes},
+            )
+            nodes.append(
+                UncertaintyNode(
+                    f"u{k}",
+                    f"uncertainty {k}",
+                    probabilities=DiscreteUnconditionalProbability.from_db_model(
+                        probability
+                    ),
+                )
+            )
+        else:
+            nodes.append(DecisionNode(f"d{k}", f"decision {k}", alternatives=outcomes))
+    edges = [
+        Edge(tail, head)
+        for tail, head in zip(nodes, nodes[1:], strict=False)
+        if head.is_decision_node
+    ]
+    return InfluenceDiagram.from_dict({"nodes": nodes, "edges": edges})
+
+
+def peak_memory(func: Callable) -> int:
+    """Peak memory (in bytes) allocated while calling `func`"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=10)
+    parser.add_argument("--levels", type=int, nargs="+", default=[3, 4, 5, 6])
+    parser.add_argument("--networkx-max-leaves", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for levels in args.levels:
+        influence_diagram = generate_influence_diagram(levels, args.states)
+        leaves = args.states**levels
+        runs = {
+            "array": lambda id=influence_diagram: (
+                id.convert_to_symmetric_decision_tree().to_dict()
+            ),
+            "graph": lambda id=influence_diagram: (
+                id.convert_to_symmetric_decision_tree().symmetric_tree.to_graph()
+            ),
+        }
+        if leaves <= args.networkx_max_leaves:
+            runs["networkx"] = lambda id=influence_diagram: json.loads(
+                id.convert_to_decision_tree().to_json()
+            )
+        for engine, run in runs.items():
+            memory = peak_memory(run)
+            durations = measure(run, args.repeat)
+            print(summary(f"{engine} {leaves:,} leaves", durations))
+            print(f"{'':<40} peak memory {memory / 2**20:,.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Latency of `GET /projects/{uuid}/export` with and without the connection pool
+
+Needs a running Gremlin Server (e.g. `docker-compose -f docker-compose.dev.yaml up
+database`). A project is seeded, exported `--repeat` times with a database client
+connecting/closing a websocket per query (before) and with a client borrowing the
+connections of an application-lifetime `ConnectionPool` (after), then streamed as
+NDJSON, and deleted.
+
+    python -m benchmarks.bench_export_latency --url ws://localhost:8182/gremlin
+"""
+
+import argparse
+
+from fastapi.testclient import TestClient
+from gremlin_python.driver import client
+
+from dependencies import test_create_app
+from src.v0.database.adapter import get_async_client
+from src.v0.database.gremlin import AsyncGremlinClient, GremlinClient
+from src.v0.database.pool import ConnectionPool
+from src.v0.models.issue import IssueCreate
+from src.v0.models.project import ProjectCreate
+from src.v0.repositories.edge import EdgeRepository
+from src.v0.repositories.issue import IssueRepository
+from src.v0.repositories.project import ProjectRepository
+
+from .common import measure, summary
+
+
+def seed_project(database_client, issues: int) -> str:
+    project = ProjectRepository(database_client).create(
+        ProjectCreate(name="benchmark", description="export latency benchmark")
+    )
+    issue_repository = IssueRepository(database_client)
+    uuids = [
+        issue_repository.create(
+            project.uuid,
+            IssueCreate(description=f"issue {k}", shortname=f"i{k}", boundary="in"),
+        ).uuid
+        for k in range(issues)
+    ]
+    for tail, head in zip(uuids[:-1], uuids[1:], strict=True):
+        EdgeRepository(database_client).create(tail, head, "influences")
+    return project.uuid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="ws://localhost:8182/gremlin")
+    parser.add_argument("--issues", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--pool-size", type=int, default=8)
+    args = parser.parse_args()
+
+    def factory():
+        return client.Client(args.url, "g", pool_size=args.pool_size)
+
+    pool = ConnectionPool(factory)
+    async_pool = ConnectionPool(factory, size=args.pool_size)
+    project_uuid = seed_project(GremlinClient(args.url, pool=pool), args.issues)
+
+    app = test_create_app()
+    http = TestClient(app)
+    url = f"/projects/{project_uuid}/export"
+    try:
+        app.dependency_overrides[get_async_client] = lambda: AsyncGremlinClient(args.url)
+        before = measure(lambda: http.get(url).raise_for_status(), args.repeat)
+        app.dependency_overrides[get_async_client] = lambda: AsyncGremlinClient(
+            args.url, pool=async_pool
+        )
+        after = measure(lambda: http.get(url).raise_for_status(), args.repeat)
+        streamed = measure(
+            lambda: http.get(url, params={"format": "ndjson"}).raise_for_status(),
+            args.repeat,
+        )
+    finally:
+        ProjectRepository(GremlinClient(args.url, pool=pool)).delete(project_uuid)
+        pool.close()
+        async_pool.close()
+
+    print(summary("export, connection per query (before)", before))
+    print(summary("export, pooled connections (after)", after))
+    print(summary("export, pooled connections, NDJSON stream", streamed))
+
+
+if __name__ == "__main__":
+    main()
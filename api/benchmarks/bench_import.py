@@ -0,0 +1,140 @@
+"""Duration of `ProjectRepository.import_project` on a large generated export
+
+Needs a running Gremlin Server (e.g. `docker-compose -f docker-compose.dev.yaml up
+database`). An export with `--issues` issues and `--edges` influences edges is
+generated (`--output` also writes it to a file, e.g. to import it through the API),
+imported `--repeat` times and every imported project is deleted. `--url memory`
+imports into an in-process graph instead, without network nor server.
+
+    python -m benchmarks.bench_import --url ws://localhost:8182/gremlin
+"""
+
+import argparse
+import json
+import random
+import uuid
+
+from gremlin_python.driver import client
+
+from src.v0.database.gremlin import GremlinClient
+from src.v0.database.memory import InMemoryDatabaseClient, MemoryGraph
+from src.v0.database.pool import ConnectionPool
+from src.v0.repositories.project import ProjectRepository
+
+from .common import measure, summary
+
+CATEGORIES = ["Uncertainty", "Decision", "Fact", "Value Metric", "Action Item"]
+
+
+def generate_export(
+    issues: int = 2000, edges: int = 5000, merged: int = 100, seed: int = 0
+) -> dict:
+    """Generate the export of a project (as returned by `export_project`)
+
+    Args:
+        issues (int, optional): number of issues. Defaults to 2000.
+        edges (int, optional): number of "influences" edges between the issues.
+            Defaults to 5000.
+        merged (int, optional): number of issues merged into the other ones.
+            Defaults to 100.
+        seed (int, optional): seed of the generator. Defaults to 0.
+
+    Returns:
+        dict: JSON dictionary of the project
+    """
+    rng = random.Random(seed)  # noqa: S311
+
+    def new_id() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128)))
+
+    def edge(out_vertex: dict, in_vertex: dict, label: str) -> dict:
+        edge_id = new_id()
+        return {
+            "id": edge_id,
+            "uuid": edge_id,
+            "outV": out_vertex["id"],
+            "inV": in_vertex["id"],
+            "label": label,
+        }
+
+    project = {"id": new_id(), "label": "project", "name": "benchmark"}
+    issue_vertices = [
+        {
+            "id": new_id(),
+            "label": "issue",
+            "shortname": f"i{k}",
+            "description": f"issue {k}",
+            "category": rng.choice(CATEGORIES),
+            "boundary": rng.choice(["in", "on", "out"]),
+            "tag": ["benchmark"],
+        }
+        for k in range(issues)
+    ]
+    merged_vertices = [
+        {"id": new_id(), "label": "issue", "description": f"merged issue {k}"}
+        for k in range(merged)
+    ]
+    pairs = set()
+    while len(pairs) < edges:
+        tail, head = sorted(rng.sample(range(issues), 2))
+        pairs.add((tail, head))
+    return {
+        "vertices": {
+            "project": project,
+            "objectives": [],
+            "opportunities": [],
+            "issues": issue_vertices,
+            "merged_issues": merged_vertices,
+        },
+        "edges": (
+            [edge(project, vertex, "contains") for vertex in issue_vertices]
+            + [
+                edge(issue_vertices[tail], issue_vertices[head], "influences")
+                for tail, head in sorted(pairs)
+            ]
+            + [
+                edge(vertex, rng.choice(issue_vertices), "merged_into")
+                for vertex in merged_vertices
+            ]
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="ws://localhost:8182/gremlin")
+    parser.add_argument("--issues", type=int, default=2000)
+    parser.add_argument("--edges", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--output", help="write the generated export to this file")
+    args = parser.parse_args()
+
+    export = generate_export(args.issues, args.edges)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(export, file)
+
+    if args.url == "memory":
+        pool = None
+        repository = ProjectRepository(InMemoryDatabaseClient(MemoryGraph()))
+    else:
+        pool = ConnectionPool(lambda: client.Client(args.url, "g"))
+        repository = ProjectRepository(GremlinClient(args.url, pool=pool))
+    try:
+        durations = measure(
+            lambda: repository.import_project(export, batch_size=args.batch_size),
+            args.repeat,
+        )
+    finally:
+        for project in repository.all():
+            if project.name == "benchmark":
+                repository.delete(project.uuid)
+        if pool is not None:
+            pool.close()
+
+    print(summary(f"import of {args.issues} issues and {args.edges} edges", durations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Time and memory of simulating the scenarios of an influence diagram
+
+No database is needed: the influence diagram of `bench_pyagrum_cpt` (an uncertainty
+"child" of `--states` states conditioned on `--parents` uncertainties) is simulated
+for each `--samples`, by chunks of `--chunk-size` scenarios, each state of the
+child valued by its index. The peak memory is measured with tracemalloc: it depends
+on the chunk size, not on the number of scenarios.
+
+    python -m benchmarks.bench_monte_carlo --samples 100000 1000000 10000000
+"""
+
+import argparse
+import tracemalloc
+
+from src.v0.services.structure_utils.decision_diagrams.monte_carlo import (
+    MonteCarloSimulation,
+)
+
+from .bench_pyagrum_cpt import generate_influence_diagram
+from .common import measure, summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=4)
+    parser.add_argument("--parents", type=int, default=5)
+    parser.add_argument(
+        "--samples", type=int, nargs="+", default=[100000, 1000000, 10000000]
+    )
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    influence_diagram = generate_influence_diagram(args.parents, args.states)
+    values = {"child": {f"s{k}": k for k in range(args.states)}}
+    for samples in args.samples:
+
+        def run(samples=samples):
+            simulation = MonteCarloSimulation(influence_diagram, {}, values, seed=0)
+            for _ in simulation.run(samples, args.chunk_size):
+                pass
+
+        tracemalloc.start()
+        run()
+        memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        durations = measure(run, args.repeat)
+        print(summary(f"{samples:,} scenarios", durations))
+        print(
+            f"{'':<40} {samples / min(durations):,.0f} scenarios/s, "
+            f"peak memory {memory / 2**20:,.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
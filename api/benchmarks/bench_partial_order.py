@@ -0,0 +1,110 @@
+"""Time of the decision elimination order and partial order of an influence diagram
+
+No database is needed: for each `--nodes`, a random influence diagram is generated
+(one decision for every `--decision-every` nodes, the others uncertainties), each
+node informed by the previous one and by up to `--parents` random earlier nodes, so
+that the diagram is as deep as it is large. The partial order is computed on a
+fresh copy of the diagram (`cold`), then again on the same diagram (`memoized`).
+Up to `--legacy-max-nodes` nodes, it is also computed by the former algorithm (`legacy`),
+which removed the nodes without children from a copy of the graph, pass after pass.
+
+    python -m benchmarks.bench_partial_order --nodes 50 500 5000
+"""
+
+import argparse
+import random
+
+from src.v0.services.structure_utils.decision_diagrams.edge import Edge
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    InfluenceDiagram,
+)
+from src.v0.services.structure_utils.decision_diagrams.node import (
+    DecisionNode,
+    NodeABC,
+    UncertaintyNode,
+)
+
+from .common import measure, summary
+
+
+def generate_influence_diagram(
+    count: int, decision_every: int, parents: int, seed: int = 0
+) -> dict:
+    """Generate the nodes and edges of a random influence diagram
+
+    Args:
+        count (int): number of nodes
+        decision_every (int): one node out of `decision_every` is a decision
+        parents (int): maximum number of random parents of a node, in addition to
+                       the previous node
+        seed (int, optional): seed of the random generator. Defaults to 0.
+
+    Returns:
+        Dict: {"nodes": List[NodeABC], "edges": List[Edge]}
+    """
+    rng = random.Random(seed)  # noqa: S311
+    nodes = [
+        DecisionNode(f"d{k}", "")
+        if k % decision_every == 0
+        else UncertaintyNode(f"u{k}", "")
+        for k in range(count)
+    ]
+    edges = []
+    for k in range(1, count):
+        tails = {k - 1, *(rng.randrange(k) for _ in range(rng.randint(0, parents)))}
+        edges += [Edge(nodes[tail], nodes[k]) for tail in sorted(tails)]
+    return {"nodes": nodes, "edges": edges}
+
+
+def legacy_partial_order(diagram: InfluenceDiagram) -> list[NodeABC]:
+    """The former partial order algorithm, as reference"""
+    cid_copy = diagram.copy()
+    decisions = []
+    decisions_count = cid_copy.decision_count
+    while decisions_count > 0:
+        for node in list(cid_copy.nx.nodes()):
+            if not cid_copy.has_children(node):
+                if node.is_decision_node:
+                    decisions.append(node)
+                    decisions_count -= 1
+                cid_copy.nx.remove_node(node)
+
+    uncertainty_node = diagram.get_uncertainty_nodes()
+    partial_order = []
+    while decisions:
+        decision = decisions.pop()
+        for parent in diagram.get_parents(decision):
+            if not parent.is_decision_node and parent in uncertainty_node:
+                partial_order.append(parent)
+                uncertainty_node.remove(parent)
+        partial_order.append(decision)
+    return partial_order + uncertainty_node
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--decision-every", type=int, default=3)
+    parser.add_argument("--parents", type=int, default=2)
+    parser.add_argument("--legacy-max-nodes", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for count in args.nodes:
+        data = generate_influence_diagram(count, args.decision_every, args.parents)
+        diagram = InfluenceDiagram.from_dict(data)
+        partial_order = diagram.calculate_partial_order()
+        runs = {
+            "cold": lambda diagram=diagram: diagram.copy().calculate_partial_order(),
+            "memoized": diagram.calculate_partial_order,
+        }
+        if count <= args.legacy_max_nodes:
+            if legacy_partial_order(diagram) != partial_order:
+                raise SystemExit(f"different partial orders for {count} nodes")
+            runs["legacy"] = lambda diagram=diagram: legacy_partial_order(diagram)
+        for name, run in runs.items():
+            print(summary(f"{name} {count:,} nodes", measure(run, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
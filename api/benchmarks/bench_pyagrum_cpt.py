@@ -0,0 +1,102 @@
+"""Time of filling the pyAgrum table of a node with many parents
+
+No database is needed: for each `--parents`, an influence diagram is generated with
+an uncertainty node of `--states` states conditioned on that many uncertainty
+parents of `--states` states each, and converted with `InfluenceDiagram.to_pyagrum`,
+which fills the table of the node in one call (`bulk`). The former conversion
+(`per-slice`), one xarray selection and one pyAgrum assignment per combination of
+the states of the parents, is measured on the same table.
+
+    python -m benchmarks.bench_pyagrum_cpt --states 4 --parents 3 5 6
+"""
+
+import argparse
+
+import numpy as np
+import pyAgrum as gum
+
+from src.v0.services.structure_utils.decision_diagrams.edge import Edge
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    InfluenceDiagram,
+)
+from src.v0.services.structure_utils.decision_diagrams.node import UncertaintyNode
+from src.v0.services.structure_utils.probability.discrete_conditional_probability import (  # noqa: E501
+    DiscreteConditionalProbability,
+)
+from src.v0.services.structure_utils.probability.discrete_unconditional_probability import (  # noqa: E501
+    DiscreteUnconditionalProbability,
+)
+
+from .common import measure, summary
+
+
+def generate_influence_diagram(parents: int, states: int) -> InfluenceDiagram:
+    """Generate an influence diagram with a node conditioned on `parents` nodes
+
+    Args:
+        parents (int): number of parents of the conditioned node "child"
+        states (int): number of states of every node
+
+    Returns:
+        InfluenceDiagram: the influence diagram
+    """
+    outcomes = [f"s{k}" for k in range(states)]
+    nodes = [
+        UncertaintyNode(
+            f"p{k}",
+            "",
+            probabilities=DiscreteUnconditionalProbability(
+                np.full(states, 1 / states), {f"p{k}": outcomes}
+            ),
+        )
+        for k in range(parents)
+    ]
+    table = np.random.default_rng(0).random((states,) * (parents + 1))
+    child = UncertaintyNode(
+        "child",
+        "",
+        probabilities=DiscreteConditionalProbability(
+            table / table.sum(axis=0),
+            {"child": outcomes, **{node.shortname: outcomes for node in nodes}},
+        ),
+    )
+    return InfluenceDiagram.from_dict(
+        {"nodes": [*nodes, child], "edges": [Edge(node, child) for node in nodes]}
+    )
+
+
+def fill_per_slice(gum_id: gum.InfluenceDiagram, node: UncertaintyNode):
+    """The former conversion of a probability into a pyAgrum table, as reference"""
+    cpt = gum_id.cpt(gum_id.idFromName(node.shortname))
+    for parent_states, distribution in node.probabilities.to_pyagrum():
+        cpt[parent_states] = distribution
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=4)
+    parser.add_argument("--parents", type=int, nargs="+", default=[3, 5, 6])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for parents in args.parents:
+        diagram = generate_influence_diagram(parents, args.states)
+        child = next(node for node in diagram.nx if node.shortname == "child")
+        gum_id = diagram.to_pyagrum()
+        bulk = gum_id.cpt(gum_id.idFromName("child")).toarray()
+        fill_per_slice(gum_id, child)
+        if not np.allclose(gum_id.cpt(gum_id.idFromName("child")).toarray(), bulk):
+            raise SystemExit(f"different tables for {parents} parents")
+
+        combinations = f"{args.states**parents:,} combinations"
+        print(summary(f"bulk {combinations}", measure(diagram.to_pyagrum, args.repeat)))
+        print(
+            summary(
+                f"per-slice {combinations}",
+                measure(lambda g=gum_id, c=child: fill_per_slice(g, c), args.repeat),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Latency of `read_vertex`/`read_out_vertex` with inlined values and with bindings
+
+Needs a running Gremlin Server (e.g. `docker-compose -f docker-compose.dev.yaml up
+database`). A project with `--issues` issues is seeded, then every issue is read
+`--repeat` times with the values formatted into the script (before: one script per
+uuid for the server to compile) and as a constant template with bindings (after: one
+script per query shape), and the project is deleted.
+
+    python -m benchmarks.bench_query_bindings --url ws://localhost:8182/gremlin
+"""
+
+import argparse
+
+from gremlin_python.driver import client
+
+from src.v0.database.gremlin import GremlinClient
+from src.v0.database.pool import ConnectionPool
+from src.v0.repositories.project import ProjectRepository
+
+from .bench_export_latency import seed_project
+from .common import measure, summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="ws://localhost:8182/gremlin")
+    parser.add_argument("--issues", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pool = ConnectionPool(lambda: client.Client(args.url, "g"))
+    database_client = GremlinClient(args.url, pool=pool)
+    project_uuid = seed_project(database_client, args.issues)
+    query = database_client.builder.query.vertex
+    try:
+        with database_client as c:
+            uuids = [
+                vertex["uuid"][0]
+                for vertex in c.execute_query(
+                    f"g.V('{project_uuid}').out('contains').valueMap(true)"
+                )
+            ]
+
+            def inlined():
+                for uuid in uuids:
+                    c.execute_query(f"g.V('{uuid}').valueMap(true)")
+                    c.execute_query(
+                        f"g.V('{uuid}').out('influences').hasLabel('issue')"
+                        ".valueMap(true)"
+                    )
+
+            def bound():
+                for uuid in uuids:
+                    read = query.read_vertex(uuid)
+                    c.execute_query(read.template, read.bindings)
+                    read_out = query.read_out_vertex(uuid, "influences", "issue")
+                    c.execute_query(read_out.template, read_out.bindings)
+
+            before = measure(inlined, args.repeat)
+            after = measure(bound, args.repeat)
+    finally:
+        ProjectRepository(database_client).delete(project_uuid)
+        pool.close()
+
+    print(summary(f"{2 * len(uuids)} reads, inlined values (before)", before))
+    print(summary(f"{2 * len(uuids)} reads, template and bindings (after)", after))
+
+
+if __name__ == "__main__":
+    main()
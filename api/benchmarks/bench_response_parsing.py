@@ -0,0 +1,94 @@
+"""Throughput of building IssueResponses from the valueMaps of issue vertices
+
+No database is needed: `--issues` synthetic valueMaps (as returned by Gremlin
+Server) are built into IssueResponses `--repeat` times, through a VertexResponse
+converted to an IssueResponse (before: the vertex is validated, dumped and validated
+again) and straight into IssueResponse (after: one validation of the whole list).
+
+    python -m benchmarks.bench_response_parsing --issues 10000
+"""
+
+import argparse
+import json
+import random
+import uuid
+
+from src.v0.database.builders.responses.gremlin_responses_vertex import (
+    GremlinResponseBuilderVertex,
+)
+from src.v0.models.issue import IssueResponse
+
+from .common import measure, summary
+
+
+def generate_value_maps(issues: int = 10000, seed: int = 0) -> list[dict]:
+    """Generate the valueMaps of issue vertices with probabilities and comments
+
+    Args:
+        issues (int, optional): number of issues. Defaults to 10000.
+        seed (int, optional): seed of the generator. Defaults to 0.
+
+    Returns:
+        list[dict]: valueMaps (`valueMap(true)`) of the issues
+    """
+    rng = random.Random(seed)  # noqa: S311
+    value_maps = []
+    for k in range(issues):
+        vertex_uuid = str(uuid.UUID(int=rng.getrandbits(128)))
+        p = rng.random()
+        probabilities = {
+            "dtype": "DiscreteUnconditionalProbability",
+            "probability_function": [[p, 1 - p]],
+            "variables": {f"i{k}": ["yes", "no"]},
+        }
+        comments = [{"comment": f"comment {n}", "author": "bench"} for n in range(3)]
+        value_maps.append(
+            {
+                "T.id": vertex_uuid,
+                "T.label": "issue",
+                "shortname": [f"i{k}"],
+                "description": [f"issue {k}"],
+                "tag": [json.dumps(["benchmark", f"t{k % 10}"])],
+                "category": ["Uncertainty"],
+                "index": [str(k)],
+                "keyUncertainty": ["true"],
+                "decisionType": [""],
+                "alternatives": [json.dumps(["yes", "no"])],
+                "probabilities": [json.dumps(probabilities)],
+                "influenceNodeUUID": [""],
+                "boundary": ["in"],
+                "comments": [json.dumps(comments)],
+                "version": ["v0"],
+                "uuid": [vertex_uuid],
+                "timestamp": ["1742398642.787523"],
+                "date": ["2025-03-19 15:37:22.787525"],
+                "ids": ["test"],
+            }
+        )
+    return value_maps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    value_maps = generate_value_maps(args.issues)
+    builder = GremlinResponseBuilderVertex()
+    runs = {
+        "vertex then IssueResponse": lambda: (
+            IssueResponse.convert_list_api_payloads_to_responses(
+                builder.build_list(value_maps)
+            )
+        ),
+        "IssueResponse": lambda: builder.build_list(value_maps, IssueResponse),
+    }
+    for name, run in runs.items():
+        durations = measure(run, args.repeat)
+        print(summary(name, durations))
+        print(f"{'':<40} {args.issues * len(durations) / sum(durations):,.0f} issues/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import statistics
+import time
+from collections.abc import Callable
+
+
+def measure(func: Callable, repeat: int, warmup: int = 1) -> list[float]:
+    """Call `func` `warmup + repeat` times and return the last `repeat` durations
+
+    Args:
+        func (Callable): function to measure, called without argument
+        repeat (int): number of measured calls
+        warmup (int, optional): number of calls not measured. Defaults to 1.
+
+    Returns:
+        list[float]: durations in seconds
+    """
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summary(name: str, durations: list[float]) -> str:
+    """One line summary (mean, p50, p95 in milliseconds) of measured durations"""
+    ms = sorted(d * 1e3 for d in durations)
+    p95 = ms[min(len(ms) - 1, round(0.95 * (len(ms) - 1)))]
+    return (
+        f"{name:<40} n={len(ms):<5} mean={statistics.fmean(ms):9.2f} ms  "
+        f"p50={statistics.median(ms):9.2f} ms  p95={p95:9.2f} ms"
+    )
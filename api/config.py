@@ -17,6 +17,33 @@ class Settings(BaseSettings):
     COSMOS_DB_NAME: str = "decisionDB"
     COSMOS_CONTAINER: str = "decisionItems"
 
+    # database connection pool, shared by all the requests of a worker
+    DB_POOL_SIZE: int = 8
+    DB_POOL_HEALTH_CHECK_INTERVAL: float = 30.0  # seconds
+    # maximum number of vertices dropped per query when deleting a project
+    DB_DELETE_BATCH_SIZE: int = 100
+    # maximum number of vertices or edges created per query when importing a project
+    DB_IMPORT_BATCH_SIZE: int = 100
+    # whether the vertices are stored in the partition of their project, and reads
+    # filter on it: False for a database in the former single partition layout
+    # ("ids" = "test") until `python -m src.v0.database.migration` has run on it
+    DB_PARTITIONED: bool = True
+    # GraphSON file loaded into the in-memory graph (APP_ENVIRONMENT containing
+    # "memory"), e.g. ../db/data/dot_graph.graphson
+    DB_MEMORY_SEED: str = ""
+    # maximum number of nodes of a decision tree built by a request
+    DECISION_TREE_MAX_NODES: int = 100000
+    # maximum estimated memory of the pyAgrum influence diagrams cached per worker
+    PYAGRUM_CACHE_MAX_BYTES: int = 256 * 2**20
+    # worker processes solving the influence diagrams, shared by the requests of an
+    # API process, and maximum time (in seconds) a request waits for a solution
+    WORKER_POOL_SIZE: int = 2
+    SOLVE_TIMEOUT: float = 60.0
+    # worker processes used at once by the solves of an analysis request (value of
+    # information, sensitivity), and maximum time (in seconds) it waits for them
+    ANALYSIS_CPU_BUDGET: int = 2
+    ANALYSIS_TIMEOUT: float = 300.0
+
     @computed_field
     def FRONTEND_URL(self) -> AnyHttpUrl:
         return f"http://{self.REACT_APP_WEB_HOST}:{self.REACT_APP_WEB_PORT}"
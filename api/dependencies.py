@@ -1,4 +1,5 @@
 import importlib
+from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware import Middleware
@@ -20,6 +21,27 @@ ROUTER_MODULES = [
 ]
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the database connection pools and the worker pools at startup and close
+    them at shutdown"""
+    pools = [
+        pool
+        for v in DATABASE_VERSIONS
+        for pool in importlib.import_module("src." + v + ".database.adapter").get_pools()
+    ] + [
+        importlib.import_module(
+            "src." + v + ".services.structure_utils.worker_pool"
+        ).worker_pool
+        for v in DATABASE_VERSIONS
+    ]
+    for pool in pools:
+        pool.open()
+    yield
+    for pool in pools:
+        pool.close()
+
+
 def create_middleware() -> list[Middleware]:
     middleware = [
         Middleware(
@@ -41,7 +63,7 @@ def create_middleware() -> list[Middleware]:
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(middleware=create_middleware())
+    app = FastAPI(middleware=create_middleware(), lifespan=lifespan)
 
     for m in ROUTER_MODULES:
         router = APIRouter()
@@ -65,7 +87,8 @@ def test_create_app() -> FastAPI:
                 allow_methods=["*"],
                 allow_headers=["*"],
             )
-        ]
+        ],
+        lifespan=lifespan,
     )
 
     for m in ROUTER_MODULES:
@@ -1,13 +1,43 @@
 from config import Settings
 
-from .client import DatabaseClient
+from .client import AsyncDatabaseClient, DatabaseClient
+from .cosmos import async_pool as cosmos_async_pool
+from .cosmos import get_async_client as get_async_cosmos_client
 from .cosmos import get_client as get_cosmos_client
+from .cosmos import pool as cosmos_pool
+from .gremlin import async_pool as gremlin_async_pool
+from .gremlin import get_async_client as get_async_gremlin_client
 from .gremlin import get_client as get_gremlin_client
+from .gremlin import pool as gremlin_pool
+from .memory import get_async_client as get_async_memory_client
+from .memory import get_client as get_memory_client
+from .pool import ConnectionPool
 
 
 # switch database configuration based on environment
 def get_client() -> DatabaseClient:
-    if Settings().APP_ENVIRONMENT.lower().__contains__("local"):
+    if Settings().APP_ENVIRONMENT.lower().__contains__("memory"):
+        return get_memory_client()
+    elif Settings().APP_ENVIRONMENT.lower().__contains__("local"):
         return get_gremlin_client()
     else:
         return get_cosmos_client()
+
+
+def get_async_client() -> AsyncDatabaseClient:
+    if Settings().APP_ENVIRONMENT.lower().__contains__("memory"):
+        return get_async_memory_client()
+    elif Settings().APP_ENVIRONMENT.lower().__contains__("local"):
+        return get_async_gremlin_client()
+    else:
+        return get_async_cosmos_client()
+
+
+def get_pools() -> list[ConnectionPool]:
+    """Connection pools of the synchronous and of the asynchronous clients"""
+    if Settings().APP_ENVIRONMENT.lower().__contains__("memory"):
+        return []  # the in-memory graph needs no connection
+    elif Settings().APP_ENVIRONMENT.lower().__contains__("local"):
+        return [gremlin_pool, gremlin_async_pool]
+    else:
+        return [cosmos_pool, cosmos_async_pool]
@@ -1,4 +1,4 @@
-from .query_builder import GremlinStringQueryBuilder
+from .query_builder import GremlinQuery, GremlinStringQueryBuilder
 
 
 class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
@@ -17,9 +17,9 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
         out_vertex_uuid: str,
         in_vertex_uuid: str,
         edge_dict: dict[str, str],
-    ) -> str:
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to create a new edge between specified vertices
+        Generates a Gremlin query to create a new edge between specified vertices
             with the given label and properties.
 
         Args:
@@ -30,34 +30,133 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
                                         the edge.
 
         Returns:
-            str: Gremlin query string for creating the edge.
+            GremlinQuery: Gremlin query for creating the edge.
         """
 
-        query = f"{self.graph_name}.V('{out_vertex_uuid}').addE('{edge_label}')"
-        query += f".to(__.V('{in_vertex_uuid}'))"
-        query += self.property_query("id", edge_dict["uuid"])
-        query += self.property_query("uuid", edge_dict["uuid"])
+        query = GremlinQuery(
+            f"{self.graph_name}.V(out_vertex_uuid).addE(edge_label)"
+            ".to(__.V(in_vertex_uuid))"
+            ".property(id, edge_uuid).property('uuid', edge_uuid)",
+            {
+                "out_vertex_uuid": out_vertex_uuid,
+                "edge_label": edge_label,
+                "in_vertex_uuid": in_vertex_uuid,
+                "edge_uuid": str(edge_dict["uuid"]),
+            },
+        )
 
         return query
 
-    def read_edge(self, edge_id: str) -> str:
+    def create_edges(
+        self, edges: list[tuple[str, str, str, dict[str, str]]]
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to retrieve an edge by its ID.
+        Generates a Gremlin query to create several edges in a single traversal
+            (a `union` of mid-traversal `V` and `addE` steps, so that an edge whose
+            vertex is missing is not created, without ending the traversal).
+
+        Args:
+            edges (list[tuple[str, str, str, dict[str, str]]]): label, UUID of the
+                outgoing vertex, UUID of the incoming vertex and dictionary of property
+                key-value pairs of each edge to create (see create_edge).
+
+        Returns:
+            GremlinQuery: Gremlin query for creating the edges, returning the number
+                          of created edges.
+        """
+
+        query = GremlinQuery(f"{self.graph_name}.inject(0).union(")
+        for n, (edge_label, out_vertex_uuid, in_vertex_uuid, edge_dict) in enumerate(
+            edges
+        ):
+            query += GremlinQuery(
+                f"{', ' if n else ''}__.V(out_vertex_uuid_{n}).addE(edge_label_{n})"
+                f".to(__.V(in_vertex_uuid_{n}))"
+                f".property(id, edge_uuid_{n}).property('uuid', edge_uuid_{n})",
+                {
+                    f"out_vertex_uuid_{n}": out_vertex_uuid,
+                    f"edge_label_{n}": edge_label,
+                    f"in_vertex_uuid_{n}": in_vertex_uuid,
+                    f"edge_uuid_{n}": str(edge_dict["uuid"]),
+                },
+            )
+        query += ").count()"
+
+        return query
+
+    def restore_edges(
+        self, edges: list[tuple[str, str, str, dict[str, str]]]
+    ) -> GremlinQuery:
+        """
+        Generates a Gremlin query to create several edges again, with all their
+            stored properties, in a single traversal (see create_edges).
+
+        Args:
+            edges (list[tuple[str, str, str, dict[str, str]]]): label, UUID of the
+                outgoing vertex, UUID of the incoming vertex and stored properties
+                (including the "uuid", also used as id) of each edge.
+
+        Returns:
+            GremlinQuery: Gremlin query for creating the edges, returning the number
+                          of created edges.
+        """
+
+        query = GremlinQuery(f"{self.graph_name}.inject(0).union(")
+        for n, (edge_label, out_vertex_uuid, in_vertex_uuid, edge_dict) in enumerate(
+            edges
+        ):
+            query += GremlinQuery(
+                f"{', ' if n else ''}__.V(out_vertex_uuid_{n}).addE(edge_label_{n})"
+                f".to(__.V(in_vertex_uuid_{n}))",
+                {
+                    f"out_vertex_uuid_{n}": out_vertex_uuid,
+                    f"edge_label_{n}": edge_label,
+                    f"in_vertex_uuid_{n}": in_vertex_uuid,
+                },
+            )
+            query += self.property_query("id", edge_dict["uuid"], f"edge_id_{n}")
+            query += self.property_dict_query(edge_dict, f"property_{n}")
+        query += ").count()"
+
+        return query
+
+    def list_incident_edges(self, vertex_uuids: list[str]) -> GremlinQuery:
+        """
+        Generates a Gremlin query to list all the edges of several vertices, in
+            whichever partition they are, with their properties.
+
+        Args:
+            vertex_uuids (list[str]): UUIDs of the vertices.
+
+        Returns:
+            GremlinQuery: Gremlin query returning, once per edge, a map with the
+                          "edge" and its "properties" (a valueMap).
+        """
+
+        return GremlinQuery(
+            f"{self.graph_name}.V().has('uuid', within(vertex_uuids)).bothE().dedup()"
+            ".project('edge', 'properties').by().by(__.valueMap())",
+            {"vertex_uuids": vertex_uuids},
+        )
+
+    def read_edge(self, edge_id: str) -> GremlinQuery:
+        """
+        Generates a Gremlin query to retrieve an edge by its ID.
 
         Args:
             edge_id (str): ID of the edge to read.
 
         Returns:
-            str: Gremlin query string for reading the edge.
+            GremlinQuery: Gremlin query for reading the edge.
         """
 
-        return f"{self.graph_name}.E('{edge_id}')"
+        return self._edge_query(edge_id)
 
     def list_all_edges(
         self, edge_label: str, filter_dict: dict[str, str] | None = None
-    ) -> str:
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to list all edges with a specific label,
+        Generates a Gremlin query to list all edges with a specific label,
         optionally filtering by additional properties.
 
         Args:
@@ -66,10 +165,12 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
                                                  key-value pairs to filter the edges.
 
         Returns:
-            str: Gremlin query string for listing the edges.
+            GremlinQuery: Gremlin query for listing the edges.
         """
 
-        query = f"{self.graph_name}.E()" + self.filter_label_query(edge_label)
+        query = GremlinQuery(f"{self.graph_name}.E()") + self.filter_label_query(
+            edge_label, "edge_label"
+        )
 
         if filter_dict is not None:
             query += self.filter_query(filter_dict)
@@ -78,9 +179,11 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
 
         return query
 
-    def list_all_edges_from_project(self, project_uuid: str, edge_label: str) -> str:
+    def list_all_edges_from_project(
+        self, project_uuid: str, edge_label: str
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to list all edges of a specific label
+        Generates a Gremlin query to list all edges of a specific label
             originating from a given project vertex.
 
         Args:
@@ -88,9 +191,10 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
             edge_label (str): Label of the edges to list.
 
         Returns:
-            str: Gremlin query string for listing the edges.
+            GremlinQuery: Gremlin query for listing the edges.
         """
-        query = f"{self.graph_name}.V('{project_uuid}').outE('contains')"
+        query = self._vertex_query(project_uuid, "project_uuid", project_uuid)
+        query += ".outE('contains')"
 
         if edge_label == "influences":
             query += ".inV().outE('influences')"
@@ -103,9 +207,9 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
 
     def list_all_edges_from_sub_project(
         self, project_uuid: str, edge_label: str, vertex_uuid: list[str]
-    ) -> str:
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to list all edges with the specified edge label
+        Generates a Gremlin query to list all edges with the specified edge label
             and linking vertices with given properties
 
         Args:
@@ -114,22 +218,29 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
             vertex_uuid (list[str]): list of vertices uuid of the sub-project
 
         Returns:
-            str: Gremlin query string for listing the edges.
+            GremlinQuery: Gremlin query for listing the edges.
         """
-        query = f"g.V('{project_uuid}').outE('contains').inV().outE('{edge_label}')"
-        query += ".where("
-        query += "and("
-        query += f"__.inV().has('uuid', within({vertex_uuid})),"
-        query += f"__.outV().has('uuid', within({vertex_uuid}))"
-        query += ")"
-        query += ")"
-        query += ""
+        query = self._vertex_query(project_uuid, "project_uuid", project_uuid)
+        query += GremlinQuery(
+            ".outE('contains').inV().outE(edge_label)", {"edge_label": edge_label}
+        )
+        query += GremlinQuery(
+            ".where("
+            "and("
+            "__.inV().has('uuid', within(vertex_uuids)),"
+            "__.outV().has('uuid', within(vertex_uuids))"
+            ")"
+            ")",
+            {"vertex_uuids": vertex_uuid},
+        )
 
         return query
 
-    def read_out_edge_from_vertex(self, vertex_uuid: str, edge_label: str):
+    def read_out_edge_from_vertex(
+        self, vertex_uuid: str, edge_label: str
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to read all outgoing edges from a vertex given
+        Generates a Gremlin query to read all outgoing edges from a vertex given
             an edge label.
 
         Args:
@@ -137,15 +248,15 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
             edge_label (str): label of the edges to read
 
         Returns:
-            str: Gremlin query string for reading the edges.
+            GremlinQuery: Gremlin query for reading the edges.
         """
-        query = f"{self.graph_name}.V('{vertex_uuid}').outE()"
-        query += self.filter_label_query(edge_label)
+        query = self._vertex_query(vertex_uuid) + ".outE()"
+        query += self.filter_label_query(edge_label, "edge_label")
         return query
 
-    def read_in_edge_to_vertex(self, vertex_uuid: str, edge_label: str):
+    def read_in_edge_to_vertex(self, vertex_uuid: str, edge_label: str) -> GremlinQuery:
         """
-        Generates a Gremlin query string to read all incoming edges to a vertex given an
+        Generates a Gremlin query to read all incoming edges to a vertex given an
             edge label.
 
         Args:
@@ -153,49 +264,52 @@ class GremlinStringQueryBuilderEdge(GremlinStringQueryBuilder):
             edge_label (str): label of the edges to read
 
         Returns:
-            str: Gremlin query string for reading the edges.
+            GremlinQuery: Gremlin query for reading the edges.
         """
-        query = f"{self.graph_name}.V('{vertex_uuid}').inE()"
-        query += self.filter_label_query(edge_label)
+        query = self._vertex_query(vertex_uuid) + ".inE()"
+        query += self.filter_label_query(edge_label, "edge_label")
         return query
 
-    def update_edge(self, edge_id: str, edge_prop: dict[str, str]) -> str:
+    def update_edge(self, edge_id: str, edge_prop: dict[str, str]) -> GremlinQuery:
         """
-        Generates a Gremlin query string to update the properties of an existing edge.
+        Generates a Gremlin query to update the properties of an existing edge.
 
         Args:
             edge_id (str): ID of the edge to update.
             edge_prop (dict[str, str]): Dictionary of property key-value pairs to update.
 
         Returns:
-            str: Gremlin query string for updating the edge.
+            GremlinQuery: Gremlin query for updating the edge.
         """
 
-        query = f"{self.graph_name}.E('{edge_id}')"
+        query = GremlinQuery("[") + self._edge_query(edge_id)
         query += self.property_dict_query(edge_prop)
-        return f"[{query}]"
+        return query + "]"
 
-    def delete_edge(self, edge_id: str) -> str:
+    def delete_edge(self, edge_id: str) -> GremlinQuery:
         """
-        Generates a Gremlin query string to delete an edge by its ID.
+        Generates a Gremlin query to delete an edge by its ID.
 
         Args:
             edge_id (str): ID of the edge to delete.
 
         Returns:
-            str: Gremlin query string for deleting the edge.
+            GremlinQuery: Gremlin query for deleting the edge.
         """
-        return f"{self.graph_name}.E('{edge_id}').drop()"
+        return self._edge_query(edge_id) + ".drop()"
 
-    def delete_edge_from_vertex(self, vertex_id: str) -> str:
+    def delete_edge_from_vertex(self, vertex_id: str) -> GremlinQuery:
         """
-        Generates a Gremlin query string to delete all edges connected to a given vertex.
+        Generates a Gremlin query to delete all edges connected to a given vertex.
 
         Args:
             vertex_id (str): ID of the vertex to remove edges from.
 
         Returns:
-            str: Gremlin query string for deleting the edges.
+            GremlinQuery: Gremlin query for deleting the edges.
         """
 
-        return f"{self.graph_name}.V('{vertex_id}').bothE().drop()"
+        return self._vertex_query(vertex_id) + ".bothE().drop()"
+
+    def _edge_query(self, edge_id: str) -> GremlinQuery:
+        return GremlinQuery(f"{self.graph_name}.E(edge_id)", {"edge_id": edge_id})
@@ -1,6 +1,6 @@
 from copy import deepcopy
 
-from .query_builder import GremlinStringQueryBuilder
+from .query_builder import GremlinQuery, GremlinStringQueryBuilder
 
 
 class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
@@ -13,9 +13,11 @@ class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
     creating, reading, updating, and deleting vertices.
     """
 
-    def create_vertex(self, vertex_label: str, vertex_dict: dict[str, str]) -> str:
+    def create_vertex(
+        self, vertex_label: str, vertex_dict: dict[str, str]
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to create a new vertex with the specified
+        Generates a Gremlin query to create a new vertex with the specified
         label and properties.
 
         Args:
@@ -24,30 +26,62 @@ class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
                                           the vertex.
 
         Returns:
-            str: Gremlin query string for creating the vertex.
+            GremlinQuery: Gremlin query for creating the vertex.
         """
 
-        query = f"{self.graph_name}.addV('{vertex_label}')"
+        query = GremlinQuery(
+            f"{self.graph_name}.addV(vertex_label)", {"vertex_label": vertex_label}
+        )
         query += self.property_query(
-            "id", vertex_dict["uuid"]
+            "id", vertex_dict["uuid"], "vertex_id"
         )  # TODO: still copying `uuid` to `id`, check other calls
         query += self.property_dict_query(vertex_dict)
         query += self.transform_query
 
         return query
 
-    def read_vertex(self, vertex_uuid: str) -> str:
+    def create_vertices(
+        self, vertices: list[tuple[str, dict[str, str]]]
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to retrieve a vertex by its UUID.
+        Generates a Gremlin query to create several vertices in a single traversal
+            (chained `addV` steps).
+
+        Args:
+            vertices (list[tuple[str, dict[str, str]]]): label and dictionary of
+                                                         property key-value pairs of
+                                                         each vertex to create.
+
+        Returns:
+            GremlinQuery: Gremlin query for creating the vertices.
+        """
+
+        query = GremlinQuery(self.graph_name)
+        for n, (vertex_label, vertex_dict) in enumerate(vertices):
+            query += GremlinQuery(
+                f".addV(vertex_label_{n})", {f"vertex_label_{n}": vertex_label}
+            )
+            query += self.property_query("id", vertex_dict["uuid"], f"vertex_id_{n}")
+            query += self.property_dict_query(vertex_dict, f"property_{n}")
+
+        return query
+
+    def read_vertex(
+        self, vertex_uuid: str, partition_key: str | None = None
+    ) -> GremlinQuery:
+        """
+        Generates a Gremlin query to retrieve a vertex by its UUID.
 
         Args:
             vertex_uuid (str): UUID of the vertex to read.
+            partition_key (str | None): Partition key of the vertex (uuid of its
+                                        project), if known.
 
         Returns:
-            str: Gremlin query string for reading the vertex.
+            GremlinQuery: Gremlin query for reading the vertex.
         """
 
-        query = f"{self.graph_name}.V('{vertex_uuid}')"
+        query = self._vertex_query(vertex_uuid, partition_key=partition_key)
         query += self.transform_query
 
         return query
@@ -58,9 +92,10 @@ class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
         edge_label: str,
         original_vertex_label: str | None = None,
         filter_dict: dict[str, str] | None = None,
-    ) -> str:
+        partition_key: str | None = None,
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to traverse to outgoing vertices along a
+        Generates a Gremlin query to traverse to outgoing vertices along a
         specified edge label,
         optionally filtering by original vertex label and additional properties.
 
@@ -72,16 +107,18 @@ class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
             filter_dict (dict[str, str] | None): Optional dictionary of property
                                                  key-value pairs to filter the traversed
                                                  vertices.
+            partition_key (str | None): Partition key of the vertex (uuid of its
+                                        project), if known.
 
         Returns:
-            str: Gremlin query string for the traversal.
+            GremlinQuery: Gremlin query for the traversal.
         """
 
-        query = f"{self.graph_name}.V('{vertex_uuid}')"
-        query += f".out('{edge_label}')"
+        query = self._vertex_query(vertex_uuid, partition_key=partition_key)
+        query += GremlinQuery(".out(edge_label)", {"edge_label": edge_label})
 
         if original_vertex_label is not None:
-            query += self.filter_label_query(original_vertex_label)
+            query += self.filter_label_query(original_vertex_label, "vertex_label")
 
         if filter_dict is not None:
             query += self.filter_query(filter_dict)
@@ -90,15 +127,47 @@ class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
 
         return query
 
+    def read_out_in_vertex(
+        self,
+        vertex_uuid: str,
+        out_edge_label: str,
+        in_edge_label: str,
+        partition_key: str | None = None,
+    ) -> GremlinQuery:
+        """
+        Generates a Gremlin query to read the vertices with an edge going into the
+            vertices an edge goes to from the specified vertex.
+
+        Args:
+            vertex_uuid (str): UUID of the vertex to start from.
+            out_edge_label (str): label of the edges going out of the vertex.
+            in_edge_label (str): label of the edges going into the vertices reached.
+            partition_key (str | None): Partition key of the vertex (uuid of its
+                                        project), if known.
+
+        Returns:
+            GremlinQuery: Gremlin query for reading the vertices.
+        """
+
+        query = self._vertex_query(vertex_uuid, partition_key=partition_key)
+        query += GremlinQuery(
+            ".out(out_edge_label).in(in_edge_label)",
+            {"out_edge_label": out_edge_label, "in_edge_label": in_edge_label},
+        )
+        query += self.transform_query
+
+        return query
+
     def read_in_vertex(
         self,
         vertex_uuid: str,
         edge_label: str,
         original_vertex_label: str | None = None,
         filter_dict: dict[str, str] | None = None,
-    ) -> str:
+        partition_key: str | None = None,
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to traverse to ingoing vertices along a
+        Generates a Gremlin query to traverse to ingoing vertices along a
         specified edge label,
         optionally filtering by original vertex label and additional properties.
 
@@ -110,15 +179,17 @@ class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
             filter_dict (dict[str, str] | None): Optional dictionary of property
                                                  key-value pairs to filter the
                                                  traversed vertices.
+            partition_key (str | None): Partition key of the vertex (uuid of its
+                                        project), if known.
 
         Returns:
-            str: Gremlin query string for the traversal.
+            GremlinQuery: Gremlin query for the traversal.
         """
-        query = f"{self.graph_name}.V('{vertex_uuid}')"
-        query += f".in('{edge_label}')"
+        query = self._vertex_query(vertex_uuid, partition_key=partition_key)
+        query += GremlinQuery(".in(edge_label)", {"edge_label": edge_label})
 
         if original_vertex_label is not None:
-            query += self.filter_label_query(original_vertex_label)
+            query += self.filter_label_query(original_vertex_label, "vertex_label")
 
         if filter_dict is not None:
             query += self.filter_query(filter_dict)
@@ -127,27 +198,111 @@ class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
 
         return query
 
-    def list_all_vertices(self, vertex_label: str) -> str:
+    def read_influence_diagram(self, project_uuid: str) -> GremlinQuery:
+        """
+        Generates a Gremlin query to retrieve the influence diagram of a project in
+            a single traversal.
+
+        The issues in or on the boundary which are key uncertainties, focus
+        decisions or value metrics are selected, and the "influences" edges between
+        them are projected next to them.
+
+        Args:
+            project_uuid (str): UUID of the project vertex.
+
+        Returns:
+            GremlinQuery: Gremlin query returning a single map with the "vertices"
+                          (as valueMaps) and the "edges" of the influence diagram.
+        """
+
+        query = self._vertex_query(project_uuid, "project_uuid", project_uuid)
+        query += (
+            ".out('contains').hasLabel('issue')"
+            ".has('boundary', within('in', 'on'))"
+            ".or("
+            "__.has('category', 'Uncertainty').has('keyUncertainty', 'true'),"
+            "__.has('category', 'Decision').has('decisionType', 'Focus'),"
+            "__.has('category', 'Value Metric')"
+            ")"
+            ".aggregate('vertices').fold()"
+            ".project('vertices', 'edges')"
+            f".by(__.unfold(){self.transform_query}.fold())"
+            ".by("
+            "__.unfold().outE('influences')"
+            ".where(__.inV().where(within('vertices')))"
+            ".fold()"
+            ")"
+        )
+
+        return query
+
+    def export_project(self, project_uuid: str) -> GremlinQuery:
         """
-        Generates a Gremlin query string to list all vertices with a specific label,
+        Generates a Gremlin query to retrieve a project and all its vertices and
+            edges in a single traversal.
+
+        Args:
+            project_uuid (str): UUID of the project vertex.
+
+        Returns:
+            GremlinQuery: Gremlin query returning a single map with the "project",
+                          "objectives", "opportunities", "issues" and
+                          "merged_issues" (as valueMaps) and the "edges" ("contains",
+                          "influences", "merged_into" and "has_value_metric").
+        """
+
+        transform = self.transform_query
+        query = self._vertex_query(project_uuid, "project_uuid", project_uuid)
+        query += (
+            ".project("
+            "'project', 'objectives', 'opportunities', 'issues', 'merged_issues', "
+            "'edges'"
+            ")"
+            f".by(__{transform})"
+            f".by(__.out('contains').hasLabel('objective'){transform}.fold())"
+            f".by(__.out('contains').hasLabel('opportunity'){transform}.fold())"
+            f".by(__.out('contains').hasLabel('issue'){transform}.fold())"
+            ".by("
+            "__.out('contains').hasLabel('issue').in('merged_into')"
+            f"{transform}.fold()"
+            ")"
+            ".by("
+            "__.union("
+            "__.outE('contains'),"
+            "__.out('contains').outE('influences'),"
+            "__.out('contains').inE('merged_into'),"
+            "__.out('contains').outE('has_value_metric')"
+            ").fold()"
+            ")"
+        )
+
+        return query
+
+    def list_all_vertices(self, vertex_label: str) -> GremlinQuery:
+        """
+        Generates a Gremlin query to list all vertices with a specific label,
         optionally filtering by additional properties.
 
         Args:
             vertex_label (str): Label of the vertices to list.
 
         Returns:
-            str: Gremlin query string for listing the vertices.
+            GremlinQuery: Gremlin query for listing the vertices.
         """
         # the filter is removed as the associated routers either do not implement the
         # method or calls it without the filter.
-        query = f"{self.graph_name}.V()" + self.filter_label_query(vertex_label)
+        query = GremlinQuery(f"{self.graph_name}.V()") + self.filter_label_query(
+            vertex_label, "vertex_label"
+        )
         query += self.transform_query
 
         return query
 
-    def update_vertex(self, vertex_uuid: str, vertex_prop: dict[str, str]) -> str:
+    def update_vertex(
+        self, vertex_uuid: str, vertex_prop: dict[str, str]
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to update the properties of an existing vertex.
+        Generates a Gremlin query to update the properties of an existing vertex.
 
         Args:
             vertex_uuid (str): UUID of the vertex to update.
@@ -155,26 +310,87 @@ class GremlinStringQueryBuilderVertex(GremlinStringQueryBuilder):
                                           update.
 
         Returns:
-            str: Gremlin query string for updating the vertex.
+            GremlinQuery: Gremlin query for updating the vertex.
         """
         properties = deepcopy(vertex_prop)
         properties.pop("id", None)
         properties.pop("label", None)
-        query = f"{self.graph_name}.V('{vertex_uuid}')"
+        query = self._vertex_query(vertex_uuid)
         query += self.property_dict_query(properties)
         query += self.transform_query
 
         return query
 
-    def delete_vertex(self, vertex_uuid: str) -> str:
+    def delete_vertex(
+        self, vertex_uuid: str, partition_key: str | None = None
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string to delete a vertex by its UUID.
+        Generates a Gremlin query to delete a vertex by its UUID.
 
         Args:
             vertex_uuid (str): UUID of the vertex to delete.
+            partition_key (str | None): Partition key of the vertex (uuid of its
+                                        project), if known.
 
         Returns:
-            str: Gremlin query string for deleting the vertex.
+            GremlinQuery: Gremlin query for deleting the vertex.
+        """
+
+        return self._vertex_query(vertex_uuid, partition_key=partition_key) + ".drop()"
+
+    def delete_vertices(self, vertex_uuids: list[str]) -> GremlinQuery:
         """
+        Generates a Gremlin query to delete several vertices by their UUID, in
+            whichever partition they are.
+
+        Args:
+            vertex_uuids (list[str]): UUIDs of the vertices to delete.
 
-        return f"{self.graph_name}.V('{vertex_uuid}').drop()"
+        Returns:
+            GremlinQuery: Gremlin query for deleting the vertices.
+        """
+
+        return GremlinQuery(
+            f"{self.graph_name}.V().has('uuid', within(vertex_uuids)).drop()",
+            {"vertex_uuids": vertex_uuids},
+        )
+
+    def delete_out_vertex_batch(
+        self,
+        vertex_uuid: str,
+        edge_label: str,
+        batch_size: int,
+        in_edge_label: str | None = None,
+        partition_key: str | None = None,
+    ) -> GremlinQuery:
+        """
+        Generates a Gremlin query to delete at most `batch_size` of the vertices
+            connected to a vertex through an outgoing edge (and optionally, from
+            those, through an incoming edge), together with all their edges.
+
+        The batch is collected before being dropped, so the traversal never iterates
+        over edges it is removing.
+
+        Args:
+            vertex_uuid (str): UUID of the vertex the edges go out of.
+            edge_label (str): label of the outgoing edges, e.g. "contains".
+            batch_size (int): maximum number of vertices to delete.
+            in_edge_label (str | None): label of the incoming edges to follow from
+                                        the vertices reached, e.g. "merged_into".
+            partition_key (str | None): Partition key of the vertex (uuid of its
+                                        project), if known.
+
+        Returns:
+            GremlinQuery: Gremlin query returning the number of deleted vertices.
+        """
+
+        query = self._vertex_query(vertex_uuid, partition_key=partition_key)
+        query += GremlinQuery(".out(edge_label)", {"edge_label": edge_label})
+        if in_edge_label is not None:
+            query += GremlinQuery(".in(in_edge_label)", {"in_edge_label": in_edge_label})
+        query += GremlinQuery(
+            ".limit(batch_size).fold().sideEffect(__.unfold().drop()).count(local)",
+            {"batch_size": batch_size},
+        )
+
+        return query
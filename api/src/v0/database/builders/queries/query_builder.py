@@ -1,22 +1,65 @@
+from __future__ import annotations
+
 import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
 
 TRANSFORM_QUERY_STRING: str = ".valueMap(true)"
+PARTITION_KEY: str = "ids"
+"""Property holding the partition key (uuid of the project of the vertices)"""
+TEMPLATE_CACHE_SIZE: int = 256
+ITERABLE_PROPERTIES: tuple[str, ...] = (
+    "alternatives",
+    "tag",
+    "probabilities",
+    "comments",
+)
+
+
+@dataclass(frozen=True)
+class GremlinQuery:
+    """
+    Gremlin script template and the values bound to its parameters.
+
+    Values are never inlined in the template, which therefore only depends on the
+    shape of the query (its steps and property keys): Gremlin Server and Cosmos DB
+    compile each template once and then hit their script cache.
+
+    Args:
+        template (str): Gremlin script with parameters, e.g. `g.V(vertex_uuid)`.
+        bindings (dict[str, Any]): values of the parameters of the template.
+    """
+
+    template: str
+    bindings: dict[str, Any] = field(default_factory=dict)
+
+    def __add__(self, other: GremlinQuery | str) -> GremlinQuery:
+        if isinstance(other, str):
+            return GremlinQuery(self.template + other, self.bindings)
+        return GremlinQuery(
+            self.template + other.template, {**self.bindings, **other.bindings}
+        )
 
 
 class GremlinStringQueryBuilder:
     """
-    Base class for building Gremlin queries using string formatting.
+    Base class for building parameterized Gremlin queries (see GremlinQuery).
 
     Args:
         graph_name (str): Name of the graph to query. Defaults to "g".
         transform_query (str): Gremlin step to transform results. Defaults to
                                ".valueMap(true)".
+        partition_key (str | None): Property holding the partition key of the
+                                    vertices, None to never filter on it (e.g. to
+                                    read data not migrated yet). Defaults to "ids".
     """
 
     def __init__(
         self,
         graph_name: str = "g",
         transform_query: str = TRANSFORM_QUERY_STRING,
+        partition_key: str | None = PARTITION_KEY,
     ) -> None:
         """
         Initializes a GremlinStringQueryBuilder instance.
@@ -25,124 +68,142 @@ class GremlinStringQueryBuilder:
             graph_name (str, optional): Name of the graph to query. Defaults to "g".
             transform_query (str, optional): Gremlin step to transform results.
                                              Defaults to ".valueMap(true)".
+            partition_key (str | None, optional): Property holding the partition key
+                                                  of the vertices. Defaults to "ids".
         """
 
         self.transform_query: str = transform_query
         self.graph_name: str = graph_name
+        self.partition_key: str | None = partition_key
 
-    def filter_query(self, filter_dict: dict[str, str]) -> str:
+    def filter_query(self, filter_dict: dict[str, str]) -> GremlinQuery:
         """
-        Generates a Gremlin query string for property filtering using
-            `.has('key', 'value')`.
+        Generates a Gremlin query for property filtering using
+            `.has('key', filter_n)`.
 
         Args:
             filter_dict (dict[str, str]): Dictionary of key-value pairs for filtering.
 
         Returns:
-            str: Gremlin query string with `.has('key', 'value')` filtering steps.
+            GremlinQuery: `.has('key', filter_n)` filtering steps, binding the values
+                          as strings.
         """
 
-        query = ""
-        if filter_dict and any(v is not None for v in filter_dict.values()):
-            for k, v in filter_dict.items():
-                if v is not None:
-                    query += f".has('{k}', '{v}')"
-                # TODO: how to get a list into the model and then also as a query
-                #       parameter? not possible in pydantic v2?
-            # https://stackoverflow.com/questions/62468402/query-parameters-from-pydantic-model
-        return query
-
-    def filter_label_query(self, label: str) -> str:
+        if not filter_dict:
+            return GremlinQuery("")
+        # TODO: how to get a list into the model and then also as a query
+        #       parameter? not possible in pydantic v2?
+        # https://stackoverflow.com/questions/62468402/query-parameters-from-pydantic-model
+        filters = {k: str(v) for k, v in filter_dict.items() if v is not None}
+        return GremlinQuery(
+            self._filter_template(tuple(filters)),
+            {f"filter_{n}": v for n, v in enumerate(filters.values())},
+        )
+
+    def filter_label_query(self, label: str, name: str = "has_label") -> GremlinQuery:
         """
-        Generates a Gremlin query string for filtering by label using
-            `.hasLabel('label')`.
+        Generates a Gremlin query for filtering by label using `.hasLabel(name)`.
 
         Args:
             label (str): Label to filter by.
+            name (str, optional): Name of the parameter. Defaults to "has_label".
 
         Returns:
-            str: Gremlin query string with `.hasLabel('label')` filtering step.
+            GremlinQuery: `.hasLabel(name)` filtering step.
         """
 
-        return f".hasLabel('{label}')"
+        return GremlinQuery(f".hasLabel({name})", {name: label})
 
-    # TODO: what whenvalue is empty?
-    def _parse_property_as_is(self, key, value):
-        return f".property({key}, '{value}')"
-
-    def _parse_property_as_empty(self, key, value):
-        return f".property('{key}', '')"
-
-    def _parse_property_as_simple_string(self, key, value):
-        return f".property('{key}', '{value}')"
-
-    def _parse_property_as_multiline_string(self, key, value):
-        return f".property('{key}', '''{value}''')"
+    def _vertex_query(
+        self,
+        vertex_uuid: str,
+        name: str = "vertex_uuid",
+        partition_key: str | None = None,
+    ) -> GremlinQuery:
+        """`g.V(name)`, followed by `.has('ids', partition_key)` when the partition
+        key of the vertex is given, for Cosmos DB to read a single partition"""
+        query = GremlinQuery(f"{self.graph_name}.V({name})", {name: vertex_uuid})
+        if partition_key is not None and self.partition_key is not None:
+            query += GremlinQuery(
+                f".has('{self.partition_key}', partition_key)",
+                {"partition_key": partition_key},
+            )
+        return query
 
-    def _parse_property_as_iterable(self, key, value):
-        return f".property('{key}', '{json.dumps(value)}')"
+    def _property_value(self, key: str, value: Any) -> str:
+        """Value of a property as stored in the database"""
+        if value is None:
+            return ""
+        elif str(key) in ITERABLE_PROPERTIES:
+            return json.dumps(value)
+        elif isinstance(value, list):
+            return json.dumps(value, ensure_ascii=False)
+        return str(value)
 
-    def property_query(self, key: str, value: str | list[str]) -> str:
+    def property_query(
+        self, key: str, value: str | list[str], name: str = "property_0"
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string for setting a property using
-            `.property('key', 'value')`.
+        Generates a Gremlin query for setting a property using
+            `.property('key', name)`.
 
         Args:
             key (str): Name of the property.
             value (str | list[str]): Value of the property (string or list of strings).
+            name (str, optional): Name of the parameter. Defaults to "property_0".
 
         Returns:
-            str: Gremlin query string with `.property('key', 'value')` property setting
-                 step.
+            GremlinQuery: `.property('key', name)` property setting step, with `id`
+                          and `label` as tokens rather than property names.
         """
-        if value is None:
-            return self._parse_property_as_empty(
-                key, value
-            )  #  f".property('{key}', '')"
-        if str(key) == "id":
-            return self._parse_property_as_is(key, value)  #  f".property(id, '{value}')"
-        elif str(key) == "label":
-            return self._parse_property_as_is(
-                key, value
-            )  #  f".property(label, '{value}')"
-        elif str(key) == "description":
-            return self._parse_property_as_multiline_string(
-                key, value
-            )  #  f".property('{key}', '''{value}''')"
-        elif str(key) == "alternatives":
-            return self._parse_property_as_iterable(
-                key, value
-            )  #  f".property('{key}', '{json.dumps(value, ensure_ascii=False)}')"
-        elif str(key) == "tag":
-            return self._parse_property_as_iterable(
-                key, value
-            )  #  f".property('{key}', '{json.dumps(value, ensure_ascii=False)}')"
-        elif str(key) == "probabilities":
-            return self._parse_property_as_iterable(
-                key, value
-            )  #  f".property('{key}', '{json.dumps(value, ensure_ascii=False)}')"
-        elif str(key) == "comments":
-            return self._parse_property_as_iterable(
-                key, value
-            )  #  f".property('{key}', '{json.dumps(value, ensure_ascii=False)}')"
-        elif isinstance(value, list):
-            return f".property('{key}', '{json.dumps(value, ensure_ascii=False)}')"
-        else:
-            return self._parse_property_as_simple_string(
-                key, value
-            )  #  f".property('{key}', '{value}')"
+        return GremlinQuery(
+            self._property_template(key, name), {name: self._property_value(key, value)}
+        )
 
-    def property_dict_query(self, property_dict: dict[str, str]) -> str:
+    def property_dict_query(
+        self, property_dict: dict[str, str], prefix: str = "property"
+    ) -> GremlinQuery:
         """
-        Generates a Gremlin query string for setting multiple properties by
+        Generates a Gremlin query for setting multiple properties by
             concatenating properties as
-        `.property('key1', 'value1').property('key2', 'value2')`.
+        `.property('key1', property_0).property('key2', property_1)`.
 
         Args:
             property_dict (dict[str, str]): Dictionary of property key-value pairs.
+            prefix (str, optional): Prefix of the names of the parameters, to set
+                                    the properties of several elements in one query.
+                                    Defaults to "property".
 
         Returns:
-            str: Gremlin query string with multiple property setting steps.
+            GremlinQuery: multiple property setting steps.
         """
 
-        return "".join([self.property_query(k, v) for k, v in property_dict.items()])
+        return GremlinQuery(
+            self._property_dict_template(tuple(property_dict), prefix),
+            {
+                f"{prefix}_{n}": self._property_value(k, v)
+                for n, (k, v) in enumerate(property_dict.items())
+            },
+        )
+
+    # The templates only depend on the keys of the filters and properties, they are
+    # assembled once per shape of query.
+    @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+    def _filter_template(keys: tuple[str, ...]) -> str:
+        return "".join(f".has('{k}', filter_{n})" for n, k in enumerate(keys))
+
+    @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+    def _property_template(key: str, name: str) -> str:
+        if str(key) in ["id", "label"]:
+            return f".property({key}, {name})"
+        return f".property('{key}', {name})"
+
+    @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+    def _property_dict_template(keys: tuple[str, ...], prefix: str = "property") -> str:
+        return "".join(
+            GremlinStringQueryBuilder._property_template(k, f"{prefix}_{n}")
+            for n, k in enumerate(keys)
+        )
@@ -1,6 +1,9 @@
 import re
 
 from ....models.edge import EdgeResponse
+from .gremlin_responses_vertex import list_adapter
+
+EDGE_PATTERN = re.compile(r"e\[(.+)\]\[(.+)-(.+)->(.+)\]")
 
 
 class GremlinResponseBuilderEdge:
@@ -35,7 +38,7 @@ class GremlinResponseBuilderEdge:
                 "uuid": edge_results["id"],
             }
 
-        match = re.match(r"e\[(.+)\]\[(.+)-(.+)->(.+)\]", str(edge_results))
+        match = EDGE_PATTERN.match(str(edge_results))
         return {
             "id": match.group(1),
             "label": match.group(3),
@@ -66,7 +69,7 @@ class GremlinResponseBuilderEdge:
             EdgeResponse: the response of the Edge
         """
         results_parsed = [self._parse_edge(d) for d in data]
-        return [EdgeResponse.model_validate(e) for e in results_parsed]
+        return list_adapter(EdgeResponse).validate_python(results_parsed)
 
     def build_none(self, data=None) -> None:
         """Build the EdgeResponse when it should only return None"""
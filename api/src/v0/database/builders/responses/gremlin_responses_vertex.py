@@ -1,9 +1,31 @@
 import ast
 import json
+from functools import lru_cache
+from typing import TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import from_json
 
 from ....models.issue import CommentData, ProbabilityData
 from ....models.vertex import VertexResponse
 
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+
+def decode(text: str):
+    """Decode a property stored as JSON (Rust decoder of pydantic-core), falling
+    back to `ast.literal_eval` for legacy properties stored as Python literals"""
+    try:
+        return from_json(text)
+    except ValueError:
+        return ast.literal_eval(text)
+
+
+@lru_cache(maxsize=32)
+def list_adapter(model: type[ResponseModel]) -> TypeAdapter[list[ResponseModel]]:
+    """TypeAdapter validating a whole list of payloads at once, built once per model"""
+    return TypeAdapter(list[model])
+
 
 class FieldParserVertex:
     """Class for parsing the different types of fields existing in the vertices of
@@ -27,10 +49,16 @@ class FieldParserVertex:
     def list(self, data):
         if data:
             if data[0]:
-                return ast.literal_eval(data[0])
+                return decode(data[0])
         else:
             return None
 
+    def json_value(self, data):
+        """JSON property left for the response model to validate"""
+        if data is None or data[0] is None or data[0] in ("", "null"):
+            return None
+        return decode(data[0])
+
     def probability(self, data):
         # default_probability by default. Cannot be empty, but legacy tests...
         if data is None:
@@ -57,7 +85,7 @@ class FieldParserVertex:
         validated_comments = []
         if not isinstance(data, list):
             raise TypeError("The data should be a list")
-        for item in ast.literal_eval(data[0]):
+        for item in decode(data[0]):
             try:
                 item_json = json.dumps(item)
                 validated_comment = CommentData.model_validate_json(
@@ -75,9 +103,33 @@ class FieldParserVertex:
 class GremlinResponseBuilderVertex:
     """
     Class for building vertex data model Responses from a Gremlin payload.
+
+    The payloads are validated straight into the response model of the caller (e.g.
+    IssueResponse), a whole result list at once. Probabilities and comments are then
+    only decoded, and validated by the response model itself.
     """
 
-    def _parse_field(self, data: dict) -> dict:
+    def __init__(self):
+        field_parser = FieldParserVertex()
+        # Mapping of keys to their corresponding parsing functions
+        self._parse_map = {
+            "id": field_parser.id,
+            "label": field_parser.label,
+            "T.id": field_parser.id,
+            "T.label": field_parser.label,
+            "alternatives": field_parser.list,
+            "tag": field_parser.list,
+            "probabilities": field_parser.probability,
+            "comments": field_parser.comments,
+        }
+        self._decode_map = {
+            **self._parse_map,
+            "probabilities": field_parser.json_value,
+            "comments": field_parser.json_value,
+        }
+        self._string = field_parser.string
+
+    def _parse_field(self, data: dict, parse_map: dict | None = None) -> dict:
         """Parse fields of vertices existing in the DataBase
 
         Fields can be:
@@ -90,57 +142,71 @@ class GremlinResponseBuilderVertex:
         """T.id and T.label classes to strings"""  # TODO: add description of what is
         #       expected to be returned
         result_dict = {}
-        field_parser = FieldParserVertex()
-
-        # Mapping of keys to their corresponding parsing functions
-        parse_map = {
-            "T.id": field_parser.id,
-            "T.label": field_parser.label,
-            "alternatives": field_parser.list,
-            "tag": field_parser.list,
-            "probabilities": field_parser.probability,
-            "comments": field_parser.comments,
-        }
+        parse_map = self._parse_map if parse_map is None else parse_map
 
         for key, value in data.items():
             str_key = str(key)
-            if str_key == "id":
-                result_dict[str_key] = parse_map["T.id"](value)
-            elif str_key == "label":
-                result_dict[str_key] = parse_map["T.label"](value)
-            elif str_key in parse_map:
+            if str_key in parse_map:
                 result_dict[str_key] = parse_map[str_key](value)
             elif isinstance(value, list) and len(value) == 1:
-                result_dict[str_key] = field_parser.string(value)
+                result_dict[str_key] = self._string(value)
             else:
                 raise ValueError(f"Parser for field '{str_key}' is not defined")
 
         return result_dict
 
-    def build_item(self, data: list) -> VertexResponse:
+    def build_item(
+        self, data: list, model: type[ResponseModel] = VertexResponse
+    ) -> ResponseModel:
         """Build the VertexResponse from input data (scalar)
 
         Args:
             data (List): data retrieved from the DataBase
+            model (type[ResponseModel], optional): response model to validate the
+                                                   data into. Defaults to
+                                                   VertexResponse.
 
 
         Returns:
-            VertexResponse: the response of the vertex
+            ResponseModel: the response of the vertex
         """
-        results_parsed = self._parse_field(data[0])
-        return VertexResponse.model_validate(results_parsed)
+        return self.build_list(data[:1], model)[0]
 
-    def build_list(self, data: list[list]) -> list[VertexResponse]:
+    def build_list(
+        self, data: list[list], model: type[ResponseModel] = VertexResponse
+    ) -> list[ResponseModel]:
         """Build the VertexResponse from input data (List)
 
         Args:
             data (List): data retrieved from the DataBase
+            model (type[ResponseModel], optional): response model to validate the
+                                                   data into. Defaults to
+                                                   VertexResponse.
 
         Returns:
-            VertexResponse: the response of the vertex
+            list[ResponseModel]: the responses of the vertices
+
+        Raises:
+            TypeError: a probability or a comment is not in its data format
         """
-        results_parsed = [self._parse_field(item) for item in data]
-        return [VertexResponse.model_validate(v) for v in results_parsed]
+        # VertexResponse allows any extra field: probabilities and comments are only
+        # validated when parsed
+        parse_map = self._parse_map if model is VertexResponse else self._decode_map
+        results_parsed = [self._parse_field(item, parse_map) for item in data]
+        try:
+            return list_adapter(model).validate_python(results_parsed)
+        except ValidationError as e:
+            # Same errors as the FieldParserVertex for the decoded properties
+            fields = {error["loc"][1] for error in e.errors() if len(error["loc"]) > 1}
+            if "probabilities" in fields:
+                raise TypeError(
+                    "Probability in DataBase is not in a ProbabilityData format"
+                ) from e
+            if "comments" in fields:
+                raise TypeError(
+                    "Comment in DataBase is not in a CommentData format"
+                ) from e
+            raise
 
     def build_none(self, data=None) -> None:
         """Build the VertexResponse when it should only return None"""
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from functools import wraps
 
@@ -13,6 +14,17 @@ def catch_query_errors(func):
     return wrapper
 
 
+def catch_async_query_errors(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            raise Exception(f"Error {e}: {args}, {kwargs}")
+
+    return wrapper
+
+
 class QueryABC(ABC):
     """
     This is defined as an Abstract class (although without abstract method) as we are
@@ -47,8 +59,9 @@ class BuilderABC(ABC):
 
 
 class DatabaseClient(ABC):
-    def __init__(self, connection):
+    def __init__(self, connection, pool=None):
         self.connection = connection
+        self._pool = pool  # application-lifetime ConnectionPool, if any
         self._session = None
         self._client = None
         self.builder = None
@@ -62,5 +75,62 @@ class DatabaseClient(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def execute_query(self, query, params=None):
+    def execute_query(self, query, params=None, idempotent=False):
+        """Submit a Gremlin script
+
+        Args:
+            query (str): Gremlin script
+            params (dict, optional): values of the parameters of the script.
+                Defaults to None.
+            idempotent (bool, optional): whether the query can safely run twice
+                (reads, updates and drops by id), and so be retried on a new
+                connection when its connection broke. Defaults to False: a write
+                may have been applied before the connection broke.
+        """
+        raise NotImplementedError
+
+
+class AsyncDatabaseClient(ABC):
+    """asyncio counterpart of DatabaseClient
+
+    Queries are awaited instead of blocking a thread, and the query/response builders
+    are the same as the ones of the synchronous client.
+
+    `async with client` blocks may be nested and run concurrently (e.g. in
+    `asyncio.gather`): the client connects when the first block is entered and
+    closes when the last one is exited.
+    """
+
+    def __init__(self, connection, pool=None):
+        self.connection = connection
+        self._pool = pool  # application-lifetime ConnectionPool, if any
+        self._session = None
+        self._client = None
+        self.builder = None
+        self._users = 0
+        self._connecting = asyncio.Lock()
+
+    @abstractmethod
+    async def connect(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self):
         raise NotImplementedError
+
+    @abstractmethod
+    async def execute_query(self, query, params=None, idempotent=False):
+        """See DatabaseClient.execute_query"""
+        raise NotImplementedError
+
+    async def __aenter__(self):
+        async with self._connecting:
+            if self._users == 0:
+                await self.connect()
+            self._users += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._users -= 1
+        if self._users == 0:
+            await self.close()
@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import nullcontext
+
 from azure.cosmos.aio import CosmosClient
 from gremlin_python.driver import client, serializer
 
@@ -9,6 +12,7 @@ from ..database.builders.queries.gremlin_queries_edge import (
 from ..database.builders.queries.gremlin_queries_vertex import (
     GremlinStringQueryBuilderVertex,
 )
+from ..database.builders.queries.query_builder import PARTITION_KEY
 from ..database.builders.responses.gremlin_responses_edge import (
     GremlinResponseBuilderEdge,
 )
@@ -16,19 +20,24 @@ from ..database.builders.responses.gremlin_responses_vertex import (
     GremlinResponseBuilderVertex,
 )
 from ..database.client import (
+    AsyncDatabaseClient,
     BuilderABC,
     DatabaseClient,
     QueryABC,
     ResponseABC,
+    catch_async_query_errors,
     catch_query_errors,
 )
+from ..database.pool import ConnectionPool, is_connection_error
 
 
 class Query(QueryABC):
     def __init__(self):
         super().__init__()
-        self.vertex = GremlinStringQueryBuilderVertex()
-        self.edge = GremlinStringQueryBuilderEdge()
+        # data not migrated yet is read without filtering on the partition key
+        partition_key = PARTITION_KEY if settings.DB_PARTITIONED else None
+        self.vertex = GremlinStringQueryBuilderVertex(partition_key=partition_key)
+        self.edge = GremlinStringQueryBuilderEdge(partition_key=partition_key)
 
 
 class Response(ResponseABC):
@@ -46,8 +55,10 @@ class Builder(BuilderABC):
 
 
 class AzureCosmosClient(DatabaseClient):
-    def __init__(self, connection, credential, database_name):
-        super().__init__(connection)
+    def __init__(
+        self, connection, credential, database_name, pool: ConnectionPool = None
+    ):
+        super().__init__(connection, pool)
         self.credential = credential  # primary key from Secret
         self.database_name = database_name  # settings.DATABASE_NAME
         self.database_container = settings.COSMOS_CONTAINER
@@ -56,26 +67,30 @@ class AzureCosmosClient(DatabaseClient):
         self.builder = Builder()
 
     def connect(self):
+        if self._pool is not None:
+            self._gremlin_client = self._pool.acquire()
+            return
         self._client = CosmosClient(self.connection, self.credential)
         # self._graph = \
         #   self._client.get_database_client(self.database_name)\
         #   .get_graph(self.graph_name)
         # db = self._client.get_database_client(self.database_name)
         # container = db.get_container_client(self.database_container)
-        self._gremlin_client = client.Client(
-            self.connection,
-            traversal_source="g",
-            username=f"/dbs/{self.database_name}/colls/{self.database_container}",
-            password=self.credential,
-            message_serializer=serializer.GraphSONSerializersV2d0(),
+        self._gremlin_client = gremlin_client(
+            self.connection, self.database_name, self.database_container, self.credential
         )
 
     def close(self):
-        if self._gremlin_client:
+        if self._pool is not None:
+            # the connections stay open in the pool for the next request
+            if self._gremlin_client:
+                self._pool.release(self._gremlin_client)
+            self._gremlin_client = None
+        elif self._gremlin_client:
             self._gremlin_client.close()
 
     @catch_query_errors
-    def execute_query(self, query, params=None):
+    def execute_query(self, query, params=None, idempotent=False):
         # this should be the gremlin python client
         """self._gremlin_client = client.Client(
             self.connection,
@@ -88,8 +103,22 @@ class AzureCosmosClient(DatabaseClient):
         if not self._gremlin_client:
             raise ConnectionError("Not connected to the Azure CosmosDB Server.")
 
+        try:
+            return self._submit(query, params)
+        except Exception as e:
+            if self._pool is None or not is_connection_error(e):
+                raise
+            # replace the broken connections, and retry once the queries which can
+            # safely run twice: a write may have been applied before the failure
+            self._pool.invalidate(self._gremlin_client)
+            self._gremlin_client = self._pool.acquire()
+            if not idempotent:
+                raise
+            return self._submit(query, params)
+
+    def _submit(self, query, params=None):
         if params:
-            results = self._gremlin_client.submit(query, **params).all().result()
+            results = self._gremlin_client.submit(query, bindings=params).all().result()
         else:
             results = self._gremlin_client.submit(query).all().result()
 
@@ -103,9 +132,117 @@ class AzureCosmosClient(DatabaseClient):
         self.close()
 
 
+class AsyncAzureCosmosClient(AsyncDatabaseClient):
+    def __init__(
+        self, connection, credential, database_name, pool: ConnectionPool = None
+    ):
+        super().__init__(connection, pool)
+        self.credential = credential  # primary key from Secret
+        self.database_name = database_name  # settings.DATABASE_NAME
+        self.database_container = settings.COSMOS_CONTAINER
+        self._gremlin_client = None
+        self.builder = Builder()
+
+    async def connect(self):
+        if self._pool is not None:
+            # acquiring may health check the connections: keep it off the event loop
+            self._gremlin_client = await asyncio.to_thread(self._pool.acquire)
+        else:
+            self._gremlin_client = gremlin_client(
+                self.connection,
+                self.database_name,
+                self.database_container,
+                self.credential,
+            )
+
+    async def close(self):
+        if self._pool is not None:
+            # the connections stay open in the pool for the next request
+            if self._gremlin_client:
+                self._pool.release(self._gremlin_client)
+            self._gremlin_client = None
+        elif self._gremlin_client:
+            await asyncio.to_thread(self._gremlin_client.close)
+
+    @catch_async_query_errors
+    async def execute_query(self, query, params=None, idempotent=False):
+        if not self._gremlin_client:
+            raise ConnectionError("Not connected to the Azure CosmosDB Server.")
+
+        try:
+            return await self._submit(query, params)
+        except Exception as e:
+            if self._pool is None or not is_connection_error(e):
+                raise
+            # replace the broken connections, and retry once the queries which can
+            # safely run twice: a write may have been applied before the failure
+            self._pool.invalidate(self._gremlin_client)
+            self._gremlin_client = await asyncio.to_thread(self._pool.acquire)
+            if not idempotent:
+                raise
+            return await self._submit(query, params)
+
+    async def _submit(self, query, params=None):
+        async with self._pool.slots if self._pool is not None else nullcontext():
+            if params:
+                future = self._gremlin_client.submit_async(query, bindings=params)
+            else:
+                future = self._gremlin_client.submit_async(query)
+            result_set = await asyncio.wrap_future(future)
+            results = await asyncio.wrap_future(result_set.all())
+
+        return results
+
+
+def gremlin_client(connection, database_name, database_container, credential, **kwargs):
+    return client.Client(
+        connection,
+        traversal_source="g",
+        username=f"/dbs/{database_name}/colls/{database_container}",
+        password=credential,
+        message_serializer=serializer.GraphSONSerializersV2d0(),
+        **kwargs,
+    )
+
+
+pool = ConnectionPool(
+    lambda: gremlin_client(
+        settings.DATABASE_CONNECTION,
+        settings.COSMOS_DB_NAME,
+        settings.COSMOS_CONTAINER,
+        settings.DB_PRIMARY_KEY,
+        pool_size=settings.DB_POOL_SIZE,
+    ),
+    health_check_interval=settings.DB_POOL_HEALTH_CHECK_INTERVAL,
+)
+# the event loop gets its own connections, so that it never waits for the ones
+# borrowed by the threads serving the synchronous routes
+async_pool = ConnectionPool(
+    lambda: gremlin_client(
+        settings.DATABASE_CONNECTION,
+        settings.COSMOS_DB_NAME,
+        settings.COSMOS_CONTAINER,
+        settings.DB_PRIMARY_KEY,
+        pool_size=settings.DB_POOL_SIZE,
+    ),
+    health_check_interval=settings.DB_POOL_HEALTH_CHECK_INTERVAL,
+    size=settings.DB_POOL_SIZE,
+)
+
+
 def get_client():
     return AzureCosmosClient(
         settings.DATABASE_CONNECTION,
         credential=settings.DB_PRIMARY_KEY,
         database_name=settings.COSMOS_DB_NAME,
+        pool=pool,
+    )
+
+
+def get_async_client():
+    return AsyncAzureCosmosClient(
+        settings.DATABASE_CONNECTION,
+        credential=settings.DB_PRIMARY_KEY,
+        database_name=settings.COSMOS_DB_NAME,
+        pool=async_pool,
     )
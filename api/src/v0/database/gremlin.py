@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import nullcontext
+
 from gremlin_python.driver import client
 
 from config import settings
@@ -8,6 +11,7 @@ from ..database.builders.queries.gremlin_queries_edge import (
 from ..database.builders.queries.gremlin_queries_vertex import (
     GremlinStringQueryBuilderVertex,
 )
+from ..database.builders.queries.query_builder import PARTITION_KEY
 from ..database.builders.responses.gremlin_responses_edge import (
     GremlinResponseBuilderEdge,
 )
@@ -15,19 +19,24 @@ from ..database.builders.responses.gremlin_responses_vertex import (
     GremlinResponseBuilderVertex,
 )
 from ..database.client import (
+    AsyncDatabaseClient,
     BuilderABC,
     DatabaseClient,
     QueryABC,
     ResponseABC,
+    catch_async_query_errors,
     catch_query_errors,
 )
+from ..database.pool import ConnectionPool, is_connection_error
 
 
 class Query(QueryABC):
     def __init__(self):
         super().__init__()
-        self.vertex = GremlinStringQueryBuilderVertex()
-        self.edge = GremlinStringQueryBuilderEdge()
+        # data not migrated yet is read without filtering on the partition key
+        partition_key = PARTITION_KEY if settings.DB_PARTITIONED else None
+        self.vertex = GremlinStringQueryBuilderVertex(partition_key=partition_key)
+        self.edge = GremlinStringQueryBuilderEdge(partition_key=partition_key)
 
 
 class Response(ResponseABC):
@@ -45,25 +54,47 @@ class Builder(BuilderABC):
 
 
 class GremlinClient(DatabaseClient):
-    def __init__(self, connection, graph_name="g"):
-        super().__init__(connection)
+    def __init__(self, connection, graph_name="g", pool: ConnectionPool = None):
+        super().__init__(connection, pool)
         self.graph_name = graph_name
         self.builder = Builder()
 
     def connect(self):
-        self._client = client.Client(self.connection, self.graph_name)
+        if self._pool is not None:
+            self._client = self._pool.acquire()
+        else:
+            self._client = client.Client(self.connection, self.graph_name)
 
     def close(self):
-        if self._client:
+        if self._pool is not None:
+            # the connections stay open in the pool for the next request
+            if self._client:
+                self._pool.release(self._client)
+            self._client = None
+        elif self._client:
             self._client.close()
 
     @catch_query_errors
-    def execute_query(self, query, params=None):
+    def execute_query(self, query, params=None, idempotent=False):
         if not self._client:
             raise ConnectionError("Not connected to the Gremlin Server.")
 
+        try:
+            return self._submit(query, params)
+        except Exception as e:
+            if self._pool is None or not is_connection_error(e):
+                raise
+            # replace the broken connections, and retry once the queries which can
+            # safely run twice: a write may have been applied before the failure
+            self._pool.invalidate(self._client)
+            self._client = self._pool.acquire()
+            if not idempotent:
+                raise
+            return self._submit(query, params)
+
+    def _submit(self, query, params=None):
         if params:
-            results = self._client.submit(query, **params).all().result()
+            results = self._client.submit(query, bindings=params).all().result()
         else:
             results = self._client.submit(query).all().result()
 
@@ -77,5 +108,78 @@ class GremlinClient(DatabaseClient):
         self.close()
 
 
+class AsyncGremlinClient(AsyncDatabaseClient):
+    def __init__(self, connection, graph_name="g", pool: ConnectionPool = None):
+        super().__init__(connection, pool)
+        self.graph_name = graph_name
+        self.builder = Builder()
+
+    async def connect(self):
+        if self._pool is not None:
+            # acquiring may health check the connections: keep it off the event loop
+            self._client = await asyncio.to_thread(self._pool.acquire)
+        else:
+            self._client = client.Client(self.connection, self.graph_name)
+
+    async def close(self):
+        if self._pool is not None:
+            # the connections stay open in the pool for the next request
+            if self._client:
+                self._pool.release(self._client)
+            self._client = None
+        elif self._client:
+            await asyncio.to_thread(self._client.close)
+
+    @catch_async_query_errors
+    async def execute_query(self, query, params=None, idempotent=False):
+        if not self._client:
+            raise ConnectionError("Not connected to the Gremlin Server.")
+
+        try:
+            return await self._submit(query, params)
+        except Exception as e:
+            if self._pool is None or not is_connection_error(e):
+                raise
+            # replace the broken connections, and retry once the queries which can
+            # safely run twice: a write may have been applied before the failure
+            self._pool.invalidate(self._client)
+            self._client = await asyncio.to_thread(self._pool.acquire)
+            if not idempotent:
+                raise
+            return await self._submit(query, params)
+
+    async def _submit(self, query, params=None):
+        async with self._pool.slots if self._pool is not None else nullcontext():
+            if params:
+                future = self._client.submit_async(query, bindings=params)
+            else:
+                future = self._client.submit_async(query)
+            result_set = await asyncio.wrap_future(future)
+            results = await asyncio.wrap_future(result_set.all())
+
+        return results
+
+
+pool = ConnectionPool(
+    lambda: client.Client(
+        settings.DATABASE_CONNECTION, "g", pool_size=settings.DB_POOL_SIZE
+    ),
+    health_check_interval=settings.DB_POOL_HEALTH_CHECK_INTERVAL,
+)
+# the event loop gets its own connections, so that it never waits for the ones
+# borrowed by the threads serving the synchronous routes
+async_pool = ConnectionPool(
+    lambda: client.Client(
+        settings.DATABASE_CONNECTION, "g", pool_size=settings.DB_POOL_SIZE
+    ),
+    health_check_interval=settings.DB_POOL_HEALTH_CHECK_INTERVAL,
+    size=settings.DB_POOL_SIZE,
+)
+
+
 def get_client():
-    return GremlinClient(settings.DATABASE_CONNECTION)
+    return GremlinClient(settings.DATABASE_CONNECTION, pool=pool)
+
+
+def get_async_client():
+    return AsyncGremlinClient(settings.DATABASE_CONNECTION, pool=async_pool)
@@ -0,0 +1,607 @@
+import json
+import re
+import threading
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from config import settings
+
+from ..database.builders.queries.query_builder import TEMPLATE_CACHE_SIZE
+from ..database.client import (
+    AsyncDatabaseClient,
+    DatabaseClient,
+    catch_async_query_errors,
+    catch_query_errors,
+)
+from ..database.gremlin import Builder
+
+TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<string>'(?:[^'\\]|\\.)*')|(?P<number>-?\d+)"
+    r"|(?P<name>[A-Za-z_]\w*)|(?P<symbol>[.(),\[\]]))"
+)
+TOKENS: dict[str, str] = {"id": "T.id", "label": "T.label", "local": "local"}
+"""Gremlin tokens used as arguments of the steps, e.g. `property(id, vertex_id)`"""
+ANONYMOUS_STEPS: tuple[str, ...] = ("and", "or", "not")
+"""Steps which may start an anonymous traversal without `__.`, e.g. `where(and(...))`"""
+
+
+@dataclass(eq=False)
+class _Vertex:
+    id: str
+    label: str
+    properties: dict[str, Any] = field(default_factory=dict)
+    out_e: dict[str, dict["_Edge", None]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
+    in_e: dict[str, dict["_Edge", None]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
+
+
+@dataclass(eq=False)
+class _Edge:
+    id: str
+    label: str
+    out_v: _Vertex
+    in_v: _Vertex
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _Traversal:
+    start: str
+    steps: tuple[tuple[str, tuple], ...]
+
+
+@dataclass(frozen=True)
+class _Within:
+    values: tuple
+
+
+class MemoryGraph:
+    """
+    In-process graph evaluating the Gremlin scripts emitted by the query builders.
+
+    Only the steps used by GremlinStringQueryBuilderVertex and
+    GremlinStringQueryBuilderEdge are supported. The vertices and edges are kept in
+    dictionaries with their adjacency (by edge label) and indexed by label and by
+    property value, and results have the shapes returned by Gremlin Server (valueMaps
+    for vertices, maps with id, label, outV and inV for edges), so that the responses
+    are built by the same GremlinResponseBuilder classes.
+
+    Each query is evaluated atomically, under a lock.
+    """
+
+    def __init__(self):
+        self.vertices: dict[str, _Vertex] = {}
+        self.edges: dict[str, _Edge] = {}
+        self._vertex_labels: dict[str, dict[_Vertex, None]] = defaultdict(dict)
+        self._edge_labels: dict[str, dict[_Edge, None]] = defaultdict(dict)
+        self._vertex_properties: dict[tuple[str, Any], dict[_Vertex, None]] = (
+            defaultdict(dict)
+        )
+        self._lock = threading.RLock()
+
+    def load_graphson(self, path: str) -> "MemoryGraph":
+        """Load the vertices and edges of a GraphSON adjacency list file
+
+        Args:
+            path (str): file with a vertex (and its outgoing edges) per line, as
+                        written by `g.io(path).write()`, e.g. db/data/dot_graph.graphson
+
+        Returns:
+            MemoryGraph: the graph itself
+        """
+        with open(path) as file:
+            lines = [json.loads(line) for line in file if line.strip()]
+        with self._lock:
+            for line in lines:
+                vertex = self.add_vertex(line["label"], line["id"])
+                for key, values in line.get("properties", {}).items():
+                    self.set_property(vertex, key, values[0]["value"])
+            for line in lines:
+                for label, edges in line.get("outE", {}).items():
+                    for edge in edges:
+                        self.add_edge(
+                            label,
+                            self.vertices[line["id"]],
+                            self.vertices[edge["inV"]],
+                            edge["id"],
+                            edge.get("properties", {}),
+                        )
+        return self
+
+    def add_vertex(self, label: str, vertex_id: str | None = None) -> _Vertex:
+        vertex = _Vertex(vertex_id or str(uuid.uuid4()), label)
+        self._check_id(self.vertices, vertex.id)
+        self.vertices[vertex.id] = vertex
+        self._vertex_labels[label][vertex] = None
+        return vertex
+
+    def add_edge(
+        self,
+        label: str,
+        out_vertex: _Vertex,
+        in_vertex: _Vertex,
+        edge_id: str | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> _Edge:
+        edge = _Edge(
+            edge_id or str(uuid.uuid4()), label, out_vertex, in_vertex, properties or {}
+        )
+        self._check_id(self.edges, edge.id)
+        self.edges[edge.id] = edge
+        self._edge_labels[label][edge] = None
+        out_vertex.out_e[label][edge] = None
+        in_vertex.in_e[label][edge] = None
+        return edge
+
+    def set_property(self, element: _Vertex | _Edge, key: str, value: Any) -> None:
+        if key == TOKENS["id"]:
+            elements = self.vertices if isinstance(element, _Vertex) else self.edges
+            self._check_id(elements, value)
+            elements[value] = elements.pop(element.id)
+            element.id = value
+            return
+        if isinstance(element, _Vertex):
+            self._unindex(element, key)
+            self._vertex_properties[(key, value)][element] = None
+        element.properties[key] = value
+
+    def remove(self, element: _Vertex | _Edge) -> None:
+        if isinstance(element, _Edge):
+            if self.edges.pop(element.id, None) is not None:
+                del self._edge_labels[element.label][element]
+                del element.out_v.out_e[element.label][element]
+                del element.in_v.in_e[element.label][element]
+            return
+        if self.vertices.pop(element.id, None) is not None:
+            for edge in [*self._incident(element, "out"), *self._incident(element)]:
+                self.remove(edge)
+            del self._vertex_labels[element.label][element]
+            for key in element.properties:
+                self._unindex(element, key)
+
+    def execute(self, query: str, params: dict[str, Any] | None = None) -> list:
+        """Evaluate a Gremlin script
+
+        Args:
+            query (str): Gremlin script, e.g. `g.V(vertex_uuid).valueMap(true)`
+            params (dict[str, Any] | None): values of the parameters of the script
+
+        Returns:
+            list: results, with vertices and edges serialized as by Gremlin Server
+        """
+        expression = _parse(query)
+        with self._lock:
+            if isinstance(expression, list):  # e.g. `[g.E(edge_id).property(...)]`
+                results = [
+                    r for e in expression for r in self._run_script(e, params or {})
+                ]
+            else:
+                results = self._run_script(expression, params or {})
+            return [self._payload(r) for r in results]
+
+    def _run_script(self, expression, params: dict[str, Any]) -> list:
+        traversal = _Evaluator(params).value(expression)
+        if not isinstance(traversal, _Traversal) or traversal.start != "g":
+            raise ValueError(f"Not a traversal of the graph: {expression}")
+        return _Run(self, {}).steps(traversal.steps, [None])
+
+    def _check_id(self, elements: dict, element_id: str) -> None:
+        if element_id in elements:
+            raise ValueError(f"An element with id {element_id} already exists")
+
+    def _unindex(self, vertex: _Vertex, key: str) -> None:
+        if key in vertex.properties:
+            index = self._vertex_properties[(key, vertex.properties[key])]
+            index.pop(vertex, None)
+
+    def _incident(self, vertex: _Vertex, direction: str = "in", labels=()) -> list:
+        edges = vertex.out_e if direction == "out" else vertex.in_e
+        return [e for label in labels or list(edges) for e in edges.get(label, ())]
+
+    def _payload(self, result: Any) -> Any:
+        if isinstance(result, _Vertex):
+            return {"id": result.id, "label": result.label}
+        if isinstance(result, _Edge):
+            return {
+                "id": result.id,
+                "label": result.label,
+                "outV": result.out_v.id,
+                "inV": result.in_v.id,
+            }
+        if isinstance(result, dict):
+            return {k: self._payload(v) for k, v in result.items()}
+        if isinstance(result, list):
+            return [self._payload(r) for r in result]
+        return result
+
+
+class _Parser:
+    """Parser of a Gremlin script into nested tuples
+
+    `("traversal", start, steps)`, `("call", name, args)`, `("name", name)` and
+    `("value", value)` nodes, and lists for `[...]`.
+    """
+
+    def __init__(self, query: str):
+        self.tokens: list[tuple[str, str]] = []
+        position, query = 0, query.rstrip()
+        while position < len(query):
+            match = TOKEN_PATTERN.match(query, position)
+            if match is None:
+                raise ValueError(f"Unexpected character in query: {query[position:]}")
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self.position = 0
+
+    def parse(self):
+        expression = self._expression()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected token {self.tokens[self.position][1]}")
+        return expression
+
+    def _next(self, expected: str | None = None) -> tuple[str, str]:
+        if self.position == len(self.tokens):
+            raise ValueError("Unexpected end of query")
+        token = self.tokens[self.position]
+        if expected is not None and token[1] != expected:
+            raise ValueError(f"Expected {expected}, got {token[1]}")
+        self.position += 1
+        return token
+
+    def _peek(self) -> str | None:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][1]
+        return None
+
+    def _arguments(self, closing: str) -> list:
+        arguments = []
+        while self._peek() != closing:
+            arguments.append(self._expression())
+            if self._peek() == ",":
+                self._next()
+        self._next(closing)
+        return arguments
+
+    def _expression(self):
+        kind, text = self._next()
+        if text == "[":
+            return self._arguments("]")
+        if kind == "string":
+            return ("value", re.sub(r"\\(.)", r"\1", text[1:-1]))
+        if kind == "number":
+            return ("value", int(text))
+        if kind != "name":
+            raise ValueError(f"Unexpected text {text}")
+        steps = []
+        if self._peek() == "(":
+            self._next()
+            arguments = self._arguments(")")
+            if text not in ANONYMOUS_STEPS:
+                return ("call", text, arguments)
+            steps.append((text, arguments))
+            text = "__"
+        elif text not in ("g", "__"):
+            return ("name", text)
+        while self._peek() == ".":
+            self._next()
+            step = self._next()[1]
+            self._next("(")
+            steps.append((step, self._arguments(")")))
+        return ("traversal", text, steps)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse(query: str):
+    """Parse each template once, as the script cache of Gremlin Server"""
+    return _Parser(query).parse()
+
+
+class _Evaluator:
+    """Resolution of the arguments of the steps (parameters, tokens, predicates)"""
+
+    def __init__(self, params: dict[str, Any]):
+        self.params = params
+
+    def value(self, expression):
+        if isinstance(expression, list):
+            return [self.value(e) for e in expression]
+        kind = expression[0]
+        if kind == "value":
+            return expression[1]
+        if kind == "name":
+            name = expression[1]
+            if name in TOKENS:
+                return TOKENS[name]
+            if name == "true":
+                return True
+            return self.params[name]
+        if kind == "call":
+            if expression[1] != "within":
+                raise ValueError(f"Unsupported predicate {expression[1]}")
+            values = [self.value(a) for a in expression[2]]
+            if len(values) == 1 and isinstance(values[0], list):
+                values = values[0]
+            return _Within(tuple(values))
+        return _Traversal(
+            expression[1],
+            tuple(
+                (name, tuple(self.value(a) for a in args))
+                for name, args in expression[2]
+            ),
+        )
+
+
+class _Run:
+    """Eager evaluation of the steps of a traversal on a list of traversers"""
+
+    def __init__(self, graph: MemoryGraph, side_effects: dict[str, list]):
+        self.graph = graph
+        self.side_effects = side_effects
+
+    def steps(self, steps: tuple[tuple[str, tuple], ...], traversers: list) -> list:
+        position = 0
+        while position < len(steps):
+            name, args = steps[position]
+            position += 1
+            modulators = []
+            while position < len(steps) and steps[position][0] in ("by", "to"):
+                modulators.append(steps[position][1])
+                position += 1
+            step = getattr(self, f"_{name}", None)
+            if step is None:
+                raise ValueError(f"Unsupported Gremlin step {name}")
+            if name in ("addE", "project"):
+                traversers = step(traversers, modulators, *args)
+            elif name in ("V", "E") and not args and position < len(steps):
+                # the vertices or edges are looked up in the indexes of the filter
+                traversers = step(traversers, following=steps[position])
+            else:
+                traversers = step(traversers, *args)
+        return traversers
+
+    def sub(self, traversal: _Traversal, traverser: Any) -> list:
+        return self.steps(traversal.steps, [traverser])
+
+    def _test(self, value: Any, condition: Any) -> bool:
+        if isinstance(condition, _Within):
+            return value in condition.values
+        return value == condition
+
+    # start and mid-traversal steps
+
+    def _V(self, traversers, *ids, following=("", ())):
+        name, args = following
+        if ids:
+            vertices = [self.graph.vertices[i] for i in ids if i in self.graph.vertices]
+        elif name == "hasLabel":
+            vertices = [v for label in args for v in self.graph._vertex_labels[label]]
+        elif name == "has" and len(args) == 2:
+            key, condition = args
+            values = condition.values if isinstance(condition, _Within) else [condition]
+            vertices = [
+                v
+                for value in values
+                for v in self.graph._vertex_properties[(key, value)]
+            ]
+        else:
+            vertices = list(self.graph.vertices.values())
+        return [v for _ in traversers for v in vertices]
+
+    def _E(self, traversers, *ids, following=("", ())):
+        name, args = following
+        if ids:
+            edges = [self.graph.edges[i] for i in ids if i in self.graph.edges]
+        elif name == "hasLabel":
+            edges = [e for label in args for e in self.graph._edge_labels[label]]
+        else:
+            edges = list(self.graph.edges.values())
+        return [e for _ in traversers for e in edges]
+
+    def _addV(self, traversers, label):
+        return [self.graph.add_vertex(label) for _ in traversers]
+
+    def _inject(self, traversers, *values):
+        return [v for _ in traversers for v in values]
+
+    def _addE(self, traversers, modulators, label):
+        (to,) = modulators
+        # no edge, and no traverser, when the incoming vertex is missing
+        return [
+            self.graph.add_edge(label, t, in_vertex)
+            for t in traversers
+            for in_vertex in self.sub(to[0], t)[:1]
+        ]
+
+    def _property(self, traversers, key, value):
+        for traverser in traversers:
+            self.graph.set_property(traverser, key, value)
+        return traversers
+
+    def _drop(self, traversers):
+        for traverser in traversers:
+            self.graph.remove(traverser)
+        return []
+
+    # navigation
+
+    def _out(self, traversers, *labels):
+        return [e.in_v for e in self._outE(traversers, *labels)]
+
+    def _in(self, traversers, *labels):
+        return [e.out_v for e in self._inE(traversers, *labels)]
+
+    def _outE(self, traversers, *labels):
+        return [e for t in traversers for e in self.graph._incident(t, "out", labels)]
+
+    def _inE(self, traversers, *labels):
+        return [e for t in traversers for e in self.graph._incident(t, "in", labels)]
+
+    def _bothE(self, traversers, *labels):
+        return self._outE(traversers, *labels) + self._inE(traversers, *labels)
+
+    def _inV(self, traversers):
+        return [t.in_v for t in traversers]
+
+    def _outV(self, traversers):
+        return [t.out_v for t in traversers]
+
+    # filters
+
+    def _hasLabel(self, traversers, *labels):
+        return [t for t in traversers if t.label in labels]
+
+    def _has(self, traversers, key, condition):
+        return [
+            t
+            for t in traversers
+            if key in t.properties and self._test(t.properties[key], condition)
+        ]
+
+    def _and(self, traversers, *traversals):
+        return [t for t in traversers if all(self.sub(s, t) for s in traversals)]
+
+    def _or(self, traversers, *traversals):
+        return [t for t in traversers if any(self.sub(s, t) for s in traversals)]
+
+    def _not(self, traversers, traversal):
+        return [t for t in traversers if not self.sub(traversal, t)]
+
+    def _where(self, traversers, condition):
+        if isinstance(condition, _Traversal):
+            return [t for t in traversers if self.sub(condition, t)]
+        # `where(within('key'))`: the traverser belongs to an aggregated side effect
+        members = {id(m) for key in condition.values for m in self.side_effects[key]}
+        return [t for t in traversers if id(t) in members]
+
+    def _dedup(self, traversers):
+        return list(dict.fromkeys(traversers))
+
+    def _limit(self, traversers, limit):
+        return traversers[:limit]
+
+    # barriers and maps
+
+    def _aggregate(self, traversers, key):
+        self.side_effects.setdefault(key, []).extend(traversers)
+        return traversers
+
+    def _fold(self, traversers):
+        return [list(traversers)]
+
+    def _unfold(self, traversers):
+        return [u for t in traversers for u in (t if isinstance(t, list) else [t])]
+
+    def _count(self, traversers, *scope):
+        if scope:
+            return [len(t) for t in traversers]
+        return [len(traversers)]
+
+    def _sideEffect(self, traversers, traversal):
+        for traverser in traversers:
+            self.sub(traversal, traverser)
+        return traversers
+
+    def _union(self, traversers, *traversals):
+        return [r for t in traversers for s in traversals for r in self.sub(s, t)]
+
+    def _project(self, traversers, modulators, *keys):
+        results = []
+        for traverser in traversers:
+            projection = {}
+            for n, key in enumerate(keys):
+                by = modulators[n % len(modulators)] if modulators else ()
+                values = self.sub(by[0], traverser) if by else [traverser]
+                if values:
+                    projection[key] = values[0]
+            results.append(projection)
+        return results
+
+    def _valueMap(self, traversers, *tokens):
+        results = []
+        for t in traversers:
+            if isinstance(t, _Vertex):
+                value_map = {k: [v] for k, v in t.properties.items()}
+            else:
+                value_map = dict(t.properties)
+            if tokens and tokens[0] is True:
+                value_map = {TOKENS["id"]: t.id, TOKENS["label"]: t.label, **value_map}
+            results.append(value_map)
+        return results
+
+
+class InMemoryDatabaseClient(DatabaseClient):
+    """DatabaseClient evaluating the queries on an in-process MemoryGraph
+
+    No network nor server is involved, e.g. for benchmarks and local runs without a
+    database (APP_ENVIRONMENT containing "memory").
+    """
+
+    def __init__(self, connection: MemoryGraph, graph_name="g"):
+        super().__init__(connection)
+        self.graph_name = graph_name
+        self.builder = Builder()
+
+    def connect(self):
+        self._client = self.connection
+
+    def close(self):
+        self._client = None
+
+    @catch_query_errors
+    def execute_query(self, query, params=None, idempotent=False):
+        if not self._client:
+            raise ConnectionError("Not connected to the in-memory graph.")
+
+        return self._client.execute(query, params)
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncInMemoryDatabaseClient(AsyncDatabaseClient):
+    """See InMemoryDatabaseClient"""
+
+    def __init__(self, connection: MemoryGraph, graph_name="g"):
+        super().__init__(connection)
+        self.graph_name = graph_name
+        self.builder = Builder()
+
+    async def connect(self):
+        self._client = self.connection
+
+    async def close(self):
+        self._client = None
+
+    @catch_async_query_errors
+    async def execute_query(self, query, params=None, idempotent=False):
+        if not self._client:
+            raise ConnectionError("Not connected to the in-memory graph.")
+
+        return self._client.execute(query, params)
+
+
+@lru_cache(maxsize=1)
+def get_graph() -> MemoryGraph:
+    """Graph shared by all the clients, seeded from settings.DB_MEMORY_SEED if set"""
+    graph = MemoryGraph()
+    if settings.DB_MEMORY_SEED:
+        graph.load_graphson(settings.DB_MEMORY_SEED)
+    return graph
+
+
+def get_client():
+    return InMemoryDatabaseClient(get_graph())
+
+
+def get_async_client():
+    return AsyncInMemoryDatabaseClient(get_graph())
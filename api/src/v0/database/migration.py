@@ -0,0 +1,257 @@
+"""Move the vertices of each project into the partition of the project
+
+The partition key ("ids") of the vertices used to be the constant "test", so that
+Cosmos DB stored the whole graph in a single logical partition. A project and the
+vertices it contains now share the uuid of the project as partition key.
+
+The partition key of a vertex cannot be changed in place: the projects are migrated
+one at a time, by reading their subgraph, writing it to a checkpoint file, dropping
+its vertices (and so all their edges) and creating them again, with the same ids, in
+the partition of the project, `--batch-size` vertices or edges per query. Every edge
+of the vertices of the project is exported and created again, with its properties,
+including the edges to vertices of other projects. A checkpoint
+is marked as done once its project is migrated; running the migration again skips
+those projects and resumes the others from their checkpoint. The migration stops,
+keeping the checkpoint, when an edge of the checkpoint cannot be created again (its
+other vertex is missing).
+
+    python -m src.v0.database.migration ./checkpoints --batch-size 100
+"""
+
+import argparse
+import json
+import logging
+import os
+from pathlib import Path
+
+from config import settings
+
+from .adapter import get_client
+from .builders.queries.gremlin_queries_edge import GremlinStringQueryBuilderEdge
+from .builders.queries.gremlin_queries_vertex import GremlinStringQueryBuilderVertex
+from .builders.queries.query_builder import (
+    ITERABLE_PROPERTIES,
+    PARTITION_KEY,
+    GremlinQuery,
+)
+from .builders.responses.gremlin_responses_vertex import decode
+from .client import DatabaseClient
+
+logger = logging.getLogger(__name__)
+
+EXPORTED = "exported"
+"""status of a project whose subgraph is in its checkpoint, and may be (partially)
+deleted from the database"""
+DONE = "done"
+"""status of a migrated project"""
+
+
+class MigrationError(Exception):
+    def __init__(self, project_uuid, edge_count, created_count):
+        self.project_uuid = project_uuid
+        error_message = (
+            f"project {project_uuid}: only {created_count} of {edge_count} edges "
+            "created again, an edge links a missing vertex; the checkpoint is kept"
+        )
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class PartitionMigration:
+    """Migration of the projects of a database to one partition per project
+
+    Args:
+        client (DatabaseClient): client of the database to migrate.
+        checkpoint_dir (Path): directory of the checkpoint files, one per project.
+        batch_size (int, optional): maximum number of vertices or edges dropped or
+                                    created per query.
+                                    Defaults to settings.DB_IMPORT_BATCH_SIZE.
+    """
+
+    def __init__(
+        self,
+        client: DatabaseClient,
+        checkpoint_dir: Path,
+        batch_size: int = settings.DB_IMPORT_BATCH_SIZE,
+    ):
+        self._client = client
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.batch_size = batch_size
+        # the vertices are read wherever they are, not in the partition of a project
+        self.vertex_query = GremlinStringQueryBuilderVertex(partition_key=None)
+        self.edge_query = GremlinStringQueryBuilderEdge(partition_key=None)
+
+    def run(self) -> dict[str, str]:
+        """Migrate all the projects of the database
+
+        Returns:
+            dict[str, str]: status of each project (uuid)
+        """
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        pending = {path.stem for path in self.checkpoint_dir.glob("*.json")}
+        query = self.vertex_query.list_all_vertices("project")
+        with self._client as c:
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        projects = {value_map["T.id"] for value_map in results}
+        return {
+            project_uuid: self.migrate_project(project_uuid)
+            for project_uuid in sorted(projects | pending)
+        }
+
+    def migrate_project(self, project_uuid: str) -> str:
+        """Migrate one project, resuming from its checkpoint if any
+
+        Args:
+            project_uuid (str): uuid of the project
+
+        Raises:
+            MigrationError: when an edge of the project is not created again
+
+        Returns:
+            str: status of the project
+        """
+        checkpoint = self._read_checkpoint(project_uuid)
+        if checkpoint is None:
+            checkpoint = self._export(project_uuid)
+            if all(
+                properties.get(PARTITION_KEY) == project_uuid
+                for _, properties in checkpoint["vertices"]
+            ):
+                logger.info("project %s is already in its partition", project_uuid)
+                return self._write_checkpoint(project_uuid, DONE)
+            self._write_checkpoint(project_uuid, EXPORTED, checkpoint)
+        elif checkpoint["status"] == DONE:
+            return DONE
+
+        # dropping the vertices by uuid also drops those created by an interrupted
+        # run, in the partition of the project, before creating them (again)
+        vertices = checkpoint["vertices"]
+        for batch in self._batches([properties["uuid"] for _, properties in vertices]):
+            self._execute(self.vertex_query.delete_vertices(batch))
+        for batch in self._batches(vertices):
+            self._execute(
+                self.vertex_query.create_vertices(
+                    [
+                        (label, {**properties, PARTITION_KEY: project_uuid})
+                        for label, properties in batch
+                    ]
+                )
+            )
+        edges = checkpoint["edges"]
+        for batch in self._batches(edges):
+            (created_count,) = self._execute(self.edge_query.restore_edges(batch))
+            if created_count != len(batch):
+                raise MigrationError(project_uuid, len(batch), created_count)
+        logger.info(
+            "project %s: %d vertices and %d edges migrated",
+            project_uuid,
+            len(vertices),
+            len(edges),
+        )
+        return self._write_checkpoint(project_uuid, DONE)
+
+    def _export(self, project_uuid: str) -> dict:
+        """Vertices (label and stored properties) of a project, the project vertex
+        first, and all their edges (label, outgoing and incoming vertices, stored
+        properties), whichever vertices they link them to"""
+        query = self.vertex_query.export_project(project_uuid)
+        with self._client as c:
+            subgraph = c.execute_query(query.template, query.bindings, idempotent=True)[
+                0
+            ]
+        value_maps = [subgraph["project"]]
+        for group in ["objectives", "opportunities", "issues", "merged_issues"]:
+            value_maps.extend(subgraph[group])
+        vertices = [
+            (value_map["T.label"], self._stored_properties(value_map))
+            for value_map in value_maps
+        ]
+
+        edges = {}
+        for batch in self._batches([properties["uuid"] for _, properties in vertices]):
+            query = self.edge_query.list_incident_edges(batch)
+            with self._client as c:
+                results = c.execute_query(
+                    query.template, query.bindings, idempotent=True
+                )
+            for result in results:
+                edge = self._client.builder.response.edge.build_list([result["edge"]])[0]
+                # an edge between vertices of two batches is listed twice
+                edges[edge.uuid] = (
+                    edge.label,
+                    edge.outV,
+                    edge.inV,
+                    {**self._stored_properties(result["properties"]), "uuid": edge.uuid},
+                )
+        # created again in the order of the export of the project, then the others
+        order = {
+            edge.uuid: k
+            for k, edge in enumerate(
+                self._client.builder.response.edge.build_list(subgraph["edges"])
+            )
+        }
+        return {
+            "vertices": vertices,
+            "edges": sorted(
+                edges.values(), key=lambda edge: order.get(edge[3]["uuid"], len(order))
+            ),
+        }
+
+    @staticmethod
+    def _stored_properties(value_map: dict) -> dict:
+        """Properties of a vertex, decoded so that the query builder stores them
+        unchanged"""
+        properties = {}
+        for key, values in value_map.items():
+            if key in ["T.id", "T.label"]:
+                continue
+            value = values[0] if isinstance(values, list) else values
+            if key in ITERABLE_PROPERTIES:
+                value = None if value in ["", "null"] else decode(value)
+            properties[key] = value
+        return properties
+
+    def _batches(self, items: list) -> list[list]:
+        return [
+            items[k : k + self.batch_size] for k in range(0, len(items), self.batch_size)
+        ]
+
+    def _execute(self, query: GremlinQuery) -> list:
+        with self._client as c:
+            return c.execute_query(query.template, query.bindings)
+
+    def _checkpoint_path(self, project_uuid: str) -> Path:
+        return self.checkpoint_dir / f"{project_uuid}.json"
+
+    def _read_checkpoint(self, project_uuid: str) -> dict | None:
+        path = self._checkpoint_path(project_uuid)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def _write_checkpoint(
+        self, project_uuid: str, status: str, subgraph: dict | None = None
+    ) -> str:
+        """Write the checkpoint of a project atomically (through a temporary file),
+        so that an interrupted migration never leaves a truncated one"""
+        path = self._checkpoint_path(project_uuid)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps({"status": status, **(subgraph or {})}))
+        os.replace(temporary, path)
+        return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("checkpoint_dir", type=Path)
+    parser.add_argument("--batch-size", type=int, default=settings.DB_IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+    statuses = PartitionMigration(
+        get_client(), args.checkpoint_dir, args.batch_size
+    ).run()
+    for project_uuid, status in statuses.items():
+        print(f"{project_uuid} {status}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+
+from aiohttp import ClientError
+from gremlin_python.driver import client
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_QUERY: str = "g.inject(0)"
+RECONNECT_ERRORS: tuple[type[Exception], ...] = (OSError, ClientError)
+"""Transport errors raised by the gremlin driver when the websocket is broken"""
+CONNECTION_CLOSED_MESSAGES: tuple[str, ...] = (
+    "Connection was closed by server.",
+    "Connection was already closed.",
+    "Received error on read:",
+)
+"""Messages of the RuntimeErrors raised by the gremlin driver on a closed websocket"""
+
+
+def is_connection_error(error: Exception) -> bool:
+    """Whether a query failed because of its connection, and not of the query itself
+
+    Args:
+        error (Exception): error raised while submitting a query
+
+    Returns:
+        bool: True for transport errors and closed websockets
+    """
+    if isinstance(error, RECONNECT_ERRORS):
+        return True
+    return isinstance(error, RuntimeError) and str(error).startswith(
+        CONNECTION_CLOSED_MESSAGES
+    )
+
+
+class ConnectionPool:
+    """Application-lifetime holder of a Gremlin driver client.
+
+    The gremlin driver client keeps `pool_size` websocket connections open and
+    hands them out per query, so a single driver client shared by all the
+    `DatabaseClient` instances of a process is the connection pool: requests borrow
+    it in `DatabaseClient.connect()` and give it back in `DatabaseClient.close()`
+    without paying the websocket (and TLS) handshake again.
+
+    The driver client is created lazily on first use, health checked when it has
+    been idle for more than `health_check_interval` seconds, and replaced when a
+    query fails on a broken connection (see `invalidate`). A replaced driver client
+    is only closed once all the requests which borrowed it have released it, so
+    that their in-flight queries are not aborted.
+
+    Asynchronous clients additionally wait for one of the `size` `slots` before
+    submitting a query: the driver client blocks the calling thread when all its
+    connections are busy, which must never happen on the event loop.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], client.Client],
+        health_check_interval: float = 30.0,
+        health_check_query: str = HEALTH_CHECK_QUERY,
+        size: int = 1,
+    ):
+        """
+        Args:
+            factory (Callable[[], client.Client]): creates a new driver client
+            health_check_interval (float, optional): idle time (in seconds) after
+                which the driver client is checked before being handed out.
+                Defaults to 30.0.
+            health_check_query (str, optional): cheap query used for health checking.
+                Defaults to "g.inject(0)".
+            size (int, optional): number of connections of the driver client (its
+                `pool_size`). Defaults to 1.
+        """
+        self._factory = factory
+        self.health_check_interval = health_check_interval
+        self.health_check_query = health_check_query
+        self._client: client.Client | None = None
+        self._last_used = 0.0
+        self._borrowers: Counter[client.Client] = Counter()
+        self._lock = threading.Lock()
+        self.size = size
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None and not self._client.is_closed()
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        """Bounds the number of in-flight asynchronous queries to `size`"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        return self._slots
+
+    def open(self) -> None:
+        """Create the driver client (typically at application startup)"""
+        with self._lock:
+            if not self.is_open:
+                self._client = self._factory()
+                self._last_used = time.monotonic()
+
+    def acquire(self) -> client.Client:
+        """Borrow the shared driver client
+
+        Returns:
+            client.Client: an open, healthy, driver client
+        """
+        with self._lock:
+            if not self.is_open:
+                self._client = self._factory()
+            elif time.monotonic() - self._last_used > self.health_check_interval:
+                if not self._is_healthy():
+                    logger.warning("Database connection pool unhealthy, reconnecting")
+                    self._replace()
+            self._last_used = time.monotonic()
+            self._borrowers[self._client] += 1
+            return self._client
+
+    def release(self, driver_client: client.Client) -> None:
+        """Give the driver client back to the pool
+
+        The connections are kept open and the idle timer is updated. A driver client
+        which has been replaced meanwhile is closed by its last borrower.
+        """
+        with self._lock:
+            self._last_used = time.monotonic()
+            self._give_back(driver_client)
+
+    def invalidate(self, driver_client: client.Client) -> None:
+        """Give back a driver client whose connections are broken
+
+        The next `acquire` creates a new one, and the broken driver client is closed
+        once the other borrowers have released it. Invalidating a driver client which
+        has already been replaced only gives it back.
+        """
+        with self._lock:
+            if driver_client is self._client:
+                self._client = None
+            self._give_back(driver_client)
+
+    def close(self) -> None:
+        """Close all the connections (typically at application shutdown)"""
+        with self._lock:
+            for driver_client in {self._client, *self._borrowers} - {None}:
+                self._close(driver_client)
+            self._client = None
+            self._borrowers.clear()
+
+    def _is_healthy(self) -> bool:
+        try:
+            self._client.submit(self.health_check_query).all().result()
+        except Exception as e:
+            logger.warning(f"Database health check failed: {e}")
+            return False
+        return True
+
+    def _replace(self) -> None:
+        retired, self._client = self._client, self._factory()
+        if not self._borrowers[retired]:
+            self._close(retired)
+
+    def _give_back(self, driver_client: client.Client) -> None:
+        self._borrowers[driver_client] -= 1
+        if self._borrowers[driver_client] > 0:
+            return
+        del self._borrowers[driver_client]
+        if driver_client is not self._client:
+            # last borrower of a replaced driver client
+            self._close(driver_client)
+
+    @staticmethod
+    def _close(driver_client: client.Client) -> None:
+        try:
+            driver_client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close the database connections: {e}")
@@ -46,6 +46,16 @@ class ProbabilityData(DOTModel):
     @model_validator(mode="before")
     @classmethod
     def nullify_probability_function(cls, values):
+        if (
+            not isinstance(values, dict)
+            or not {
+                "variables",
+                "probability_function",
+            }
+            <= values.keys()
+        ):
+            # Missing fields are reported by the field validation
+            return values
         variables = values["variables"]
         array_size = tuple([len(v) for v in variables.values()])
         probability_function = values["probability_function"]
@@ -23,8 +23,9 @@ class VertexMetaData(MetaData):
     """Timestamp at vertex creation"""
     date: datetime = Field(default_factory=lambda: datetime.now())
     """Date at vertex creation"""
-    ids: str | None = "test"  # partition key for Azure cosmos DB
-    """Partition key for Azure cosmos DB"""
+    ids: str | None = None  # partition key for Azure cosmos DB
+    """Partition key for Azure cosmos DB: uuid of the project of the vertex (its own
+    uuid for a project), set by the vertex repository"""
 
 
 class EdgeMetaData(MetaData):
@@ -1,3 +1,5 @@
+from pydantic import Field, confloat
+
 from ... import DOTModel
 from .edge import EdgeResponse
 from .issue import IssueResponse, ProbabilityData
@@ -158,3 +160,357 @@ class DecisionTreeResponse(DOTModel):
 
 
 DecisionTreeResponse.model_rebuild()
+
+
+class DecisionTreeExpansionResponse(DOTModel):
+    id: DecisionTreeNodeData
+    node_count: int
+    children: list["DecisionTreeExpansionResponse"] | None = None
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "id": {
+                        "node_type": "UncertaintyNode",
+                        "description": "The result of the test is currently unknown",
+                        "shortname": "Test Result",
+                        "uuid": "e0d590dc-b62f-4476-b8cc-aee672f29458",
+                        "branch_name": "yes",
+                    },
+                    "node_count": 13,
+                    "children": [
+                        {
+                            "id": {
+                                "node_type": "DecisionNode",
+                                "description": "Joe can buy the car",
+                                "shortname": "Buy",
+                                "uuid": "8e729eb3-f47d-4380-99d8-ed823376dc86",
+                                "branch_name": "good",
+                                "alternatives": ["buy", "do not buy"],
+                            },
+                            "node_count": 3,
+                        },
+                    ],
+                }
+            ]
+        }
+    }
+
+
+DecisionTreeExpansionResponse.model_rebuild()
+
+
+class DecisionGraphNode(DOTModel):
+    id: DecisionTreeNodeData
+    children: list[str] | None = None
+
+
+class DecisionGraphResponse(DOTModel):
+    root: str
+    node_count: int
+    nodes: dict[str, DecisionGraphNode]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "root": "0.0",
+                    "node_count": 3,
+                    "nodes": {
+                        "0.0": {
+                            "id": {
+                                "node_type": "DecisionNode",
+                                "description": "Joe can test the car",
+                                "shortname": "Test",
+                                "uuid": "ad651f50-22de-4f85-a560-bf5fb2d9f706",
+                                "branch_name": "",
+                                "alternatives": ["Test", "no Test"],
+                            },
+                            "children": ["1.0", "1.1"],
+                        },
+                        "1.0": {
+                            "id": {
+                                "node_type": "UtilityNode",
+                                "description": "Utility",
+                                "shortname": "ut",
+                                "uuid": "55d46d6b-9563-4fbc-80aa-8368a60d3e31",
+                                "branch_name": "Test",
+                                "utility": [],
+                            },
+                        },
+                        "1.1": {
+                            "id": {
+                                "node_type": "UtilityNode",
+                                "description": "Utility",
+                                "shortname": "ut",
+                                "uuid": "55d46d6b-9563-4fbc-80aa-8368a60d3e31",
+                                "branch_name": "no Test",
+                                "utility": [],
+                            },
+                        },
+                    },
+                }
+            ]
+        }
+    }
+
+
+class PyAgrumCacheStatistics(DOTModel):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "hits": 12,
+                    "misses": 3,
+                    "evictions": 0,
+                    "entries": 3,
+                    "size_bytes": 7384,
+                    "max_bytes": 268435456,
+                }
+            ]
+        }
+    }
+
+
+class DecisionRule(DOTModel):
+    parent_states: dict[str, str]
+    alternative: str
+
+
+class DecisionPolicy(DOTModel):
+    decision: str
+    parents: list[str]
+    rules: list[DecisionRule]
+
+
+class InfluenceDiagramSolution(DOTModel):
+    expected_utility: float
+    variance: float
+    policies: list[DecisionPolicy]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "expected_utility": 35.0,
+                    "variance": 525.0,
+                    "policies": [
+                        {
+                            "decision": "Drill",
+                            "parents": ["Test Result"],
+                            "rules": [
+                                {
+                                    "parent_states": {"Test Result": "Dry"},
+                                    "alternative": "Walk away",
+                                },
+                                {
+                                    "parent_states": {"Test Result": "Wet"},
+                                    "alternative": "Drill",
+                                },
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+    }
+
+
+class ValueOfInformation(DOTModel):
+    uuid: str
+    shortname: str
+    expected_utility: float | None = None
+    evpi: float | None = None
+
+
+class ValueOfInformationResponse(DOTModel):
+    expected_utility: float
+    uncertainties: list[ValueOfInformation]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "expected_utility": 28.5,
+                    "uncertainties": [
+                        {
+                            "uuid": "ad651f50-22de-4f85-a560-bf5fb2d9f706",
+                            "shortname": "State",
+                            "expected_utility": 35.0,
+                            "evpi": 6.5,
+                        },
+                        {
+                            "uuid": "55d46d6b-9563-4fbc-80aa-8368a60d3e31",
+                            "shortname": "Production",
+                            "expected_utility": None,
+                            "evpi": None,
+                        },
+                    ],
+                }
+            ]
+        }
+    }
+
+
+class ProbabilitySensitivity(DOTModel):
+    uuid: str
+    shortname: str
+    outcome: str
+    deltas: list[float]
+    expected_utilities: list[float]
+    changed_decisions: list[list[str]]
+    low: float
+    high: float
+    swing: float
+
+
+class SensitivityResponse(DOTModel):
+    expected_utility: float
+    sensitivities: list[ProbabilitySensitivity]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "expected_utility": 28.5,
+                    "sensitivities": [
+                        {
+                            "uuid": "ad651f50-22de-4f85-a560-bf5fb2d9f706",
+                            "shortname": "State",
+                            "outcome": "Dry",
+                            "deltas": [-0.3, 0.0, 0.3],
+                            "expected_utilities": [50.0, 28.5, 12.0],
+                            "changed_decisions": [["Drill"], [], []],
+                            "low": 50.0,
+                            "high": 12.0,
+                            "swing": 38.0,
+                        }
+                    ],
+                }
+            ]
+        }
+    }
+
+
+class MonteCarloRequest(DOTModel):
+    strategy: dict[str, str]
+    """alternative of each decision, by shortname"""
+    values: dict[str, dict[str, float]] = {}
+    """value of states of decisions and uncertainties, by shortname, the value of a
+    scenario being the sum of the values of its states"""
+    samples: int = Field(default=100000, gt=0, le=100000000)
+    chunk_size: int = Field(default=100000, gt=0, le=1000000)
+    seed: int | None = None
+    percentiles: list[confloat(ge=0, le=100)] = [5.0, 50.0, 95.0]
+    confidence: float = Field(default=0.95, gt=0, lt=1)
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "strategy": {"Test": "Test", "Buy": "Buy with guarantee"},
+                    "values": {
+                        "State": {"Peach": 1000, "Lemon": -500},
+                        "Test": {"Test": -25},
+                    },
+                    "samples": 1000000,
+                    "chunk_size": 100000,
+                    "seed": 0,
+                }
+            ]
+        }
+    }
+
+
+class MonteCarloSummary(DOTModel):
+    samples: int
+    mean: float
+    confidence_interval: list[float]
+    std: float
+    min: float
+    max: float
+    percentiles: dict[str, float]
+
+
+class PosteriorRequest(DOTModel):
+    scenarios: list[dict[str, str]] = Field(min_length=1, max_length=10000)
+    """observed state of decisions and uncertainties, by shortname, for each
+    scenario"""
+    targets: list[str] = Field(min_length=1)
+    """shortnames of the uncertainties whose posterior distribution is queried"""
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "scenarios": [
+                        {},
+                        {"Test": "Test", "TestResult": "Lemon"},
+                    ],
+                    "targets": ["State"],
+                }
+            ]
+        }
+    }
+
+
+class ScenarioPosterior(DOTModel):
+    evidence_probability: float
+    posteriors: dict[str, dict[str, float]] | None
+    """posterior distribution of each target, None for impossible evidence"""
+
+
+class PosteriorResponse(DOTModel):
+    results: list[ScenarioPosterior]
+
+
+class PrunedNode(DOTModel):
+    uuid: str
+    shortname: str
+
+
+class PrunedArc(DOTModel):
+    tail: PrunedNode
+    head: PrunedNode
+
+
+class PruningReport(DOTModel):
+    nodes: list[PrunedNode]
+    """barren uncertainties removed"""
+    arcs: list[PrunedArc]
+    """arcs of non-requisite observations removed"""
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "nodes": [
+                        {
+                            "uuid": "ad651f50-22de-4f85-a560-bf5fb2d9f706",
+                            "shortname": "Weather",
+                        }
+                    ],
+                    "arcs": [
+                        {
+                            "tail": {
+                                "uuid": "7e2f9a43-8b1c-4e5d-9f60-21a3c4d5e6f7",
+                                "shortname": "Rumour",
+                            },
+                            "head": {
+                                "uuid": "0b6c1d2e-3f4a-4b5c-8d6e-7f8091a2b3c4",
+                                "shortname": "Buy",
+                            },
+                        }
+                    ],
+                }
+            ]
+        }
+    }
@@ -1,7 +1,23 @@
-from ..database.client import DatabaseClient
+import logging
+
+from ..database.client import AsyncDatabaseClient, DatabaseClient
 from ..models.edge import EdgeResponse
 from ..models.meta import EdgeMetaData
 
+logger = logging.getLogger(__name__)
+
+
+class EdgeCreationError(Exception):
+    def __init__(self, edge_count, created_count):
+        self.edge_count = edge_count
+        self.created_count = created_count
+        error_message = (
+            f"only {created_count} of {edge_count} edges created, "
+            "the others link a missing vertex"
+        )
+        super().__init__(error_message)
+        logger.critical(error_message)
+
 
 class EdgeRepository:
     def __init__(self, client: DatabaseClient):
@@ -30,9 +46,39 @@ class EdgeRepository:
             edge_label, out_vertex_uuid, in_vertex_uuid, edge
         )
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings)
         return self.builder.response.edge.build_item(results)
 
+    def create_batch(self, edges: list[tuple[str, str, str]]) -> None:
+        """Create several edges in a single query
+
+        Args:
+            edges (list[tuple[str, str, str]]): out_vertex_uuid, in_vertex_uuid and
+                                                edge_label of each edge (see create)
+
+        Raises:
+            EdgeCreationError: when an edge is not created (missing vertex)
+
+        Return:
+            None
+        """
+        query = self.builder.query.edge.create_edges(
+            [
+                (
+                    edge_label,
+                    out_vertex_uuid,
+                    in_vertex_uuid,
+                    EdgeMetaData().model_dump(),
+                )
+                for out_vertex_uuid, in_vertex_uuid, edge_label in edges
+            ]
+        )
+        with self._client as c:
+            (created_count,) = c.execute_query(query.template, query.bindings)
+        if created_count != len(edges):
+            raise EdgeCreationError(len(edges), created_count)
+        return None
+
     def read_all_edges_from_project(
         self, project_uuid: str, edge_label: str
     ) -> list[EdgeResponse]:
@@ -49,7 +95,7 @@ class EdgeRepository:
             project_uuid, edge_label
         )
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
         return self.builder.response.edge.build_list(results)
 
     def read_all_edges_from_sub_project(
@@ -70,7 +116,7 @@ class EdgeRepository:
             project_uuid, edge_label, vertex_uuid
         )
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
         return self.builder.response.edge.build_list(results)
 
     def read_out_edge_from_vertex(
@@ -88,7 +134,7 @@ class EdgeRepository:
             vertex_uuid, edge_label
         )
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
         return self.builder.response.edge.build_list(results)
 
     def read_in_edge_to_vertex(
@@ -104,7 +150,7 @@ class EdgeRepository:
         """
         query = self.builder.query.edge.read_in_edge_to_vertex(vertex_uuid, edge_label)
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
         return self.builder.response.edge.build_list(results)
 
     def read(self, edge_uuid: str) -> EdgeResponse:
@@ -118,7 +164,7 @@ class EdgeRepository:
         """
         query = self.builder.query.edge.read_edge(edge_uuid)
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
         return self.builder.response.edge.build_item(results)
 
     # # TODO: do we need that? Instead of deleting and creating a new one?
@@ -136,7 +182,7 @@ class EdgeRepository:
     #         edge_uuid, modified_fields.model_dump(exclude_unset=True)
     #     )
     #     with self._client as c:
-    #         results = c.execute_query(query)
+    #         results = c.execute_query(query.template, query.bindings)
     #     return self.builder.response.edge.build_item(results)
 
     def delete(self, edge_uuid: str):
@@ -150,7 +196,7 @@ class EdgeRepository:
         """
         query = self.builder.query.edge.delete_edge(edge_uuid)
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
         return self.builder.response.edge.build_none(results)
 
     def delete_edge_from_vertex(self, vertex_uuid: str) -> None:
@@ -164,5 +210,123 @@ class EdgeRepository:
         """
         query = self.builder.query.edge.delete_edge_from_vertex(vertex_uuid)
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        return self.builder.response.edge.build_none(results)
+
+
+class AsyncEdgeRepository:
+    """asyncio counterpart of EdgeRepository, sharing its query/response builders"""
+
+    def __init__(self, client: AsyncDatabaseClient):
+        self._client = client
+        self.builder = client.builder
+
+    async def create(
+        self, out_vertex_uuid: str, in_vertex_uuid: str, edge_label: str
+    ) -> EdgeResponse:
+        """See EdgeRepository.create"""
+        edge_data = {"inV": in_vertex_uuid, "outV": out_vertex_uuid, "id": ""}
+        metadata = EdgeMetaData()
+        edge = {**metadata.model_dump(), **edge_data}
+        query = self.builder.query.edge.create_edge(
+            edge_label, out_vertex_uuid, in_vertex_uuid, edge
+        )
+        async with self._client as c:
+            results = await c.execute_query(query.template, query.bindings)
+        return self.builder.response.edge.build_item(results)
+
+    async def create_batch(self, edges: list[tuple[str, str, str]]) -> None:
+        """See EdgeRepository.create_batch"""
+        query = self.builder.query.edge.create_edges(
+            [
+                (
+                    edge_label,
+                    out_vertex_uuid,
+                    in_vertex_uuid,
+                    EdgeMetaData().model_dump(),
+                )
+                for out_vertex_uuid, in_vertex_uuid, edge_label in edges
+            ]
+        )
+        async with self._client as c:
+            (created_count,) = await c.execute_query(query.template, query.bindings)
+        if created_count != len(edges):
+            raise EdgeCreationError(len(edges), created_count)
+        return None
+
+    async def read_all_edges_from_project(
+        self, project_uuid: str, edge_label: str
+    ) -> list[EdgeResponse]:
+        """See EdgeRepository.read_all_edges_from_project"""
+        query = self.builder.query.edge.list_all_edges_from_project(
+            project_uuid, edge_label
+        )
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.edge.build_list(results)
+
+    async def read_all_edges_from_sub_project(
+        self, project_uuid: str, edge_label: str, vertex_uuid: list[str]
+    ) -> list[EdgeResponse]:
+        """See EdgeRepository.read_all_edges_from_sub_project"""
+        query = self.builder.query.edge.list_all_edges_from_sub_project(
+            project_uuid, edge_label, vertex_uuid
+        )
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.edge.build_list(results)
+
+    async def read_out_edge_from_vertex(
+        self, vertex_uuid: str, edge_label: str
+    ) -> list[EdgeResponse]:
+        """See EdgeRepository.read_out_edge_from_vertex"""
+        query = self.builder.query.edge.read_out_edge_from_vertex(
+            vertex_uuid, edge_label
+        )
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.edge.build_list(results)
+
+    async def read_in_edge_to_vertex(
+        self, vertex_uuid: str, edge_label: str
+    ) -> list[EdgeResponse]:
+        """See EdgeRepository.read_in_edge_to_vertex"""
+        query = self.builder.query.edge.read_in_edge_to_vertex(vertex_uuid, edge_label)
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.edge.build_list(results)
+
+    async def read(self, edge_uuid: str) -> EdgeResponse:
+        """See EdgeRepository.read"""
+        query = self.builder.query.edge.read_edge(edge_uuid)
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.edge.build_item(results)
+
+    async def delete(self, edge_uuid: str):
+        """See EdgeRepository.delete"""
+        query = self.builder.query.edge.delete_edge(edge_uuid)
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.edge.build_none(results)
+
+    async def delete_edge_from_vertex(self, vertex_uuid: str) -> None:
+        """See EdgeRepository.delete_edge_from_vertex"""
+        query = self.builder.query.edge.delete_edge_from_vertex(vertex_uuid)
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
         return self.builder.response.edge.build_none(results)
@@ -1,8 +1,8 @@
-from ..database.client import DatabaseClient
+from ..database.client import AsyncDatabaseClient, DatabaseClient
 from ..models.filter import Filter
 from ..models.issue import IssueCreate, IssueResponse, IssueUpdate
-from ..repositories.edge import EdgeRepository
-from ..repositories.vertex import VertexRepository
+from ..repositories.edge import AsyncEdgeRepository, EdgeRepository
+from ..repositories.vertex import AsyncVertexRepository, VertexRepository
 
 
 class IssueRepository:
@@ -25,13 +25,15 @@ class IssueRepository:
         Returns:
             IssueResponse: Created Issue with the issue_data as IssueCreate
         """
-        vertex = VertexRepository(self._client).create("issue", issue_data)
+        vertex = VertexRepository(self._client).create(
+            "issue", issue_data, partition_key=project_uuid, response_model=IssueResponse
+        )
         EdgeRepository(self._client).create(
             out_vertex_uuid=project_uuid,
             in_vertex_uuid=vertex.uuid,
             edge_label="contains",
         )
-        return IssueResponse.convert_api_payload_to_response(vertex)
+        return vertex
 
     def read_issues_all(
         self,
@@ -58,13 +60,14 @@ class IssueRepository:
                                  and have the label "issue" and satisfy the filters
                                  when given in filter_model
         """
-        vertex_list = VertexRepository(self._client).read_out_vertex(
+        return VertexRepository(self._client).read_out_vertex(
             vertex_uuid=project_uuid,
             edge_label=edge_label,
             original_vertex_label=vertex_label,
             filter_model=filter_model,
+            partition_key=project_uuid,
+            response_model=IssueResponse,
         )
-        return IssueResponse.convert_list_api_payloads_to_responses(vertex_list)
 
     def read(self, issue_uuid: str) -> IssueResponse:
         """Method to read one issue based on the id
@@ -75,8 +78,9 @@ class IssueRepository:
         Returns:
             IssueResponse: Issue with all properties
         """
-        vertex = VertexRepository(self._client).read(issue_uuid)
-        return IssueResponse.convert_api_payload_to_response(vertex)
+        return VertexRepository(self._client).read(
+            issue_uuid, response_model=IssueResponse
+        )
 
     def update(self, issue_uuid: str, modified_fields: IssueUpdate) -> IssueResponse:
         """Updates the specified issue based on the id with the new issue_data
@@ -94,7 +98,9 @@ class IssueRepository:
             modified_fields.decisionType = None
             modified_fields.keyUncertainty = None
 
-        vertex = VertexRepository(self._client).update(issue_uuid, modified_fields)
+        vertex = VertexRepository(self._client).update(
+            issue_uuid, modified_fields, response_model=IssueResponse
+        )
         # if boundary is not 'in' or 'on' anymore, remove decision type and key
         # uncertainty, and remove "influences" edges from parents or children
         if vertex.boundary not in ["in", "on"]:
@@ -108,7 +114,7 @@ class IssueRepository:
                 EdgeRepository(self._client).delete(edge.uuid)
             for edge in in_edges:
                 EdgeRepository(self._client).delete(edge.uuid)
-        return IssueResponse.convert_api_payload_to_response(vertex)
+        return vertex
 
     def delete(self, issue_uuid: str) -> None:
         """Deletes the issue vertex based on the id and also all in and outgoing edges
@@ -123,3 +129,79 @@ class IssueRepository:
         EdgeRepository(self._client).delete_edge_from_vertex(issue_uuid)
         VertexRepository(self._client).delete(issue_uuid)
         return None
+
+
+class AsyncIssueRepository:
+    """asyncio counterpart of IssueRepository"""
+
+    def __init__(self, client: AsyncDatabaseClient):
+        self._client = client
+        self.builder = client.builder
+
+    async def create(self, project_uuid: str, issue_data: IssueCreate) -> IssueResponse:
+        """See IssueRepository.create"""
+        vertex = await AsyncVertexRepository(self._client).create(
+            "issue", issue_data, partition_key=project_uuid, response_model=IssueResponse
+        )
+        await AsyncEdgeRepository(self._client).create(
+            out_vertex_uuid=project_uuid,
+            in_vertex_uuid=vertex.uuid,
+            edge_label="contains",
+        )
+        return vertex
+
+    async def read_issues_all(
+        self,
+        project_uuid: str,
+        vertex_label: str,
+        edge_label: str,
+        filter_model: Filter,
+    ) -> list[IssueResponse]:
+        """See IssueRepository.read_issues_all"""
+        return await AsyncVertexRepository(self._client).read_out_vertex(
+            vertex_uuid=project_uuid,
+            edge_label=edge_label,
+            original_vertex_label=vertex_label,
+            filter_model=filter_model,
+            partition_key=project_uuid,
+            response_model=IssueResponse,
+        )
+
+    async def read(self, issue_uuid: str) -> IssueResponse:
+        """See IssueRepository.read"""
+        return await AsyncVertexRepository(self._client).read(
+            issue_uuid, response_model=IssueResponse
+        )
+
+    async def update(
+        self, issue_uuid: str, modified_fields: IssueUpdate
+    ) -> IssueResponse:
+        """See IssueRepository.update"""
+        if ("boundary" in modified_fields.model_dump(exclude_unset=True)) and (
+            modified_fields.boundary not in ["in", "on"]
+        ):
+            modified_fields.decisionType = None
+            modified_fields.keyUncertainty = None
+
+        vertex = await AsyncVertexRepository(self._client).update(
+            issue_uuid, modified_fields, response_model=IssueResponse
+        )
+        # if boundary is not 'in' or 'on' anymore, remove decision type and key
+        # uncertainty, and remove "influences" edges from parents or children
+        if vertex.boundary not in ["in", "on"]:
+            edge_repository = AsyncEdgeRepository(self._client)
+            out_edges = await edge_repository.read_out_edge_from_vertex(
+                issue_uuid, edge_label="influences"
+            )
+            in_edges = await edge_repository.read_in_edge_to_vertex(
+                issue_uuid, edge_label="influences"
+            )
+            for edge in out_edges + in_edges:
+                await edge_repository.delete(edge.uuid)
+        return vertex
+
+    async def delete(self, issue_uuid: str) -> None:
+        """See IssueRepository.delete"""
+        await AsyncEdgeRepository(self._client).delete_edge_from_vertex(issue_uuid)
+        await AsyncVertexRepository(self._client).delete(issue_uuid)
+        return None
@@ -29,13 +29,18 @@ class ObjectiveRepository:
             ObjectiveResponse: Created Objective with the objective_data as
                                ObjectiveData
         """
-        vertex = VertexRepository(self._client).create("objective", objective_data)
+        vertex = VertexRepository(self._client).create(
+            "objective",
+            objective_data,
+            partition_key=project_uuid,
+            response_model=ObjectiveResponse,
+        )
         EdgeRepository(self._client).create(
             out_vertex_uuid=project_uuid,
             in_vertex_uuid=vertex.uuid,
             edge_label="contains",
         )
-        return ObjectiveResponse.convert_api_payload_to_response(vertex)
+        return vertex
 
     def read_objectives_all(
         self,
@@ -62,13 +67,14 @@ class ObjectiveRepository:
                                      "contains" edge and have the label "objective" and
                                      satisfy the filters when the filter_model is given
         """
-        vertex_list = VertexRepository(self._client).read_out_vertex(
+        return VertexRepository(self._client).read_out_vertex(
             vertex_uuid=project_uuid,
             original_vertex_label=vertex_label,
             edge_label=edge_label,
             filter_model=filter_model,
+            partition_key=project_uuid,
+            response_model=ObjectiveResponse,
         )
-        return ObjectiveResponse.convert_list_api_payloads_to_responses(vertex_list)
 
     def read(self, objective_uuid: str) -> ObjectiveResponse:
         """Method to read one objective based on the id
@@ -79,8 +85,9 @@ class ObjectiveRepository:
         Returns
             ObjectiveResponse: Objective with all properties
         """
-        vertex = VertexRepository(self._client).read(objective_uuid)
-        return ObjectiveResponse.convert_api_payload_to_response(vertex)
+        return VertexRepository(self._client).read(
+            objective_uuid, response_model=ObjectiveResponse
+        )
 
     def update(
         self, objective_uuid: str, modified_fields: ObjectiveUpdate
@@ -94,8 +101,9 @@ class ObjectiveRepository:
         Returns:
             ObjectiveResponse: Objective with the objective_data as ObjectiveData
         """
-        vertex = VertexRepository(self._client).update(objective_uuid, modified_fields)
-        return ObjectiveResponse.convert_api_payload_to_response(vertex)
+        return VertexRepository(self._client).update(
+            objective_uuid, modified_fields, response_model=ObjectiveResponse
+        )
 
     def delete(self, objective_uuid: str):
         """Deletes the objective vertex based on the id and also all in and outgoing
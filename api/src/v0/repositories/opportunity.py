@@ -34,9 +34,14 @@ class OpportunityRepository:
             OpportunityResponse: Created Opportunity with the opportunity_data as
             OpportunityCreate
         """
-        vertex = VertexRepository(self._client).create("opportunity", opportunity_data)
+        vertex = VertexRepository(self._client).create(
+            "opportunity",
+            opportunity_data,
+            partition_key=project_uuid,
+            response_model=OpportunityResponse,
+        )
         EdgeRepository(self._client).create(project_uuid, vertex.uuid, "contains")
-        return OpportunityResponse.convert_api_payload_to_response(vertex)
+        return vertex
 
     def read_opportunities_all(
         self,
@@ -63,13 +68,14 @@ class OpportunityRepository:
                                        and satisfy the filters when the filter_model is
                                        given
         """
-        vertex_list = VertexRepository(self._client).read_out_vertex(
+        return VertexRepository(self._client).read_out_vertex(
             vertex_uuid=project_uuid,
             original_vertex_label=vertex_label,
             edge_label=edge_label,
             filter_model=filter_model,
+            partition_key=project_uuid,
+            response_model=OpportunityResponse,
         )
-        return OpportunityResponse.convert_list_api_payloads_to_responses(vertex_list)
 
     def read(self, opportunity_uuid: str) -> OpportunityResponse:
         """Method to read one opportunity based on the id
@@ -80,8 +86,9 @@ class OpportunityRepository:
         Returns
             OpportunityResponse: Opportunity with all properties
         """
-        vertex = VertexRepository(self._client).read(opportunity_uuid)
-        return OpportunityResponse.convert_api_payload_to_response(vertex)
+        return VertexRepository(self._client).read(
+            opportunity_uuid, response_model=OpportunityResponse
+        )
 
     def update(
         self, opportunity_uuid: str, modified_fields: OpportunityUpdate
@@ -97,8 +104,9 @@ class OpportunityRepository:
             OpportunityResponse: Opportunity with the opportunity_data as
                                  OpportunityData
         """
-        vertex = VertexRepository(self._client).update(opportunity_uuid, modified_fields)
-        return OpportunityResponse.convert_api_payload_to_response(vertex)
+        return VertexRepository(self._client).update(
+            opportunity_uuid, modified_fields, response_model=OpportunityResponse
+        )
 
     def delete(self, opportunity_uuid):
         """Deletes the opportunity vertex based on the id and also all in and outgoing
@@ -1,61 +1,51 @@
-from itertools import chain
+import logging
+from collections.abc import AsyncIterator
 
-from ..database.client import DatabaseClient
+from config import settings
+
+from ..database.client import AsyncDatabaseClient, DatabaseClient
 from ..models.issue import IssueCreate
 from ..models.meta import VertexMetaData
 from ..models.objective import ObjectiveCreate
 from ..models.opportunity import OpportunityCreate
 from ..models.project import ProjectCreate, ProjectResponse, ProjectUpdate
-from ..repositories.edge import EdgeRepository
-from ..repositories.issue import IssueRepository
-from ..repositories.objective import ObjectiveRepository
-from ..repositories.opportunity import OpportunityRepository
-from ..repositories.vertex import VertexRepository
-
-
-class ProjectRepository:
-    def __init__(self, client: DatabaseClient):
+from ..models.vertex import VertexCreate, VertexResponse
+from ..repositories.edge import AsyncEdgeRepository, EdgeRepository
+from ..repositories.vertex import AsyncVertexRepository, VertexRepository
+
+COMPONENT_VERTICES = {
+    "objectives": ("objective", ObjectiveCreate),
+    "opportunities": ("opportunity", OpportunityCreate),
+    "issues": ("issue", IssueCreate),
+    "merged_issues": ("issue", IssueCreate),
+}
+"""vertex label and create model of each group of vertices of an exported project"""
+PROJECT_DELETE_ORDER = ["merged_into", None]
+"""Incoming edges followed from the vertices contained in a project when deleting it:
+the issues merged into them first, then the contained vertices themselves"""
+EXPORTED_VERTEX_GROUPS = ["objectives", "opportunities", "issues", "merged_issues"]
+VERTEX_METADATA_KEYS = list(VertexMetaData.model_fields)
+"""["version", "uuid", "timestamp", "date", "ids"], not exported"""
+EXPORTED_EDGE_LABELS = ["contains", "influences", "merged_into", "has_value_metric"]
+
+logger = logging.getLogger(__name__)
+
+
+class DanglingEdgeError(Exception):
+    def __init__(self, edges):
+        self.edges = edges
+        error_message = f"edges linking vertices not in the project: {edges}"
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class ProjectRepositoryBase:
+    """Database independent part of the (sync and async) project repositories"""
+
+    def __init__(self, client: DatabaseClient | AsyncDatabaseClient):
         self._client = client
         self.builder = client.builder
 
-    def create(self, project_data: ProjectCreate) -> ProjectResponse:
-        """Method to create a new project vertex
-
-            Creates vertex with the label "project" and the properties of project_data
-
-        Args:
-            project_data (ProjectCreate): contains all properties for the project
-
-        Returns
-            ProjectResponse: Created Project with the project_data as ProjectCreate
-        """
-        vertex = VertexRepository(self._client).create("project", project_data)
-        return ProjectResponse.convert_api_payload_to_response(vertex)
-
-    def all(self) -> list[ProjectResponse]:
-        """Reads all project vertices
-
-        Args:
-            None
-
-        Returns
-            List[ProjectResponse]: List of Projects in the database
-        """
-        vertex_list = VertexRepository(self._client).all("project")
-        return ProjectResponse.convert_list_api_payloads_to_responses(vertex_list)
-
-    def read(self, project_uuid: str) -> ProjectResponse:
-        """Method to read one project based on the id
-
-        Args:
-            project_uuid (str): id of the vertex with the label "project"'
-
-        Returns
-            ProjectResponse: Project with all properties
-        """
-        vertex = VertexRepository(self._client).read(project_uuid)
-        return ProjectResponse.convert_api_payload_to_response(vertex)
-
     def _filter_non_empty_fields(
         self, data: list[dict] | dict, exclude_keys: None | list[str] = None
     ) -> list[dict] | dict:
@@ -85,206 +75,253 @@ class ProjectRepository:
         else:
             return data
 
-    def export_project(self, project_uuid: str) -> dict:
-        """Method to export one project based on the id in JSON format
-
-        Args
-            project_uuid (str): id of the vertex with the label "project"'
-
-        Returns
-            json_dict: JSON dictionary containing the project data
-        """
-        project = VertexRepository(self._client).read(project_uuid)
-        # all issues (through "contains" edge) of the project
-        objectives_nodes = VertexRepository(self._client).read_out_vertex(
-            project_uuid,
-            original_vertex_label="objective",
-            edge_label="contains",
-        )
-        opportunities_nodes = VertexRepository(self._client).read_out_vertex(
-            project_uuid,
-            original_vertex_label="opportunity",
-            edge_label="contains",
-        )
-        issue_nodes = VertexRepository(self._client).read_out_vertex(
-            project_uuid, original_vertex_label="issue", edge_label="contains"
-        )
-        # merged issues of the project, through "merged_into" edge into one of the nodes
-        merged_issues = []
-        for issue in issue_nodes:
-            merged_issues.extend(
-                VertexRepository(self._client).read_in_vertex(
-                    issue.id, edge_label="merged_into"
-                )
-            )
-        # all edges of the project, e.g. "contains", "merged_into", "influences"
-        # basically all which are connected to some node which is connected to the
-        # project
-        contain_edges = EdgeRepository(self._client).read_all_edges_from_project(
-            project_uuid, edge_label="contains"
-        )  # contains edges
-        influence_edges = EdgeRepository(self._client).read_all_edges_from_project(
-            project_uuid, edge_label="influences"
-        )
-        merged_edges = EdgeRepository(self._client).read_all_edges_from_project(
-            project_uuid, edge_label="merged_into"
-        )
-        has_vm_edges = EdgeRepository(self._client).read_all_edges_from_project(
-            project_uuid, edge_label="has_value_metric"
+    def _export_vertex(self, vertex: VertexResponse) -> dict:
+        """Exported properties of a vertex (without metadata and empty fields)"""
+        return self._filter_non_empty_fields(
+            vertex.model_dump(), exclude_keys=VERTEX_METADATA_KEYS
         )
 
-        # can we get these keys from somewhere else?
-        metadata = VertexMetaData()
-        metadata_keys = metadata.model_dump().keys()
-        # ["version", "timestamp", "date", "ids"]
+    def _export_json(self, results: list[dict]) -> dict:
+        """Assemble the JSON dictionary of an exported project
 
-        # Create JSON dictionary
-        json_dict = {
+        Args:
+            results (list[dict]): the project subgraph, as returned by the
+                                  export_project query
+
+        Returns:
+            dict: JSON dictionary containing the project data
+        """
+        subgraph = results[0]
+        vertex_builder = self.builder.response.vertex
+        return {
             "vertices": {
-                "project": self._filter_non_empty_fields(
-                    project.model_dump(),
-                    exclude_keys=metadata_keys,
+                "project": self._export_vertex(
+                    vertex_builder.build_item([subgraph["project"]])
                 ),
-                "objectives": [
-                    self._filter_non_empty_fields(
-                        obj.model_dump(), exclude_keys=metadata_keys
-                    )
-                    for obj in objectives_nodes
-                ],
-                "opportunities": [
-                    self._filter_non_empty_fields(
-                        opp.model_dump(), exclude_keys=metadata_keys
-                    )
-                    for opp in opportunities_nodes
-                ],
-                "issues": [
-                    self._filter_non_empty_fields(
-                        issue.model_dump(), exclude_keys=metadata_keys
-                    )
-                    for issue in issue_nodes
-                ],
-                "merged_issues": [
-                    self._filter_non_empty_fields(
-                        merged.model_dump(), exclude_keys=metadata_keys
-                    )
-                    for merged in merged_issues
-                ],
+                **{
+                    group: [
+                        self._export_vertex(vertex)
+                        for vertex in vertex_builder.build_list(subgraph[group])
+                    ]
+                    for group in EXPORTED_VERTEX_GROUPS
+                },
             },
             "edges": [
                 edge.model_dump()
-                for edge in chain(
-                    contain_edges, influence_edges, merged_edges, has_vm_edges
-                )
+                for edge in self.builder.response.edge.build_list(subgraph["edges"])
             ],
         }
 
-        # Write JSON dictionary to file - Handled in frontend - saved to downloads folder
-        # print(f"Exporting project {project.model_dump()['name']} to JSON")
-        # file_name = project.model_dump()['name'].replace(" ", "_")
-        # downloads_folder = ""
-        # file_path = os.path.join(downloads_folder, f"{file_name}.json")
-        # with open(file_path, "w") as file:
-        #    json.dump(json_dict, file)
-
-        return json_dict
-
-    def _remove_contains_edge(self, uuid: str) -> None:
-        """Remove incoming edges with labels "contains" to a vertex
+    def _import_vertices(
+        self, project_json: dict
+    ) -> list[tuple[str, str, VertexCreate, bool]]:
+        """Vertices of an imported project, the project vertex first
 
         Args:
-            uuid (str): UUID of the vertex
+            project_json (dict): JSON dictionary with the project data
 
         Returns:
-            None
+            list[tuple[str, str, VertexCreate, bool]]: id in the JSON dictionary,
+                vertex label, data and whether the project "contains" the vertex
+                (merged issues are only linked to the issue they are merged into)
         """
-        contains_edge = EdgeRepository(self._client).read_in_edge_to_vertex(
-            edge_label="contains", vertex_uuid=uuid
-        )  # EdgeResponse
-        contains_edge_id = contains_edge[0].model_dump()
-        EdgeRepository(self._client).delete(contains_edge_id["id"])
-        return None
-
-    def _create_project_components_vertices(
-        self, vertices: list | dict, label: str, project_uuid: str, project_json: dict
+        project = project_json["vertices"]["project"]
+        vertices = [
+            (
+                project["id"],
+                "project",
+                ProjectCreate.model_validate(self._vertex_properties(project)),
+                False,
+            )
+        ]
+        for group, group_vertices in project_json["vertices"].items():
+            if group == "project":
+                continue
+            vertex_label, create_model = COMPONENT_VERTICES[group]
+            vertices.extend(
+                (
+                    vertex["id"],
+                    vertex_label,
+                    create_model.model_validate(self._vertex_properties(vertex)),
+                    group != "merged_issues",
+                )
+                for vertex in group_vertices
+            )
+        return vertices
+
+    def _check_import_edges(
+        self, project_json: dict, vertices: list[tuple[str, str, VertexCreate, bool]]
     ) -> None:
-        """Create vertices contained in a project and update uuids of edges
+        """Check, before creating anything, that the edges of an imported project
+        only link its own vertices
+
+        Args:
+            project_json (dict): JSON dictionary with the project data
+            vertices (list[tuple[str, str, VertexCreate, bool]]): the vertices of the
+                project (see _import_vertices)
+
+        Raises:
+            DanglingEdgeError: when an edge links a vertex which is not in the project
+        """
+        ids = {vertex[0] for vertex in vertices}
+        dangling = [
+            edge
+            for edge in project_json["edges"]
+            if edge["outV"] not in ids or edge["inV"] not in ids
+        ]
+        if dangling:
+            raise DanglingEdgeError(dangling)
+
+    def _import_edges(
+        self,
+        project_json: dict,
+        vertices: list[tuple[str, str, VertexCreate, bool]],
+        vertices_uuid: list[str],
+    ) -> list[tuple[str, str, str]]:
+        """Edges of an imported project, between the newly created vertices
 
         Args:
-            vertices (list | dict): vertices to be created as json
-            label (str): label of the vertice to create
-            project_uuid (str): UUID of the project
-            project_json (dict): The full project data as json
+            project_json (dict): JSON dictionary with the project data
+            vertices (list[tuple[str, str, VertexCreate, bool]]): the vertices of the
+                project (see _import_vertices)
+            vertices_uuid (list[str]): uuids of the created vertices
 
         Returns:
+            list[tuple[str, str, str]]: out_vertex_uuid, in_vertex_uuid and edge_label
+                                        of each edge
+        """
+        new_uuid = {
+            vertex[0]: uuid for vertex, uuid in zip(vertices, vertices_uuid, strict=True)
+        }
+        project_uuid = vertices_uuid[0]
+        edges = [
+            (project_uuid, uuid, "contains")
+            for vertex, uuid in zip(vertices, vertices_uuid, strict=True)
+            if vertex[3]
+        ]
+        edges.extend(
+            (new_uuid[edge["outV"]], new_uuid[edge["inV"]], edge["label"])
+            for edge in project_json["edges"]
+            # "contains" edges are created with the vertices
+            if edge["label"] != "contains"
+        )
+        return edges
+
+    @staticmethod
+    def _vertex_properties(vertex: dict) -> dict:
+        return {k: v for k, v in vertex.items() if k not in ["id", "label"]}
+
+
+class ProjectRepository(ProjectRepositoryBase):
+    def create(self, project_data: ProjectCreate) -> ProjectResponse:
+        """Method to create a new project vertex
+
+            Creates vertex with the label "project" and the properties of project_data
+
+        Args:
+            project_data (ProjectCreate): contains all properties for the project
+
+        Returns
+            ProjectResponse: Created Project with the project_data as ProjectCreate
+        """
+        return VertexRepository(self._client).create(
+            "project", project_data, response_model=ProjectResponse
+        )
+
+    def all(self) -> list[ProjectResponse]:
+        """Reads all project vertices
+
+        Args:
             None
+
+        Returns
+            List[ProjectResponse]: List of Projects in the database
         """
-        for vertex in vertices:
-            vertex.pop("label")
-            id = vertex.pop("id")
-            if label == "objectives":
-                created_vertex = ObjectiveRepository(self._client).create(
-                    project_uuid, ObjectiveCreate.model_validate(vertex)
-                )
-            elif label == "opportunities":
-                created_vertex = OpportunityRepository(self._client).create(
-                    project_uuid, OpportunityCreate.model_validate(vertex)
-                )
-            elif label == "issues":
-                created_vertex = IssueRepository(self._client).create(
-                    project_uuid, IssueCreate.model_validate(vertex)
-                )
-            elif label == "merged_issues":
-                created_vertex = IssueRepository(self._client).create(
-                    project_uuid, IssueCreate.model_validate(vertex)
-                )
-                self._remove_contains_edge(created_vertex.uuid)
-            # Update the vertex id in the edges
-            for edge in project_json["edges"]:
-                if edge["outV"] == id:
-                    edge["outV"] = created_vertex.uuid
-                elif edge["inV"] == id:
-                    edge["inV"] = created_vertex.uuid
-        return None
-
-    def import_project(self, project_json: dict):
+        return VertexRepository(self._client).all(
+            "project", response_model=ProjectResponse
+        )
+
+    def read(self, project_uuid: str) -> ProjectResponse:
+        """Method to read one project based on the id
+
+        Args:
+            project_uuid (str): id of the vertex with the label "project"'
+
+        Returns
+            ProjectResponse: Project with all properties
+        """
+        return VertexRepository(self._client).read(
+            project_uuid, project_uuid, response_model=ProjectResponse
+        )
+
+    def export_project(self, project_uuid: str) -> dict:
+        """Method to export one project based on the id in JSON format
+
+            The project, its objectives, opportunities, issues, merged issues and
+            all their edges are read in a single query.
+
+        Args
+            project_uuid (str): id of the vertex with the label "project"'
+
+        Returns
+            json_dict: JSON dictionary containing the project data
+        """
+        query = self.builder.query.vertex.export_project(project_uuid)
+        with self._client as c:
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+
+        # Write JSON dictionary to file - Handled in frontend - saved to downloads folder
+        # print(f"Exporting project {project.model_dump()['name']} to JSON")
+        # file_name = project.model_dump()['name'].replace(" ", "_")
+        # downloads_folder = ""
+        # file_path = os.path.join(downloads_folder, f"{file_name}.json")
+        # with open(file_path, "w") as file:
+        #    json.dump(json_dict, file)
+
+        return self._export_json(results)
+
+    def import_project(
+        self, project_json: dict, batch_size: int = settings.DB_IMPORT_BATCH_SIZE
+    ):
         """Method to import a project in JSON format
 
+            The project vertex, then the other vertices (in the partition of the
+            project), then the edges, are created batch_size at a time, each batch in
+            a single query.
+
         Args:
             project_json (dict): JSON dictionary with the project data
+            batch_size (int, optional): maximum number of vertices or edges created
+                                        per query.
+                                        Defaults to settings.DB_IMPORT_BATCH_SIZE.
+
+        Raises:
+            DanglingEdgeError: when an edge links a vertex which is not in the project
+            EdgeCreationError: when an edge is not created
 
         Returns
             None
         """
         # TODO: check the JSON format
-        project = project_json["vertices"]["project"]
-        project.pop("label")
-        id = project.pop("id")
-        project = ProjectCreate.model_validate(project)
-        # project_vertex = self._create_project_from_dict(project)
-        project_vertex = self.create(project)
-        # project_vertex = VertexRepository(self._client).create("project", project)
-        # Update the project vertex id in the edges
-        for edge in project_json["edges"]:
-            if edge["outV"] == id:
-                edge["outV"] = project_vertex.uuid
-        # Create all other vertices
-        for label, vertices in project_json["vertices"].items():
-            if label == "project":
-                continue
-            self._create_project_components_vertices(
-                vertices, label, project_vertex.uuid, project_json
-            )
-        # Create all edges
-        for edge in project_json["edges"]:
-            if edge["label"] == "contains":
-                # already created
-                continue
-            else:
-                EdgeRepository(self._client).create(
-                    edge_label=edge["label"],
-                    out_vertex_uuid=edge["outV"],
-                    in_vertex_uuid=edge["inV"],
+        vertices = self._import_vertices(project_json)
+        self._check_import_edges(project_json, vertices)
+        vertex_repository = VertexRepository(self._client)
+        (project_uuid,) = vertex_repository.create_batch([vertices[0][1:3]])
+        vertices_uuid = [project_uuid]
+        for k in range(1, len(vertices), batch_size):
+            vertices_uuid.extend(
+                vertex_repository.create_batch(
+                    [
+                        (label, data)
+                        for _, label, data, _ in vertices[k : k + batch_size]
+                    ],
+                    partition_key=project_uuid,
                 )
+            )
+        edges = self._import_edges(project_json, vertices, vertices_uuid)
+        edge_repository = EdgeRepository(self._client)
+        for k in range(0, len(edges), batch_size):
+            edge_repository.create_batch(edges[k : k + batch_size])
         return
 
     def update(
@@ -299,38 +336,152 @@ class ProjectRepository:
         Returns
             ProjectResponse: Project with the project_data as ProjectUpdate
         """
-        vertex = VertexRepository(self._client).update(project_uuid, modified_fields)
-        return ProjectResponse.convert_api_payload_to_response(vertex)
+        return VertexRepository(self._client).update(
+            project_uuid, modified_fields, response_model=ProjectResponse
+        )
 
-    def delete(self, project_uuid: str):
-        """Gets all vertices connected (via edge with label "contains") to the project
-             vertex with the id = project_uuid
+    def delete(self, project_uuid: str, batch_size: int = settings.DB_DELETE_BATCH_SIZE):
+        """Deletes the project vertex with the id = project_uuid, with all the
+            vertices connected to it (via edge with label "contains"), the issues
+            merged into those (via edge with label "merged_into") and their edges
 
-            Deletes all edges from these vertices and deletes afterwards all vertices
-            connected to the project
-            Deletes the project vertex based on the id
+            The vertices are dropped server side, batch_size at a time, the merged
+            issues first so that none is left unreachable.
 
         Args
             project_uuid (str): id of the project vertex
+            batch_size (int, optional): maximum number of vertices dropped per query.
+                                        Defaults to settings.DB_DELETE_BATCH_SIZE.
 
         Returns
             None
         """
-        vertex_list = VertexRepository(self._client).read_out_vertex(
-            project_uuid, edge_label="contains"
+        vertex_repository = VertexRepository(self._client)
+        for in_edge_label in PROJECT_DELETE_ORDER:
+            while (
+                vertex_repository.delete_out_vertex_batch(
+                    project_uuid, "contains", batch_size, in_edge_label, project_uuid
+                )
+                == batch_size
+            ):
+                pass
+        vertex_repository.delete(project_uuid, project_uuid)
+        return
+
+
+class AsyncProjectRepository(ProjectRepositoryBase):
+    """asyncio counterpart of ProjectRepository"""
+
+    async def create(self, project_data: ProjectCreate) -> ProjectResponse:
+        """See ProjectRepository.create"""
+        return await AsyncVertexRepository(self._client).create(
+            "project", project_data, response_model=ProjectResponse
+        )
+
+    async def all(self) -> list[ProjectResponse]:
+        """See ProjectRepository.all"""
+        return await AsyncVertexRepository(self._client).all(
+            "project", response_model=ProjectResponse
         )
 
-        # merged issues of the project, through "merged_into" edge into one of the nodes
-        merged_issues = []
-        for issue in vertex_list:
-            merged_issues.extend(
-                VertexRepository(self._client).read_in_vertex(
-                    issue.id, edge_label="merged_into"
+    async def read(self, project_uuid: str) -> ProjectResponse:
+        """See ProjectRepository.read"""
+        return await AsyncVertexRepository(self._client).read(
+            project_uuid, project_uuid, response_model=ProjectResponse
+        )
+
+    async def export_project(self, project_uuid: str) -> dict:
+        """See ProjectRepository.export_project"""
+        query = self.builder.query.vertex.export_project(project_uuid)
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self._export_json(results)
+
+    async def stream_project(self, project_uuid: str) -> AsyncIterator[dict]:
+        """Export a project one vertex or edge at a time
+
+            A constant number of queries is made (one per group of vertices and per
+            label of edges), each group being yielded as soon as it is read.
+
+        Args:
+            project_uuid (str): id of the vertex with the label "project"
+
+        Yields:
+            dict: `{group: vertex}` for the project, then its objectives,
+                  opportunities, issues and merged issues, then `{"edges": edge}`
+                  for all its edges (the keys of the JSON export)
+        """
+        vertex_repository = AsyncVertexRepository(self._client)
+        edge_repository = AsyncEdgeRepository(self._client)
+        project = await vertex_repository.read(project_uuid, project_uuid)
+        yield {"project": self._export_vertex(project)}
+        for group in EXPORTED_VERTEX_GROUPS:
+            if group == "merged_issues":
+                vertices = await vertex_repository.read_out_in_vertex(
+                    project_uuid, "contains", "merged_into", project_uuid
+                )
+            else:
+                vertices = await vertex_repository.read_out_vertex(
+                    project_uuid,
+                    "contains",
+                    COMPONENT_VERTICES[group][0],
+                    partition_key=project_uuid,
+                )
+            for vertex in vertices:
+                yield {group: self._export_vertex(vertex)}
+        for label in EXPORTED_EDGE_LABELS:
+            for edge in await edge_repository.read_all_edges_from_project(
+                project_uuid, label
+            ):
+                yield {"edges": edge.model_dump()}
+
+    async def import_project(
+        self, project_json: dict, batch_size: int = settings.DB_IMPORT_BATCH_SIZE
+    ):
+        """See ProjectRepository.import_project"""
+        vertices = self._import_vertices(project_json)
+        self._check_import_edges(project_json, vertices)
+        vertex_repository = AsyncVertexRepository(self._client)
+        (project_uuid,) = await vertex_repository.create_batch([vertices[0][1:3]])
+        vertices_uuid = [project_uuid]
+        for k in range(1, len(vertices), batch_size):
+            vertices_uuid.extend(
+                await vertex_repository.create_batch(
+                    [
+                        (label, data)
+                        for _, label, data, _ in vertices[k : k + batch_size]
+                    ],
+                    partition_key=project_uuid,
                 )
             )
-        vertex_list.extend(merged_issues)
-        for v in vertex_list:
-            EdgeRepository(self._client).delete_edge_from_vertex(v.id)
-            VertexRepository(self._client).delete(v.id)
-        VertexRepository(self._client).delete(project_uuid)
+        edges = self._import_edges(project_json, vertices, vertices_uuid)
+        edge_repository = AsyncEdgeRepository(self._client)
+        for k in range(0, len(edges), batch_size):
+            await edge_repository.create_batch(edges[k : k + batch_size])
+        return
+
+    async def update(
+        self, project_uuid: str, modified_fields: ProjectUpdate
+    ) -> ProjectResponse:
+        """See ProjectRepository.update"""
+        return await AsyncVertexRepository(self._client).update(
+            project_uuid, modified_fields, response_model=ProjectResponse
+        )
+
+    async def delete(
+        self, project_uuid: str, batch_size: int = settings.DB_DELETE_BATCH_SIZE
+    ):
+        """See ProjectRepository.delete"""
+        vertex_repository = AsyncVertexRepository(self._client)
+        for in_edge_label in PROJECT_DELETE_ORDER:
+            while (
+                await vertex_repository.delete_out_vertex_batch(
+                    project_uuid, "contains", batch_size, in_edge_label, project_uuid
+                )
+                == batch_size
+            ):
+                pass
+        await vertex_repository.delete(project_uuid, project_uuid)
         return
@@ -0,0 +1,45 @@
+from itertools import product
+
+from ..database.client import DatabaseClient
+from ..models.issue import IssueResponse
+from ..models.structure import InfluenceDiagramResponse
+
+INFLUENCE_DIAGRAM_ORDER: dict[tuple[str, str], int] = {
+    key: k
+    for k, key in enumerate(
+        product(["Uncertainty", "Decision", "Value Metric"], ["in", "on"])
+    )
+}
+"""Order of the vertices of the influence diagram (by category then boundary)"""
+
+
+class StructureRepository:
+    def __init__(self, client: DatabaseClient):
+        self._client = client
+        self.builder = client.builder
+
+    def read_influence_diagram(self, project_uuid: str) -> InfluenceDiagramResponse:
+        """Read the vertices and "influences" edges of the influence diagram
+
+        The vertices (key uncertainties, focus decisions and value metrics in or on
+        the boundary) and the edges between them are read in a single query.
+
+        Args:
+            project_uuid (str): id of the project vertex
+
+        Returns:
+            InfluenceDiagramResponse: vertices (ordered by category then boundary) and
+                                      edges of the influence diagram
+        """
+        query = self.builder.query.vertex.read_influence_diagram(project_uuid)
+        with self._client as c:
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        issues = self.builder.response.vertex.build_list(
+            results[0]["vertices"], IssueResponse
+        )
+        edges = self.builder.response.edge.build_list(results[0]["edges"])
+        issues = sorted(
+            issues,
+            key=lambda issue: INFLUENCE_DIAGRAM_ORDER[(issue.category, issue.boundary)],
+        )
+        return InfluenceDiagramResponse(vertices=issues, edges=edges)
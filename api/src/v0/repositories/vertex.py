@@ -1,4 +1,5 @@
-from ..database.client import DatabaseClient
+from ..database.builders.responses.gremlin_responses_vertex import ResponseModel
+from ..database.client import AsyncDatabaseClient, DatabaseClient
 from ..models.filter import Filter
 from ..models.meta import VertexMetaData
 from ..models.vertex import VertexCreate, VertexResponse, VertexUpdate
@@ -9,7 +10,13 @@ class VertexRepository:
         self._client = client
         self.builder = client.builder
 
-    def create(self, vertex_label: str, vertex: VertexCreate) -> VertexResponse:
+    def create(
+        self,
+        vertex_label: str,
+        vertex: VertexCreate,
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> ResponseModel:
         """Creates a new vertex based on vertex data
 
         Args:
@@ -18,6 +25,14 @@ class VertexRepository:
             vertex (VertexCreate): data for properties in vertex
                 provides generated uuid
                 provides uuid will also be set as the id in the DB
+            partition_key (str, optional): uuid of the project of the vertex, stored
+                                           as its partition key ("ids"). Defaults to
+                                           None, a vertex without project (e.g. a
+                                           project) being its own partition.
+            response_model (type[ResponseModel], optional): model to validate the
+                                                            vertices into, e.g.
+                                                            IssueResponse. Defaults to
+                                                            VertexResponse.
 
         Return:
             VertexResponse: dict of the created vertex
@@ -25,12 +40,43 @@ class VertexRepository:
         """
         metadata = VertexMetaData()
         vertex_data = {**metadata.model_dump(), **vertex.model_dump()}
+        vertex_data["ids"] = partition_key or str(vertex_data["uuid"])
         query = self.builder.query.vertex.create_vertex(vertex_label, vertex_data)
         with self._client as c:
-            results = c.execute_query(query)
-        return self.builder.response.vertex.build_item(results)
+            results = c.execute_query(query.template, query.bindings)
+        return self.builder.response.vertex.build_item(results, response_model)
+
+    def create_batch(
+        self, vertices: list[tuple[str, VertexCreate]], partition_key: str = None
+    ) -> list[str]:
+        """Creates several vertices in a single query
+
+        Args:
+            vertices (list[tuple[str, VertexCreate]]): vertex label and data of each
+                                                       vertex (see create)
+            partition_key (str, optional): uuid of the project of the vertices (see
+                                           create). Defaults to None.
 
-    def read(self, vertex_uuid: str) -> VertexResponse:
+        Return:
+            list[str]: uuids of the created vertices, in the same order
+        """
+        vertices_data = [
+            (vertex_label, {**VertexMetaData().model_dump(), **vertex.model_dump()})
+            for vertex_label, vertex in vertices
+        ]
+        for _, vertex_data in vertices_data:
+            vertex_data["ids"] = partition_key or str(vertex_data["uuid"])
+        query = self.builder.query.vertex.create_vertices(vertices_data)
+        with self._client as c:
+            c.execute_query(query.template, query.bindings)
+        return [str(vertex_data["uuid"]) for _, vertex_data in vertices_data]
+
+    def read(
+        self,
+        vertex_uuid: str,
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> ResponseModel:
         """Reads a vertex based on the vertex id in the DB
 
         Args:
@@ -40,14 +86,20 @@ class VertexRepository:
                 the same based on the implementation in the create method
                 This is an active choice of us, otherwise, the id will be automatically
                 generated in the DB
+            partition_key (str, optional): uuid of the project of the vertex, its
+                                           partition key. Defaults to None.
+            response_model (type[ResponseModel], optional): model to validate the
+                                                            vertices into, e.g.
+                                                            IssueResponse. Defaults to
+                                                            VertexResponse.
 
         Return:
             VertexResponse: dict with all data of the vertex (VertexResponse)
         """
-        query = self.builder.query.vertex.read_vertex(vertex_uuid)
+        query = self.builder.query.vertex.read_vertex(vertex_uuid, partition_key)
         with self._client as c:
-            results = c.execute_query(query)
-        return self.builder.response.vertex.build_item(results)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        return self.builder.response.vertex.build_item(results, response_model)
 
     def read_out_vertex(
         self,
@@ -55,7 +107,9 @@ class VertexRepository:
         edge_label: str,
         original_vertex_label: str = None,
         filter_model: Filter = None,
-    ) -> list[VertexResponse]:
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> list[ResponseModel]:
         """Read vertices based on outgoing edge labels.
 
         Args:
@@ -68,6 +122,12 @@ class VertexRepository:
             filter_model (Filter, optional): BaseModel containing properties to use as
                                              a filter, for example the type or tag of
                                              vertices. Defaults to None.
+            partition_key (str, optional): uuid of the project of the vertex, its
+                                           partition key. Defaults to None.
+            response_model (type[ResponseModel], optional): model to validate the
+                                                            vertices into, e.g.
+                                                            IssueResponse. Defaults to
+                                                            VertexResponse.
 
         Returns:
             List[VertexResponse]:
@@ -85,11 +145,45 @@ class VertexRepository:
         """
         filter_dict = None if filter_model is None else filter_model.model_dump()
         query = self.builder.query.vertex.read_out_vertex(
-            vertex_uuid, edge_label, original_vertex_label, filter_dict
+            vertex_uuid, edge_label, original_vertex_label, filter_dict, partition_key
+        )
+        with self._client as c:
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        return self.builder.response.vertex.build_list(results, response_model)
+
+    def read_out_in_vertex(
+        self,
+        vertex_uuid: str,
+        out_edge_label: str,
+        in_edge_label: str,
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> list[ResponseModel]:
+        """Read the vertices with an edge going into the vertices connected to the
+            specified vertex through an outgoing edge
+
+        Args:
+            vertex_uuid (str): id of the vertex
+            out_edge_label (str): label of the outgoing edges, e.g. "contains"
+            in_edge_label (str): label of the edges going into the connected
+                                 vertices, e.g. "merged_into"
+            partition_key (str, optional): uuid of the project of the vertex, its
+                                           partition key. Defaults to None.
+            response_model (type[ResponseModel], optional): model to validate the
+                                                            vertices into, e.g.
+                                                            IssueResponse. Defaults to
+                                                            VertexResponse.
+
+        Returns:
+            List[VertexResponse]: e.g. the issues merged into the vertices contained
+                                  in a project
+        """
+        query = self.builder.query.vertex.read_out_in_vertex(
+            vertex_uuid, out_edge_label, in_edge_label, partition_key
         )
         with self._client as c:
-            results = c.execute_query(query)
-        return self.builder.response.vertex.build_list(results)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        return self.builder.response.vertex.build_list(results, response_model)
 
     def read_in_vertex(
         self,
@@ -97,7 +191,9 @@ class VertexRepository:
         edge_label: str,
         original_vertex_label: str = None,
         filter_model: Filter = None,
-    ) -> list[VertexResponse]:
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> list[ResponseModel]:
         """Read vertices based on incoming edge labels.
 
         Args:
@@ -110,6 +206,12 @@ class VertexRepository:
             filter_model (Filter, optional): BaseModel containing properties to use
                                              as a filter, for example the type or tag
                                              of vertices. Defaults to None.
+            partition_key (str, optional): uuid of the project of the vertex, its
+                                           partition key. Defaults to None.
+            response_model (type[ResponseModel], optional): model to validate the
+                                                            vertices into, e.g.
+                                                            IssueResponse. Defaults to
+                                                            VertexResponse.
 
         Returns:
             List[VertexResponse]: List of all vertices connected to the vertex with
@@ -128,35 +230,50 @@ class VertexRepository:
         """
         filter_dict = None if filter_model is None else filter_model.model_dump()
         query = self.builder.query.vertex.read_in_vertex(
-            vertex_uuid, edge_label, original_vertex_label, filter_dict
+            vertex_uuid, edge_label, original_vertex_label, filter_dict, partition_key
         )
         with self._client as c:
-            results = c.execute_query(query)
-        return self.builder.response.vertex.build_list(results)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        return self.builder.response.vertex.build_list(results, response_model)
 
     # Not sure if this is needed
     # def all(self, vertex_label: str, filter_dict: dict = None) -> List[VertexResponse]:
-    def all(self, vertex_label: str) -> list[VertexResponse]:
+    def all(
+        self, vertex_label: str, response_model: type[ResponseModel] = VertexResponse
+    ) -> list[ResponseModel]:
         """Read all vertices given a label
 
         Args:
             vertex_label (str): label of vertices to read (e.g. opportunity)
+            response_model (type[ResponseModel], optional): model to validate the
+                                                            vertices into, e.g.
+                                                            IssueResponse. Defaults to
+                                                            VertexResponse.
 
         Returns:
             list[VertexResponse]: list of vertices with the given label
         """
         query = self.builder.query.vertex.list_all_vertices(vertex_label)
         with self._client as c:
-            results = c.execute_query(query)
-        return self.builder.response.vertex.build_list(results)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        return self.builder.response.vertex.build_list(results, response_model)
 
-    def update(self, vertex_uuid: str, modified_fields: VertexUpdate) -> VertexResponse:
+    def update(
+        self,
+        vertex_uuid: str,
+        modified_fields: VertexUpdate,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> ResponseModel:
         """Updated the specified vertex with the new vertex properties
 
         Args:
             vertex_uuid (str): id of the to be updated vertex
             modified_fields (VertexUpdate): properties of vertices which will
                                             be updated
+            response_model (type[ResponseModel], optional): model to validate the
+                                                            vertices into, e.g.
+                                                            IssueResponse. Defaults to
+                                                            VertexResponse.
 
         Return:
             VertexResponse: vertex dict with updated properties
@@ -165,19 +282,215 @@ class VertexRepository:
             vertex_uuid, modified_fields.model_dump(exclude_unset=True)
         )
         with self._client as c:
-            results = c.execute_query(query)
-        return self.builder.response.vertex.build_item(results)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        return self.builder.response.vertex.build_item(results, response_model)
 
-    def delete(self, vertex_uuid: str) -> None:
+    def delete(self, vertex_uuid: str, partition_key: str = None) -> None:
         """method to delete a vertex based on the vertex id
 
         Args:
             vertex_uuid (str): id of the vertex which will be deleted
+            partition_key (str, optional): uuid of the project of the vertex, its
+                                           partition key. Defaults to None.
 
         Return:
             None
         """
-        query = self.builder.query.vertex.delete_vertex(vertex_uuid)
+        query = self.builder.query.vertex.delete_vertex(vertex_uuid, partition_key)
         with self._client as c:
-            results = c.execute_query(query)
+            results = c.execute_query(query.template, query.bindings, idempotent=True)
+        return self.builder.response.vertex.build_none(results)
+
+    def delete_out_vertex_batch(
+        self,
+        vertex_uuid: str,
+        edge_label: str,
+        batch_size: int,
+        in_edge_label: str = None,
+        partition_key: str = None,
+    ) -> int:
+        """Delete at most batch_size vertices connected through an outgoing edge
+
+        Args:
+            vertex_uuid (str): id of the vertex
+            edge_label (str): edge label, e.g. "contains"
+            batch_size (int): maximum number of vertices to delete
+            in_edge_label (str, optional): label of the incoming edges to follow from
+                                           the connected vertices, e.g. "merged_into".
+                                           Defaults to None.
+            partition_key (str, optional): uuid of the project of the vertex, its
+                                           partition key. Defaults to None.
+
+        Return:
+            int: number of deleted vertices (less than batch_size when no vertex is
+                 left to delete)
+        """
+        query = self.builder.query.vertex.delete_out_vertex_batch(
+            vertex_uuid, edge_label, batch_size, in_edge_label, partition_key
+        )
+        with self._client as c:
+            results = c.execute_query(query.template, query.bindings)
+        return results[0]
+
+
+class AsyncVertexRepository:
+    """asyncio counterpart of VertexRepository, sharing its query/response builders"""
+
+    def __init__(self, client: AsyncDatabaseClient):
+        self._client = client
+        self.builder = client.builder
+
+    async def create(
+        self,
+        vertex_label: str,
+        vertex: VertexCreate,
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> ResponseModel:
+        """See VertexRepository.create"""
+        metadata = VertexMetaData()
+        vertex_data = {**metadata.model_dump(), **vertex.model_dump()}
+        vertex_data["ids"] = partition_key or str(vertex_data["uuid"])
+        query = self.builder.query.vertex.create_vertex(vertex_label, vertex_data)
+        async with self._client as c:
+            results = await c.execute_query(query.template, query.bindings)
+        return self.builder.response.vertex.build_item(results, response_model)
+
+    async def create_batch(
+        self, vertices: list[tuple[str, VertexCreate]], partition_key: str = None
+    ) -> list[str]:
+        """See VertexRepository.create_batch"""
+        vertices_data = [
+            (vertex_label, {**VertexMetaData().model_dump(), **vertex.model_dump()})
+            for vertex_label, vertex in vertices
+        ]
+        for _, vertex_data in vertices_data:
+            vertex_data["ids"] = partition_key or str(vertex_data["uuid"])
+        query = self.builder.query.vertex.create_vertices(vertices_data)
+        async with self._client as c:
+            await c.execute_query(query.template, query.bindings)
+        return [str(vertex_data["uuid"]) for _, vertex_data in vertices_data]
+
+    async def read(
+        self,
+        vertex_uuid: str,
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> ResponseModel:
+        """See VertexRepository.read"""
+        query = self.builder.query.vertex.read_vertex(vertex_uuid, partition_key)
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.vertex.build_item(results, response_model)
+
+    async def read_out_vertex(
+        self,
+        vertex_uuid: str,
+        edge_label: str,
+        original_vertex_label: str = None,
+        filter_model: Filter = None,
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> list[ResponseModel]:
+        """See VertexRepository.read_out_vertex"""
+        filter_dict = None if filter_model is None else filter_model.model_dump()
+        query = self.builder.query.vertex.read_out_vertex(
+            vertex_uuid, edge_label, original_vertex_label, filter_dict, partition_key
+        )
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.vertex.build_list(results, response_model)
+
+    async def read_out_in_vertex(
+        self,
+        vertex_uuid: str,
+        out_edge_label: str,
+        in_edge_label: str,
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> list[ResponseModel]:
+        """See VertexRepository.read_out_in_vertex"""
+        query = self.builder.query.vertex.read_out_in_vertex(
+            vertex_uuid, out_edge_label, in_edge_label, partition_key
+        )
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.vertex.build_list(results, response_model)
+
+    async def read_in_vertex(
+        self,
+        vertex_uuid: str,
+        edge_label: str,
+        original_vertex_label: str = None,
+        filter_model: Filter = None,
+        partition_key: str = None,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> list[ResponseModel]:
+        """See VertexRepository.read_in_vertex"""
+        filter_dict = None if filter_model is None else filter_model.model_dump()
+        query = self.builder.query.vertex.read_in_vertex(
+            vertex_uuid, edge_label, original_vertex_label, filter_dict, partition_key
+        )
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.vertex.build_list(results, response_model)
+
+    async def all(
+        self, vertex_label: str, response_model: type[ResponseModel] = VertexResponse
+    ) -> list[ResponseModel]:
+        """See VertexRepository.all"""
+        query = self.builder.query.vertex.list_all_vertices(vertex_label)
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.vertex.build_list(results, response_model)
+
+    async def update(
+        self,
+        vertex_uuid: str,
+        modified_fields: VertexUpdate,
+        response_model: type[ResponseModel] = VertexResponse,
+    ) -> ResponseModel:
+        """See VertexRepository.update"""
+        query = self.builder.query.vertex.update_vertex(
+            vertex_uuid, modified_fields.model_dump(exclude_unset=True)
+        )
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
+        return self.builder.response.vertex.build_item(results, response_model)
+
+    async def delete(self, vertex_uuid: str, partition_key: str = None) -> None:
+        """See VertexRepository.delete"""
+        query = self.builder.query.vertex.delete_vertex(vertex_uuid, partition_key)
+        async with self._client as c:
+            results = await c.execute_query(
+                query.template, query.bindings, idempotent=True
+            )
         return self.builder.response.vertex.build_none(results)
+
+    async def delete_out_vertex_batch(
+        self,
+        vertex_uuid: str,
+        edge_label: str,
+        batch_size: int,
+        in_edge_label: str = None,
+        partition_key: str = None,
+    ) -> int:
+        """See VertexRepository.delete_out_vertex_batch"""
+        query = self.builder.query.vertex.delete_out_vertex_batch(
+            vertex_uuid, edge_label, batch_size, in_edge_label, partition_key
+        )
+        async with self._client as c:
+            results = await c.execute_query(query.template, query.bindings)
+        return results[0]
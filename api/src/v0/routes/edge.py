@@ -2,10 +2,10 @@ from fastapi import APIRouter, Depends, Query
 from fastapi_versionizer.versionizer import api_version
 
 from .. import database_version
-from ..database.adapter import get_client
+from ..database.adapter import get_async_client
 from ..models.edge import EdgeResponse
-from ..repositories.edge import EdgeRepository
-from ..services.edge import EdgeService
+from ..repositories.edge import AsyncEdgeRepository
+from ..services.edge import AsyncEdgeService
 
 router = APIRouter(
     tags=["edges"],
@@ -15,12 +15,12 @@ router = APIRouter(
 )
 
 
-def get_repository(client=Depends(get_client)):
-    return EdgeRepository(client)
+def get_repository(client=Depends(get_async_client)):
+    return AsyncEdgeRepository(client)
 
 
 def get_service(repository=Depends(get_repository)):
-    return EdgeService(repository)
+    return AsyncEdgeService(repository)
 
 
 @api_version(database_version)
@@ -29,11 +29,11 @@ def get_service(repository=Depends(get_repository)):
     response_model=EdgeResponse,
     summary="Create a new edge by its label",
 )
-def create(
+async def create(
     out_vertex_uuid: str,
     in_vertex_uuid: str,
     edge_label: str,
-    service: EdgeService = Depends(get_service),
+    service: AsyncEdgeService = Depends(get_service),
 ) -> EdgeResponse:
     """Create a new edge between two vertices
 
@@ -47,7 +47,7 @@ def create(
                         where id == uuid
 
     """
-    return service.create(out_vertex_uuid, in_vertex_uuid, edge_label)
+    return await service.create(out_vertex_uuid, in_vertex_uuid, edge_label)
 
 
 # TODO: Do we need this call?
@@ -57,10 +57,10 @@ def create(
     response_model=list[EdgeResponse],
     summary="Get edges by their label from a project by its UUID",
 )
-def read_all_edges_from_project(
+async def read_all_edges_from_project(
     project_uuid: str,
     edge_label: str,
-    service: EdgeService = Depends(get_service),
+    service: AsyncEdgeService = Depends(get_service),
 ) -> list[EdgeResponse]:
     """Method to return all edges with the specified edge label
 
@@ -71,7 +71,7 @@ def read_all_edges_from_project(
     Returns:
         list[EdgeResponse]: List of Edges
     """
-    return service.read_all_edges_from_project(project_uuid, edge_label)
+    return await service.read_all_edges_from_project(project_uuid, edge_label)
 
 
 # TODO: Do we need this call?
@@ -84,11 +84,11 @@ def read_all_edges_from_project(
         "tails from a project by its UUID"
     ),
 )
-def read_all_edges_from_sub_project(
+async def read_all_edges_from_sub_project(
     project_uuid: str,
     edge_label: str,
     vertex_uuid: list[str] = Query(None),
-    service: EdgeService = Depends(get_service),
+    service: AsyncEdgeService = Depends(get_service),
 ) -> list[EdgeResponse]:
     """Method to return all edges with the specified edge label and linking vertices
         with given properties
@@ -101,7 +101,9 @@ def read_all_edges_from_sub_project(
     Returns:
         list[EdgeResponse]: List of Edges
     """
-    return service.read_all_edges_from_sub_project(project_uuid, edge_label, vertex_uuid)
+    return await service.read_all_edges_from_sub_project(
+        project_uuid, edge_label, vertex_uuid
+    )
 
 
 @api_version(database_version)
@@ -112,10 +114,10 @@ def read_all_edges_from_sub_project(
         "Get outgoing edges by their label and " "their heads from a project by its UUID"
     ),
 )
-def read_out_edge_from_vertex(
+async def read_out_edge_from_vertex(
     vertex_uuid: str,
     edge_label: str,
-    service: EdgeService = Depends(get_service),
+    service: AsyncEdgeService = Depends(get_service),
 ) -> list[EdgeResponse]:
     """Returns edges going out of the specified vertex
 
@@ -125,7 +127,7 @@ def read_out_edge_from_vertex(
     Return:
         List of edges
     """
-    return service.read_out_edge_from_vertex(vertex_uuid, edge_label)
+    return await service.read_out_edge_from_vertex(vertex_uuid, edge_label)
 
 
 @api_version(database_version)
@@ -136,10 +138,10 @@ def read_out_edge_from_vertex(
         "Get incoming edges by their label and " "their tails from a project by its UUID"
     ),
 )
-def read_in_edge_to_vertex(
+async def read_in_edge_to_vertex(
     vertex_uuid: str,
     edge_label: str,
-    service: EdgeService = Depends(get_service),
+    service: AsyncEdgeService = Depends(get_service),
 ) -> list[EdgeResponse]:
     """Returns edges going in to the specified vertex
 
@@ -149,7 +151,7 @@ def read_in_edge_to_vertex(
     Return:
         List of edges
     """
-    return service.read_in_edge_to_vertex(vertex_uuid, edge_label)
+    return await service.read_in_edge_to_vertex(vertex_uuid, edge_label)
 
 
 # TODO: Do we need this call?
@@ -159,7 +161,9 @@ def read_in_edge_to_vertex(
     response_model=EdgeResponse,
     summary="Get an edge by its UUID",
 )
-def read(edge_id: str, service: EdgeService = Depends(get_service)) -> EdgeResponse:
+async def read(
+    edge_id: str, service: AsyncEdgeService = Depends(get_service)
+) -> EdgeResponse:
     """Method to read one edge based on the id
 
     Args:
@@ -168,7 +172,7 @@ def read(edge_id: str, service: EdgeService = Depends(get_service)) -> EdgeRespo
     Returns:
         EdgeResponse: Edge
     """
-    return service.read(edge_id)
+    return await service.read(edge_id)
 
 
 # # TODO: Do we need this call?
@@ -181,7 +185,7 @@ def read(edge_id: str, service: EdgeService = Depends(get_service)) -> EdgeRespo
 # def update(
 #     edge_id: str,
 #     modified_fields: EdgeUpdate,
-#     service: EdgeService = Depends(get_service),
+#     service: AsyncEdgeService = Depends(get_service),
 # ):
 #     return service.update(edge_id, modified_fields)
 
@@ -192,7 +196,7 @@ def read(edge_id: str, service: EdgeService = Depends(get_service)) -> EdgeRespo
     response_model=None,
     summary="Delete an edge by its UUID",
 )
-def delete(edge_id: str, service: EdgeService = Depends(get_service)) -> None:
+async def delete(edge_id: str, service: AsyncEdgeService = Depends(get_service)) -> None:
     """Deletes edges going in and out of the specified vertex
 
     Args:
@@ -201,7 +205,7 @@ def delete(edge_id: str, service: EdgeService = Depends(get_service)) -> None:
     Return:
         None
     """
-    return service.delete(edge_id)
+    return await service.delete(edge_id)
 
 
 # TODO: add more routers for special deletion of edges based on vertices.
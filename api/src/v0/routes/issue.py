@@ -2,11 +2,11 @@ from fastapi import APIRouter, Depends
 from fastapi_versionizer.versionizer import api_version
 
 from .. import database_version
-from ..database.adapter import get_client
+from ..database.adapter import get_async_client
 from ..models.filter import Filter
 from ..models.issue import IssueCreate, IssueResponse, IssueUpdate
-from ..repositories.issue import IssueRepository
-from ..services.issue import IssueService
+from ..repositories.issue import AsyncIssueRepository
+from ..services.issue import AsyncIssueService
 
 router = APIRouter(
     tags=["issues"],
@@ -16,12 +16,12 @@ router = APIRouter(
 )
 
 
-def get_repository(client=Depends(get_client)):
-    return IssueRepository(client)
+def get_repository(client=Depends(get_async_client)):
+    return AsyncIssueRepository(client)
 
 
 def get_service(repository=Depends(get_repository)):
-    return IssueService(repository)
+    return AsyncIssueService(repository)
 
 
 @api_version(database_version)
@@ -30,10 +30,10 @@ def get_service(repository=Depends(get_repository)):
     response_model=IssueResponse,
     summary="Create a new issue by its project UUID",
 )
-def create(
+async def create(
     project_uuid: str,
     issue_data: IssueCreate,
-    service: IssueService = Depends(get_service),
+    service: AsyncIssueService = Depends(get_service),
 ) -> IssueResponse:
     """Method to create a new issue connected to a project vertex
 
@@ -49,7 +49,7 @@ def create(
     Returns:
         IssueResponse: Created Issue with the issue_data as IssueCreate
     """
-    return service.create(project_uuid=project_uuid, issue_data=issue_data)
+    return await service.create(project_uuid=project_uuid, issue_data=issue_data)
 
 
 @api_version(database_version)
@@ -58,10 +58,10 @@ def create(
     response_model=list[IssueResponse],
     summary="Get all issues by their project UUID",
 )
-def read_issues_all(
+async def read_issues_all(
     project_uuid: str,
     filter_model: Filter = Depends(),
-    service: IssueService = Depends(get_service),
+    service: AsyncIssueService = Depends(get_service),
 ) -> list[IssueResponse]:
     """Read all issues connected to one project with filter possibilities
 
@@ -81,7 +81,7 @@ def read_issues_all(
                                 and have the label "issue" and satisfy the filters
                                 when given in filter_model
     """
-    return service.read_issues_all(
+    return await service.read_issues_all(
         project_uuid=project_uuid,
         filter_model=filter_model,
     )
@@ -93,9 +93,9 @@ def read_issues_all(
     response_model=IssueResponse,
     summary="Get an issue by its UUID",
 )
-def read(
+async def read(
     issue_uuid: str,
-    service: IssueService = Depends(get_service),
+    service: AsyncIssueService = Depends(get_service),
 ) -> IssueResponse:
     """Method to read one issue based on the id
 
@@ -105,7 +105,7 @@ def read(
     Returns:
         IssueResponse: Issue with all properties
     """
-    return service.read(issue_uuid)
+    return await service.read(issue_uuid)
 
 
 @api_version(database_version)
@@ -114,10 +114,10 @@ def read(
     response_model=IssueResponse,
     summary="Partial update of an issue by its UUID",
 )
-def update(
+async def update(
     issue_uuid: str,
     modified_fields: IssueUpdate,
-    service: IssueService = Depends(get_service),
+    service: AsyncIssueService = Depends(get_service),
 ) -> IssueResponse:
     """Updates the specified issue based on the id with the new issue_data
 
@@ -128,7 +128,7 @@ def update(
     Returns:
         IssueResponse: Issue with the issue_data as IssueCreate
     """
-    return service.update(issue_uuid, modified_fields)
+    return await service.update(issue_uuid, modified_fields)
 
 
 @api_version(database_version)
@@ -137,7 +137,9 @@ def update(
     response_model=None,
     summary="Delete an issue by its UUID",
 )
-def delete(issue_uuid: str, service: IssueService = Depends(get_service)) -> None:
+async def delete(
+    issue_uuid: str, service: AsyncIssueService = Depends(get_service)
+) -> None:
     """Deletes the issue vertex based on the id and also all in and outgoing edges
         from this vertex
 
@@ -147,7 +149,7 @@ def delete(issue_uuid: str, service: IssueService = Depends(get_service)) -> Non
     Returns:
         None
     """
-    service.delete(issue_uuid)
+    await service.delete(issue_uuid)
     return
 
 
@@ -157,11 +159,11 @@ def delete(issue_uuid: str, service: IssueService = Depends(get_service)) -> Non
     response_model=IssueResponse,
     summary="Merged 2 issues within a project by its UUID",
 )
-def merge(
+async def merge(
     project_uuid: str,
     source_issue: IssueResponse,
     destination_issue: IssueResponse,
-    service: IssueService = Depends(get_service),
+    service: AsyncIssueService = Depends(get_service),
 ) -> IssueResponse:
     """Function to merge two issues, will create a new issue if source issue or
         destination issue is not a merged issue already.
@@ -179,7 +181,7 @@ def merge(
     Returns:
         merged_issue (IssueResponse)
     """
-    return service.merge(
+    return await service.merge(
         project_uuid=project_uuid,
         source_issue=source_issue,
         destination_issue=destination_issue,
@@ -192,10 +194,10 @@ def merge(
     response_model=list[str],
     summary="Unmerge a merged issue by its UUID within a project by its UUID",
 )
-def un_merge(
+async def un_merge(
     project_uuid: str,
     merged_issue_uuid: str,
-    service: IssueService = Depends(get_service),
+    service: AsyncIssueService = Depends(get_service),
 ) -> list[str]:
     """Function to un-merge a merged issue
 
@@ -209,6 +211,6 @@ def un_merge(
     Returns:
         list[str]: uuids of the issues that had been merged
     """
-    return service.un_merge(
+    return await service.un_merge(
         project_uuid=project_uuid, merged_issue_uuid=merged_issue_uuid
     )
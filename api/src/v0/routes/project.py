@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi_versionizer.versionizer import api_version
 
 from .. import database_version
-from ..database.adapter import get_client
+from ..database.adapter import get_async_client
 from ..models.project import ProjectCreate, ProjectResponse, ProjectUpdate
-from ..repositories.project import ProjectRepository
-from ..services.project import ProjectService
+from ..repositories.project import AsyncProjectRepository, DanglingEdgeError
+from ..services.project import AsyncProjectService
 
 router = APIRouter(
     tags=["projects"],
@@ -15,18 +18,18 @@ router = APIRouter(
 )
 
 
-def get_repository(client=Depends(get_client)):
-    return ProjectRepository(client)
+def get_repository(client=Depends(get_async_client)):
+    return AsyncProjectRepository(client)
 
 
 def get_service(repository=Depends(get_repository)):
-    return ProjectService(repository)
+    return AsyncProjectService(repository)
 
 
 @api_version(database_version)
 @router.post("/projects", response_model=ProjectResponse, summary="Create a new project")
-def create(
-    project_data: ProjectCreate, service: ProjectService = Depends(get_service)
+async def create(
+    project_data: ProjectCreate, service: AsyncProjectService = Depends(get_service)
 ) -> ProjectResponse:
     """Method to create a new project vertex
 
@@ -38,15 +41,15 @@ def create(
     Returns
         ProjectResponse: Created Project with the project_data as ProjectCreate
     """
-    return service.create(project_data)
+    return await service.create(project_data)
 
 
 @api_version(database_version)
 @router.get(
     "/projects", response_model=list[ProjectResponse], summary="Read all projects"
 )
-def read_projects_all(
-    service: ProjectService = Depends(get_service),
+async def read_projects_all(
+    service: AsyncProjectService = Depends(get_service),
 ) -> list[ProjectResponse]:
     """Reads all project vertices
 
@@ -56,15 +59,15 @@ def read_projects_all(
     Returns
         List[ProjectResponse]: List of Projects in the database
     """
-    return service.read_projects_all()
+    return await service.read_projects_all()
 
 
 @api_version(database_version)
 @router.get(
     "/projects/{project_uuid}", response_model=ProjectResponse, summary="Read a project"
 )
-def read(
-    project_uuid: str, service: ProjectService = Depends(get_service)
+async def read(
+    project_uuid: str, service: AsyncProjectService = Depends(get_service)
 ) -> ProjectResponse:
     """Method to read one project based on the id
 
@@ -74,31 +77,55 @@ def read(
     Returns
         ProjectResponse: Project with all properties
     """
-    return service.read(project_uuid)
+    return await service.read(project_uuid)
 
 
 @api_version(database_version)
 @router.get(
-    "/projects/{project_uuid}/export", response_model=dict, summary="Export a project"
+    "/projects/{project_uuid}/export",
+    response_model=None,
+    summary="Export a project",
+    responses={200: {"content": {"application/x-ndjson": {}}}},
 )
-def export_project(
-    project_uuid: str, service: ProjectService = Depends(get_service)
-) -> dict:
+async def export_project(
+    project_uuid: str,
+    format: Literal["json", "ndjson"] = "json",
+    service: AsyncProjectService = Depends(get_service),
+) -> dict | StreamingResponse:
     """Method to export one project based on the id in JSON format
 
     Args
         project_uuid (str): id of the vertex with the label "project"'
+        format (str): "json" for a single JSON document, or "ndjson" to stream one
+                      JSON line per vertex (`{"issues": {...}}`) and edge
+                      (`{"edges": {...}}`). Defaults to "json".
 
     Returns
         json_dict: JSON dictionary containing the project data
     """
-    return service.export_project(project_uuid)
+    if format == "json":
+        return await service.export_project(project_uuid)
+    lines = service.stream_project(project_uuid)
+    # read the project before the response starts, so that errors are not streamed
+    first_line = await anext(lines)
+
+    async def content():
+        yield first_line
+        async for line in lines:
+            yield line
+
+    return StreamingResponse(content(), media_type="application/x-ndjson")
 
 
 @api_version(database_version)
-@router.post("/projects/import", response_model=None, summary="Import a project")
-def import_project(
-    project_json: dict, service: ProjectService = Depends(get_service)
+@router.post(
+    "/projects/import",
+    response_model=None,
+    summary="Import a project",
+    responses={422: {"description": "Edge linking a vertex not in the project"}},
+)
+async def import_project(
+    project_json: dict, service: AsyncProjectService = Depends(get_service)
 ) -> None:
     """Method to import a project in JSON format
 
@@ -108,7 +135,10 @@ def import_project(
     Returns
         None
     """
-    return service.import_project(project_json)
+    try:
+        return await service.import_project(project_json)
+    except DanglingEdgeError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
 
 
 @api_version(database_version)
@@ -117,10 +147,10 @@ def import_project(
     response_model=ProjectResponse,
     summary="Update a project",
 )
-def update(
+async def update(
     project_uuid: str,
     modified_fields: ProjectUpdate,
-    service: ProjectService = Depends(get_service),
+    service: AsyncProjectService = Depends(get_service),
 ) -> ProjectResponse:
     """Updates the specified project based on the id with the new project_data
 
@@ -131,14 +161,16 @@ def update(
     Returns
         ProjectResponse: Project with the project_data as ProjectUpdate
     """
-    return service.update(project_uuid, modified_fields)
+    return await service.update(project_uuid, modified_fields)
 
 
 @api_version(database_version)
 @router.delete(
     "/projects/{project_uuid}", response_model=None, summary="Delete a project"
 )
-def delete(project_uuid: str, service: ProjectService = Depends(get_service)) -> None:
+async def delete(
+    project_uuid: str, service: AsyncProjectService = Depends(get_service)
+) -> None:
     """Gets all vertices connected (via edge with label "contains") to the project
             vertex with the id = project_uuid
 
@@ -152,4 +184,4 @@ def delete(project_uuid: str, service: ProjectService = Depends(get_service)) ->
     Returns
         None
     """
-    return service.delete(project_uuid)
+    return await service.delete(project_uuid)
@@ -1,11 +1,47 @@
-from fastapi import APIRouter, Depends
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from fastapi_versionizer.versionizer import api_version
 
 from .. import database_version
 from ..database.adapter import get_client
-from ..models.structure import DecisionTreeResponse, InfluenceDiagramResponse
-from ..repositories.vertex import VertexRepository
+from ..models.structure import (
+    DecisionGraphResponse,
+    DecisionTreeExpansionResponse,
+    DecisionTreeResponse,
+    InfluenceDiagramResponse,
+    InfluenceDiagramSolution,
+    MonteCarloRequest,
+    MonteCarloSummary,
+    PosteriorRequest,
+    PosteriorResponse,
+    PruningReport,
+    PyAgrumCacheStatistics,
+    SensitivityResponse,
+    ValueOfInformationResponse,
+)
+from ..repositories.structure import StructureRepository
 from ..services.structure import StructureService
+from ..services.structure_utils.decision_diagrams.chance_network import EvidenceError
+from ..services.structure_utils.decision_diagrams.influence_diagram import (
+    ArcFormatError,
+    InfluenceDiagramNotAcyclicError,
+    ProbabilityFormatError,
+)
+from ..services.structure_utils.decision_diagrams.monte_carlo import (
+    StrategyError,
+    ValuationError,
+)
+from ..services.structure_utils.decision_diagrams.pyagrum_cache import pyagrum_cache
+from ..services.structure_utils.decision_diagrams.solver import (
+    InfluenceDiagramNotSolvable,
+)
+from ..services.structure_utils.decision_diagrams.symmetric_decision_tree import (
+    BranchNotFound,
+    TreeTooLarge,
+)
+from ..services.structure_utils.worker_pool import WorkerTimeout
 
 router = APIRouter(
     tags=["structures"],
@@ -15,14 +51,28 @@ router = APIRouter(
 )
 
 
+WORKER_DIED = "the worker process died, the computation can be retried"
+
+
 def get_repository(client=Depends(get_client)):
-    return VertexRepository(client)
+    return StructureRepository(client)
 
 
 def get_service(repository=Depends(get_repository)):
     return StructureService(repository)
 
 
+def tree_too_large(error: TreeTooLarge) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail={
+            "message": str(error),
+            "node_count": error.node_count,
+            "max_node_count": error.max_node_count,
+        },
+    )
+
+
 @api_version(database_version)
 @router.get(
     "/projects/{project_uuid}/influence-diagram",
@@ -43,21 +93,368 @@ def read_influence_diagram(
     return service.read_influence_diagram(project_uuid=project_uuid)
 
 
+@api_version(database_version)
+@router.post(
+    "/projects/{project_uuid}/influence-diagram/solve",
+    response_model=InfluenceDiagramSolution,
+    summary="Solve the influence diagram from project by its UUID",
+    responses={
+        422: {"description": "Influence diagram not solvable"},
+        503: {"description": "Worker process died"},
+        504: {"description": "Influence diagram not solved in time"},
+    },
+)
+def solve_influence_diagram(
+    project_uuid: str,
+    prune: bool = False,
+    service: StructureService = Depends(get_service),
+) -> InfluenceDiagramSolution:
+    """Method to solve the influence diagram: its maximum expected utility and the
+    optimal policy of each decision
+
+    Args:
+        project_uuid (str): id of the project vertex
+        prune (bool): work on the requisite sub-model of the influence diagram,
+                      without its barren uncertainties and non-requisite
+                      observations. Defaults to False.
+
+    Returns
+        InfluenceDiagramSolution: maximum expected utility and optimal policies
+    """
+    try:
+        return service.solve_influence_diagram(project_uuid=project_uuid, prune=prune)
+    except (
+        InfluenceDiagramNotAcyclicError,
+        ProbabilityFormatError,
+        ArcFormatError,
+        InfluenceDiagramNotSolvable,
+    ) as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    except BrokenProcessPool as e:
+        raise HTTPException(status_code=503, detail=WORKER_DIED) from e
+    except WorkerTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+
+
+@api_version(database_version)
+@router.get(
+    "/projects/{project_uuid}/influence-diagram/requisite",
+    response_model=PruningReport,
+    summary="Get what is removed from the requisite sub-model of a project",
+    responses={422: {"description": "Influence diagram not acyclic"}},
+)
+def prune_influence_diagram(
+    project_uuid: str, service: StructureService = Depends(get_service)
+) -> PruningReport:
+    """Method to report the barren uncertainties and the arcs of non-requisite
+    observations, removed from the influence diagram when the solving and the
+    decision tree endpoints are called with `prune`
+
+    Args:
+        project_uuid (str): id of the project vertex
+
+    Returns
+        PruningReport: removed uncertainties and arcs
+    """
+    try:
+        return service.prune_influence_diagram(project_uuid=project_uuid)
+    except InfluenceDiagramNotAcyclicError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
+@api_version(database_version)
+@router.post(
+    "/projects/{project_uuid}/influence-diagram/value-of-information",
+    response_model=ValueOfInformationResponse,
+    summary="Rank the uncertainties of a project by value of perfect information",
+    responses={
+        422: {"description": "Influence diagram not solvable"},
+        503: {"description": "Worker process died"},
+        504: {"description": "Influence diagram not solved in time"},
+    },
+)
+def value_of_information(
+    project_uuid: str, service: StructureService = Depends(get_service)
+) -> ValueOfInformationResponse:
+    """Method to compute the expected value of perfect information (EVPI) of each
+    uncertainty: the increase of the maximum expected utility when it is observed
+    before the first decision
+
+    Args:
+        project_uuid (str): id of the project vertex
+
+    Returns
+        ValueOfInformationResponse: maximum expected utility, and uncertainties by
+                                    decreasing EVPI (null for the uncertainties
+                                    descending from a decision)
+    """
+    try:
+        return service.value_of_information(project_uuid=project_uuid)
+    except (
+        InfluenceDiagramNotAcyclicError,
+        ProbabilityFormatError,
+        ArcFormatError,
+        InfluenceDiagramNotSolvable,
+    ) as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    except BrokenProcessPool as e:
+        raise HTTPException(status_code=503, detail=WORKER_DIED) from e
+    except WorkerTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+
+
+@api_version(database_version)
+@router.post(
+    "/projects/{project_uuid}/influence-diagram/sensitivity",
+    response_model=SensitivityResponse,
+    summary="Sensitivity of the expected utility to the probabilities of a project",
+    responses={
+        422: {"description": "Influence diagram not solvable"},
+        503: {"description": "Worker process died"},
+        504: {"description": "Influence diagram not solved in time"},
+    },
+)
+def probability_sensitivity(
+    project_uuid: str,
+    span: float = Query(default=0.1, gt=0, le=1),
+    points: int = Query(default=5, ge=2, le=101),
+    service: StructureService = Depends(get_service),
+) -> SensitivityResponse:
+    """Method to compute the maximum expected utility and the changed optimal
+    policies when the probability of each state of each uncertainty is shifted, as
+    tornado chart data
+
+    Args:
+        project_uuid (str): id of the project vertex
+        span (float): largest shift of the probabilities. Defaults to 0.1.
+        points (int): number of shifts, from -span to span. Defaults to 5.
+
+    Returns
+        SensitivityResponse: maximum expected utility, and sweeps of the states of
+                             the uncertainties by decreasing swing
+    """
+    try:
+        return service.probability_sensitivity(
+            project_uuid=project_uuid, span=span, points=points
+        )
+    except (
+        InfluenceDiagramNotAcyclicError,
+        ProbabilityFormatError,
+        ArcFormatError,
+        InfluenceDiagramNotSolvable,
+    ) as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    except BrokenProcessPool as e:
+        raise HTTPException(status_code=503, detail=WORKER_DIED) from e
+    except WorkerTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+
+
+@api_version(database_version)
+@router.post(
+    "/projects/{project_uuid}/influence-diagram/simulate",
+    summary="Simulate the scenarios of a project for a strategy",
+    responses={
+        200: {
+            "description": "A JSON MonteCarloSummary per line, after each chunk",
+            "content": {"application/x-ndjson": {}},
+            "model": MonteCarloSummary,
+        },
+        422: {"description": "Invalid strategy or values"},
+    },
+)
+def simulate(
+    project_uuid: str,
+    request: MonteCarloRequest,
+    service: StructureService = Depends(get_service),
+) -> StreamingResponse:
+    """Method to sample the scenarios of the influence diagram for a strategy (an
+    alternative for each decision), valued by the sum of the values of their states
+
+    Args:
+        project_uuid (str): id of the project vertex
+        request (MonteCarloRequest): strategy, values of the states, number of
+                                     scenarios, size of the chunks and seed
+
+    Returns
+        StreamingResponse: a JSON MonteCarloSummary per line (mean and its
+                           confidence interval, standard deviation, percentiles
+                           of the values so far), after each chunk
+    """
+    try:
+        summaries = service.simulate(project_uuid=project_uuid, request=request)
+    except (
+        InfluenceDiagramNotAcyclicError,
+        ProbabilityFormatError,
+        StrategyError,
+        ValuationError,
+    ) as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return StreamingResponse(summaries, media_type="application/x-ndjson")
+
+
+@api_version(database_version)
+@router.post(
+    "/projects/{project_uuid}/influence-diagram/posteriors",
+    response_model=PosteriorResponse,
+    summary="Query the posterior distributions of uncertainties of a project",
+    responses={422: {"description": "Invalid evidence or targets"}},
+)
+def posterior_queries(
+    project_uuid: str,
+    request: PosteriorRequest,
+    service: StructureService = Depends(get_service),
+) -> PosteriorResponse:
+    """Method to compute the posterior distributions of uncertainties of the
+    influence diagram given each of a batch of evidence scenarios
+
+    Args:
+        project_uuid (str): id of the project vertex
+        request (PosteriorRequest): observed states of each scenario, and queried
+                                    uncertainties
+
+    Returns
+        PosteriorResponse: probability of the evidence and posterior distributions,
+                           for each scenario
+    """
+    try:
+        return service.posterior_queries(project_uuid=project_uuid, request=request)
+    except (
+        InfluenceDiagramNotAcyclicError,
+        ProbabilityFormatError,
+        ArcFormatError,
+        EvidenceError,
+    ) as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
 @api_version(database_version)
 @router.get(
     "/projects/{project_uuid}/decision-tree",
-    response_model=DecisionTreeResponse,
+    response_model=DecisionTreeResponse | DecisionTreeExpansionResponse,
     summary="Get the decision tree from project by its UUID",
+    responses={413: {"description": "Decision tree too large"}},
 )
 def convert_influence_diagram_to_decision_tree_model(
-    project_uuid: str, service: StructureService = Depends(get_service)
-) -> DecisionTreeResponse:
+    project_uuid: str,
+    stream: bool = False,
+    truncate: bool = False,
+    prune: bool = False,
+    service: StructureService = Depends(get_service),
+) -> DecisionTreeResponse | DecisionTreeExpansionResponse | StreamingResponse:
     """Method to read the necessary data to create the decision tree structure
 
+    A tree of more nodes than the configured maximum is refused with a 413, its
+    detail holding the "node_count" of the tree, unless truncated.
+
     Args:
         project_uuid (str): id of the project vertex
+        stream (bool): stream the JSON of the tree while walking it depth-first,
+                       instead of validating the whole tree first. Defaults to False.
+        truncate (bool): return only the first levels of the tree within the
+                         maximum, with the node count of each subtree (as the
+                         decision tree expansion). Defaults to False.
+        prune (bool): build the tree of the requisite sub-model of the influence diagram,
+                      without its barren uncertainties and non-requisite
+                      observations. Defaults to False.
 
     Returns
         DecisionTreeResponse: Dict of vertices
     """
-    return service.create_decision_tree(project_uuid=project_uuid)
+    try:
+        if truncate:
+            return service.expand_decision_tree(
+                project_uuid=project_uuid, depth=None, prune=prune
+            )
+        if stream:
+            return StreamingResponse(
+                service.stream_decision_tree(project_uuid=project_uuid, prune=prune),
+                media_type="application/json",
+            )
+        return service.create_decision_tree(project_uuid=project_uuid, prune=prune)
+    except TreeTooLarge as e:
+        raise tree_too_large(e) from e
+
+
+@api_version(database_version)
+@router.get(
+    "/projects/{project_uuid}/decision-tree/expansion",
+    response_model=DecisionTreeExpansionResponse,
+    summary="Get some levels of the decision tree from project by its UUID",
+    responses={413: {"description": "Decision tree too large"}},
+)
+def expand_decision_tree(
+    project_uuid: str,
+    path: str = "",
+    depth: int = Query(default=1, ge=0),
+    prune: bool = False,
+    service: StructureService = Depends(get_service),
+) -> DecisionTreeExpansionResponse:
+    """Method to create the levels of the decision tree below a node
+
+    Args:
+        project_uuid (str): id of the project vertex
+        path (str): branch path to the node, "/"-separated "shortname:branch name",
+                    e.g. "Test:yes/State:Peach". Defaults to "", the root.
+        depth (int): number of levels below the node. Defaults to 1.
+        prune (bool): build the tree of the requisite sub-model of the influence diagram,
+                      without its barren uncertainties and non-requisite
+                      observations. Defaults to False.
+
+    Returns
+        DecisionTreeExpansionResponse: nested nodes, with the node count of their
+                                       subtree
+    """
+    try:
+        return service.expand_decision_tree(
+            project_uuid=project_uuid, path=path, depth=depth, prune=prune
+        )
+    except BranchNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except TreeTooLarge as e:
+        raise tree_too_large(e) from e
+
+
+@api_version(database_version)
+@router.get(
+    "/projects/{project_uuid}/decision-graph",
+    response_model=DecisionGraphResponse,
+    summary="Get the decision tree from project by its UUID, as a decision graph",
+)
+def create_decision_graph(
+    project_uuid: str,
+    prune: bool = False,
+    service: StructureService = Depends(get_service),
+) -> DecisionGraphResponse:
+    """Method to create the decision tree structure with its identical subtrees
+    described once, as nodes referencing their children by id
+
+    Args:
+        project_uuid (str): id of the project vertex
+        prune (bool): build the tree of the requisite sub-model of the influence diagram,
+                      without its barren uncertainties and non-requisite
+                      observations. Defaults to False.
+
+    Returns
+        DecisionGraphResponse: root id, node count of the decision tree, and nodes
+                               by id
+    """
+    return service.create_decision_graph(project_uuid=project_uuid, prune=prune)
+
+
+@api_version(database_version)
+@router.get(
+    "/pyagrum-cache/statistics",
+    response_model=PyAgrumCacheStatistics,
+    summary="Get the counters of the pyAgrum influence diagram cache",
+)
+def read_pyagrum_cache_statistics() -> PyAgrumCacheStatistics:
+    """Method to read the counters of the cache of the pyAgrum influence diagrams
+    converted by the worker process answering the request
+
+        The cache lives in the process: no database client is needed
+
+    Returns
+        PyAgrumCacheStatistics: hits, misses, evictions and memory of the cache
+    """
+    return PyAgrumCacheStatistics.model_validate(pyagrum_cache.statistics())
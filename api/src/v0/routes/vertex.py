@@ -2,11 +2,11 @@ from fastapi import APIRouter, Depends
 from fastapi_versionizer.versionizer import api_version
 
 from .. import database_version
-from ..database.adapter import get_client
-from ..database.client import DatabaseClient
+from ..database.adapter import get_async_client
+from ..database.client import AsyncDatabaseClient
 from ..models.filter import Filter
 from ..models.vertex import VertexCreate, VertexResponse, VertexUpdate
-from ..repositories.vertex import VertexRepository
+from ..repositories.vertex import AsyncVertexRepository
 
 router = APIRouter(
     tags=["vertex"],
@@ -22,10 +22,10 @@ router = APIRouter(
     response_model=VertexResponse,
     summary="Create a new vertex by its label",
 )
-def create_vertex(
+async def create_vertex(
     vertex_label: str,
     vertex_data: VertexCreate,
-    client: DatabaseClient = Depends(get_client),
+    client: AsyncDatabaseClient = Depends(get_async_client),
 ) -> VertexResponse:
     """Creates a new vertex based on vertex data
 
@@ -40,8 +40,8 @@ def create_vertex(
         VertexResponse: dict of the created vertex
 
     """
-    with client as c:
-        return VertexRepository(c).create(
+    async with client as c:
+        return await AsyncVertexRepository(c).create(
             vertex_label, VertexCreate.model_validate(vertex_data.model_dump())
         )
 
@@ -52,8 +52,8 @@ def create_vertex(
     response_model=list[VertexResponse],
     summary="Get all vertices by their label",
 )
-def read_vertex_all(
-    vertex_label: str, client: DatabaseClient = Depends(get_client)
+async def read_vertex_all(
+    vertex_label: str, client: AsyncDatabaseClient = Depends(get_async_client)
 ) -> list[VertexResponse]:
     """Read all vertices given a label
 
@@ -63,8 +63,8 @@ def read_vertex_all(
     Returns:
         list[VertexResponse]: list of vertices with the given label
     """
-    with client as c:
-        return VertexRepository(c).all(vertex_label)
+    async with client as c:
+        return await AsyncVertexRepository(c).all(vertex_label)
 
 
 @api_version(database_version)
@@ -73,8 +73,8 @@ def read_vertex_all(
     response_model=VertexResponse,
     summary="Get a vertex by its UUID",
 )
-def read_vertex(
-    vertex_uuid: str, client: DatabaseClient = Depends(get_client)
+async def read_vertex(
+    vertex_uuid: str, client: AsyncDatabaseClient = Depends(get_async_client)
 ) -> VertexResponse:
     """Reads a vertex based on the vertex id in the DB
 
@@ -89,8 +89,8 @@ def read_vertex(
     Return:
         VertexResponse: dict with all data of the vertex (VertexResponse)
     """
-    with client as c:
-        return VertexRepository(c).read(vertex_uuid)
+    async with client as c:
+        return await AsyncVertexRepository(c).read(vertex_uuid)
 
 
 # dictionaries are difficult to use in the get request
@@ -103,12 +103,12 @@ def read_vertex(
     response_model=list[VertexResponse],
     summary="Get the children of a vertex by its UUID",
 )
-def read_out_vertex(
+async def read_out_vertex(
     vertex_uuid: str,
     edge_label: str,
     filter_model: Filter = Depends(),
     original_vertex_label: str = None,
-    client: DatabaseClient = Depends(get_client),
+    client: AsyncDatabaseClient = Depends(get_async_client),
 ) -> list[VertexResponse]:
     """Read vertices based on outgoing edge labels.
 
@@ -137,8 +137,8 @@ def read_out_vertex(
             If filter_model is None, no filter will be applied and all vertices will
             be returned.
     """
-    with client as c:
-        return VertexRepository(c).read_out_vertex(
+    async with client as c:
+        return await AsyncVertexRepository(c).read_out_vertex(
             vertex_uuid=vertex_uuid,
             edge_label=edge_label,
             original_vertex_label=original_vertex_label,
@@ -152,12 +152,12 @@ def read_out_vertex(
     response_model=list[VertexResponse],
     summary="Get the parents of a vertex by its UUID",
 )
-def read_in_vertex(
+async def read_in_vertex(
     vertex_uuid: str,
     edge_label: str,
     filter_model: Filter = Depends(),
     original_vertex_label: str = None,
-    client: DatabaseClient = Depends(get_client),
+    client: AsyncDatabaseClient = Depends(get_async_client),
 ) -> list[VertexResponse]:
     """Read vertices based on incoming edge labels.
 
@@ -187,8 +187,8 @@ def read_in_vertex(
             If filter_model is None, no filter will be applied and all vertices will
             be returned.
     """
-    with client as c:
-        return VertexRepository(c).read_in_vertex(
+    async with client as c:
+        return await AsyncVertexRepository(c).read_in_vertex(
             vertex_uuid=vertex_uuid,
             edge_label=edge_label,
             original_vertex_label=original_vertex_label,
@@ -202,10 +202,10 @@ def read_in_vertex(
     response_model=VertexResponse,
     summary="Delete a vertex by its UUID",
 )
-def update_vertex(
+async def update_vertex(
     vertex_uuid: str,
     modified_fields: VertexUpdate,
-    client: DatabaseClient = Depends(get_client),
+    client: AsyncDatabaseClient = Depends(get_async_client),
 ) -> VertexResponse:
     """Updated the specified vertex with the new vertex properties
 
@@ -217,16 +217,16 @@ def update_vertex(
     Return:
         VertexResponse: vertex dict with updated properties
     """
-    with client as c:
-        return VertexRepository(c).update(vertex_uuid, modified_fields)
+    async with client as c:
+        return await AsyncVertexRepository(c).update(vertex_uuid, modified_fields)
 
 
 @api_version(database_version)
 @router.delete(
     "/vertices/{vertex_uuid}", response_model=None, summary="Delete a vertex by its UUID"
 )
-def delete_vertex(
-    vertex_uuid: str, client: DatabaseClient = Depends(get_client)
+async def delete_vertex(
+    vertex_uuid: str, client: AsyncDatabaseClient = Depends(get_async_client)
 ) -> None:
     """method to delete a vertex based on the vertex id
 
@@ -236,5 +236,5 @@ def delete_vertex(
     Return:
         None
     """
-    with client as c:
-        return VertexRepository(c).delete(vertex_uuid)
+    async with client as c:
+        return await AsyncVertexRepository(c).delete(vertex_uuid)
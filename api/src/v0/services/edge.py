@@ -1,12 +1,12 @@
 from ..models.edge import EdgeResponse
-from ..repositories.edge import EdgeRepository
+from ..repositories.edge import AsyncEdgeRepository
 
 
-class EdgeService:
-    def __init__(self, repository: EdgeRepository):
+class AsyncEdgeService:
+    def __init__(self, repository: AsyncEdgeRepository):
         self.repository = repository
 
-    def create(
+    async def create(
         self,
         out_vertex_uuid: str,
         in_vertex_uuid: str,
@@ -24,9 +24,9 @@ class EdgeService:
                           where id == uuid
 
         """
-        return self.repository.create(out_vertex_uuid, in_vertex_uuid, edge_label)
+        return await self.repository.create(out_vertex_uuid, in_vertex_uuid, edge_label)
 
-    def read_all_edges_from_project(
+    async def read_all_edges_from_project(
         self, project_uuid: str, edge_label: str
     ) -> list[EdgeResponse]:
         """Method to return all edges with the specified edge label
@@ -38,9 +38,11 @@ class EdgeService:
         Returns:
             List[EdgeResponse]: List of Edges
         """
-        return self.repository.read_all_edges_from_project(project_uuid, edge_label)
+        return await self.repository.read_all_edges_from_project(
+            project_uuid, edge_label
+        )
 
-    def read_all_edges_from_sub_project(
+    async def read_all_edges_from_sub_project(
         self, project_uuid: str, edge_label: str, vertex_uuid: list[str]
     ) -> list[EdgeResponse]:
         """Method to return all edges with the specified edge label and linking vertices
@@ -54,11 +56,11 @@ class EdgeService:
         Returns:
             List[EdgeResponse]: List of Edges
         """
-        return self.repository.read_all_edges_from_sub_project(
+        return await self.repository.read_all_edges_from_sub_project(
             project_uuid, edge_label, vertex_uuid
         )
 
-    def read_out_edge_from_vertex(
+    async def read_out_edge_from_vertex(
         self, vertex_uuid: str, edge_label: str
     ) -> list[EdgeResponse]:
         """Returns edges going out of the specified vertex
@@ -69,9 +71,9 @@ class EdgeService:
         Return:
             List of edges
         """
-        return self.repository.read_out_edge_from_vertex(vertex_uuid, edge_label)
+        return await self.repository.read_out_edge_from_vertex(vertex_uuid, edge_label)
 
-    def read_in_edge_to_vertex(
+    async def read_in_edge_to_vertex(
         self, vertex_uuid: str, edge_label: str
     ) -> list[EdgeResponse]:
         """Returns edges going in to the specified vertex
@@ -82,9 +84,9 @@ class EdgeService:
         Return:
             List of edges
         """
-        return self.repository.read_in_edge_to_vertex(vertex_uuid, edge_label)
+        return await self.repository.read_in_edge_to_vertex(vertex_uuid, edge_label)
 
-    def read(self, edge_uuid: str) -> EdgeResponse:
+    async def read(self, edge_uuid: str) -> EdgeResponse:
         """Method to read one edge based on the id
 
         Args:
@@ -93,12 +95,12 @@ class EdgeService:
         Returns:
             EdgeResponse: Edge
         """
-        return self.repository.read(edge_uuid)
+        return await self.repository.read(edge_uuid)
 
-    # def update(self, edge_uuid: str, edge_data: EdgeUpdate) -> EdgeResponse:
-    #     return self.repository.update(edge_uuid, edge_data)
+    # async def update(self, edge_uuid: str, edge_data: EdgeUpdate) -> EdgeResponse:
+    #     return await self.repository.update(edge_uuid, edge_data)
 
-    def delete(self, edge_uuid: str) -> None:
+    async def delete(self, edge_uuid: str) -> None:
         """Deletes edges going in and out of the specified vertex
 
         Args:
@@ -107,4 +109,4 @@ class EdgeService:
         Return:
             None
         """
-        return self.repository.delete(edge_uuid)
+        return await self.repository.delete(edge_uuid)
@@ -1,15 +1,15 @@
 from ..models.filter import Filter
 from ..models.issue import IssueCreate, IssueResponse, IssueUpdate
-from ..repositories.edge import EdgeRepository
-from ..repositories.issue import IssueRepository
+from ..repositories.edge import AsyncEdgeRepository
+from ..repositories.issue import AsyncIssueRepository
 from .issue_utils.issue_merge import issue_merge
 
 
-class IssueService:
-    def __init__(self, repository: IssueRepository):
+class AsyncIssueService:
+    def __init__(self, repository: AsyncIssueRepository):
         self.repository = repository
 
-    def create(self, project_uuid: str, issue_data: IssueCreate) -> IssueResponse:
+    async def create(self, project_uuid: str, issue_data: IssueCreate) -> IssueResponse:
         """Method to create a new issue connected to a project vertex
 
             Creates vertex with the label "issue" and the properties of issue_data
@@ -24,12 +24,12 @@ class IssueService:
         Returns:
             IssueResponse: Created Issue with the issue_data as IssueCreate
         """
-        return self.repository.create(
+        return await self.repository.create(
             project_uuid=project_uuid,
             issue_data=issue_data,
         )
 
-    def read_issues_all(
+    async def read_issues_all(
         self,
         project_uuid: str,
         filter_model: Filter,
@@ -52,14 +52,14 @@ class IssueService:
                                  and have the label "issue" and satisfy the filters
                                  when given in filter_model
         """
-        return self.repository.read_issues_all(
+        return await self.repository.read_issues_all(
             project_uuid=project_uuid,
             vertex_label="issue",
             edge_label="contains",
             filter_model=filter_model,
         )
 
-    def read(self, issue_uuid: str) -> IssueResponse:
+    async def read(self, issue_uuid: str) -> IssueResponse:
         """Method to read one issue based on the id
 
         Args:
@@ -68,9 +68,11 @@ class IssueService:
         Returns:
             IssueResponse: Issue with all properties
         """
-        return self.repository.read(issue_uuid)
+        return await self.repository.read(issue_uuid)
 
-    def update(self, issue_uuid: str, modified_fields: IssueUpdate) -> IssueResponse:
+    async def update(
+        self, issue_uuid: str, modified_fields: IssueUpdate
+    ) -> IssueResponse:
         """Updates the specified issue based on the id with the new issue_data
 
         Args:
@@ -80,9 +82,9 @@ class IssueService:
         Returns:
             IssueResponse: Issue with the issue_data as IssueCreate
         """
-        return self.repository.update(issue_uuid, modified_fields)
+        return await self.repository.update(issue_uuid, modified_fields)
 
-    def delete(self, issue_uuid: str) -> None:
+    async def delete(self, issue_uuid: str) -> None:
         """Deletes the issue vertex based on the id and also all in and outgoing edges
             from this vertex
 
@@ -92,9 +94,9 @@ class IssueService:
         Returns:
             None
         """
-        return self.repository.delete(issue_uuid)
+        return await self.repository.delete(issue_uuid)
 
-    def merge(
+    async def merge(
         self,
         project_uuid: str,
         source_issue: IssueResponse,
@@ -116,50 +118,50 @@ class IssueService:
         Returns:
             merged_issue (IssueResponse)
         """
-        edge_repository = EdgeRepository(self.repository._client)
+        edge_repository = AsyncEdgeRepository(self.repository._client)
         # create merged_issue_data
         merged_issue_data = issue_merge(
             source_issue=source_issue, destination_issue=destination_issue
         )
-        source_merged_check = edge_repository.read_in_edge_to_vertex(
+        source_merged_check = await edge_repository.read_in_edge_to_vertex(
             source_issue.uuid, "merged_into"
         )
-        destination_merged_check = edge_repository.read_in_edge_to_vertex(
+        destination_merged_check = await edge_repository.read_in_edge_to_vertex(
             destination_issue.uuid, "merged_into"
         )
         # TODO: what happens if they are both merged issues?
         if source_merged_check:
-            parent_issue = self.update(
+            parent_issue = await self.update(
                 issue_uuid=source_issue.uuid,
                 modified_fields=merged_issue_data,
             )
             children_issue = [destination_issue]
         elif destination_merged_check:
-            parent_issue = self.update(
+            parent_issue = await self.update(
                 issue_uuid=destination_issue.uuid,
                 modified_fields=merged_issue_data,
             )
             children_issue = [source_issue]
         else:
-            parent_issue = self.create(
+            parent_issue = await self.create(
                 project_uuid=project_uuid, issue_data=merged_issue_data
             )
             children_issue = [source_issue, destination_issue]
 
         for child_issue in children_issue:
-            edge_repository.create(
+            await edge_repository.create(
                 out_vertex_uuid=child_issue.uuid,
                 in_vertex_uuid=parent_issue.uuid,
                 edge_label="merged_into",
             )
-            contains_edge = edge_repository.read_in_edge_to_vertex(
+            contains_edge = await edge_repository.read_in_edge_to_vertex(
                 vertex_uuid=child_issue.uuid, edge_label="contains"
             )
-            edge_repository.delete(edge_uuid=contains_edge[0].uuid)
+            await edge_repository.delete(edge_uuid=contains_edge[0].uuid)
 
         return parent_issue
 
-    def un_merge(self, project_uuid: str, merged_issue_uuid: str) -> list[str]:
+    async def un_merge(self, project_uuid: str, merged_issue_uuid: str) -> list[str]:
         """Function to un-merge a merged issue
 
             Will create new "contains" edges for the parents of the merged issue
@@ -172,19 +174,19 @@ class IssueService:
         Returns:
             list[str]: uuids of the issues that had been merged
         """
-        edge_repository = EdgeRepository(self.repository._client)
+        edge_repository = AsyncEdgeRepository(self.repository._client)
         # What if the merged_issue is not a merged issue? -> then the parent_issues
         # should be empty
-        parent_issues = edge_repository.read_in_edge_to_vertex(
+        parent_issues = await edge_repository.read_in_edge_to_vertex(
             merged_issue_uuid, "merged_into"
         )
         parent_issue_uuids = [issue.outV for issue in parent_issues]
         for parent_issue_uuid in parent_issue_uuids:
-            edge_repository.create(
+            await edge_repository.create(
                 out_vertex_uuid=project_uuid,
                 in_vertex_uuid=parent_issue_uuid,
                 edge_label="contains",
             )
         if len(parent_issue_uuids) > 0:
-            self.repository.delete(merged_issue_uuid)
+            await self.repository.delete(merged_issue_uuid)
         return parent_issue_uuids
@@ -1,12 +1,15 @@
+import json
+from collections.abc import AsyncIterator
+
 from ..models.project import ProjectCreate, ProjectResponse, ProjectUpdate
-from ..repositories.project import ProjectRepository
+from ..repositories.project import AsyncProjectRepository
 
 
-class ProjectService:
-    def __init__(self, repository: ProjectRepository):
+class AsyncProjectService:
+    def __init__(self, repository: AsyncProjectRepository):
         self.repository = repository
 
-    def create(self, project_data: ProjectCreate) -> ProjectResponse:
+    async def create(self, project_data: ProjectCreate) -> ProjectResponse:
         """Method to create a new project vertex
 
             Creates vertex with the label "project" and the properties of project_data
@@ -17,9 +20,9 @@ class ProjectService:
         Returns
             ProjectResponse: Created Project with the project_data as ProjectCreate
         """
-        return self.repository.create(project_data)
+        return await self.repository.create(project_data)
 
-    def read_projects_all(self) -> list[ProjectResponse]:
+    async def read_projects_all(self) -> list[ProjectResponse]:
         """Reads all project vertices
 
         Args:
@@ -28,9 +31,9 @@ class ProjectService:
         Returns
             List[ProjectResponse]: List of Projects in the database
         """
-        return self.repository.all()
+        return await self.repository.all()
 
-    def read(self, project_uuid: str) -> ProjectResponse:
+    async def read(self, project_uuid: str) -> ProjectResponse:
         """Method to read one project based on the id
 
         Args:
@@ -39,9 +42,9 @@ class ProjectService:
         Returns
             ProjectResponse: Project with all properties
         """
-        return self.repository.read(project_uuid)
+        return await self.repository.read(project_uuid)
 
-    def export_project(self, project_uuid: str) -> dict:
+    async def export_project(self, project_uuid: str) -> dict:
         """Method to export one project based on the id in JSON format
 
         Args
@@ -50,9 +53,22 @@ class ProjectService:
         Returns
             json_dict: JSON dictionary containing the project data
         """
-        return self.repository.export_project(project_uuid)
+        return await self.repository.export_project(project_uuid)
+
+    async def stream_project(self, project_uuid: str) -> AsyncIterator[str]:
+        """Export a project in NDJSON format
+
+        Args:
+            project_uuid (str): id of the vertex with the label "project"
+
+        Yields:
+            str: one JSON line per vertex or edge (see
+                 AsyncProjectRepository.stream_project)
+        """
+        async for item in self.repository.stream_project(project_uuid):
+            yield json.dumps(item, default=str) + "\n"
 
-    def import_project(self, project_json: dict) -> None:
+    async def import_project(self, project_json: dict) -> None:
         """Method to import a project in JSON format
 
         Args:
@@ -61,9 +77,9 @@ class ProjectService:
         Returns
             None
         """
-        return self.repository.import_project(project_json)
+        return await self.repository.import_project(project_json)
 
-    def update(
+    async def update(
         self, project_uuid: str, modified_fields: ProjectUpdate
     ) -> ProjectResponse:
         """Updates the specified project based on the id with the new project_data
@@ -75,9 +91,9 @@ class ProjectService:
         Returns
             ProjectResponse: Project with the project_data as ProjectUpdate
         """
-        return self.repository.update(project_uuid, modified_fields)
+        return await self.repository.update(project_uuid, modified_fields)
 
-    def delete(self, project_uuid: str) -> None:
+    async def delete(self, project_uuid: str) -> None:
         """Gets all vertices connected (via edge with label "contains") to the project
              vertex with the id = project_uuid
 
@@ -91,4 +107,4 @@ class ProjectService:
         Returns
             None
         """
-        return self.repository.delete(project_uuid)
+        return await self.repository.delete(project_uuid)
@@ -1,22 +1,71 @@
-import json
+import time
+from collections.abc import Iterator
 
+import networkx as nx
+import numpy as np
+import pyAgrum as gum
+
+from config import settings
 from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
     InfluenceDiagram,
 )
+from src.v0.services.structure_utils.decision_diagrams.monte_carlo import (
+    MonteCarloSimulation,
+)
+from src.v0.services.structure_utils.decision_diagrams.pyagrum_cache import (
+    PyAgrumCache,
+    pyagrum_cache,
+)
+from src.v0.services.structure_utils.decision_diagrams.solver import (
+    solve,
+    solve_with_observation,
+    sweep_probability,
+)
+from src.v0.services.structure_utils.decision_diagrams.symmetric_decision_tree import (
+    SymmetricDecisionTree,
+)
+from src.v0.services.structure_utils.worker_pool import (
+    WorkerPool,
+    WorkerTimeout,
+    worker_pool,
+)
 
-from ..models.filter import Filter
-from ..models.issue import IssueResponse
 from ..models.structure import (
+    DecisionGraphResponse,
+    DecisionTreeExpansionResponse,
+    DecisionTreeNodeData,
     DecisionTreeResponse,
     InfluenceDiagramResponse,
+    InfluenceDiagramSolution,
+    MonteCarloRequest,
+    MonteCarloSummary,
+    PosteriorRequest,
+    PosteriorResponse,
+    PruningReport,
+    SensitivityResponse,
+    ValueOfInformationResponse,
 )
-from ..repositories.edge import EdgeRepository
-from ..repositories.vertex import VertexRepository
+from ..repositories.structure import StructureRepository
 
 
 class StructureService:
-    def __init__(self, repository: VertexRepository):
+    def __init__(
+        self,
+        repository: StructureRepository,
+        max_node_count: int = settings.DECISION_TREE_MAX_NODES,
+        cache: PyAgrumCache = pyagrum_cache,
+        worker_pool: WorkerPool = worker_pool,
+        solve_timeout: float = settings.SOLVE_TIMEOUT,
+        analysis_cpu_budget: int = settings.ANALYSIS_CPU_BUDGET,
+        analysis_timeout: float = settings.ANALYSIS_TIMEOUT,
+    ):
         self.repository = repository
+        self.max_node_count = max_node_count
+        self.cache = cache
+        self.worker_pool = worker_pool
+        self.solve_timeout = solve_timeout
+        self.analysis_cpu_budget = analysis_cpu_budget
+        self.analysis_timeout = analysis_timeout
 
     def read_influence_diagram(self, project_uuid: str) -> InfluenceDiagramResponse:
         """Method to read the necessary data to create the influence diagram structure
@@ -27,54 +76,408 @@ class StructureService:
         Returns
             InfluenceDiagramResponse: Dict of vertices and edges
         """
-        edge_repository = EdgeRepository(self.repository._client)
-
-        # read nodes (uncertainty, decision, valuemetric category)
-        vertices = []
-
-        # In boundary
-        for vertex_category in ["Uncertainty", "Decision", "Value Metric"]:
-            for boundary in ["in", "on"]:
-                filter_model = Filter(category=vertex_category, boundary=boundary)
-                if vertex_category == "Uncertainty":
-                    filter_model.keyUncertainty = "true"
-                elif vertex_category == "Decision":
-                    filter_model.decisionType = "Focus"
-                vertex = self.repository.read_out_vertex(
-                    vertex_uuid=project_uuid,
-                    original_vertex_label="issue",
-                    edge_label="contains",
-                    filter_model=filter_model,
-                )
-                vertices.extend(vertex)
-
-        # create list of Issue objects from vertices
-        issues_list = [
-            IssueResponse.model_validate(v.model_dump()) for v in vertices if v
-        ]
-        edges = edge_repository.read_all_edges_from_sub_project(
-            project_uuid=project_uuid,
-            edge_label="influences",
-            vertex_uuid=[issue.uuid for issue in issues_list],
+        return self.repository.read_influence_diagram(project_uuid)
+
+    def compile_influence_diagram(
+        self, project_uuid: str, prune: bool = False
+    ) -> gum.InfluenceDiagram:
+        """Method to get the pyAgrum influence diagram of a project
+
+        The pyAgrum influence diagram is converted only when the cache holds none
+        of the same content (nodes, states, probabilities and arcs), and is shared
+        between the requests: it must not be modified.
+
+        Args:
+            project_uuid (str): id of the project vertex
+            prune (bool, optional): convert the requisite sub-model of the influence
+                                    diagram (see `InfluenceDiagram.prune`). Defaults
+                                    to False.
+
+        Returns
+            gum.InfluenceDiagram: the pyAgrum influence diagram
+        """
+        return self.cache.get(self._read_influence_diagram_model(project_uuid, prune))
+
+    def prune_influence_diagram(self, project_uuid: str) -> PruningReport:
+        """Method to report the nodes and arcs of the influence diagram of a project
+        that are removed from its requisite sub-model
+
+        Args:
+            project_uuid (str): id of the project vertex
+
+        Raises:
+            InfluenceDiagramNotAcyclicError: when the diagram has a cycle
+
+        Returns
+            PruningReport: the barren uncertainties, and the arcs of the
+                           non-requisite observations
+        """
+        _, removed = self._read_influence_diagram_model(project_uuid).prune()
+        return PruningReport.model_validate(
+            {
+                "nodes": [
+                    {"uuid": node.uuid, "shortname": node.shortname}
+                    for node in removed["nodes"]
+                ],
+                "arcs": [
+                    {
+                        "tail": {"uuid": tail.uuid, "shortname": tail.shortname},
+                        "head": {"uuid": head.uuid, "shortname": head.shortname},
+                    }
+                    for tail, head in removed["arcs"]
+                ],
+            }
         )
 
-        influence_diagram = InfluenceDiagramResponse(vertices=issues_list, edges=edges)
-        return influence_diagram
+    def solve_influence_diagram(
+        self, project_uuid: str, prune: bool = False
+    ) -> InfluenceDiagramSolution:
+        """Method to solve the influence diagram of a project
+
+        The pyAgrum influence diagram is solved (Shafer-Shenoy LIMID inference) in a
+        worker process, the decisions made in the order of the partial order when
+        the diagram does not order them.
+
+        Args:
+            project_uuid (str): id of the project vertex
+            prune (bool, optional): solve the requisite sub-model of the influence
+                                    diagram, of the same maximum expected utility.
+                                    Defaults to False.
+
+        Raises:
+            InfluenceDiagramNotSolvable: when pyAgrum fails to solve the diagram
+            WorkerTimeout: when not solved after `solve_timeout` seconds
 
-    def create_decision_tree(self, project_uuid: str) -> DecisionTreeResponse:
+        Returns
+            InfluenceDiagramSolution: maximum expected utility and optimal policy of
+                                      each decision
+        """
+        influence_diagram = self._read_influence_diagram_model(project_uuid, prune)
+        solution = self.worker_pool.run(
+            solve,
+            self.cache.get(influence_diagram),
+            self._decision_order(influence_diagram),
+            timeout=self.solve_timeout,
+        )
+        return InfluenceDiagramSolution.model_validate(solution)
+
+    def value_of_information(self, project_uuid: str) -> ValueOfInformationResponse:
+        """Method to rank the uncertainties of a project by expected value of perfect
+        information (EVPI)
+
+        The EVPI of an uncertainty is the increase of the maximum expected utility
+        when it is observed before the first decision. The influence diagram and
+        its variants, one for each uncertainty, are solved in parallel in the worker
+        processes, at most `analysis_cpu_budget` at once. The uncertainties descending
+        from a decision cannot be observed before it: they have no EVPI.
+
+        Args:
+            project_uuid (str): id of the project vertex
+
+        Raises:
+            InfluenceDiagramNotSolvable: when pyAgrum fails to solve the diagram
+            WorkerTimeout: when not solved after `analysis_timeout` seconds
+
+        Returns
+            ValueOfInformationResponse: maximum expected utility, and uncertainties
+                                        by decreasing EVPI
+        """
+        influence_diagram = self._read_influence_diagram_model(project_uuid)
+        gum_id = self.cache.get(influence_diagram)
+        decision_order = self._decision_order(influence_diagram)
+        informed = set().union(
+            *(
+                nx.descendants(influence_diagram.nx, decision)
+                for decision in influence_diagram.get_decision_nodes()
+            )
+        )
+        observable = [
+            node
+            for node in influence_diagram.get_uncertainty_nodes()
+            if node not in informed
+        ]
+        expected_utility, *expected_utilities = self.worker_pool.map(
+            solve_with_observation,
+            [
+                (gum_id, decision_order, uncertainty)
+                for uncertainty in [None, *(node.shortname for node in observable)]
+            ],
+            max_workers=self.analysis_cpu_budget,
+            timeout=self.analysis_timeout,
+        )
+        observed = dict(zip(observable, expected_utilities, strict=True))
+        uncertainties = [
+            {
+                "uuid": node.uuid,
+                "shortname": node.shortname,
+                "expected_utility": observed.get(node),
+                "evpi": observed[node] - expected_utility if node in observed else None,
+            }
+            for node in influence_diagram.get_uncertainty_nodes()
+        ]
+        uncertainties.sort(key=lambda row: (row["evpi"] is None, -(row["evpi"] or 0.0)))
+        return ValueOfInformationResponse.model_validate(
+            {"expected_utility": expected_utility, "uncertainties": uncertainties}
+        )
+
+    def create_decision_tree(
+        self, project_uuid: str, prune: bool = False
+    ) -> DecisionTreeResponse:
         """Method to read the necessary data to create the decision tree structure
 
         Args:
             project_uuid (str): id of the project vertex
+            prune (bool, optional): build the tree of the requisite sub-model of the
+                                    influence diagram. Defaults to False.
+
+        Raises:
+            TreeTooLarge: when the tree has more than `max_node_count` nodes
 
         Returns
             DecisionTreeResponse: Dict of vertices
         """
-        influence_diagram = self.read_influence_diagram(project_uuid=project_uuid)
-        local_id = InfluenceDiagram.from_db(influence_diagram)
-        # local_id.to_json("id.json")
-        local_dt = local_id.convert_to_decision_tree()
-        # dt_json = json.loads(local_dt.to_json("dt.json"))
-        dt_json = json.loads(local_dt.to_json())
-        decision_tree = DecisionTreeResponse.model_validate(dt_json)
-        return decision_tree
+        tree = self._read_decision_tree(project_uuid, prune)
+        tree.check_size(self.max_node_count)
+        return DecisionTreeResponse.model_validate(tree.to_dict())
+
+    def create_decision_graph(
+        self, project_uuid: str, prune: bool = False
+    ) -> DecisionGraphResponse:
+        """Method to create the decision tree structure as a decision graph
+
+        The identical subtrees of the decision tree are described once, and
+        referenced by id, see `expand_graph` to get the decision tree back.
+
+        Args:
+            project_uuid (str): id of the project vertex
+            prune (bool, optional): build the tree of the requisite sub-model of the
+                                    influence diagram. Defaults to False.
+
+        Returns
+            DecisionGraphResponse: distinct subtrees, by id
+        """
+        tree = self._read_decision_tree(project_uuid, prune)
+        return DecisionGraphResponse.model_validate(tree.to_graph())
+
+    def expand_decision_tree(
+        self,
+        project_uuid: str,
+        path: str = "",
+        depth: int | None = 1,
+        prune: bool = False,
+    ) -> DecisionTreeExpansionResponse:
+        """Method to create the levels of the decision tree below a branch path
+
+        Only the returned nodes are created, the tree being described by the partial
+        order of the influence diagram.
+
+        Args:
+            project_uuid (str): id of the project vertex
+            path (str, optional): branch path to the first node, e.g.
+                                  "Test:yes/State:Peach". Defaults to "", the root.
+            depth (int, optional): number of levels below the first node. Defaults
+                                   to 1, None for as many levels as there are of at
+                                   most `max_node_count` nodes (a truncated tree).
+            prune (bool, optional): build the tree of the requisite sub-model of the
+                                    influence diagram. Defaults to False.
+
+        Raises:
+            BranchNotFound: when the path does not lead to a node of the tree
+            TreeTooLarge: when the levels have more than `max_node_count` nodes
+
+        Returns
+            DecisionTreeExpansionResponse: nested nodes, with the node count of
+                                           their subtree
+        """
+        tree = self._read_decision_tree(project_uuid, prune)
+        states = tree.find(path)
+        if depth is None:
+            depth = tree.expansion_depth(len(states), self.max_node_count)
+        tree.check_size(self.max_node_count, len(states), depth)
+        return DecisionTreeExpansionResponse.model_validate(tree.expand(states, depth))
+
+    def stream_decision_tree(
+        self, project_uuid: str, prune: bool = False
+    ) -> Iterator[str]:
+        """Method to create the decision tree structure as a stream of JSON chunks
+
+        The influence diagram is read and the tree built before the first chunk, so
+        that errors are raised by this method and not in the middle of the stream.
+
+        Args:
+            project_uuid (str): id of the project vertex
+            prune (bool, optional): build the tree of the requisite sub-model of the
+                                    influence diagram. Defaults to False.
+
+        Raises:
+            TreeTooLarge: when the tree has more than `max_node_count` nodes
+
+        Returns
+            Iterator[str]: chunks of the JSON of a DecisionTreeResponse
+        """
+        tree = self._read_decision_tree(project_uuid, prune)
+        tree.check_size(self.max_node_count)
+        return tree.iter_json(
+            lambda data: DecisionTreeNodeData.model_validate(data).model_dump_json()
+        )
+
+    def probability_sensitivity(
+        self, project_uuid: str, span: float = 0.1, points: int = 5
+    ) -> SensitivityResponse:
+        """Method to compute the sensitivity of the maximum expected utility to the
+        probability of each state of each uncertainty, as tornado chart data
+
+        The probability of the state is shifted by `points` deltas from -`span` to
+        `span`, in every distribution of the uncertainty, the probabilities of the
+        other states being scaled to keep the distributions normalized. The tables
+        of all the shifts of an uncertainty are computed at once and solved in a
+        worker process, at most `analysis_cpu_budget` uncertainties at once. The
+        base solution and the sweeps share the `analysis_timeout`.
+
+        Args:
+            project_uuid (str): id of the project vertex
+            span (float, optional): largest shift of the probabilities. Defaults to
+                                    0.1.
+            points (int, optional): number of shifts. Defaults to 5.
+
+        Raises:
+            InfluenceDiagramNotSolvable: when pyAgrum fails to solve the diagram
+            WorkerTimeout: when not solved after `analysis_timeout` seconds
+
+        Returns
+            SensitivityResponse: maximum expected utility, and sweeps of the states
+                                 of the uncertainties by decreasing swing
+        """
+        influence_diagram = self._read_influence_diagram_model(project_uuid)
+        gum_id = self.cache.get(influence_diagram)
+        decision_order = self._decision_order(influence_diagram)
+        deadline = time.monotonic() + self.analysis_timeout
+        solution = self.worker_pool.run(
+            solve, gum_id, decision_order, timeout=self.analysis_timeout
+        )
+        deltas = np.linspace(-span, span, points).tolist()
+        uncertainties = influence_diagram.get_uncertainty_nodes()
+        policies = solution["policies"]
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise WorkerTimeout(self.analysis_timeout)
+        try:
+            sweeps = self.worker_pool.map(
+                sweep_probability,
+                [
+                    (gum_id, decision_order, node.shortname, deltas, policies)
+                    for node in uncertainties
+                ],
+                max_workers=self.analysis_cpu_budget,
+                timeout=remaining,
+            )
+        except WorkerTimeout as e:
+            # reported against the timeout of the whole request
+            raise WorkerTimeout(self.analysis_timeout) from e
+        sensitivities = [
+            {
+                "uuid": node.uuid,
+                "shortname": node.shortname,
+                "deltas": deltas,
+                "low": sweep["expected_utilities"][0],
+                "high": sweep["expected_utilities"][-1],
+                "swing": max(sweep["expected_utilities"])
+                - min(sweep["expected_utilities"]),
+                **sweep,
+            }
+            for node, node_sweeps in zip(uncertainties, sweeps, strict=True)
+            for sweep in node_sweeps
+        ]
+        sensitivities.sort(key=lambda row: -row["swing"])
+        return SensitivityResponse.model_validate(
+            {
+                "expected_utility": solution["expected_utility"],
+                "sensitivities": sensitivities,
+            }
+        )
+
+    def simulate(self, project_uuid: str, request: MonteCarloRequest) -> Iterator[str]:
+        """Method to simulate the scenarios of a project for a strategy, as a stream
+        of running summaries of their values
+
+        The influence diagram is read and the simulation checked before the first
+        summary, so that errors are raised by this method and not in the middle of
+        the stream.
+
+        Args:
+            project_uuid (str): id of the project vertex
+            request (MonteCarloRequest): strategy, values of the states, number of
+                                         scenarios and size of the chunks
+
+        Raises:
+            StrategyError: when an alternative is missing from the strategy or
+                           unknown
+            ValuationError: when a valued node or state is unknown
+
+        Returns
+            Iterator[str]: a line of the JSON of a MonteCarloSummary after each chunk
+        """
+        simulation = MonteCarloSimulation(
+            self._read_influence_diagram_model(project_uuid),
+            request.strategy,
+            request.values,
+            seed=request.seed,
+        )
+        summaries = simulation.run(
+            request.samples, request.chunk_size, request.percentiles, request.confidence
+        )
+        return (
+            MonteCarloSummary.model_validate(summary).model_dump_json() + "\n"
+            for summary in summaries
+        )
+
+    def posterior_queries(
+        self, project_uuid: str, request: PosteriorRequest
+    ) -> PosteriorResponse:
+        """Method to query the posterior distributions of uncertainties of a project
+        for a batch of evidence scenarios
+
+        The Bayesian network of the chance nodes and its junction tree are compiled
+        once per content of the influence diagram (see `PyAgrumCache.get_network`),
+        and reused by all the scenarios of the batch and by the next requests.
+
+        Args:
+            project_uuid (str): id of the project vertex
+            request (PosteriorRequest): evidence scenarios and queried uncertainties
+
+        Raises:
+            EvidenceError: when a node or a state of the request is unknown
+
+        Returns
+            PosteriorResponse: the probability of the evidence and the posterior
+                               distributions, for each scenario
+        """
+        network = self.cache.get_network(
+            self._read_influence_diagram_model(project_uuid)
+        )
+        results = network.posteriors(request.scenarios, request.targets)
+        return PosteriorResponse.model_validate({"results": results})
+
+    @staticmethod
+    def _decision_order(influence_diagram: InfluenceDiagram) -> list[str]:
+        return [
+            node.shortname
+            for node in influence_diagram.calculate_partial_order()
+            if node.is_decision_node
+        ]
+
+    def _read_influence_diagram_model(
+        self, project_uuid: str, prune: bool = False
+    ) -> InfluenceDiagram:
+        influence_diagram = InfluenceDiagram.from_db(
+            self.read_influence_diagram(project_uuid=project_uuid)
+        )
+        if prune:
+            influence_diagram, _ = influence_diagram.prune()
+        return influence_diagram
+
+    def _read_decision_tree(
+        self, project_uuid: str, prune: bool = False
+    ) -> SymmetricDecisionTree:
+        influence_diagram = self._read_influence_diagram_model(project_uuid, prune)
+        return influence_diagram.convert_to_symmetric_decision_tree().symmetric_tree
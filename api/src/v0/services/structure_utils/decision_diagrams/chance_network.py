@@ -0,0 +1,156 @@
+"""Module defining the ChanceNetwork class
+
+The chance nodes of a pyAgrum influence diagram form a Bayesian network, queried for
+the posterior distributions of its uncertainties given evidence scenarios. The junction
+tree of the network is compiled once, when the network is created, and reused by
+all the scenarios of all the queries.
+"""
+
+import logging
+import math
+import threading
+
+import pyAgrum as gum
+
+logger = logging.getLogger(__name__)
+
+
+class EvidenceError(Exception):
+    def __init__(self, variable, state=None):
+        self.variable = variable
+        self.state = state
+        if state is None:
+            error_message = f"no uncertainty or decision {variable} in the network"
+        else:
+            error_message = f"{state} is not a state of {variable}"
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class ChanceNetwork:
+    """Bayesian network of the chance nodes of an influence diagram"""
+
+    def __init__(self, gum_id: gum.InfluenceDiagram):
+        """Create an instance of a ChanceNetwork
+
+        The decisions informing chance nodes are kept, as uniformly distributed
+        roots: a scenario sets their alternative as evidence, or averages over them.
+        The probability of the evidence of a scenario is the probability of its
+        uncertainties given its alternatives.
+
+        Args:
+            gum_id (gum.InfluenceDiagram): the pyAgrum influence diagram, left
+                                           unchanged
+
+        Attributes:
+            bn (gum.BayesNet): the Bayesian network
+            decisions (set[str]): names of the decisions of the network
+            entries (int): number of entries of the probability tables of the
+                           network and of the cliques of its junction tree
+        """
+        self.bn = gum.BayesNet()
+        kept = [
+            node
+            for node in gum_id.nodes()
+            if gum_id.isChanceNode(node)
+            or (
+                gum_id.isDecisionNode(node)
+                and any(gum_id.isChanceNode(child) for child in gum_id.children(node))
+            )
+        ]
+        for node in kept:
+            self.bn.add(gum_id.variable(node))
+        self.decisions = {
+            gum_id.variable(node).name() for node in kept if gum_id.isDecisionNode(node)
+        }
+        for tail, head in gum_id.arcs():
+            if tail in kept and gum_id.isChanceNode(head):
+                self.bn.addArc(
+                    gum_id.variable(tail).name(), gum_id.variable(head).name()
+                )
+        for node in kept:
+            cpt = self.bn.cpt(gum_id.variable(node).name())
+            if gum_id.isChanceNode(node):
+                # matched by variable name, whatever the order of the parents
+                cpt.fillWith(gum_id.cpt(node))
+            else:
+                cpt.fillWith(1 / gum_id.variable(node).domainSize())
+
+        self._inference = gum.LazyPropagation(self.bn)
+        self._inference.makeInference()
+        self._lock = threading.Lock()
+        junction_tree = self._inference.junctionTree()
+        self.entries = sum(self.bn.cpt(node).domainSize() for node in self.bn.nodes())
+        self.entries += sum(
+            math.prod(self.bn.variable(node).domainSize() for node in clique)
+            for clique in map(junction_tree.clique, junction_tree.nodes())
+        )
+
+    def check(self, variable: str, state: str | None = None):
+        """Check that a variable, and a state of the variable, are in the network
+
+        Raises:
+            EvidenceError: when the variable or the state is unknown
+        """
+        if not self.bn.exists(variable):
+            raise EvidenceError(variable)
+        if state is not None and state not in self.bn.variable(variable).labels():
+            raise EvidenceError(variable, state)
+
+    def posteriors(
+        self, scenarios: list[dict[str, str]], targets: list[str]
+    ) -> list[dict]:
+        """Posterior distributions of uncertainties for each evidence scenario
+
+        The scenarios are run one after the other on the compiled junction tree, the
+        network being queried by one request at a time.
+
+        Args:
+            scenarios (list[dict[str, str]]): observed state of variables, by name,
+                                              for each scenario
+            targets (list[str]): names of the variables whose posterior is queried
+
+        Raises:
+            EvidenceError: when a variable or a state is unknown
+
+        Returns:
+            List[Dict]: for each scenario, {"evidence_probability", "posteriors":
+                        {target: {state: probability}}}, the posteriors being None
+                        for impossible evidence (of probability 0)
+        """
+        for target in targets:
+            self.check(target)
+        for evidence in scenarios:
+            for variable, state in evidence.items():
+                self.check(variable, state)
+
+        results = []
+        with self._lock:
+            for evidence in scenarios:
+                self._inference.setEvidence(evidence)
+                self._inference.makeInference()
+                try:
+                    probability = self._inference.evidenceProbability()
+                except Exception:  # noqa: BLE001
+                    # pyAgrum raises a plain Exception for incompatible evidence
+                    probability = 0.0
+                # the alternatives are chosen, not drawn from their uniform prior
+                for variable in evidence.keys() & self.decisions:
+                    probability *= self.bn.variable(variable).domainSize()
+                posteriors = None
+                if probability > 0:
+                    posteriors = {
+                        target: dict(
+                            zip(
+                                self.bn.variable(target).labels(),
+                                self._inference.posterior(target).tolist(),
+                                strict=True,
+                            )
+                        )
+                        for target in targets
+                    }
+                results.append(
+                    {"evidence_probability": probability, "posteriors": posteriors}
+                )
+            self._inference.eraseAllEvidence()
+        return results
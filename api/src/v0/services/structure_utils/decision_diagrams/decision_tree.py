@@ -20,6 +20,7 @@ from ..decision_diagrams.probabilistic_graph_model import ProbabilisticGraphMode
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..decision_diagrams.node import NodeABC
+    from ..decision_diagrams.symmetric_decision_tree import SymmetricDecisionTree
 
 
 logger = logging.getLogger(__name__)
@@ -41,15 +42,24 @@ class DecisionTree(ProbabilisticGraphModelABC):
 
         Args:
             *args, **kwargs: arguments for networkx.DiGraph
+            symmetric_tree (SymmetricDecisionTree, optional): array-backed tree to
+                wrap instead of building the networkx graph. Defaults to None.
 
         Attributes:
             nx (networkx.DiGraph): networkx.DiGraph object containing the decision tree
-                                  (nodes and arcs)
+                                  (nodes and arcs), only the root when wrapping a
+                                  symmetric tree
+            symmetric_tree (SymmetricDecisionTree | None): the wrapped symmetric tree
         """
+        self.symmetric_tree: SymmetricDecisionTree | None = kwargs.pop(
+            "symmetric_tree", None
+        )
         super().__init__(*args, **kwargs)
         self.root = kwargs.get("root", None)
+        if self.symmetric_tree is not None:
+            self.root = self.symmetric_tree.root
         if self.root is not None:
-            self.nx.add_node(self.root)
+            self.add_node(self.root)
 
     @classmethod
     def initialize_diagram(cls, data: dict):
@@ -118,6 +128,20 @@ class DecisionTree(ProbabilisticGraphModelABC):
         parents = self.get_parents(node)
         return parents[0] if len(parents) > 0 else None
 
+    def to_dict(self) -> dict:
+        """convert the decision tree instance into nested dictionaries
+
+        Raises:
+            RootNodeNotFound: Raised when no root has been set in the decision tree
+
+        Returns:
+            Dict: `{"id": node data, "children": [...]}`, the shape of a
+                  DecisionTreeResponse
+        """
+        if self.symmetric_tree is not None:
+            return self.symmetric_tree.to_dict()
+        return json.loads(self._to_json_stream())
+
     def _to_json_stream(self) -> dict:
         """convert the decision tree instance into a dictionary
             It uses the method `networkx.readwrite.json_graph.tree_data()`
@@ -138,6 +162,8 @@ class DecisionTree(ProbabilisticGraphModelABC):
 
         if self.root is None:
             raise RootNodeNotFound
+        if self.symmetric_tree is not None:
+            return json.dumps(self.symmetric_tree.to_dict(), indent=2)
 
         edges_name = nx.get_edge_attributes(self.nx, "name")
         tg = nx.readwrite.json_graph.tree_data(self.nx, self.root)
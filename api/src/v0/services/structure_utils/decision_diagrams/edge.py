@@ -180,18 +180,16 @@ class Edge:
         }
 
     @classmethod
-    def from_db(cls, response: EdgeResponse, nodes: list[NodeABC]):
-        """create an Edges defined as an EdgeResponse and given a list of NodeABC
+    def from_db(cls, response: EdgeResponse, nodes: dict[str, NodeABC]):
+        """create an Edges defined as an EdgeResponse and given the NodeABC by uuid
 
         Args:
             response (EdgeResponse): response from DataBase defining the edge
-            nodes (list[NodeABC]): nodes existing in the diagram
+            nodes (dict[str, NodeABC]): nodes existing in the diagram, by uuid
 
         Returns
             Edge: An Edge between existing nodes (NodeABC)
         """
-        uuid_tail = response.outV
-        uuid_head = response.inV
-        tail = [node for node in nodes if node.uuid == uuid_tail][0]
-        head = [node for node in nodes if node.uuid == uuid_head][0]
+        tail = nodes[response.outV]
+        head = nodes[response.inV]
         return Edge(tail, head, **response.__dict__)
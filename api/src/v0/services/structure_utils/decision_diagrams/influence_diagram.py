@@ -9,17 +9,20 @@ An InfluenceDiagram is a sub-class of ProbabilisticGraphModel.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from typing import TYPE_CHECKING
 
 import networkx as nx
+import numpy as np
 import pyAgrum as gum
 
 from ..decision_diagrams.decision_tree import DecisionTree
 from ..decision_diagrams.edge import Edge
 from ..decision_diagrams.node import DecisionNode, NodeABC, UncertaintyNode, UtilityNode
 from ..decision_diagrams.probabilistic_graph_model import ProbabilisticGraphModelABC
+from ..decision_diagrams.symmetric_decision_tree import SymmetricDecisionTree
 
 if TYPE_CHECKING:  # pragma: no cover
     from ....models.structure import InfluenceDiagramResponse
@@ -132,7 +135,7 @@ class InfluenceDiagram(ProbabilisticGraphModelABC):
         Returns:
             int: the number of DecisionNode objects in the influence diagram
         """
-        return len(self.get_decision_nodes())
+        return self._count_nodes_from_type("DecisionNode")
 
     @property
     def uncertainty_count(self) -> int:
@@ -141,7 +144,7 @@ class InfluenceDiagram(ProbabilisticGraphModelABC):
         Returns:
             int: the number of UncertaintyNode objects in the influence diagram
         """
-        return len(self.get_uncertainty_nodes())
+        return self._count_nodes_from_type("UncertaintyNode")
 
     @property
     def utility_count(self) -> int:
@@ -150,7 +153,7 @@ class InfluenceDiagram(ProbabilisticGraphModelABC):
         Returns:
             int:  the number of UtilityNode objects in the influence diagram
         """
-        return len(self.get_utility_nodes())
+        return self._count_nodes_from_type("UtilityNode")
 
     def _to_json_stream(self) -> dict:
         """convert the influence diagram instance into a dictionary
@@ -167,6 +170,22 @@ class InfluenceDiagram(ProbabilisticGraphModelABC):
         json_object = json.dumps(data, default=lambda o: o.to_dict(), indent=4)
         return json_object
 
+    def content_hash(self) -> str:
+        """Hash of the content of the diagram: its nodes, in order, with their states
+        and probabilities, and its arcs
+
+        Returns:
+            str: SHA-256 hex digest, the same for diagrams converted into the same
+                 pyAgrum influence diagram
+        """
+        content = {
+            "nodes": [node.to_dict() for node in self.nx],
+            "edges": [[tail.uuid, head.uuid] for tail, head in self.nx.edges],
+        }
+        return hashlib.sha256(
+            json.dumps(content, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
     @classmethod
     def from_db(cls, response: InfluenceDiagramResponse):
         """Create a diagram from the DataBase Response
@@ -188,74 +207,177 @@ class InfluenceDiagram(ProbabilisticGraphModelABC):
             >>> InfluenceDiagram.from_db(influence_diagram_response)
         """
         nodes = [NodeABC.from_db(vertex) for vertex in response.vertices]
-        arcs = [Edge.from_db(edge, nodes) for edge in response.edges]
+        nodes_by_uuid = {node.uuid: node for node in reversed(nodes)}
+        arcs = [Edge.from_db(edge, nodes_by_uuid) for edge in response.edges]
         return cls.from_dict({"nodes": nodes, "edges": arcs})
 
     def decision_elimination_order(self) -> list[NodeABC]:
         """Decision Elimination Order algorithm
 
+        The nodes without children are removed from the diagram, pass after pass
+        over its remaining nodes (in insertion order), until all the decisions are
+        removed. The decisions are returned in the order of their removal.
+
+        Instead of removing nodes, the pass in which each node would be removed is
+        computed in a single reverse topological pass: a node goes in the pass of
+        its last removed child, or in the next one when that child comes after it.
+
+        Raises:
+            InfluenceDiagramNotAcyclicError: when the diagram has a cycle
+
         Returns:
             List[NodeABC] : the decision elimination order graph associated to
-                            the influence diagram. Nodes in the list are copies of the
-                            nodes of the influence diagram ones.
-
-        TODO: add description of what is the algorithm about
+                            the influence diagram. Nodes in the list are views of the
+                            nodes of the influence diagram.
         """
-        cid_copy = self.copy()
-        decisions = []
-        decisions_count = cid_copy.decision_count
-        while decisions_count > 0:
-            nodes = list(cid_copy.nx.nodes())
-            for node in nodes:
-                if not cid_copy.has_children(node):
-                    if node.is_decision_node:
-                        decisions.append(node)
-                        decisions_count -= 1
-                    cid_copy.nx.remove_node(node)
-        return decisions
+        return list(
+            self._memoize("decision_elimination_order", self._decision_elimination_order)
+        )
+
+    def _decision_elimination_order(self) -> list[NodeABC]:
+        try:
+            nodes = list(nx.topological_sort(self.nx))
+        except nx.NetworkXUnfeasible:
+            raise InfluenceDiagramNotAcyclicError
+        position = {node: k for k, node in enumerate(self.nx)}
+        removal_pass = {}
+        for node in reversed(nodes):
+            removal_pass[node] = max(
+                (
+                    removal_pass[child] + (position[child] > position[node])
+                    for child in self.nx.successors(node)
+                ),
+                default=0,
+            )
+        return sorted(
+            self.get_decision_nodes(),
+            key=lambda node: (removal_pass[node], position[node]),
+        )
 
     def calculate_partial_order(self, mode="view") -> list[NodeABC]:
         """Partial order algorithm
 
+        From the last eliminated decision, each decision comes after its parent
+        uncertainties not yet in the partial order. The other uncertainties come
+        last.
 
         Args:
             mode (str): ["view"(default)|"copy"]
                 returns a view or a copy of the nodes
 
+        Raises:
+            PartialOrderOutputModeError: when the mode is neither "view" nor "copy"
+            InfluenceDiagramNotAcyclicError: when the diagram has a cycle
+
         Returns
-            List[NodeABC]: list of nodes (copies or vioews) sorted in decision order
+            List[NodeABC]: list of nodes (copies or views) sorted in decision order
 
-        TODO: add description of what the algorithm is about
         TODO: handle utility nodes
         """
         if mode not in ["view", "copy"]:
             raise PartialOrderOutputModeError(mode)
 
-        # get all chance nodes
-        uncertainty_node = self.get_uncertainty_nodes()
-        elimination_order = self.decision_elimination_order()
-        # TODO: Add utility nodes
-        partial_order = []
+        partial_order = self._memoize("partial_order", self._calculate_partial_order)
+        if mode == "copy":
+            return [node.copy() for node in partial_order]
+        return list(partial_order)
 
-        while elimination_order:
-            decision = elimination_order.pop()
-            parent_decision_nodes = []
-            for parent in self.get_parents(decision):
-                if not parent.is_decision_node:
-                    if parent in uncertainty_node:
-                        parent_decision_nodes.append(parent)
-                        uncertainty_node.remove(parent)
-
-            if len(parent_decision_nodes) > 0:
-                partial_order += parent_decision_nodes
+    def _calculate_partial_order(self) -> list[NodeABC]:
+        uncertainty_nodes = self.get_uncertainty_nodes()
+        remaining = set(uncertainty_nodes)
+        partial_order = []
+        for decision in reversed(self.decision_elimination_order()):
+            for parent in self.nx.predecessors(decision):
+                if parent in remaining:
+                    partial_order.append(parent)
+                    remaining.remove(parent)
             partial_order.append(decision)
+        # TODO: Add utility nodes
+        partial_order += [node for node in uncertainty_nodes if node in remaining]
+        return partial_order
 
-        partial_order += uncertainty_node
+    def prune(self) -> tuple[InfluenceDiagram, dict]:
+        """Requisite sub-model of the influence diagram
 
-        if mode == "copy":
-            partial_order = [node.copy() for node in partial_order]
+        Two reductions are repeated until neither removes anything:
 
-        return partial_order
+        - barren uncertainties, without children, are removed: no decision or
+          utility depends on them;
+        - from the last decision, the arcs of non-requisite observations are
+          removed: an uncertainty parent of a decision is not requisite when it
+          is d-separated from the utilities descending from the decision, given the
+          decision and its other parents. An arc whose removal would change the
+          order of the decisions is kept.
+
+        A diagram without utility nodes is not pruned, the value of its scenarios
+        not being modelled. The probabilities of the remaining uncertainties are
+        unchanged: only childless nodes, and arcs into decisions, are removed.
+
+        Raises:
+            InfluenceDiagramNotAcyclicError: when the diagram has a cycle
+
+        Returns:
+            Tuple[InfluenceDiagram, Dict]: the pruned copy of the diagram (sharing
+                                           its nodes), and what was removed
+                                           {"nodes": [NodeABC], "arcs":
+                                           [(tail, head)]}
+        """
+        decision_order = [
+            node for node in self.calculate_partial_order() if node.is_decision_node
+        ]
+        pruned = self.copy()
+        removed = {"nodes": [], "arcs": []}
+        if not self.utility_count:
+            return pruned, removed
+
+        changed = True
+        while changed:
+            changed = False
+            barren = [
+                node
+                for node in pruned.get_uncertainty_nodes()
+                if not pruned.has_children(node)
+            ]
+            while barren:
+                changed = True
+                node = barren.pop()
+                parents = pruned.get_parents(node)
+                pruned.remove_node(node)
+                removed["nodes"].append(node)
+                barren += [
+                    parent
+                    for parent in parents
+                    if parent.is_uncertainty_node and not pruned.has_children(parent)
+                ]
+
+            for decision in reversed(decision_order):
+                utilities = {
+                    node
+                    for node in nx.descendants(pruned.nx, decision)
+                    if node.is_utility_node
+                }
+                parents = pruned.get_parents(decision)
+                for parent in list(parents):
+                    if not parent.is_uncertainty_node:
+                        continue
+                    given = {decision, *parents} - {parent}
+                    if utilities and not nx.is_d_separator(
+                        pruned.nx, {parent}, utilities, given
+                    ):
+                        continue
+                    name = pruned.nx.edges[parent, decision].get("name")
+                    pruned.remove_edge(parent, decision)
+                    if [
+                        node
+                        for node in pruned.calculate_partial_order()
+                        if node.is_decision_node
+                    ] != decision_order:
+                        pruned.add_edge(Edge(parent, decision, name=name))
+                        continue
+                    parents.remove(parent)
+                    removed["arcs"].append((parent, decision))
+                    changed = True
+        return pruned, removed
 
     def _output_branches_from_node(
         self, node: NodeABC, node_in_partial_order: NodeABC, flip=True
@@ -334,6 +456,20 @@ class InfluenceDiagram(ProbabilisticGraphModelABC):
 
         return decision_tree
 
+    def convert_to_symmetric_decision_tree(self) -> DecisionTree:
+        """Convert the influence diagram into a DecisionTree wrapping a
+            SymmetricDecisionTree
+
+            Unlike convert_to_decision_tree, no node is copied nor added to a
+            networkx graph: the levels of the tree are the nodes of the partial order.
+
+        Returns:
+            DecisionTree: The symmetric decision tree equivalent to the influence diagram
+        """
+        return DecisionTree(
+            symmetric_tree=SymmetricDecisionTree(self.calculate_partial_order())
+        )
+
     @staticmethod
     def _nodes_to_pyagrum(nodes, gum_id):
         # create an uuid for gum as 8 bytes integer and keep relation to uuid
@@ -381,6 +517,38 @@ class InfluenceDiagram(ProbabilisticGraphModelABC):
                 raise ArcFormatError(e)
         return None
 
+    @staticmethod
+    def probability_table(
+        probabilities, variables: list[str], shape: list[int]
+    ) -> np.ndarray:
+        """Probability table of a node, with one axis for the node and for each of
+        the given parents
+
+        Args:
+            probabilities (ProbabilityABC): probabilities of the node
+            variables (list[str]): shortnames of the node and of its parents
+            shape (list[int]): number of states of the node and of its parents
+
+        Raises:
+            ProbabilityFormatError: when the probabilities do not match the states
+
+        Returns:
+            np.ndarray: the (read-only) table, broadcast over the parents the
+                        probabilities do not depend on
+        """
+        try:
+            return np.broadcast_to(probabilities.to_pyagrum_array(variables), shape)
+        except ValueError as e:
+            raise ProbabilityFormatError(e)
+
+    @staticmethod
+    def _cpt_to_pyagrum(probabilities, cpt):
+        # fill the whole table in one call: the first variable of a pyAgrum table
+        # varies fastest, as the first axis in Fortran order
+        shape = [cpt.variable(k).domainSize() for k in range(cpt.nbrDim())]
+        array = InfluenceDiagram.probability_table(probabilities, cpt.names, shape)
+        cpt.fillWith(array.ravel(order="F"))
+
     def to_pyagrum(self):
         if not nx.is_directed_acyclic_graph(self.nx):
             raise InfluenceDiagramNotAcyclicError
@@ -396,7 +564,8 @@ class InfluenceDiagram(ProbabilisticGraphModelABC):
 
         for variable_id in uuid_gum_to_dot:
             if isinstance(node_uuid[variable_id], UncertaintyNode):
-                for agrum_prob in node_uuid[variable_id].probabilities.to_pyagrum():
-                    gum_id.cpt(variable_id)[agrum_prob[0]] = agrum_prob[1]
+                InfluenceDiagram._cpt_to_pyagrum(
+                    node_uuid[variable_id].probabilities, gum_id.cpt(variable_id)
+                )
 
         return gum_id
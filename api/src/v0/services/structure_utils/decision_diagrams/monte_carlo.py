@@ -0,0 +1,257 @@
+"""Module defining the MonteCarloSimulation class
+
+The scenarios of an influence diagram are sampled for a strategy (an alternative for
+each decision), in topological order, by chunks: each uncertainty draws the state of
+all the scenarios of a chunk at once, from the rows of its probability table indexed
+by the states of its parents. The value of a scenario is the sum of the values of
+the states of its nodes.
+
+The summaries of the values (mean and its confidence interval, standard deviation,
+percentiles) are updated after each chunk: the memory used depends on the chunk size
+and on the number of distinct values, not on the number of scenarios.
+"""
+
+import logging
+from collections.abc import Iterator
+from statistics import NormalDist
+
+import networkx as nx
+import numpy as np
+
+from .influence_diagram import InfluenceDiagram, InfluenceDiagramNotAcyclicError
+
+logger = logging.getLogger(__name__)
+
+
+class StrategyError(Exception):
+    def __init__(self, decision, alternative=None):
+        self.decision = decision
+        self.alternative = alternative
+        if alternative is None:
+            error_message = f"no alternative of the decision {decision} in the strategy"
+        else:
+            error_message = f"{alternative} is not an alternative of {decision}"
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class ValuationError(Exception):
+    def __init__(self, shortname, state=None):
+        self.shortname = shortname
+        self.state = state
+        if state is None:
+            error_message = f"no decision or uncertainty {shortname} to value"
+        else:
+            error_message = f"{state} is not a state of {shortname}"
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class MonteCarloSimulation:
+    """Sampling of the scenarios of an influence diagram for a strategy"""
+
+    def __init__(
+        self,
+        influence_diagram: InfluenceDiagram,
+        strategy: dict[str, str],
+        values: dict[str, dict[str, float]],
+        seed: int | None = None,
+    ):
+        """Create an instance of a MonteCarloSimulation
+
+        Args:
+            influence_diagram (InfluenceDiagram): the influence diagram
+            strategy (dict[str, str]): alternative of each decision, by shortname
+            values (dict[str, dict[str, float]]): value of states of decisions and
+                                                  uncertainties, by shortname; the
+                                                  states not given are valued 0
+            seed (int, optional): seed of the random generator, for reproducible
+                                  simulations. Defaults to None.
+
+        Raises:
+            InfluenceDiagramNotAcyclicError: when the influence diagram has a cycle
+            StrategyError: when an alternative is missing from the strategy or
+                           unknown
+            ValuationError: when a valued node or state is unknown
+            ProbabilityFormatError: when a probability table does not match the
+                                    states of the node and its parents
+
+        Attributes:
+            nodes (list[NodeABC]): the decisions and uncertainties, in topological
+                                   order
+            states (dict[NodeABC, int]): index of the alternative of each decision
+            parents (dict[NodeABC, list[NodeABC]]): parents of each uncertainty
+            cumulative (dict[NodeABC, np.ndarray]): cumulative distribution of each
+                                                    uncertainty, one row for each
+                                                    combination of the states of its
+                                                    parents
+            values (dict[NodeABC, np.ndarray]): value of each state of each node
+        """
+        try:
+            order = list(nx.topological_sort(influence_diagram.nx))
+        except nx.NetworkXUnfeasible as e:
+            raise InfluenceDiagramNotAcyclicError from e
+        self.nodes = [node for node in order if not node.is_utility_node]
+        self.rng = np.random.default_rng(seed)
+
+        self.states = {}
+        for decision in influence_diagram.get_decision_nodes():
+            if decision.shortname not in strategy:
+                raise StrategyError(decision.shortname)
+            alternative = strategy[decision.shortname]
+            if alternative not in decision.states:
+                raise StrategyError(decision.shortname, alternative)
+            self.states[decision] = decision.states.index(alternative)
+
+        self.parents = {}
+        self.cumulative = {}
+        for uncertainty in influence_diagram.get_uncertainty_nodes():
+            parents = [
+                parent
+                for parent in influence_diagram.get_parents(uncertainty)
+                if not parent.is_utility_node
+            ]
+            table = InfluenceDiagram.probability_table(
+                uncertainty.probabilities,
+                [node.shortname for node in [uncertainty, *parents]],
+                [len(node.states) for node in [uncertainty, *parents]],
+            )
+            # rows of the distributions, in C order of the states of the parents
+            rows = np.moveaxis(table, 0, -1).reshape(-1, table.shape[0])
+            self.parents[uncertainty] = parents
+            self.cumulative[uncertainty] = np.cumsum(rows, axis=1)
+
+        nodes = {node.shortname: node for node in self.nodes}
+        self.values = {}
+        for shortname, node_values in values.items():
+            if shortname not in nodes:
+                raise ValuationError(shortname)
+            node = nodes[shortname]
+            self.values[node] = np.zeros(len(node.states))
+            for state, value in node_values.items():
+                if state not in node.states:
+                    raise ValuationError(shortname, state)
+                self.values[node][node.states.index(state)] = value
+
+    def sample(self, size: int) -> dict:
+        """Sample scenarios
+
+        Args:
+            size (int): number of scenarios
+
+        Returns:
+            Dict: state indices of the scenarios (an array of `size` integers) by
+                  node
+        """
+        states = {}
+        for node in self.nodes:
+            if node in self.states:
+                states[node] = np.full(size, self.states[node])
+                continue
+            parents = self.parents[node]
+            row = np.ravel_multi_index(
+                [states[parent] for parent in parents],
+                [len(parent.states) for parent in parents],
+            )
+            cumulative = self.cumulative[node]
+            draws = self.rng.random(size)
+            # inverse transform sampling: the first state whose cumulative
+            # probability exceeds the draw
+            state = (cumulative[row] <= draws[:, None]).sum(axis=1)
+            states[node] = np.minimum(state, cumulative.shape[1] - 1)
+        return states
+
+    def value(self, states: dict, size: int) -> np.ndarray:
+        """Values of sampled scenarios
+
+        Args:
+            states (dict): state indices of the scenarios by node (see `sample`)
+            size (int): number of scenarios
+
+        Returns:
+            np.ndarray: the sum of the values of the states of each scenario
+        """
+        value = np.zeros(size)
+        for node, node_values in self.values.items():
+            value += node_values[states[node]]
+        return value
+
+    def run(
+        self,
+        samples: int,
+        chunk_size: int,
+        percentiles: list[float] = (5.0, 50.0, 95.0),
+        confidence: float = 0.95,
+    ) -> Iterator[dict]:
+        """Sample and value scenarios by chunks, and summarize the values so far
+        after each chunk
+
+        Args:
+            samples (int): number of scenarios
+            chunk_size (int): number of scenarios of a chunk
+            percentiles (list[float], optional): percentiles of the values (between
+                                                 0 and 100). Defaults to (5.0, 50.0,
+                                                 95.0).
+            confidence (float, optional): confidence level of the interval of the
+                                          mean. Defaults to 0.95.
+
+        Returns:
+            Iterator[Dict]: after each chunk, {"samples", "mean",
+                            "confidence_interval": [low, high], "std", "min",
+                            "max", "percentiles": {percentile: value}}
+        """
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        summary = RunningSummary()
+        for start in range(0, samples, chunk_size):
+            size = min(chunk_size, samples - start)
+            summary.update(self.value(self.sample(size), size))
+            yield summary.to_dict(percentiles, z)
+
+
+class RunningSummary:
+    """Count, mean and sum of the squared deviations (Chan et al.) of the values,
+    and counts of the distinct values for the percentiles"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.distinct = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of values"""
+        count = len(values)
+        mean = values.mean()
+        delta = mean - self.mean
+        total = self.count + count
+        self.m2 += ((values - mean) ** 2).sum() + delta**2 * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+        distinct, inverse = np.unique(
+            np.concatenate([self.distinct, values]), return_inverse=True
+        )
+        weights = np.concatenate([self.counts, np.ones(count, dtype=np.int64)])
+        self.distinct = distinct
+        self.counts = np.bincount(inverse, weights=weights).astype(np.int64)
+
+    def percentile(self, q: float) -> float:
+        """Percentile of the values (the "inverted_cdf" method of numpy)"""
+        rank = np.ceil(q / 100 * self.count)
+        return float(self.distinct[np.searchsorted(np.cumsum(self.counts), rank)])
+
+    def to_dict(self, percentiles: list[float], z: float) -> dict:
+        std = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+        margin = z * std / np.sqrt(self.count)
+        return {
+            "samples": self.count,
+            "mean": float(self.mean),
+            "confidence_interval": [
+                float(self.mean - margin),
+                float(self.mean + margin),
+            ],
+            "std": float(std),
+            "min": float(self.distinct[0]),
+            "max": float(self.distinct[-1]),
+            "percentiles": {str(q): self.percentile(q) for q in percentiles},
+        }
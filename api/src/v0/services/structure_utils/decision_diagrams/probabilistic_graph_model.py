@@ -1,10 +1,15 @@
-"""Module defining the ProbabilisticGraphModel Abstract class"""
+"""Module defining the ProbabilisticGraphModel Abstract class
+
+The nodes of a graph model are indexed by uuid and by type, and the results of the
+algorithms on it are memoized, as long as it is mutated through `add_node`,
+`add_edge`, `remove_node` and `remove_edge`.
+"""
 
 from __future__ import annotations
 
-import importlib
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,8 +24,6 @@ logger = logging.getLogger(__name__)
 
 
 class ProbabilisticGraphModelABC(ABC):
-    NODES_MODULE_PATH = "src.v0.services.structure_utils.decision_diagrams.node"
-
     """Probabilistic Graph Model"""
 
     def __init__(self, *args, **kwargs):
@@ -35,6 +38,8 @@ class ProbabilisticGraphModelABC(ABC):
             nx: networkx object
         """
         self.nx = nx.DiGraph(*args, **kwargs)
+        self._memo: dict = {}
+        self._reindex()
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -66,7 +71,9 @@ class ProbabilisticGraphModelABC(ABC):
         Args:
             node (NodeABC): node to be added
         """
+        self._memo.clear()
         self.nx.add_node(node)
+        self._index_node(node)
 
     def add_edge(self, edge: Edge):
         """Add an edge to the graph
@@ -76,7 +83,39 @@ class ProbabilisticGraphModelABC(ABC):
                          are added to the graph too.
         """
         nx_edge, nx_attributes = edge.to_nx()
+        self._memo.clear()
         self.nx.add_edge(nx_edge[0], nx_edge[1], **nx_attributes)
+        self._index_node(nx_edge[0])
+        self._index_node(nx_edge[1])
+
+    def remove_node(self, node: NodeABC):
+        """Remove a node, and its edges, from the graph
+
+        Args:
+            node (NodeABC): node to be removed
+        """
+        self._memo.clear()
+        self.nx.remove_node(node)
+        for key, index in [
+            (node.uuid, self._nodes_by_uuid),
+            *(
+                (node_type.__name__, self._nodes_by_type)
+                for node_type in type(node).__mro__
+            ),
+        ]:
+            del index[key][node]
+            if not index[key]:
+                del index[key]
+
+    def remove_edge(self, tail: NodeABC, head: NodeABC):
+        """Remove an edge from the graph, keeping its endpoints
+
+        Args:
+            tail (NodeABC): start node of the edge
+            head (NodeABC): end node of the edge
+        """
+        self._memo.clear()
+        self.nx.remove_edge(tail, head)
 
     def copy(self):
         """copy the probabilistic graph model
@@ -87,8 +126,37 @@ class ProbabilisticGraphModelABC(ABC):
         """
         new_id = type(self)()  # Need to instance from the concrete class
         new_id.nx = self.nx.copy()
+        new_id._reindex()
         return new_id
 
+    def _reindex(self):
+        """Build the indexes of the nodes of the graph"""
+        # insertion ordered sets (dict keys) of nodes
+        self._nodes_by_uuid: dict[str, dict[NodeABC, None]] = {}
+        self._nodes_by_type: dict[str, dict[NodeABC, None]] = {}
+        for node in self.nx:
+            self._index_node(node)
+
+    def _index_node(self, node: NodeABC):
+        self._nodes_by_uuid.setdefault(node.uuid, {})[node] = None
+        for node_type in type(node).__mro__:
+            self._nodes_by_type.setdefault(node_type.__name__, {})[node] = None
+
+    def _memoize(self, key: str, func: Callable):
+        """Result of an algorithm on the graph model, computed once until the graph
+        model is mutated
+
+        Args:
+            key (str): name of the result
+            func (Callable): function computing the result
+
+        Returns
+            the result of `func()`
+        """
+        if key not in self._memo:
+            self._memo[key] = func()
+        return self._memo[key]
+
     def get_parents(self, node: NodeABC) -> list[NodeABC]:
         """get parents of a given node
 
@@ -130,16 +198,20 @@ class ProbabilisticGraphModelABC(ABC):
             node_type_str (str): type of the nodes to find as a string
 
         Returns
-            List[NodeABC]: the list of the nodes of given type
+            List[NodeABC]: the list of the nodes of given type (or of a sub-class)
+        """
+        return list(self._nodes_by_type.get(node_type_string, ()))
+
+    def _count_nodes_from_type(self, node_type_string: str) -> int:
+        """count the nodes of a given type
+
+        Args:
+            node_type_str (str): type of the nodes to count as a string
+
+        Returns
+            int: the number of nodes of given type (or of a sub-class)
         """
-        node_type = getattr(
-            importlib.import_module(self.NODES_MODULE_PATH), node_type_string
-        )
-        node_list = []
-        for node in list(self.nx.nodes(data=True)):
-            if isinstance(node[0], node_type):
-                node_list.append(node[0])
-        return node_list
+        return len(self._nodes_by_type.get(node_type_string, ()))
 
     def has_children(self, node: NodeABC) -> bool:
         """Check for existence of children
@@ -178,7 +250,10 @@ class ProbabilisticGraphModelABC(ABC):
         Args:
             uuid (str): uuid of node to look for
 
+        Raises:
+            KeyError: when no node has this uuid
+
         Returns:
-            NodeABC: node object having the given uuid
+            NodeABC: node object having the given uuid (the first added if several)
         """
-        return [node for node in self.nx if node.uuid == uuid][0]
+        return next(iter(self._nodes_by_uuid[uuid]))
@@ -0,0 +1,175 @@
+"""Module defining the PyAgrumCache class
+
+The pyAgrum influence diagrams converted from influence diagrams, and the Bayesian
+networks of their chance nodes with their compiled junction trees, are kept, per
+process, by content hash of the influence diagram, so that an unchanged project is
+neither converted nor compiled again. The least recently used ones are evicted when
+the estimated memory of the cache exceeds its maximum.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import pyAgrum as gum
+
+from config import settings
+
+from .chance_network import ChanceNetwork
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..decision_diagrams.influence_diagram import InfluenceDiagram
+
+
+logger = logging.getLogger(__name__)
+
+# estimated memory of a pyAgrum node besides its table (variable, labels, arcs)
+NODE_OVERHEAD_BYTES = 1024
+
+
+def estimate_size(gum_id: gum.InfluenceDiagram) -> int:
+    """Estimated memory of a pyAgrum influence diagram
+
+    Args:
+        gum_id (gum.InfluenceDiagram): the pyAgrum influence diagram
+
+    Returns:
+        int: size in bytes, 8 bytes per entry of the probability and utility tables
+             and NODE_OVERHEAD_BYTES per node
+    """
+    entries = 0
+    for node in gum_id.nodes():
+        if gum_id.isChanceNode(node):
+            entries += gum_id.cpt(node).domainSize()
+        elif gum_id.isUtilityNode(node):
+            entries += gum_id.utility(node).domainSize()
+    return 8 * entries + NODE_OVERHEAD_BYTES * gum_id.size()
+
+
+def estimate_network_size(network: ChanceNetwork) -> int:
+    """Estimated memory of a chance network
+
+    Args:
+        network (ChanceNetwork): the chance network
+
+    Returns:
+        int: size in bytes, 8 bytes per entry of the probability tables and of the
+             cliques of the junction tree and NODE_OVERHEAD_BYTES per node
+    """
+    return 8 * network.entries + NODE_OVERHEAD_BYTES * network.bn.size()
+
+
+class PyAgrumCache:
+    """Least recently used pyAgrum influence diagrams and chance networks, bounded
+    in memory"""
+
+    def __init__(self, max_bytes: int = settings.PYAGRUM_CACHE_MAX_BYTES):
+        """Create an instance of a PyAgrumCache
+
+        Args:
+            max_bytes (int, optional): maximum estimated memory of the cached pyAgrum
+                                       influence diagrams and chance networks.
+                                       Defaults to settings.PYAGRUM_CACHE_MAX_BYTES.
+
+        Attributes:
+            hits (int): number of entries found in the cache
+            misses (int): number of entries converted or compiled
+            evictions (int): number of entries evicted
+            size (int): estimated memory of the cached entries
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: OrderedDict[
+            str, tuple[gum.InfluenceDiagram | ChanceNetwork, int]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, influence_diagram: InfluenceDiagram) -> gum.InfluenceDiagram:
+        """Return the pyAgrum influence diagram of an influence diagram, converted
+        only when none of the same content is cached
+
+        The pyAgrum influence diagram is shared: it must not be modified.
+
+        Args:
+            influence_diagram (InfluenceDiagram): the influence diagram
+
+        Returns:
+            gum.InfluenceDiagram: the result of `influence_diagram.to_pyagrum()`
+        """
+        return self._get(
+            influence_diagram.content_hash(),
+            influence_diagram.to_pyagrum,
+            estimate_size,
+        )
+
+    def get_network(self, influence_diagram: InfluenceDiagram) -> ChanceNetwork:
+        """Return the chance network of an influence diagram, compiled only when
+        none of the same content is cached
+
+        The chance network is shared: its Bayesian network must not be modified.
+
+        Args:
+            influence_diagram (InfluenceDiagram): the influence diagram
+
+        Returns:
+            ChanceNetwork: the chance network of the pyAgrum influence diagram (see
+                           `get`)
+        """
+        return self._get(
+            "chance_network:" + influence_diagram.content_hash(),
+            lambda: ChanceNetwork(self.get(influence_diagram)),
+            estimate_network_size,
+        )
+
+    def _get(self, key: str, build: Callable, estimate: Callable):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+        # built outside of the lock, not to block the other requests
+        value = build()
+        size = estimate(value)
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (value, size)
+                self.size += size
+                while self.size > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self.size -= evicted_size
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        """Remove all the entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.size = 0
+
+    def statistics(self) -> dict:
+        """
+        Returns:
+            Dict: the counters, the number of entries, and the estimated and maximum
+                  memory of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size_bytes": self.size,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# cache shared by the requests of a worker process
+pyagrum_cache = PyAgrumCache()
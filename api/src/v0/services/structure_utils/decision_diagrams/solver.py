@@ -0,0 +1,228 @@
+"""Module solving pyAgrum influence diagrams
+
+The functions of this module run in the worker processes (see `WorkerPool`): their
+arguments, the pyAgrum influence diagram included, are pickled to the workers, and
+their results are plain data pickled back.
+"""
+
+import logging
+
+import numpy as np
+import pyAgrum as gum
+
+logger = logging.getLogger(__name__)
+
+
+class InfluenceDiagramNotSolvable(Exception):
+    def __init__(self, error):
+        self.error = error
+        error_message = f"the influence diagram cannot be solved: {error}"
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+    def __reduce__(self):
+        # raised in a worker process and pickled back, without the pyAgrum error
+        return self.__class__, (str(self.error),)
+
+
+def optimal_policy(inference: gum.ShaferShenoyLIMIDInference, decision: str) -> dict:
+    """Optimal policy of a decision of a solved influence diagram
+
+    Args:
+        inference (gum.ShaferShenoyLIMIDInference): inference on which
+                                                    `makeInference` has been called
+        decision (str): name of the decision variable
+
+    Returns:
+        Dict: {"decision", "parents": names of the requisite observations, "rules":
+              [{"parent_states": {name: state}, "alternative"}]} with a rule for
+              each combination of the states of the requisite observations
+    """
+    table = inference.optimalDecision(decision)
+    variables = [table.variable(k) for k in range(table.nbrDim())]
+    # the axes of toarray are the variables of the table in reverse order, the
+    # decision last
+    values = table.toarray()
+    parents = variables[:0:-1]
+    rules = []
+    for states in np.ndindex(values.shape[:-1]):
+        rules.append(
+            {
+                "parent_states": {
+                    parent.name(): parent.label(state)
+                    for parent, state in zip(parents, states, strict=True)
+                },
+                "alternative": variables[0].label(int(np.argmax(values[states]))),
+            }
+        )
+    return {
+        "decision": decision,
+        "parents": [parent.name() for parent in parents],
+        "rules": rules,
+    }
+
+
+def solve(gum_id: gum.InfluenceDiagram, decision_order: list[str]) -> dict:
+    """Solve an influence diagram with Shafer-Shenoy LIMID inference
+
+    When the influence diagram does not order its decisions, it is solved with the
+    no-forgetting assumption on the given order: each decision knows the previous
+    decisions and their observations.
+
+    Args:
+        gum_id (gum.InfluenceDiagram): the pyAgrum influence diagram
+        decision_order (list[str]): names of the decisions, in the order they are
+                                    made (e.g. from the partial order)
+
+    Raises:
+        InfluenceDiagramNotSolvable: when pyAgrum fails to solve the diagram
+
+    Returns:
+        Dict: {"expected_utility", "variance", "policies": [optimal_policy, ...]},
+              the maximum expected utility and the policies in decision order
+    """
+    try:
+        inference = gum.ShaferShenoyLIMIDInference(gum_id)
+        if not inference.isSolvable():
+            inference.addNoForgettingAssumption(decision_order)
+        inference.makeInference()
+        meu = inference.MEU()
+        return {
+            "expected_utility": meu["mean"],
+            "variance": meu["variance"],
+            "policies": [
+                optimal_policy(inference, decision) for decision in decision_order
+            ],
+        }
+    except gum.GumException as e:
+        raise InfluenceDiagramNotSolvable(e) from e
+
+
+def solve_with_observation(
+    gum_id: gum.InfluenceDiagram, decision_order: list[str], uncertainty: str | None
+) -> float:
+    """Maximum expected utility of an influence diagram in which an uncertainty is
+    observed before the first decision
+
+    The uncertainty informs every decision of a copy of the influence diagram, the
+    influence diagram itself being left unchanged.
+
+    Args:
+        gum_id (gum.InfluenceDiagram): the pyAgrum influence diagram
+        decision_order (list[str]): names of the decisions, in the order they are
+                                    made
+        uncertainty (str | None): name of the observed chance variable, which must
+                                  not descend from a decision; None for no
+                                  additional observation
+
+    Raises:
+        InfluenceDiagramNotSolvable: when pyAgrum fails to solve the diagram, or
+                                     the uncertainty descends from a decision
+
+    Returns:
+        float: the maximum expected utility with perfect information on the
+               uncertainty
+    """
+    variant = gum.InfluenceDiagram(gum_id)
+    try:
+        for decision in decision_order if uncertainty is not None else ():
+            if not variant.existsArc(uncertainty, decision):
+                variant.addArc(uncertainty, decision)
+    except gum.GumException as e:
+        raise InfluenceDiagramNotSolvable(e) from e
+    return solve(variant, decision_order)["expected_utility"]
+
+
+def swept_tables(table: np.ndarray, deltas: np.ndarray) -> np.ndarray:
+    """Tables of a probability with the probability of each state shifted
+
+    The probability of the state is shifted by each delta (clipped to [0, 1]) for
+    every combination of the states of the parents, the probabilities of the other
+    states being scaled to keep the distribution normalized (and set uniform when
+    they were all 0).
+
+    Args:
+        table (np.ndarray): probability table, the distributions on the last axis
+        deltas (np.ndarray): shifts of the probability of the state
+
+    Returns:
+        np.ndarray: the tables, of shape (states, deltas, *table.shape)
+    """
+    states = table.shape[-1]
+    # (states, 1, *parents): the probability of each state
+    probability = np.moveaxis(table, -1, 0)[:, None]
+    shifted = np.clip(
+        probability + deltas.reshape(-1, *(1,) * (table.ndim - 1)), 0.0, 1.0
+    )
+    others = 1.0 - probability
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(others > 0, (1.0 - shifted) / others, 0.0)
+    # (states, deltas, *parents, states)
+    tables = table[None, None] * scale[..., None]
+    uniform = (1.0 - shifted) / max(states - 1, 1)
+    tables += np.where(others > 0, 0.0, uniform)[..., None]
+    index = np.arange(states)
+    tables[index, ..., index] = shifted
+    return tables
+
+
+def sweep_probability(
+    gum_id: gum.InfluenceDiagram,
+    decision_order: list[str],
+    uncertainty: str,
+    deltas: list[float],
+    policies: list[dict],
+) -> list[dict]:
+    """Solve an influence diagram with the probability of each state of an
+    uncertainty shifted by each delta (see `swept_tables`)
+
+    The tables of all the shifts are computed at once, and filled in turn in a copy
+    of the influence diagram, the influence diagram itself being left unchanged.
+
+    Args:
+        gum_id (gum.InfluenceDiagram): the pyAgrum influence diagram
+        decision_order (list[str]): names of the decisions, in the order they are
+                                    made
+        uncertainty (str): name of the chance variable
+        deltas (list[float]): shifts of the probability of each state
+        policies (list[dict]): optimal policies of the influence diagram (see
+                               `solve`)
+
+    Raises:
+        InfluenceDiagramNotSolvable: when pyAgrum fails to solve the diagram
+
+    Returns:
+        List[Dict]: for each state, {"outcome", "expected_utilities": maximum
+                    expected utility for each delta, "changed_decisions": names of
+                    the decisions whose optimal policy differs, for each delta}
+    """
+    variant = gum.InfluenceDiagram(gum_id)
+    cpt = variant.cpt(uncertainty)
+    # the axes of toarray are the variables in reverse order, the uncertainty last,
+    # as the flat order of fillWith
+    tables = swept_tables(cpt.toarray(), np.asarray(deltas))
+    sweeps = []
+    for state, state_tables in enumerate(tables):
+        expected_utilities = []
+        changed_decisions = []
+        for table in state_tables:
+            cpt.fillWith(table.ravel())
+            solution = solve(variant, decision_order)
+            expected_utilities.append(solution["expected_utility"])
+            changed_decisions.append(
+                [
+                    policy["decision"]
+                    for policy, base_policy in zip(
+                        solution["policies"], policies, strict=True
+                    )
+                    if policy != base_policy
+                ]
+            )
+        sweeps.append(
+            {
+                "outcome": cpt.variable(0).label(state),
+                "expected_utilities": expected_utilities,
+                "changed_decisions": changed_decisions,
+            }
+        )
+    return sweeps
@@ -0,0 +1,507 @@
+"""Module defining the SymmetricDecisionTree class
+
+A symmetric decision tree has the same node at every position of a level: the nodes
+of its levels are those of the partial order of an influence diagram, followed by a
+utility level for the leaves. The tree is therefore fully described by the number of
+states of each level, and a node is addressed by its depth and its index in the
+level, the mixed-radix number of the states of its branches from the root:
+
+    index(depth + 1) = index(depth) * state_count(depth) + state
+
+No node is copied: the nodes of the tree are views of the partial order nodes.
+The subtree of a node only depends on its depth and the state of the branch into it,
+so that the tree is also emitted as a decision graph, a DAG of those subtrees each
+described once (`to_graph`), which `expand_graph` expands back into the tree.
+
+A branch path names the node and the state of each branch from the root, e.g.
+"Test:yes/State:Peach".
+
+    Raises:
+        TreeIndexError: When a node is outside of the tree
+        BranchNotFound: When a branch path does not lead to a node of the tree
+        TreeTooLarge: When (a part of) the tree has more nodes than a maximum
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable, Iterator
+from itertools import accumulate
+from math import prod
+from operator import mul
+from typing import TYPE_CHECKING
+
+from ..decision_diagrams.node import UtilityNode
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..decision_diagrams.node import NodeABC
+
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 2**16
+
+
+class TreeIndexError(Exception):
+    def __init__(self, depth, index):
+        error_message = f"no node of index {index} at depth {depth} of the tree"
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class BranchNotFound(Exception):
+    def __init__(self, branch):
+        error_message = f"no branch {branch} in the decision tree"
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class TreeTooLarge(Exception):
+    def __init__(self, node_count, max_node_count):
+        self.node_count = node_count
+        self.max_node_count = max_node_count
+        error_message = (
+            f"decision tree of {node_count} nodes, "
+            f"more than the maximum of {max_node_count}"
+        )
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class SymmetricDecisionTree:
+    """Array-backed symmetric decision tree"""
+
+    def __init__(self, partial_order: list[NodeABC], leaf: NodeABC | None = None):
+        """Create an instance of a SymmetricDecisionTree
+
+        Args:
+            partial_order (List[NodeABC]): nodes of the levels of the tree, from the
+                                           root, as sorted by the partial order of an
+                                           influence diagram
+            leaf (NodeABC, optional): node of the leaves. Defaults to None, a
+                                      UtilityNode "ut".
+
+        Attributes:
+            levels (List[NodeABC]): nodes of each level, the leaf last
+            state_counts (List[int]): number of branches out of the nodes of each
+                                      level (0 for the leaves)
+            level_sizes (List[int]): number of nodes at each level
+            subtree_sizes (List[int]): number of nodes in the subtree of any node of
+                                       each level
+        """
+        if leaf is None:
+            leaf = UtilityNode(shortname="ut", description="Utility")
+        self.levels: list[NodeABC] = [*partial_order, leaf]
+        self.state_counts: list[int] = [len(node.states) for node in partial_order]
+        self.state_counts.append(0)
+        self.level_sizes: list[int] = list(
+            accumulate(self.state_counts[:-1], mul, initial=1)
+        )
+        self.subtree_sizes: list[int] = list(
+            accumulate(
+                reversed(self.state_counts[:-1]),
+                lambda size, state_count: 1 + state_count * size,
+                initial=1,
+            )
+        )[::-1]
+        self._node_data: list[list[dict] | None] = [None] * len(self.levels)
+
+    @property
+    def root(self) -> NodeABC:
+        """
+        Returns:
+            NodeABC: the node at the root of the tree
+        """
+        return self.levels[0]
+
+    @property
+    def depth(self) -> int:
+        """
+        Returns:
+            int: depth of the leaves (the root is at depth 0)
+        """
+        return len(self.levels) - 1
+
+    @property
+    def node_count(self) -> int:
+        """
+        Returns:
+            int: number of nodes in the tree
+        """
+        return sum(self.level_sizes)
+
+    @property
+    def leaf_count(self) -> int:
+        """
+        Returns:
+            int: number of leaves (utility nodes) of the tree
+        """
+        return self.level_sizes[-1]
+
+    def node(self, depth: int, index: int = 0) -> NodeABC:
+        """Return the node at a given position, the same at every index of a level
+
+        Args:
+            depth (int): depth of the node
+            index (int, optional): index of the node in its level. Defaults to 0.
+
+        Raises:
+            TreeIndexError: when there is no such node in the tree
+
+        Returns:
+            NodeABC: node of the partial order (or leaf) at this position
+        """
+        self._check(depth, index)
+        return self.levels[depth]
+
+    def children(self, depth: int, index: int) -> range:
+        """Indices of the children of a node, in the next level
+
+        Args:
+            depth (int): depth of the node
+            index (int): index of the node in its level
+
+        Returns:
+            range: indices of the children, in the order of the states of the node
+        """
+        self._check(depth, index)
+        state_count = self.state_counts[depth]
+        return range(index * state_count, (index + 1) * state_count)
+
+    def parent(self, depth: int, index: int) -> tuple[int, int] | None:
+        """Position of the parent of a node
+
+        Args:
+            depth (int): depth of the node
+            index (int): index of the node in its level
+
+        Returns:
+            tuple[int, int] | None: depth and index of the parent, None for the root
+        """
+        self._check(depth, index)
+        if depth == 0:
+            return None
+        return depth - 1, index // self.state_counts[depth - 1]
+
+    def path(self, depth: int, index: int) -> list[int]:
+        """States of the branches from the root to a node (digits of its index)
+
+        Args:
+            depth (int): depth of the node
+            index (int): index of the node in its level
+
+        Returns:
+            List[int]: index of the state of each node on the path, from the root
+        """
+        self._check(depth, index)
+        states = []
+        for state_count in reversed(self.state_counts[:depth]):
+            index, state = divmod(index, state_count)
+            states.append(state)
+        return states[::-1]
+
+    def index(self, states: list[int]) -> int:
+        """Index of the node reached by following branches from the root
+
+        Args:
+            states (List[int]): index of the state of each node on the path
+
+        Raises:
+            TreeIndexError: when a state is not a state of its node
+
+        Returns:
+            int: index of the node, at depth `len(states)`
+        """
+        index = 0
+        for depth, state in enumerate(states):
+            if not 0 <= state < self.state_counts[depth]:
+                raise TreeIndexError(depth + 1, state)
+            index = index * self.state_counts[depth] + state
+        return index
+
+    def subtree_size(self, depth: int) -> int:
+        """Number of nodes in the subtree of any node of a level (itself included)
+
+        Args:
+            depth (int): depth of the root of the subtree
+
+        Returns:
+            int: number of nodes of the subtree
+        """
+        return self.subtree_sizes[depth]
+
+    def to_graph(self) -> dict:
+        """Convert the decision tree into a decision graph of its distinct subtrees
+
+        Its size is the sum, instead of the product, of the state counts.
+
+        Returns:
+            Dict: `{"root": id, "node_count": int, "nodes": {id: {"id": node data,
+                  "children": [ids]}}}` (no "children" for the leaves), ids being
+                  "depth.state"
+        """
+        nodes = {}
+        for depth, state_count in enumerate(self.state_counts):
+            for state in range(self.state_counts[depth - 1] if depth > 0 else 1):
+                node = {"id": self.node_data(depth, state)}
+                if state_count > 0:
+                    node["children"] = [f"{depth + 1}.{k}" for k in range(state_count)]
+                nodes[f"{depth}.{state}"] = node
+        return {"root": "0.0", "node_count": self.node_count, "nodes": nodes}
+
+    def expansion_size(self, start: int, depth: int | None = None) -> int:
+        """Number of nodes of the levels below a node (itself included)
+
+        Args:
+            start (int): depth of the node
+            depth (int, optional): number of levels below the node. Defaults to None,
+                                   down to the leaves.
+
+        Returns:
+            int: number of nodes, computed from the state counts of the levels
+        """
+        last = self.depth if depth is None else min(start + depth, self.depth)
+        return sum(
+            prod(self.state_counts[start:level]) for level in range(start, last + 1)
+        )
+
+    def expansion_depth(self, start: int, max_node_count: int) -> int:
+        """Largest number of levels below a node of at most a given number of nodes
+
+        Args:
+            start (int): depth of the node
+            max_node_count (int): maximum number of nodes (the node included)
+
+        Returns:
+            int: number of levels below the node
+        """
+        depth, size, level_size = 0, 1, 1
+        while start + depth < self.depth:
+            level_size *= self.state_counts[start + depth]
+            if size + level_size > max_node_count:
+                break
+            size += level_size
+            depth += 1
+        return depth
+
+    def check_size(self, max_node_count: int, start: int = 0, depth: int | None = None):
+        """Check the number of nodes of the levels below a node against a maximum
+
+        Args:
+            max_node_count (int): maximum number of nodes
+            start (int, optional): depth of the node. Defaults to 0, the root.
+            depth (int, optional): number of levels below the node. Defaults to None,
+                                   down to the leaves.
+
+        Raises:
+            TreeTooLarge: when there are more nodes than the maximum
+        """
+        node_count = self.expansion_size(start, depth)
+        if node_count > max_node_count:
+            raise TreeTooLarge(node_count, max_node_count)
+
+    def find(self, path: str) -> list[int]:
+        """States of the branches of a branch path, from the root
+
+        Args:
+            path (str): "/"-separated "shortname:branch name" of each branch, e.g.
+                        "Test:yes/State:Peach" ("" for the root)
+
+        Raises:
+            BranchNotFound: when a node of the path is not the node at its depth, or
+                            has no such branch
+
+        Returns:
+            List[int]: index of the state of each node on the path, see `index`
+        """
+        states = []
+        for depth, branch in enumerate(path.split("/") if path else []):
+            shortname, _, name = branch.partition(":")
+            if depth >= self.depth or self.levels[depth].shortname != shortname:
+                raise BranchNotFound(branch)
+            names = [
+                self.branch_name(depth + 1, k) for k in range(self.state_counts[depth])
+            ]
+            if name not in names:
+                raise BranchNotFound(branch)
+            states.append(names.index(name))
+        return states
+
+    def branch_name(self, depth: int, state: int) -> str:
+        """Name of the branch into the nodes of a level
+
+        Args:
+            depth (int): depth of the nodes the branch goes into
+            state (int): index of the state of the parent the branch stands for
+
+        Returns:
+            str: the state (joined with "-" when it is a tuple), "" for the root
+        """
+        if depth == 0:
+            return ""
+        name = self.levels[depth - 1].states[state]
+        return name if isinstance(name, str) else "-".join(name)
+
+    def node_data(self, depth: int, state: int = 0) -> dict:
+        """Description of the nodes of a level reached through a given branch
+
+        All those nodes are described by the same dictionary, computed once.
+
+        Args:
+            depth (int): depth of the nodes
+            state (int, optional): index of the state of their parent. Defaults to 0.
+
+        Returns:
+            Dict: `NodeABC.to_dict()` and the "branch_name"
+        """
+        if self._node_data[depth] is None:
+            data = self.levels[depth].to_dict()
+            states = range(self.state_counts[depth - 1]) if depth > 0 else [0]
+            self._node_data[depth] = [
+                {**data, "branch_name": self.branch_name(depth, k)} for k in states
+            ]
+        return self._node_data[depth][state]
+
+    def to_dict(self, depth: int = 0, state: int = 0) -> dict:
+        """Convert (a subtree of) the decision tree into nested dictionaries
+
+        Args:
+            depth (int, optional): depth of the root of the subtree. Defaults to 0.
+            state (int, optional): index of the state of the branch into the root of
+                                   the subtree. Defaults to 0.
+
+        Returns:
+            Dict: `{"id": node data, "children": [...]}` (no "children" for the
+                  leaves), the shape of a DecisionTreeResponse
+        """
+        data = {"id": self.node_data(depth, state)}
+        if self.state_counts[depth] > 0:
+            data["children"] = [
+                self.to_dict(depth + 1, k) for k in range(self.state_counts[depth])
+            ]
+        return data
+
+    def expand(self, states: list[int], depth: int = 1) -> dict:
+        """Convert the subtree of a node into nested dictionaries, down to a depth
+
+        Each node has the "node_count" of its subtree, so that the size of what is
+        left unexpanded is known. Only the returned nodes are visited.
+
+        Args:
+            states (List[int]): index of the state of each node on the path from the
+                                root to the node, see `find`
+            depth (int, optional): number of levels expanded below the node. Defaults
+                                   to 1.
+
+        Raises:
+            TreeIndexError: when a state is not a state of its node
+
+        Returns:
+            Dict: `{"id": node data, "node_count": int, "children": [...]}` (no
+                  "children" below the expanded levels or for the leaves)
+        """
+        self.index(states)
+        start = len(states)
+        return self._expand(start, states[-1] if states else 0, start + depth)
+
+    def _expand(self, depth: int, state: int, last: int) -> dict:
+        data = {
+            "id": self.node_data(depth, state),
+            "node_count": self.subtree_sizes[depth],
+        }
+        if depth < last and self.state_counts[depth] > 0:
+            data["children"] = [
+                self._expand(depth + 1, k, last) for k in range(self.state_counts[depth])
+            ]
+        return data
+
+    def iter_json(
+        self,
+        encode: Callable[[dict], str] | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """Serialize the decision tree into JSON chunks, walking it depth-first
+
+        Only the path from the root to the current node is held in memory, and each
+        node data is encoded once per level and branch. The leaves have a null
+        "children", as in a serialized DecisionTreeResponse.
+
+        Args:
+            encode (Callable[[dict], str], optional): encoder of the node data.
+                                                      Defaults to None, compact
+                                                      `json.dumps`.
+            chunk_size (int, optional): number of characters buffered before a chunk
+                                        is yielded. Defaults to CHUNK_SIZE.
+
+        Yields:
+            str: consecutive parts of the JSON document
+        """
+        if encode is None:
+            encode = _compact_json
+        encoded = [{} for _ in self.levels]
+        buffer, size = [], 0
+        for text in self._iter_json(0, 0, encode, encoded):
+            buffer.append(text)
+            size += len(text)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield "".join(buffer)
+
+    def _iter_json(
+        self,
+        depth: int,
+        state: int,
+        encode: Callable[[dict], str],
+        encoded: list[dict[int, str]],
+    ) -> Iterator[str]:
+        if state not in encoded[depth]:
+            encoded[depth][state] = encode(self.node_data(depth, state))
+        yield '{"id":'
+        yield encoded[depth][state]
+        if self.state_counts[depth] == 0:
+            yield ',"children":null}'
+            return
+        yield ',"children":['
+        for k in range(self.state_counts[depth]):
+            if k:
+                yield ","
+            yield from self._iter_json(depth + 1, k, encode, encoded)
+        yield "]}"
+
+    def _check(self, depth: int, index: int):
+        if not (0 <= depth < len(self.levels) and 0 <= index < self.level_sizes[depth]):
+            raise TreeIndexError(depth, index)
+
+
+def expand_graph(graph: dict) -> dict:
+    """Expand a decision graph into the decision tree, as nested dictionaries
+
+    The subtrees referenced several times are built once and shared.
+
+    Args:
+        graph (Dict): decision graph, see `SymmetricDecisionTree.to_graph`
+
+    Returns:
+        Dict: `{"id": node data, "children": [...]}`, the shape of a
+              DecisionTreeResponse
+    """
+    nodes = graph["nodes"]
+    subtrees = {}
+
+    def subtree(node_id: str) -> dict:
+        if node_id not in subtrees:
+            node = nodes[node_id]
+            data = {"id": node["id"]}
+            if node.get("children") is not None:
+                data["children"] = [subtree(child) for child in node["children"]]
+            subtrees[node_id] = data
+        return subtrees[node_id]
+
+    return subtree(graph["root"])
+
+
+def _compact_json(data: dict) -> str:
+    return json.dumps(data, separators=(",", ":"))
@@ -51,6 +51,10 @@ class ProbabilityABC(ABC):
     def to_pyagrum(self):
         raise NotImplementedError
 
+    @abstractmethod
+    def to_pyagrum_array(self, variables):
+        raise NotImplementedError
+
     @abstractmethod
     def to_pycid(self):
         raise NotImplementedError
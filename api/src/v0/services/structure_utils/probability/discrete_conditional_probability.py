@@ -179,5 +179,30 @@ class DiscreteConditionalProbability(ProbabilityABC):
         agrum = list(zip(agrum_dict, agrum_prob, strict=False))
         return agrum
 
+    def to_pyagrum_array(self, variables):
+        """Return the probability table as an array of the pyAgrum variables
+
+        The variables of the pyAgrum table are matched to the variables of the
+        probability by name (white spaces removed), except the first one, the
+        variable of the node. The states are matched by position.
+
+        Parameters
+        ----------
+        variables: Sequence[str]
+            names of the variables of the pyAgrum table, the variable of the node first
+
+        Return
+        ------
+        np.ndarray
+            the probabilities, with one axis per variable in the given order, of size
+            1 for the variables the probability does not depend on
+        """
+        dims = [
+            self._cpt.dims[0],
+            *(re.sub(r"\s+", "", variable) for variable in variables[1:]),
+        ]
+        cpt = self._cpt.expand_dims([dim for dim in dims if dim not in self._cpt.dims])
+        return cpt.transpose(*dims).data
+
     def to_pycid(self):
         raise NotImplementedError
@@ -184,5 +184,32 @@ class DiscreteUnconditionalProbability(ProbabilityABC):
             )
         ]
 
+    def to_pyagrum_array(self, variables):
+        """Return the probability table as an array of the pyAgrum variables
+
+        The variables of the pyAgrum table are matched to the variables of the
+        probability by name (white spaces removed), except the first one, the
+        variable of the node. The states are matched by position.
+
+        Parameters
+        ----------
+        variables: Sequence[str]
+            names of the variables of the pyAgrum table, the variable of the node first
+
+        Raises
+        ------
+        AgrumConversionError
+            when the probability has more than one variable
+
+        Return
+        ------
+        np.ndarray
+            the probabilities, with one axis per variable in the given order, of size
+            1 for the variables the probability does not depend on
+        """
+        if len(self.variables) != 1:
+            raise AgrumConversionError
+        return self._cpt.data.reshape(-1, *(1 for _ in variables[1:]))
+
     def to_pycid(self):
         raise NotImplementedError
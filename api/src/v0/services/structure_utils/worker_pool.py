@@ -0,0 +1,164 @@
+"""Module defining the WorkerPool class
+
+Heavy computations (solving influence diagrams) run in worker processes, so that
+they neither hold the interpreter lock of the API process nor grow its memory: a
+request waits for its result, up to a timeout, while the other requests are served.
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerTimeout(Exception):
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        error_message = f"computation not finished after {timeout} seconds"
+        super().__init__(error_message)
+        logger.critical(error_message)
+
+
+class WorkerPool:
+    """Application-lifetime holder of a pool of worker processes.
+
+    The processes are started ("spawn", not forked from the threads of the API
+    process) on demand, up to `max_workers`; the computations submitted while they
+    are all busy wait in a queue. A computation running beyond its timeout keeps
+    its worker until it finishes, the request having been answered: the number of
+    workers, not the timeout, bounds the load.
+
+    A pool whose worker died (e.g. killed when out of memory) is re-created.
+    """
+
+    def __init__(self, max_workers: int = settings.WORKER_POOL_SIZE):
+        """
+        Args:
+            max_workers (int, optional): number of worker processes. Defaults to
+                settings.WORKER_POOL_SIZE.
+        """
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._executor is not None
+
+    def open(self) -> None:
+        """Create the process pool (typically at application startup)"""
+        self._acquire()
+
+    def run(self, func: Callable, *args, timeout: float | None = None):
+        """Call `func(*args)` in a worker process and wait for its result
+
+        `func`, its arguments and its result are pickled.
+
+        Args:
+            func (Callable): function importable by the worker processes
+            timeout (float, optional): maximum waiting time (in seconds), queueing
+                included. Defaults to None, no timeout.
+
+        Raises:
+            WorkerTimeout: when the result is not available after `timeout` seconds
+            BrokenProcessPool: when a worker died, the pool being re-created for the
+                               next computations
+
+        Returns:
+            the result of `func(*args)`
+        """
+        return self.map(func, [args], timeout=timeout)[0]
+
+    def map(
+        self,
+        func: Callable,
+        arguments: Iterable[tuple],
+        max_workers: int | None = None,
+        timeout: float | None = None,
+    ) -> list:
+        """Call `func(*args)` in the worker processes for each `args` of `arguments`
+        and wait for all the results
+
+        At most `max_workers` calls are submitted at once, so that one request does
+        not take all the workers of the pool, the next call being submitted when
+        one finishes.
+
+        Args:
+            func (Callable): function importable by the worker processes
+            arguments (Iterable[tuple]): arguments of each call
+            max_workers (int, optional): maximum number of calls running at once.
+                Defaults to None, the number of workers of the pool.
+            timeout (float, optional): maximum waiting time (in seconds) for all the
+                results, queueing included. Defaults to None, no timeout.
+
+        Raises:
+            WorkerTimeout: when the results are not available after `timeout`
+                           seconds, the calls not started being cancelled
+            BrokenProcessPool: when a worker died, the pool being re-created for the
+                               next computations
+
+        Returns:
+            List: the results of the calls, in the order of `arguments`
+        """
+        executor = self._acquire()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = enumerate(arguments)
+        running: dict[Future, int] = {}
+        results = {}
+        try:
+            for k, args in islice(pending, max_workers or self.max_workers):
+                running[executor.submit(func, *args)] = k
+            while running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    raise WorkerTimeout(timeout)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+                    for k, args in islice(pending, 1):
+                        running[executor.submit(func, *args)] = k
+            return [results[k] for k in range(len(results))]
+        except BrokenProcessPool:
+            logger.warning("Worker process died, re-creating the worker pool")
+            self._invalidate(executor)
+            raise
+        finally:
+            # not started yet: do not start them
+            for future in running:
+                future.cancel()
+
+    def close(self) -> None:
+        """Stop the worker processes (typically at application shutdown)"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _acquire(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _invalidate(self, executor: ProcessPoolExecutor) -> None:
+        """Discard a broken process pool, the next computation creating a new one.
+        Invalidating a process pool which has already been replaced does nothing."""
+        with self._lock:
+            if executor is self._executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# pool shared by the requests of an API process
+worker_pool = WorkerPool()
@@ -9,3 +9,14 @@ def test_read_main():
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "Welcome to the DOT api"}
+
+
+def test_lifespan_opens_and_closes_pools():
+    from src.v0.database.adapter import get_pools
+    from src.v0.services.structure_utils.worker_pool import worker_pool
+
+    with TestClient(app):
+        assert all(pool.is_open for pool in get_pools())
+        assert worker_pool.is_open
+    assert not any(pool.is_open for pool in get_pools())
+    assert not worker_pool.is_open
@@ -1,85 +1,177 @@
 from src.v0.database.builders.queries.gremlin_queries_edge import (
     GremlinStringQueryBuilderEdge,
 )
+from src.v0.database.builders.queries.query_builder import GremlinQuery
 
 
 def test_create_edge():
     assert GremlinStringQueryBuilderEdge().create_edge(
         "junk", "id_out", "id_in", {"uuid": "id"}
-    ) == (
-        "g.V('id_out')"
-        ".addE('junk')"
-        ".to(__.V('id_in'))"
-        ".property(id, 'id')"
-        ".property('uuid', 'id')"
+    ) == GremlinQuery(
+        "g.V(out_vertex_uuid)"
+        ".addE(edge_label)"
+        ".to(__.V(in_vertex_uuid))"
+        ".property(id, edge_uuid)"
+        ".property('uuid', edge_uuid)",
+        {
+            "out_vertex_uuid": "id_out",
+            "edge_label": "junk",
+            "in_vertex_uuid": "id_in",
+            "edge_uuid": "id",
+        },
     )
 
 
 def test_read_edge():
-    assert GremlinStringQueryBuilderEdge().read_edge("junk") == "g.E('junk')"
+    assert GremlinStringQueryBuilderEdge().read_edge("junk") == GremlinQuery(
+        "g.E(edge_id)", {"edge_id": "junk"}
+    )
 
 
 def test_list_all_edges():
-    assert (
-        GremlinStringQueryBuilderEdge().list_all_edges("junk")
-        == "g.E().hasLabel('junk').valueMap(true)"
+    assert GremlinStringQueryBuilderEdge().list_all_edges("junk") == GremlinQuery(
+        "g.E().hasLabel(edge_label).valueMap(true)", {"edge_label": "junk"}
     )
-    assert (
-        GremlinStringQueryBuilderEdge().list_all_edges("junk", {"a": "1"})
-        == "g.E().hasLabel('junk').has('a', '1').valueMap(true)"
+    assert GremlinStringQueryBuilderEdge().list_all_edges(
+        "junk", {"a": "1"}
+    ) == GremlinQuery(
+        "g.E().hasLabel(edge_label).has('a', filter_0).valueMap(true)",
+        {"edge_label": "junk", "filter_0": "1"},
     )
 
 
 def test_list_all_edges_from_project():
-    assert (
-        GremlinStringQueryBuilderEdge().list_all_edges_from_project("uuid", "junk")
-        == "g.V('uuid').outE('contains')"
+    def query(edge_label):
+        return GremlinStringQueryBuilderEdge().list_all_edges_from_project(
+            "uuid", edge_label
+        )
+
+    bindings = {"project_uuid": "uuid", "partition_key": "uuid"}
+    start = "g.V(project_uuid).has('ids', partition_key).outE('contains')"
+    assert query("junk") == GremlinQuery(start, bindings)
+    assert query("influences") == GremlinQuery(
+        start + ".inV().outE('influences')", bindings
     )
-    assert (
-        GremlinStringQueryBuilderEdge().list_all_edges_from_project("uuid", "influences")
-        == "g.V('uuid').outE('contains').inV().outE('influences')"
+    assert query("merged_into") == GremlinQuery(
+        start + ".inV().inE('merged_into')", bindings
     )
-    assert (
-        GremlinStringQueryBuilderEdge().list_all_edges_from_project(
-            "uuid", "merged_into"
-        )
-        == "g.V('uuid').outE('contains').inV().inE('merged_into')"
+    assert query("has_value_metric") == GremlinQuery(
+        start + ".inV().outE('has_value_metric')", bindings
     )
-    assert (
-        GremlinStringQueryBuilderEdge().list_all_edges_from_project(
-            "uuid", "has_value_metric"
-        )
-        == "g.V('uuid').outE('contains').inV().outE('has_value_metric')"
+
+
+def test_list_all_edges_from_sub_project():
+    assert GremlinStringQueryBuilderEdge().list_all_edges_from_sub_project(
+        "uuid", "junk", ["1", "2"]
+    ) == GremlinQuery(
+        "g.V(project_uuid).has('ids', partition_key)"
+        ".outE('contains').inV().outE(edge_label)"
+        ".where(and("
+        "__.inV().has('uuid', within(vertex_uuids)),"
+        "__.outV().has('uuid', within(vertex_uuids))"
+        "))",
+        {
+            "project_uuid": "uuid",
+            "partition_key": "uuid",
+            "edge_label": "junk",
+            "vertex_uuids": ["1", "2"],
+        },
     )
 
 
+def test_list_all_edges_from_project_without_partition_key():
+    assert GremlinStringQueryBuilderEdge(partition_key=None).list_all_edges_from_project(
+        "uuid", "junk"
+    ) == GremlinQuery("g.V(project_uuid).outE('contains')", {"project_uuid": "uuid"})
+
+
 def test_read_out_edge_from_vertex():
-    assert (
-        GremlinStringQueryBuilderEdge().read_out_edge_from_vertex("uuid", "junk")
-        == "g.V('uuid').outE().hasLabel('junk')"
+    assert GremlinStringQueryBuilderEdge().read_out_edge_from_vertex(
+        "uuid", "junk"
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).outE().hasLabel(edge_label)",
+        {"vertex_uuid": "uuid", "edge_label": "junk"},
     )
 
 
 def test_read_in_edge_to_vertex():
-    assert (
-        GremlinStringQueryBuilderEdge().read_in_edge_to_vertex("uuid", "junk")
-        == "g.V('uuid').inE().hasLabel('junk')"
+    assert GremlinStringQueryBuilderEdge().read_in_edge_to_vertex(
+        "uuid", "junk"
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).inE().hasLabel(edge_label)",
+        {"vertex_uuid": "uuid", "edge_label": "junk"},
     )
 
 
 def test_update_edge():
-    assert (
-        GremlinStringQueryBuilderEdge().update_edge("uuid", {"a": 1})
-        == "[g.E('uuid').property('a', '1')]"
+    assert GremlinStringQueryBuilderEdge().update_edge("uuid", {"a": 1}) == (
+        GremlinQuery(
+            "[g.E(edge_id).property('a', property_0)]",
+            {"edge_id": "uuid", "property_0": "1"},
+        )
     )
 
 
 def test_delete_edge():
-    assert GremlinStringQueryBuilderEdge().delete_edge("uuid") == "g.E('uuid').drop()"
+    assert GremlinStringQueryBuilderEdge().delete_edge("uuid") == GremlinQuery(
+        "g.E(edge_id).drop()", {"edge_id": "uuid"}
+    )
 
 
 def test_delete_edge_from_vertex():
-    assert (
-        GremlinStringQueryBuilderEdge().delete_edge_from_vertex("uuid")
-        == "g.V('uuid').bothE().drop()"
+    assert GremlinStringQueryBuilderEdge().delete_edge_from_vertex(
+        "uuid"
+    ) == GremlinQuery("g.V(vertex_uuid).bothE().drop()", {"vertex_uuid": "uuid"})
+
+
+def test_create_edges():
+    assert GremlinStringQueryBuilderEdge().create_edges(
+        [("contains", "1", "2", {"uuid": "a"}), ("influences", "2", "3", {"uuid": "b"})]
+    ) == GremlinQuery(
+        "g.inject(0).union("
+        "__.V(out_vertex_uuid_0).addE(edge_label_0).to(__.V(in_vertex_uuid_0))"
+        ".property(id, edge_uuid_0).property('uuid', edge_uuid_0), "
+        "__.V(out_vertex_uuid_1).addE(edge_label_1).to(__.V(in_vertex_uuid_1))"
+        ".property(id, edge_uuid_1).property('uuid', edge_uuid_1)"
+        ").count()",
+        {
+            "out_vertex_uuid_0": "1",
+            "edge_label_0": "contains",
+            "in_vertex_uuid_0": "2",
+            "edge_uuid_0": "a",
+            "out_vertex_uuid_1": "2",
+            "edge_label_1": "influences",
+            "in_vertex_uuid_1": "3",
+            "edge_uuid_1": "b",
+        },
+    )
+
+
+def test_restore_edges():
+    assert GremlinStringQueryBuilderEdge().restore_edges(
+        [("relates_to", "1", "2", {"uuid": "a", "weight": "3"})]
+    ) == GremlinQuery(
+        "g.inject(0).union("
+        "__.V(out_vertex_uuid_0).addE(edge_label_0).to(__.V(in_vertex_uuid_0))"
+        ".property(id, edge_id_0)"
+        ".property('uuid', property_0_0).property('weight', property_0_1)"
+        ").count()",
+        {
+            "out_vertex_uuid_0": "1",
+            "edge_label_0": "relates_to",
+            "in_vertex_uuid_0": "2",
+            "edge_id_0": "a",
+            "property_0_0": "a",
+            "property_0_1": "3",
+        },
+    )
+
+
+def test_list_incident_edges():
+    assert GremlinStringQueryBuilderEdge().list_incident_edges(["1", "2"]) == (
+        GremlinQuery(
+            "g.V().has('uuid', within(vertex_uuids)).bothE().dedup()"
+            ".project('edge', 'properties').by().by(__.valueMap())",
+            {"vertex_uuids": ["1", "2"]},
+        )
     )
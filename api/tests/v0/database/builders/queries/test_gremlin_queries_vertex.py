@@ -1,92 +1,209 @@
 from src.v0.database.builders.queries.gremlin_queries_vertex import (
     GremlinStringQueryBuilderVertex,
 )
+from src.v0.database.builders.queries.query_builder import GremlinQuery
 
 
 def test_create_vertex():
     assert GremlinStringQueryBuilderVertex().create_vertex(
         "junk", {"uuid": "id", "a": 1}
-    ) == (
-        "g.addV('junk')"
-        ".property(id, 'id')"
-        ".property('uuid', 'id')"
-        ".property('a', '1')"
-        ".valueMap(true)"
+    ) == GremlinQuery(
+        "g.addV(vertex_label)"
+        ".property(id, vertex_id)"
+        ".property('uuid', property_0)"
+        ".property('a', property_1)"
+        ".valueMap(true)",
+        {
+            "vertex_label": "junk",
+            "vertex_id": "id",
+            "property_0": "id",
+            "property_1": "1",
+        },
     )
 
 
 def test_read_vertex():
-    assert (
-        GremlinStringQueryBuilderVertex().read_vertex("uuid")
-        == "g.V('uuid').valueMap(true)"
+    assert GremlinStringQueryBuilderVertex().read_vertex("uuid") == GremlinQuery(
+        "g.V(vertex_uuid).valueMap(true)", {"vertex_uuid": "uuid"}
+    )
+    assert GremlinStringQueryBuilderVertex().read_vertex(
+        "uuid", "project"
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).has('ids', partition_key).valueMap(true)",
+        {"vertex_uuid": "uuid", "partition_key": "project"},
     )
+    assert GremlinStringQueryBuilderVertex(partition_key=None).read_vertex(
+        "uuid", "project"
+    ) == GremlinQuery("g.V(vertex_uuid).valueMap(true)", {"vertex_uuid": "uuid"})
 
 
-def test_read_out_vertex():
+def test_read_vertex_template_is_constant():
+    builder = GremlinStringQueryBuilderVertex()
+    assert builder.read_vertex("1").template == builder.read_vertex("2").template
     assert (
-        GremlinStringQueryBuilderVertex().read_out_vertex("uuid", "junk")
-        == "g.V('uuid').out('junk').valueMap(true)"
+        builder.read_out_vertex("1", "contains", "issue").template
+        == builder.read_out_vertex("2", "influences", "objective").template
     )
-    assert (
-        GremlinStringQueryBuilderVertex().read_out_vertex(
-            "uuid", "junk", original_vertex_label="junky"
-        )
-        == "g.V('uuid').out('junk').hasLabel('junky').valueMap(true)"
+
+
+def test_read_out_vertex():
+    bindings = {"vertex_uuid": "uuid", "edge_label": "junk"}
+    assert GremlinStringQueryBuilderVertex().read_out_vertex(
+        "uuid", "junk"
+    ) == GremlinQuery("g.V(vertex_uuid).out(edge_label).valueMap(true)", bindings)
+    assert GremlinStringQueryBuilderVertex().read_out_vertex(
+        "uuid", "junk", original_vertex_label="junky"
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).out(edge_label).hasLabel(vertex_label).valueMap(true)",
+        {**bindings, "vertex_label": "junky"},
     )
-    assert (
-        GremlinStringQueryBuilderVertex().read_out_vertex(
-            "uuid", "junk", filter_dict={"a": 1}
-        )
-        == "g.V('uuid').out('junk').has('a', '1').valueMap(true)"
+    assert GremlinStringQueryBuilderVertex().read_out_vertex(
+        "uuid", "junk", filter_dict={"a": 1}
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).out(edge_label).has('a', filter_0).valueMap(true)",
+        {**bindings, "filter_0": "1"},
     )
-    assert (
-        GremlinStringQueryBuilderVertex().read_out_vertex(
-            "uuid", "junk", original_vertex_label="junky", filter_dict={"a": 1}
-        )
-        == "g.V('uuid').out('junk').hasLabel('junky').has('a', '1').valueMap(true)"
+    assert GremlinStringQueryBuilderVertex().read_out_vertex(
+        "uuid", "junk", original_vertex_label="junky", filter_dict={"a": 1}
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).out(edge_label).hasLabel(vertex_label)"
+        ".has('a', filter_0).valueMap(true)",
+        {**bindings, "vertex_label": "junky", "filter_0": "1"},
     )
 
 
 def test_read_in_vertex():
-    assert (
-        GremlinStringQueryBuilderVertex().read_in_vertex("uuid", "junk")
-        == "g.V('uuid').in('junk').valueMap(true)"
+    bindings = {"vertex_uuid": "uuid", "edge_label": "junk"}
+    assert GremlinStringQueryBuilderVertex().read_in_vertex(
+        "uuid", "junk"
+    ) == GremlinQuery("g.V(vertex_uuid).in(edge_label).valueMap(true)", bindings)
+    assert GremlinStringQueryBuilderVertex().read_in_vertex(
+        "uuid", "junk", original_vertex_label="junky"
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).in(edge_label).hasLabel(vertex_label).valueMap(true)",
+        {**bindings, "vertex_label": "junky"},
     )
-    assert (
-        GremlinStringQueryBuilderVertex().read_in_vertex(
-            "uuid", "junk", original_vertex_label="junky"
-        )
-        == "g.V('uuid').in('junk').hasLabel('junky').valueMap(true)"
+    assert GremlinStringQueryBuilderVertex().read_in_vertex(
+        "uuid", "junk", filter_dict={"a": 1}
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).in(edge_label).has('a', filter_0).valueMap(true)",
+        {**bindings, "filter_0": "1"},
     )
-    assert (
-        GremlinStringQueryBuilderVertex().read_in_vertex(
-            "uuid", "junk", filter_dict={"a": 1}
-        )
-        == "g.V('uuid').in('junk').has('a', '1').valueMap(true)"
-    )
-    assert (
-        GremlinStringQueryBuilderVertex().read_in_vertex(
-            "uuid", "junk", original_vertex_label="junky", filter_dict={"a": 1}
-        )
-        == "g.V('uuid').in('junk').hasLabel('junky').has('a', '1').valueMap(true)"
+    assert GremlinStringQueryBuilderVertex().read_in_vertex(
+        "uuid", "junk", original_vertex_label="junky", filter_dict={"a": 1}
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).in(edge_label).hasLabel(vertex_label)"
+        ".has('a', filter_0).valueMap(true)",
+        {**bindings, "vertex_label": "junky", "filter_0": "1"},
     )
 
 
 def test_list_all_vertices():
-    assert (
-        GremlinStringQueryBuilderVertex().list_all_vertices("junk")
-        == "g.V().hasLabel('junk').valueMap(true)"
+    assert GremlinStringQueryBuilderVertex().list_all_vertices("junk") == GremlinQuery(
+        "g.V().hasLabel(vertex_label).valueMap(true)", {"vertex_label": "junk"}
     )
 
 
 def test_update_vertex():
-    assert (
-        GremlinStringQueryBuilderVertex().update_vertex("uuid", {"a": 1})
-        == "g.V('uuid').property('a', '1').valueMap(true)"
+    assert GremlinStringQueryBuilderVertex().update_vertex(
+        "uuid", {"a": 1, "id": "x", "label": "y"}
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).property('a', property_0).valueMap(true)",
+        {"vertex_uuid": "uuid", "property_0": "1"},
     )
 
 
 def test_delete_vertex():
-    assert (
-        GremlinStringQueryBuilderVertex().delete_vertex("uuid") == "g.V('uuid').drop()"
+    assert GremlinStringQueryBuilderVertex().delete_vertex("uuid") == GremlinQuery(
+        "g.V(vertex_uuid).drop()", {"vertex_uuid": "uuid"}
+    )
+    assert GremlinStringQueryBuilderVertex().delete_vertex(
+        "uuid", "uuid"
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).has('ids', partition_key).drop()",
+        {"vertex_uuid": "uuid", "partition_key": "uuid"},
+    )
+
+
+def test_read_influence_diagram():
+    query = GremlinStringQueryBuilderVertex().read_influence_diagram("uuid")
+    assert query.bindings == {"project_uuid": "uuid", "partition_key": "uuid"}
+    assert query.template.startswith(
+        "g.V(project_uuid).has('ids', partition_key).out('contains')"
+    )
+    assert ".project('vertices', 'edges')" in query.template
+    assert ".where(__.inV().where(within('vertices')))" in query.template
+
+
+def test_delete_out_vertex_batch():
+    builder = GremlinStringQueryBuilderVertex()
+    assert builder.delete_out_vertex_batch("uuid", "contains", 10) == GremlinQuery(
+        "g.V(vertex_uuid).out(edge_label)"
+        ".limit(batch_size).fold().sideEffect(__.unfold().drop()).count(local)",
+        {"vertex_uuid": "uuid", "edge_label": "contains", "batch_size": 10},
+    )
+    assert builder.delete_out_vertex_batch(
+        "uuid", "contains", 10, "merged_into"
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).out(edge_label).in(in_edge_label)"
+        ".limit(batch_size).fold().sideEffect(__.unfold().drop()).count(local)",
+        {
+            "vertex_uuid": "uuid",
+            "edge_label": "contains",
+            "in_edge_label": "merged_into",
+            "batch_size": 10,
+        },
+    )
+    assert builder.delete_out_vertex_batch(
+        "uuid", "contains", 10, partition_key="uuid"
+    ).template.startswith("g.V(vertex_uuid).has('ids', partition_key).out(edge_label)")
+
+
+def test_create_vertices():
+    assert GremlinStringQueryBuilderVertex().create_vertices(
+        [("issue", {"uuid": "1", "a": "x"}), ("project", {"uuid": "2"})]
+    ) == GremlinQuery(
+        "g"
+        ".addV(vertex_label_0).property(id, vertex_id_0)"
+        ".property('uuid', property_0_0).property('a', property_0_1)"
+        ".addV(vertex_label_1).property(id, vertex_id_1)"
+        ".property('uuid', property_1_0)",
+        {
+            "vertex_label_0": "issue",
+            "vertex_id_0": "1",
+            "property_0_0": "1",
+            "property_0_1": "x",
+            "vertex_label_1": "project",
+            "vertex_id_1": "2",
+            "property_1_0": "2",
+        },
+    )
+
+
+def test_read_out_in_vertex():
+    assert GremlinStringQueryBuilderVertex().read_out_in_vertex(
+        "uuid", "contains", "merged_into"
+    ) == GremlinQuery(
+        "g.V(vertex_uuid).out(out_edge_label).in(in_edge_label).valueMap(true)",
+        {
+            "vertex_uuid": "uuid",
+            "out_edge_label": "contains",
+            "in_edge_label": "merged_into",
+        },
+    )
+
+
+def test_export_project():
+    query = GremlinStringQueryBuilderVertex().export_project("uuid")
+    assert query.bindings == {"project_uuid": "uuid", "partition_key": "uuid"}
+    assert query.template.startswith(
+        "g.V(project_uuid).has('ids', partition_key).project("
+        "'project', 'objectives', 'opportunities', 'issues', 'merged_issues', 'edges')"
+    )
+    assert query.template.count(".by(") == 6
+
+
+def test_delete_vertices():
+    assert GremlinStringQueryBuilderVertex().delete_vertices(["1", "2"]) == GremlinQuery(
+        "g.V().has('uuid', within(vertex_uuids)).drop()", {"vertex_uuids": ["1", "2"]}
     )
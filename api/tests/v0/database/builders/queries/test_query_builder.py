@@ -1,4 +1,7 @@
-from src.v0.database.builders.queries.query_builder import GremlinStringQueryBuilder
+from src.v0.database.builders.queries.query_builder import (
+    GremlinQuery,
+    GremlinStringQueryBuilder,
+)
 
 
 def test_GremlinStringQueryBuilder():
@@ -7,79 +10,83 @@ def test_GremlinStringQueryBuilder():
     assert gqb.graph_name == "g"
 
 
+def test_GremlinQuery_add():
+    query = GremlinQuery("g.V(a)", {"a": "1"}) + GremlinQuery(".out(b)", {"b": "2"})
+    assert query == GremlinQuery("g.V(a).out(b)", {"a": "1", "b": "2"})
+    assert query + ".drop()" == GremlinQuery("g.V(a).out(b).drop()", query.bindings)
+    assert GremlinQuery("g.V()").bindings == {}
+
+
 def test_filter_query():
     gqb = GremlinStringQueryBuilder()
-    assert gqb.filter_query({}) == ""
-    assert gqb.filter_query({"a": None}) == ""
-    assert (
-        gqb.filter_query({"a": "1", "b": "2", "c": None, "d": "4"})
-        == ".has('a', '1').has('b', '2').has('d', '4')"
+    assert gqb.filter_query({}) == GremlinQuery("")
+    assert gqb.filter_query({"a": None}) == GremlinQuery("")
+    assert gqb.filter_query({"a": "1", "b": 2, "c": None, "d": "4"}) == GremlinQuery(
+        ".has('a', filter_0).has('b', filter_1).has('d', filter_2)",
+        {"filter_0": "1", "filter_1": "2", "filter_2": "4"},
     )
 
 
 def test_filter_label_query():
     gqb = GremlinStringQueryBuilder()
-    assert gqb.filter_label_query("junk") == ".hasLabel('junk')"
-
-
-def test__parse_property_as_is():
-    gqb = GremlinStringQueryBuilder()
-    assert gqb._parse_property_as_is("a", 1) == ".property(a, '1')"
-
-
-def test__parse_property_as_empty():
-    gqb = GremlinStringQueryBuilder()
-    assert gqb._parse_property_as_empty("a", 1) == ".property('a', '')"
-
-
-def test__parse_property_as_simple_string():
-    gqb = GremlinStringQueryBuilder()
-    assert gqb._parse_property_as_simple_string("a", 1) == ".property('a', '1')"
-
-
-def test__parse_property_as_multiline_string():
-    gqb = GremlinStringQueryBuilder()
-    assert gqb._parse_property_as_multiline_string("a", 1) == ".property('a', '''1''')"
-
-
-def test__parse_property_as_iterable():
-    gqb = GremlinStringQueryBuilder()
-    assert gqb._parse_property_as_iterable("a", [1, 2]) == ".property('a', '[1, 2]')"
-    assert (
-        gqb._parse_property_as_iterable("a", ["1", "2"])
-        == ".property('a', '[\"1\", \"2\"]')"
+    assert gqb.filter_label_query("junk") == GremlinQuery(
+        ".hasLabel(has_label)", {"has_label": "junk"}
+    )
+    assert gqb.filter_label_query("junk", "edge_label") == GremlinQuery(
+        ".hasLabel(edge_label)", {"edge_label": "junk"}
     )
 
 
 def test_property_query():
     gqb = GremlinStringQueryBuilder()
-    assert gqb.property_query("a", None) == ".property('a', '')"
-    assert gqb.property_query("id", "1") == ".property(id, '1')"
-    assert gqb.property_query("label", "1") == ".property(label, '1')"
-    assert gqb.property_query("description", "1") == ".property('description', '''1''')"
-    assert (
-        gqb.property_query("alternatives", ["1", "2"])
-        == ".property('alternatives', '[\"1\", \"2\"]')"
-    )
-    assert gqb.property_query("tag", ["1", "2"]) == ".property('tag', '[\"1\", \"2\"]')"
-    assert (
-        gqb.property_query("probabilities", {"x": ["1", "2"]})
-        == '.property(\'probabilities\', \'{"x": ["1", "2"]}\')'
-    )
+
+    def bound(key, value):
+        query = gqb.property_query(key, value, "p")
+        assert query.template == (
+            f".property({key}, p)"
+            if key in ["id", "label"]
+            else f".property('{key}', p)"
+        )
+        return query.bindings["p"]
+
+    assert bound("a", None) == ""
+    assert bound("id", "1") == "1"
+    assert bound("label", "1") == "1"
+    assert bound("description", "1\n'2'") == "1\n'2'"
+    assert bound("alternatives", ["1", "2"]) == '["1", "2"]'
+    assert bound("tag", ["1", "2"]) == '["1", "2"]'
+    assert bound("probabilities", {"x": ["1", "2"]}) == '{"x": ["1", "2"]}'
     assert (
-        gqb.property_query("comments", [{"comment": "test", "author": "user"}])
-        == '.property(\'comments\', \'[{"comment": "test", "author": "user"}]\')'
+        bound("comments", [{"comment": "test", "author": "user"}])
+        == '[{"comment": "test", "author": "user"}]'
     )
-    assert (
-        gqb.property_query("a_list", ["1", "2"])
-        == ".property('a_list', '[\"1\", \"2\"]')"
+    assert bound("a_list", ["1", "é"]) == '["1", "é"]'
+    assert bound("a", 1) == "1"
+    assert gqb.property_query("a", "1") == GremlinQuery(
+        ".property('a', property_0)", {"property_0": "1"}
     )
-    assert gqb.property_query("a", "1") == ".property('a', '1')"
 
 
 def test_property_dict_query():
     gqb = GremlinStringQueryBuilder()
-    assert (
-        gqb.property_dict_query({"a": "1", "b": "2", "c": None, "d": "4"})
-        == ".property('a', '1').property('b', '2').property('c', '').property('d', '4')"
+    assert gqb.property_dict_query(
+        {"a": "1", "b": "2", "c": None, "d": "4"}
+    ) == GremlinQuery(
+        ".property('a', property_0)"
+        ".property('b', property_1)"
+        ".property('c', property_2)"
+        ".property('d', property_3)",
+        {"property_0": "1", "property_1": "2", "property_2": "", "property_3": "4"},
     )
+
+
+def test_templates_are_cached_per_shape():
+    gqb = GremlinStringQueryBuilder()
+    template_cache = GremlinStringQueryBuilder._property_dict_template
+    template_cache.cache_clear()
+    first = gqb.property_dict_query({"a": "1", "b": "2"})
+    second = gqb.property_dict_query({"a": "3", "b": "4"})
+    assert first.template == second.template
+    assert first.bindings != second.bindings
+    assert template_cache.cache_info().hits == 1
+    assert template_cache.cache_info().misses == 1
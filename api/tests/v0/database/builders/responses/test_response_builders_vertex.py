@@ -1,9 +1,11 @@
 import pytest
+from pydantic import ValidationError
 
 from src.v0.database.builders.responses.gremlin_responses_vertex import (
     FieldParserVertex,
     GremlinResponseBuilderVertex,
 )
+from src.v0.models.issue import IssueResponse
 
 
 def test_FieldParser():
@@ -14,6 +16,11 @@ def test_FieldParser():
     assert FieldParserVertex().list("") is None
     assert FieldParserVertex().list([]) is None
     assert FieldParserVertex().list(['["yes", "no"]']) == ["yes", "no"]
+    # legacy properties stored as Python literals
+    assert FieldParserVertex().list(["['yes', 'no']"]) == ["yes", "no"]
+    assert FieldParserVertex().json_value(None) is None
+    assert FieldParserVertex().json_value(["null"]) is None
+    assert FieldParserVertex().json_value(['{"a": [1]}']) == {"a": [1]}
     assert (
         FieldParserVertex().probability(None) is None
     )  # cannot be as default_probability is set by default - legacy
@@ -28,6 +35,8 @@ def test_FieldParser():
     with pytest.raises(Exception) as exc:
         FieldParserVertex().probability("a string")
     assert str(exc.value) == "Probability in DataBase is not in a ProbabilityData format"
+    with pytest.raises(TypeError, match="not in a ProbabilityData format"):
+        FieldParserVertex().probability(['{"dtype": "unknown"}'])
     with pytest.raises(Exception) as exc:
         FieldParserVertex().id(["an id"])
     assert str(exc.value) == "The id should be a string"
@@ -188,3 +197,56 @@ def test_vertex_response_build_list():
 
 def test_vertex_response_build_none():
     assert GremlinResponseBuilderVertex().build_none() is None
+
+
+def test_vertex_response_build_list_into_response_model():
+    data = [
+        {
+            "shortname": ["an issue"],
+            "description": ["an issue description"],
+            "tag": ['["a tag"]'],
+            "category": ["Uncertainty"],
+            "index": ["0"],
+            "keyUncertainty": ["true"],
+            "decisionType": [""],
+            "alternatives": [""],
+            "probabilities": [
+                (
+                    '{"dtype": "DiscreteUnconditionalProbability",'
+                    '"probability_function": [[0.2, 0.8]],'
+                    '"variables": {"an issue": ["yes", "no"]}}'
+                )
+            ],
+            "influenceNodeUUID": [""],
+            "boundary": ["in"],
+            "comments": ['[{"comment": "a comment", "author": "an author"}]'],
+            "timestamp": ["1622477127.0"],
+            "date": ["2024-06-01 00:00:00"],
+            "uuid": ["134a1f4a-2c11-46a2-b5cf-8498ef99aa08"],
+            "ids": ["test"],
+            "T.id": "134a1f4a-2c11-46a2-b5cf-8498ef99aa08",
+            "T.label": "Issue",
+            "version": ["v0"],
+        }
+    ]
+    (issue,) = GremlinResponseBuilderVertex().build_list(data, IssueResponse)
+    assert isinstance(issue, IssueResponse)
+    assert issue.label == "issue"
+    assert issue.probabilities.probability_function == [[0.2, 0.8]]
+    assert issue.comments[0].author == "an author"
+    assert issue.alternatives is None
+
+    comments = data[0]["comments"]
+    data[0]["comments"] = ['[{"comment": "no author"}]']
+    with pytest.raises(TypeError, match="not in a CommentData format"):
+        GremlinResponseBuilderVertex().build_item(data, IssueResponse)
+
+    data[0]["comments"] = comments
+    data[0]["probabilities"] = ['{"dtype": "unknown"}']
+    with pytest.raises(TypeError, match="not in a ProbabilityData format"):
+        GremlinResponseBuilderVertex().build_item(data, IssueResponse)
+
+    data[0]["probabilities"] = ["null"]
+    data[0]["description"] = [["not", "a", "string"]]
+    with pytest.raises(ValidationError):
+        GremlinResponseBuilderVertex().build_item(data, IssueResponse)
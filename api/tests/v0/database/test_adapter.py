@@ -1,5 +1,10 @@
-from src.v0.database.cosmos import AzureCosmosClient
-from src.v0.database.gremlin import GremlinClient
+from src.v0.database.cosmos import AsyncAzureCosmosClient, AzureCosmosClient
+from src.v0.database.cosmos import async_pool as cosmos_async_pool
+from src.v0.database.cosmos import pool as cosmos_pool
+from src.v0.database.gremlin import AsyncGremlinClient, GremlinClient
+from src.v0.database.gremlin import async_pool as gremlin_async_pool
+from src.v0.database.gremlin import pool as gremlin_pool
+from src.v0.database.memory import AsyncInMemoryDatabaseClient, InMemoryDatabaseClient
 
 
 def test_get_client_local_environment(monkeypatch):
@@ -16,3 +21,42 @@ def test_get_client_dev_environment(monkeypatch):
 
     client = get_client()
     assert isinstance(client, AzureCosmosClient)
+
+
+def test_get_async_client_local_environment(monkeypatch):
+    monkeypatch.setenv("APP_ENVIRONMENT", "local")
+    from src.v0.database.adapter import get_async_client
+
+    client = get_async_client()
+    assert isinstance(client, AsyncGremlinClient)
+
+
+def test_get_async_client_dev_environment(monkeypatch):
+    monkeypatch.setenv("APP_ENVIRONMENT", "dev")
+    from src.v0.database.adapter import get_async_client
+
+    client = get_async_client()
+    assert isinstance(client, AsyncAzureCosmosClient)
+
+
+def test_get_pools_local_environment(monkeypatch):
+    monkeypatch.setenv("APP_ENVIRONMENT", "local")
+    from src.v0.database.adapter import get_pools
+
+    assert get_pools() == [gremlin_pool, gremlin_async_pool]
+
+
+def test_get_pools_dev_environment(monkeypatch):
+    monkeypatch.setenv("APP_ENVIRONMENT", "dev")
+    from src.v0.database.adapter import get_pools
+
+    assert get_pools() == [cosmos_pool, cosmos_async_pool]
+
+
+def test_get_client_memory_environment(monkeypatch):
+    monkeypatch.setenv("APP_ENVIRONMENT", "local-memory")
+    from src.v0.database.adapter import get_async_client, get_client, get_pools
+
+    assert isinstance(get_client(), InMemoryDatabaseClient)
+    assert isinstance(get_async_client(), AsyncInMemoryDatabaseClient)
+    assert get_pools() == []
@@ -1,6 +1,6 @@
 import pytest
 
-from src.v0.database.client import DatabaseClient
+from src.v0.database.client import AsyncDatabaseClient, DatabaseClient
 
 
 def test_database_client_methods(monkeypatch):
@@ -19,3 +19,22 @@ def test_database_client_methods(monkeypatch):
 
     with pytest.raises(NotImplementedError):
         client.execute_query("query")
+
+
+@pytest.mark.asyncio
+async def test_async_database_client_methods(monkeypatch):
+    monkeypatch.setattr(
+        AsyncDatabaseClient,
+        "__abstractmethods__",
+        set(),
+    )
+    client = AsyncDatabaseClient("junk")
+
+    with pytest.raises(NotImplementedError):
+        await client.connect()
+
+    with pytest.raises(NotImplementedError):
+        await client.close()
+
+    with pytest.raises(NotImplementedError):
+        await client.execute_query("query")
@@ -1,20 +1,35 @@
-from unittest.mock import patch
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from config import settings
 from src.v0.database.cosmos import (
+    AsyncAzureCosmosClient,
     AzureCosmosClient,
     Builder,
     Query,
     Response,
+    async_pool,
+    get_async_client,
     get_client,
+    pool,
 )
+from src.v0.database.pool import ConnectionPool
 
 
 def test_class_Query():
     query = Query()
     assert hasattr(query, "vertex")
     assert hasattr(query, "edge")
+    assert query.vertex.partition_key == query.edge.partition_key == "ids"
+
+
+def test_class_Query_not_partitioned(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PARTITIONED", False)
+    query = Query()
+    assert query.vertex.partition_key is query.edge.partition_key is None
+    assert "has(" not in query.vertex.read_vertex("1", "project").template
 
 
 def test_class_Response():
@@ -69,6 +84,7 @@ def test_mock_GremlinClient_execute_query_with_params(mocked_client):
         mock = mocked_client.return_value
         mock.submit.return_value = True
         assert c.execute_query("query", params={"key": True})
+        c._gremlin_client.submit.assert_called_once_with("query", bindings={"key": True})
 
 
 @patch("src.v0.database.cosmos.AzureCosmosClient.connect")
@@ -83,3 +99,179 @@ def test_mock_GremlinClient_execute_query_fail(mocked_connection):
 
 def test_get_client():
     assert isinstance(get_client(), AzureCosmosClient)
+
+
+@pytest.fixture
+def mocked_pool():
+    pool = MagicMock(spec=ConnectionPool)
+    pool.acquire.side_effect = [MagicMock(), MagicMock()]
+    return pool
+
+
+def test_pooled_AzureCosmosClient_connect_close(mocked_pool):
+    client = AzureCosmosClient(
+        "connection", "credential", "database_name", pool=mocked_pool
+    )
+    with client as c:
+        driver_client = c._gremlin_client
+        mocked_pool.acquire.assert_called_once()
+        assert c._client is None
+    mocked_pool.release.assert_called_once_with(driver_client)
+    driver_client.close.assert_not_called()
+    client.close()
+    mocked_pool.release.assert_called_once()
+
+
+def test_pooled_AzureCosmosClient_reconnect(mocked_pool):
+    with AzureCosmosClient(
+        "connection", "credential", "database_name", pool=mocked_pool
+    ) as c:
+        broken = c._gremlin_client
+        broken.submit.side_effect = OSError("Connection reset by peer")
+        c.execute_query("query", idempotent=True)
+        mocked_pool.invalidate.assert_called_once_with(broken)
+        c._gremlin_client.submit.assert_called_once_with("query")
+
+
+def test_pooled_AzureCosmosClient_no_replay_of_writes(mocked_pool):
+    with AzureCosmosClient(
+        "connection", "credential", "database_name", pool=mocked_pool
+    ) as c:
+        broken = c._gremlin_client
+        broken.submit.side_effect = OSError("Connection reset by peer")
+        with pytest.raises(Exception, match="reset by peer"):
+            c.execute_query("g.addV('issue')")
+        # the broken connections are replaced, the write is not submitted again
+        mocked_pool.invalidate.assert_called_once_with(broken)
+        c._gremlin_client.submit.assert_not_called()
+
+
+def test_pooled_AzureCosmosClient_no_reconnect_on_query_error(mocked_pool):
+    with pytest.raises(Exception) as exc:
+        with AzureCosmosClient(
+            "connection", "credential", "database_name", pool=mocked_pool
+        ) as c:
+            c._gremlin_client.submit.side_effect = RuntimeError("not a connection error")
+            c.execute_query("query")
+    assert "not a connection error" in str(exc.value)
+    mocked_pool.invalidate.assert_not_called()
+
+
+@patch("src.v0.database.cosmos.client")
+def test_AzureCosmosClient_no_reconnect_without_pool(mocked_client):
+    mocked_client.Client.return_value.submit.side_effect = OSError("reset")
+    with pytest.raises(Exception) as exc:
+        with AzureCosmosClient("connection", "credential", "database_name") as c:
+            c.execute_query("query")
+    assert "reset" in str(exc.value)
+
+
+@patch("src.v0.database.cosmos.client")
+def test_AzureCosmosClient_close_without_pool(mocked_client):
+    with AzureCosmosClient("connection", "credential", "database_name") as c:
+        driver_client = c._gremlin_client
+    driver_client.close.assert_called_once()
+
+
+def test_get_client_uses_pool():
+    assert get_client()._pool is pool
+
+
+def resolved(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def async_driver_client(results):
+    driver_client = MagicMock()
+    driver_client.submit_async.return_value = resolved(MagicMock())
+    driver_client.submit_async.return_value.result().all.return_value = resolved(results)
+    return driver_client
+
+
+@pytest.mark.asyncio
+@patch("src.v0.database.cosmos.client")
+async def test_AsyncAzureCosmosClient_execute_query(mocked_client):
+    mocked_client.Client.return_value = async_driver_client(["result"])
+    client = AsyncAzureCosmosClient("connection", "credential", "database_name")
+    async with client as c:
+        assert await c.execute_query("query") == ["result"]
+        assert await c.execute_query("query", params={"key": True}) == ["result"]
+        driver_client = c._gremlin_client
+    driver_client.submit_async.assert_called_with("query", bindings={"key": True})
+    driver_client.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_AsyncAzureCosmosClient_execute_query_fail():
+    with pytest.raises(Exception) as exc:
+        await AsyncAzureCosmosClient(
+            "connection", "credential", "database_name"
+        ).execute_query("query")
+    assert "Not connected to the" in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_pooled_AsyncAzureCosmosClient_connect_close(mocked_pool):
+    mocked_pool.size = 2
+    mocked_pool.slots = ConnectionPool(MagicMock, size=2).slots
+    client = AsyncAzureCosmosClient(
+        "connection", "credential", "database_name", pool=mocked_pool
+    )
+    async with client as c:
+        driver_client = c._gremlin_client
+        mocked_pool.acquire.assert_called_once()
+    mocked_pool.release.assert_called_once_with(driver_client)
+    driver_client.close.assert_not_called()
+    assert client._gremlin_client is None
+    # closing twice does not release twice
+    await client.close()
+    mocked_pool.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_pooled_AsyncAzureCosmosClient_reconnect(mocked_pool):
+    broken = MagicMock()
+    broken.submit_async.side_effect = RuntimeError("Connection was closed by server.")
+    mocked_pool.acquire.side_effect = [broken, async_driver_client(["result"])]
+    mocked_pool.slots = ConnectionPool(MagicMock).slots
+    async with AsyncAzureCosmosClient(
+        "connection", "credential", "database_name", pool=mocked_pool
+    ) as c:
+        assert await c.execute_query("query", idempotent=True) == ["result"]
+        mocked_pool.invalidate.assert_called_once_with(broken)
+
+
+@pytest.mark.asyncio
+async def test_pooled_AsyncAzureCosmosClient_no_replay_of_writes(mocked_pool):
+    broken = MagicMock()
+    broken.submit_async.side_effect = RuntimeError("Connection was closed by server.")
+    mocked_pool.acquire.side_effect = [broken, async_driver_client(["result"])]
+    mocked_pool.slots = ConnectionPool(MagicMock).slots
+    async with AsyncAzureCosmosClient(
+        "connection", "credential", "database_name", pool=mocked_pool
+    ) as c:
+        with pytest.raises(Exception, match="closed by server"):
+            await c.execute_query("g.addV('issue')")
+        mocked_pool.invalidate.assert_called_once_with(broken)
+        c._gremlin_client.submit_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("src.v0.database.cosmos.client")
+async def test_AsyncAzureCosmosClient_no_reconnect_without_pool(mocked_client):
+    mocked_client.Client.return_value.submit_async.side_effect = OSError("reset")
+    with pytest.raises(Exception) as exc:
+        async with AsyncAzureCosmosClient(
+            "connection", "credential", "database_name"
+        ) as c:
+            await c.execute_query("query")
+    assert "reset" in str(exc.value)
+
+
+def test_get_async_client_uses_async_pool():
+    client = get_async_client()
+    assert isinstance(client, AsyncAzureCosmosClient)
+    assert client._pool is async_pool
+    assert async_pool is not pool
@@ -0,0 +1,217 @@
+import pathlib
+
+import pytest
+
+from src.v0.database import memory
+from src.v0.database.memory import (
+    AsyncInMemoryDatabaseClient,
+    InMemoryDatabaseClient,
+    MemoryGraph,
+    get_async_client,
+    get_client,
+    get_graph,
+)
+from src.v0.models.filter import Filter
+from src.v0.models.vertex import VertexCreate, VertexUpdate
+from src.v0.repositories.edge import (
+    AsyncEdgeRepository,
+    EdgeCreationError,
+    EdgeRepository,
+)
+from src.v0.repositories.project import ProjectRepository
+from src.v0.repositories.structure import StructureRepository
+from src.v0.repositories.vertex import AsyncVertexRepository, VertexRepository
+
+GRAPHSON = pathlib.Path(__file__).parents[4] / "db" / "data" / "dot_graph.graphson"
+PROJECT = "72ba27a5-2e9c-4551-aa1a-6ad9d676d67b"
+
+
+@pytest.fixture
+def graph():
+    return MemoryGraph().load_graphson(GRAPHSON)
+
+
+@pytest.fixture
+def client(graph):
+    return InMemoryDatabaseClient(graph)
+
+
+def test_load_graphson(graph):
+    assert len(graph.vertices) == 16
+    assert len(graph.edges) == 26
+    assert graph.vertices[PROJECT].properties["name"] == "The Used Car Buyer Problem"
+
+
+def test_project_repository(client, graph):
+    repository = ProjectRepository(client)
+    assert sorted(p.name for p in repository.all()) == [
+        "The Oil Wildcatter",
+        "The Used Car Buyer Problem",
+    ]
+
+    export = repository.export_project(PROJECT)
+    assert len(export["vertices"]["issues"]) == 5
+    assert len(export["edges"]) == 13
+
+    repository.import_project(export)
+    assert len(graph.vertices) == 16 + 8
+    assert len(graph.edges) == 26 + 13
+
+    repository.delete(PROJECT)
+    assert len(graph.vertices) == 16
+    assert len(graph.edges) == 26
+    assert PROJECT not in graph.vertices
+
+
+def test_structure_repository(client):
+    diagram = StructureRepository(client).read_influence_diagram(PROJECT)
+    assert [v.category for v in diagram.vertices] == [
+        "Uncertainty",
+        "Uncertainty",
+        "Decision",
+        "Decision",
+        "Value Metric",
+    ]
+    assert len(diagram.edges) == 6
+
+
+def test_vertex_and_edge_repositories(client, graph):
+    vertices = VertexRepository(client)
+    edges = EdgeRepository(client)
+
+    issue = vertices.create("issue", VertexCreate(description="new", category="Fact"))
+    assert vertices.read(issue.uuid).description == "new"
+    edge = edges.create(PROJECT, issue.uuid, "contains")
+    assert edges.read(edge.uuid).inV == issue.uuid
+    assert [e.uuid for e in edges.read_in_edge_to_vertex(issue.uuid, "contains")] == [
+        edge.uuid
+    ]
+    assert issue.uuid in [
+        v.uuid for v in vertices.read_out_vertex(PROJECT, "contains", "issue", Filter())
+    ]
+    assert [v.uuid for v in vertices.read_in_vertex(issue.uuid, "contains")] == [PROJECT]
+    assert [
+        v.uuid
+        for v in vertices.read_out_vertex(
+            PROJECT, "contains", None, Filter(category="Fact")
+        )
+    ] == [issue.uuid]
+
+    updated = vertices.update(issue.uuid, VertexUpdate(shortname="updated"))
+    assert updated.shortname == "updated"
+    assert [
+        v.uuid
+        for v in vertices.read_out_vertex(
+            PROJECT, "contains", None, Filter(shortname="updated")
+        )
+    ] == [issue.uuid]
+
+    edges.delete_edge_from_vertex(issue.uuid)
+    assert edges.read_out_edge_from_vertex(PROJECT, "contains") != []
+    assert edges.read_in_edge_to_vertex(issue.uuid, "contains") == []
+    vertices.delete(issue.uuid)
+    assert issue.uuid not in graph.vertices
+
+
+def test_create_batch_missing_vertex(client, graph):
+    issue = VertexRepository(client).create("issue", VertexCreate(description="new"))
+    with pytest.raises(EdgeCreationError):
+        EdgeRepository(client).create_batch(
+            [
+                (PROJECT, "missing", "contains"),
+                (PROJECT, issue.uuid, "contains"),
+                ("missing", issue.uuid, "influences"),
+            ]
+        )
+    # the edges after the one with a missing vertex are created
+    assert [e.out_v.id for e in graph.vertices[issue.uuid].in_e["contains"]] == [PROJECT]
+    assert len(graph.edges) == 26 + 1
+
+
+def test_sub_project_edges(client):
+    edges = EdgeRepository(client)
+    influences = edges.read_all_edges_from_project(PROJECT, "influences")
+    vertex_uuids = [influences[0].outV, influences[0].inV]
+    assert [
+        e.uuid
+        for e in edges.read_all_edges_from_sub_project(
+            PROJECT, "influences", vertex_uuids
+        )
+    ] == [influences[0].uuid]
+
+
+def test_indexed_lookups(client, graph):
+    builder = client.builder.query
+    with client as c:
+        query = builder.vertex.list_all_vertices("project")
+        assert len(c.execute_query(query.template, query.bindings)) == 2
+        query = builder.edge.list_all_edges("influences", {"uuid": "none"})
+        assert c.execute_query(query.template, query.bindings) == []
+        query = builder.edge.list_all_edges("influences")
+        value_maps = c.execute_query(query.template, query.bindings)
+        assert len(value_maps) == 12
+        assert set(value_maps[0]) == {"T.id", "T.label", "uuid"}
+        assert len(c.execute_query("g.E()")) == 26
+        assert len(c.execute_query("g.V().has('category', 'Decision')")) == 4
+        query = "g.V().has('category', within(c))"
+        assert len(c.execute_query(query, {"c": ["Fact", "Decision"]})) == 4
+        assert c.execute_query("g.V().has('category', within(['Fact']))") == []
+        assert c.execute_query("g.V().count()") == [16]
+        assert c.execute_query("g.V().not(__.hasLabel('issue')).count()") == [6]
+        assert c.execute_query("g.V().project('a').by().count()") == [16]
+
+
+def test_update_edge(client, graph):
+    edge = next(iter(graph.edges))
+    query = client.builder.query.edge.update_edge(edge, {"weight": "1"})
+    with client as c:
+        c.execute_query(query.template, query.bindings)
+    assert graph.edges[edge].properties["weight"] == "1"
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "g.V().unknown()",
+        "g.V().count)",
+        "g.V(",
+        "g.V() .",
+        "g.V()) ",
+        "g.V(#)",
+        "g.V(.)",
+        "g.V(missing)",
+        "g.V().has('a', gt(1))",
+        "__.V()",
+        "g.addV('a').property(id, 'a').addV('b').property(id, 'a')",
+    ],
+)
+def test_invalid_query(client, query):
+    with client as c, pytest.raises(Exception):
+        c.execute_query(query)
+
+
+def test_not_connected(client):
+    with pytest.raises(Exception, match="Not connected"):
+        client.execute_query("g.V()")
+
+
+@pytest.mark.asyncio
+async def test_async_repositories(graph):
+    client = AsyncInMemoryDatabaseClient(graph)
+    vertices = AsyncVertexRepository(client)
+    issue = await vertices.create("issue", VertexCreate(description="new"))
+    edge = await AsyncEdgeRepository(client).create(PROJECT, issue.uuid, "contains")
+    assert graph.edges[edge.uuid].in_v is graph.vertices[issue.uuid]
+    with pytest.raises(Exception, match="Not connected"):
+        await client.execute_query("g.V()")
+
+
+def test_get_graph(monkeypatch):
+    get_graph.cache_clear()
+    monkeypatch.setattr(memory.settings, "DB_MEMORY_SEED", str(GRAPHSON))
+    assert len(get_graph().vertices) == 16
+    assert get_client().connection is get_async_client().connection is get_graph()
+    get_graph.cache_clear()
+    monkeypatch.setattr(memory.settings, "DB_MEMORY_SEED", "")
+    assert get_graph().vertices == {}
+    get_graph.cache_clear()
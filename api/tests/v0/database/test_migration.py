@@ -0,0 +1,164 @@
+import json
+import pathlib
+
+import pytest
+
+from src.v0.database import migration
+from src.v0.database.memory import InMemoryDatabaseClient, MemoryGraph
+from src.v0.database.migration import (
+    DONE,
+    EXPORTED,
+    MigrationError,
+    PartitionMigration,
+)
+from src.v0.repositories.project import ProjectRepository
+
+GRAPHSON = pathlib.Path(__file__).parents[4] / "db" / "data" / "dot_graph.graphson"
+PROJECTS = {
+    "72ba27a5-2e9c-4551-aa1a-6ad9d676d67b": 8,
+    "1bfcc6da-f610-4e07-ad2e-b331b862333d": 8,
+}
+
+
+@pytest.fixture
+def graph():
+    """The seed graph, all in the former single partition"""
+    graph = MemoryGraph().load_graphson(GRAPHSON)
+    for vertex in graph.vertices.values():
+        vertex.properties["ids"] = "test"
+    return graph
+
+
+@pytest.fixture
+def client(graph):
+    return InMemoryDatabaseClient(graph)
+
+
+def partitions(graph: MemoryGraph) -> dict[str, int]:
+    counts = {}
+    for vertex in graph.vertices.values():
+        counts[vertex.properties["ids"]] = counts.get(vertex.properties["ids"], 0) + 1
+    return counts
+
+
+def export(client, project_uuid: str) -> dict:
+    return ProjectRepository(client).export_project(project_uuid)
+
+
+@pytest.fixture
+def exports():
+    """Exports of the projects of the seed graph, each in its own partition"""
+    client = InMemoryDatabaseClient(MemoryGraph().load_graphson(GRAPHSON))
+    return {project_uuid: export(client, project_uuid) for project_uuid in PROJECTS}
+
+
+def test_migration(client, graph, exports, tmp_path, monkeypatch):
+    edges = set(graph.edges)
+    legacy = PartitionMigration(client, tmp_path, batch_size=3)
+
+    assert legacy.run() == dict.fromkeys(PROJECTS, DONE)
+    assert partitions(graph) == PROJECTS
+    assert set(graph.edges) == edges
+    for project_uuid, project_export in exports.items():
+        assert export(client, project_uuid) == project_export
+    assert {path.name for path in tmp_path.iterdir()} == {f"{p}.json" for p in PROJECTS}
+
+    # migrated projects are skipped
+    monkeypatch.setattr(PartitionMigration, "_export", None)
+    assert legacy.run() == dict.fromkeys(PROJECTS, DONE)
+
+
+def test_migration_keeps_every_edge(client, graph, tmp_path):
+    """edges outside of the export of a project, with their properties, survive"""
+    projects = [graph.vertices[project_uuid] for project_uuid in PROJECTS]
+    issue = next(iter(projects[0].out_e["contains"])).in_v
+    other = next(iter(projects[1].out_e["contains"])).in_v
+    graph.add_edge("relates_to", issue, other, "e-1", {"uuid": "e-1", "weight": "3"})
+    graph.add_edge("mentions", other, issue, "e-2", {"uuid": "e-2"})
+    graph.add_edge("relates_to", issue, issue, "e-3", {"uuid": "e-3"})
+    edges = set(graph.edges)
+
+    assert PartitionMigration(client, tmp_path, batch_size=3).run() == dict.fromkeys(
+        PROJECTS, DONE
+    )
+    assert set(graph.edges) == edges
+    relates_to = graph.edges["e-1"]
+    # the vertices are created again, with the same ids
+    assert (relates_to.label, relates_to.out_v.id, relates_to.in_v.id) == (
+        "relates_to",
+        issue.id,
+        other.id,
+    )
+    assert relates_to.properties == {"uuid": "e-1", "weight": "3"}
+    assert graph.edges["e-2"].in_v.id == issue.id
+    assert graph.edges["e-3"].out_v.id == graph.edges["e-3"].in_v.id == issue.id
+
+
+def test_migration_of_partitioned_projects(tmp_path):
+    graph = MemoryGraph().load_graphson(GRAPHSON)
+    vertices = dict(graph.vertices)
+    assert PartitionMigration(
+        InMemoryDatabaseClient(graph), tmp_path
+    ).run() == dict.fromkeys(PROJECTS, DONE)
+    assert graph.vertices == vertices
+    assert json.loads((tmp_path / f"{next(iter(PROJECTS))}.json").read_text()) == {
+        "status": DONE
+    }
+
+
+def test_migration_resumes_from_checkpoint(
+    client, graph, exports, tmp_path, monkeypatch
+):
+    project_uuid, vertex_count = next(iter(PROJECTS.items()))
+    execute = PartitionMigration._execute
+    calls = []
+
+    def interrupted(self, query):
+        calls.append(query)
+        if len(calls) == 5:  # after the vertices are dropped and some recreated
+            raise ConnectionError("interrupted")
+        return execute(self, query)
+
+    monkeypatch.setattr(PartitionMigration, "_execute", interrupted)
+    with pytest.raises(ConnectionError):
+        PartitionMigration(client, tmp_path, batch_size=3).migrate_project(project_uuid)
+    checkpoint = json.loads((tmp_path / f"{project_uuid}.json").read_text())
+    assert checkpoint["status"] == EXPORTED
+    assert len(checkpoint["vertices"]) == vertex_count
+    assert len(graph.vertices) == 16 - vertex_count + 3
+
+    monkeypatch.setattr(PartitionMigration, "_execute", execute)
+    assert PartitionMigration(client, tmp_path).migrate_project(project_uuid) == DONE
+    assert export(client, project_uuid) == exports[project_uuid]
+    assert partitions(graph) == {"test": 8, project_uuid: vertex_count}
+
+
+def test_migration_stops_on_dangling_edge(client, graph, tmp_path, monkeypatch):
+    project_uuid = next(iter(PROJECTS))
+    export_project = PartitionMigration._export
+
+    def dangling(self, project_uuid):
+        checkpoint = export_project(self, project_uuid)
+        issue_uuid = checkpoint["vertices"][1][1]["uuid"]
+        checkpoint["edges"].insert(
+            0, ("relates_to", issue_uuid, "missing", {"uuid": "e-1"})
+        )
+        return checkpoint
+
+    monkeypatch.setattr(PartitionMigration, "_export", dangling)
+    with pytest.raises(MigrationError):
+        PartitionMigration(client, tmp_path, batch_size=3).migrate_project(project_uuid)
+    checkpoint = json.loads((tmp_path / f"{project_uuid}.json").read_text())
+    assert checkpoint["status"] == EXPORTED
+    # the other edges of the batch of the dangling edge are created
+    assert all(edge[3]["uuid"] in graph.edges for edge in checkpoint["edges"][1:3])
+
+
+def test_main(client, graph, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(migration, "get_client", lambda: client)
+    monkeypatch.setattr("sys.argv", ["migration", str(tmp_path), "--batch-size", "5"])
+    migration.main()
+    assert capsys.readouterr().out.splitlines() == sorted(
+        f"{project_uuid} {DONE}" for project_uuid in PROJECTS
+    )
+    assert partitions(graph) == PROJECTS
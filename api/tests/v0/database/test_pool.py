@@ -0,0 +1,147 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.v0.database.pool import ConnectionPool, is_connection_error
+
+
+@pytest.fixture
+def factory():
+    def _factory():
+        driver_client = MagicMock()
+        driver_client.is_closed.return_value = False
+        return driver_client
+
+    return MagicMock(side_effect=_factory)
+
+
+def test_pool_is_lazy(factory):
+    pool = ConnectionPool(factory)
+    assert not pool.is_open
+    factory.assert_not_called()
+
+
+def test_pool_open(factory):
+    pool = ConnectionPool(factory)
+    pool.open()
+    pool.open()
+    assert pool.is_open
+    factory.assert_called_once()
+
+
+def test_pool_acquire_shares_driver_client(factory):
+    pool = ConnectionPool(factory)
+    c1 = pool.acquire()
+    pool.release(c1)
+    c2 = pool.acquire()
+    assert c1 is c2
+    factory.assert_called_once()
+    c1.submit.assert_not_called()
+
+
+def test_pool_acquire_reopens_closed_driver_client(factory):
+    pool = ConnectionPool(factory)
+    c1 = pool.acquire()
+    c1.is_closed.return_value = True
+    c2 = pool.acquire()
+    assert c1 is not c2
+
+
+def test_pool_health_check_success(factory):
+    pool = ConnectionPool(factory, health_check_interval=0)
+    c1 = pool.acquire()
+    c2 = pool.acquire()
+    assert c1 is c2
+    c1.submit.assert_called_once_with("g.inject(0)")
+
+
+def test_pool_health_check_failure_reconnects(factory):
+    pool = ConnectionPool(factory, health_check_interval=0)
+    c1 = pool.acquire()
+    c1.submit.side_effect = RuntimeError("Connection was closed by server.")
+    c2 = pool.acquire()
+    assert c1 is not c2
+    # c1 is still borrowed: its in-flight queries are not aborted
+    c1.close.assert_not_called()
+    pool.release(c1)
+    c1.close.assert_called_once()
+    pool.release(c2)
+    c2.close.assert_not_called()
+
+
+def test_pool_health_check_failure_closes_idle_driver_client(factory):
+    pool = ConnectionPool(factory, health_check_interval=0)
+    c1 = pool.acquire()
+    pool.release(c1)
+    c1.submit.side_effect = RuntimeError("Connection was closed by server.")
+    assert pool.acquire() is not c1
+    c1.close.assert_called_once()
+
+
+def test_pool_reset_close_failure(factory):
+    pool = ConnectionPool(factory, health_check_interval=0)
+    c1 = pool.acquire()
+    c1.submit.side_effect = RuntimeError("Connection was closed by server.")
+    c1.close.side_effect = RuntimeError("Connection was already closed.")
+    c2 = pool.acquire()
+    assert c1 is not c2
+    pool.release(c1)
+    c1.close.assert_called_once()
+
+
+def test_pool_invalidate(factory):
+    pool = ConnectionPool(factory)
+    c1 = pool.acquire()
+    assert pool.acquire() is c1
+    pool.invalidate(c1)
+    c2 = pool.acquire()
+    assert c1 is not c2
+    # the other borrower of c1 keeps its connections until it gives c1 back
+    c1.close.assert_not_called()
+    # invalidating an already replaced driver client only gives it back
+    pool.invalidate(c1)
+    c1.close.assert_called_once()
+    assert pool.acquire() is c2
+    c2.close.assert_not_called()
+
+
+def test_pool_close(factory):
+    pool = ConnectionPool(factory)
+    pool.close()
+    c1 = pool.acquire()
+    pool.close()
+    assert not pool.is_open
+    c1.close.assert_called_once()
+
+
+def test_pool_close_replaced_driver_clients(factory):
+    pool = ConnectionPool(factory)
+    c1 = pool.acquire()
+    c2 = pool.acquire()
+    pool.invalidate(c1)
+    c3 = pool.acquire()
+    pool.close()
+    c1.close.assert_called_once()
+    c3.close.assert_called_once()
+    assert c1 is c2
+
+
+def test_pool_slots(factory):
+    pool = ConnectionPool(factory, size=3)
+    assert pool.slots is pool.slots
+    assert pool.slots._value == 3
+    factory.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (OSError("Connection reset by peer"), True),
+        (RuntimeError("Connection was closed by server."), True),
+        (RuntimeError("Received error on read: 'timeout'"), True),
+        (RuntimeError("division by zero in application code"), False),
+        (ValueError("Connection was closed by server."), False),
+    ],
+)
+def test_is_connection_error(error, expected):
+    assert is_connection_error(error) is expected
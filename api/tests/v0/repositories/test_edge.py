@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.v0.database.gremlin import (
+    AsyncGremlinClient,
     Builder,
     GremlinClient,
     GremlinResponseBuilderEdge,
@@ -10,7 +11,11 @@ from src.v0.database.gremlin import (
     Query,
     Response,
 )
-from src.v0.repositories.edge import EdgeRepository
+from src.v0.repositories.edge import (
+    AsyncEdgeRepository,
+    EdgeCreationError,
+    EdgeRepository,
+)
 
 
 @pytest.fixture
@@ -39,6 +44,8 @@ def test_read_all_edges_from_project_success(mock_client):
     repository = EdgeRepository(mock_client)
     repository.read_all_edges_from_project(project_uuid="0", edge_label="L")
     mock_client.execute_query.assert_called_once()
+    # reads are retried on a new connection when theirs broke
+    assert mock_client.execute_query.call_args.kwargs == {"idempotent": True}
 
 
 def test_read_all_edges_from_sub_project_success(mock_client):
@@ -57,6 +64,25 @@ def test_create_success(mock_client):
     mock_client.execute_query.assert_called_once()
 
 
+def test_create_batch_success(mock_client):
+    mock_client.execute_query.return_value = [2]
+    repository = EdgeRepository(mock_client)
+    assert repository.create_batch([("1", "2", "L"), ("2", "3", "L")]) is None
+    mock_client.execute_query.assert_called_once()
+    _, bindings = mock_client.execute_query.call_args.args
+    assert isinstance(bindings["edge_uuid_0"], str)
+    # writes are not
+    assert mock_client.execute_query.call_args.kwargs == {}
+
+
+def test_create_batch_missing_vertex(mock_client):
+    mock_client.execute_query.return_value = [1]
+    repository = EdgeRepository(mock_client)
+    with pytest.raises(EdgeCreationError) as exc:
+        repository.create_batch([("1", "2", "L"), ("2", "missing", "L")])
+    assert (exc.value.edge_count, exc.value.created_count) == (2, 1)
+
+
 def test_read_out_edge_from_vertex_success(mock_client):
     mock_client.execute_query.return_value = ["e[x][1-L->2]"]
     repository = EdgeRepository(mock_client)
@@ -97,3 +123,68 @@ def test_delete_edge_from_vertex_success(mock_client):
     repository = EdgeRepository(mock_client)
     repository.delete_edge_from_vertex(vertex_uuid="1")
     mock_client.execute_query.assert_called_once()
+
+
+@pytest.fixture
+def mock_async_client():
+    mock_client = MagicMock(spec=AsyncGremlinClient)
+    mock_client.__aenter__.return_value = mock_client
+
+    mock_builder = MagicMock(spec=Builder)
+    mock_query = MagicMock(spec=Query)
+    mock_response = MagicMock(spec=Response)
+    mock_query.edge = GremlinStringQueryBuilderEdge()
+    mock_response.edge = GremlinResponseBuilderEdge()
+
+    mock_builder.query = mock_query
+    mock_builder.response = mock_response
+    mock_client.builder = mock_builder
+
+    return mock_client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("create", {"out_vertex_uuid": "1", "in_vertex_uuid": "2", "edge_label": "L"}),
+        ("read_all_edges_from_project", {"project_uuid": "0", "edge_label": "L"}),
+        (
+            "read_all_edges_from_sub_project",
+            {"project_uuid": "0", "edge_label": "L", "vertex_uuid": "1"},
+        ),
+        ("read_out_edge_from_vertex", {"vertex_uuid": "1", "edge_label": "L"}),
+        ("read_in_edge_to_vertex", {"vertex_uuid": "1", "edge_label": "L"}),
+        ("read", {"edge_uuid": "1"}),
+    ],
+)
+async def test_async_repository(mock_async_client, method, kwargs):
+    mock_async_client.execute_query.return_value = ["e[x][1-L->2]"]
+    repository = AsyncEdgeRepository(mock_async_client)
+    assert await getattr(repository, method)(**kwargs)
+    mock_async_client.execute_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [("delete", {"edge_uuid": "1"}), ("delete_edge_from_vertex", {"vertex_uuid": "1"})],
+)
+async def test_async_repository_delete(mock_async_client, method, kwargs):
+    mock_async_client.execute_query.return_value = None
+    repository = AsyncEdgeRepository(mock_async_client)
+    assert await getattr(repository, method)(**kwargs) is None
+    mock_async_client.execute_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("created_count", [2, 1])
+async def test_async_create_batch(mock_async_client, created_count):
+    mock_async_client.execute_query.return_value = [created_count]
+    repository = AsyncEdgeRepository(mock_async_client)
+    edges = [("1", "2", "L"), ("2", "3", "L")]
+    if created_count == 2:
+        assert await repository.create_batch(edges) is None
+    else:
+        with pytest.raises(EdgeCreationError):
+            await repository.create_batch(edges)
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.v0.database.gremlin import (
+    AsyncGremlinClient,
     Builder,
     GremlinClient,
     GremlinResponseBuilderEdge,
@@ -14,7 +15,7 @@ from src.v0.database.gremlin import (
 )
 from src.v0.models.filter import Filter
 from src.v0.models.issue import IssueCreate, IssueUpdate
-from src.v0.repositories.issue import IssueRepository
+from src.v0.repositories.issue import AsyncIssueRepository, IssueRepository
 
 
 @pytest.fixture
@@ -161,3 +162,90 @@ def test_delete_success(mock_client):
     call_count = 1  # delete all edges to project
     call_count += 1  # delete objective vertex
     assert mock_client.execute_query.call_count == call_count
+
+
+@pytest.fixture
+def mock_async_client():
+    mock_client = MagicMock(spec=AsyncGremlinClient)
+    mock_client.__aenter__.return_value = mock_client
+
+    mock_builder = MagicMock(spec=Builder)
+    mock_query = MagicMock(spec=Query)
+    mock_response = MagicMock(spec=Response)
+    mock_query.vertex = GremlinStringQueryBuilderVertex()
+    mock_response.vertex = GremlinResponseBuilderVertex()
+    mock_query.edge = GremlinStringQueryBuilderEdge()
+    mock_response.edge = GremlinResponseBuilderEdge()
+
+    mock_builder.query = mock_query
+    mock_builder.response = mock_response
+    mock_client.builder = mock_builder
+
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_async_create_read_success(mock_async_client, issue, metadata):
+    body_vertex = [{**issue, **metadata}]
+    body_edge = ["e[x][1-L->2]"]
+    mock_async_client.execute_query.side_effect = [
+        body_vertex,
+        body_edge,
+        body_vertex,
+        body_vertex,
+    ]
+    repository = AsyncIssueRepository(mock_async_client)
+    created = await repository.create(
+        project_uuid="0", issue_data=IssueCreate(description="an issue description")
+    )
+    assert await repository.read(issue_uuid="1") == created
+    assert await repository.read_issues_all(
+        project_uuid="0", vertex_label="V", edge_label="L", filter_model=Filter()
+    ) == [created]
+    call_count = 2  # create issue vertex and edge to project
+    call_count += 1  # read issue
+    call_count += 1  # read issues
+    assert mock_async_client.execute_query.await_count == call_count
+
+
+@pytest.mark.asyncio
+async def test_async_update_in_boundary_success(mock_async_client, issue, metadata):
+    mock_async_client.execute_query.return_value = [{**issue, **metadata}]
+    repository = AsyncIssueRepository(mock_async_client)
+    await repository.update(
+        issue_uuid="1", modified_fields=IssueUpdate(description="A new one")
+    )
+    mock_async_client.execute_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_update_out_boundary_success(mock_async_client, issue, metadata):
+    body_vertex = [{**issue, **metadata}]
+    body_vertex[0]["boundary"] = ["out"]
+    body_edge = ["e[x][1-L->2]"]
+    mock_async_client.execute_query.side_effect = [
+        body_vertex,
+        body_edge,
+        body_edge,
+        None,
+        None,
+    ]
+    repository = AsyncIssueRepository(mock_async_client)
+    await repository.update(
+        issue_uuid="1",
+        modified_fields=IssueUpdate(description="A new one", boundary="out"),
+    )
+    call_count = 1  # update issue vertex
+    call_count += 2  # read edges from and to issue
+    call_count += 2  # delete edges from and to issue
+    assert mock_async_client.execute_query.await_count == call_count
+
+
+@pytest.mark.asyncio
+async def test_async_delete_success(mock_async_client):
+    mock_async_client.execute_query.return_value = None
+    repository = AsyncIssueRepository(mock_async_client)
+    assert await repository.delete(issue_uuid="1") is None
+    call_count = 1  # delete all edges of the issue
+    call_count += 1  # delete issue vertex
+    assert mock_async_client.execute_query.await_count == call_count
@@ -1,8 +1,9 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from src.v0.database.gremlin import (
+    AsyncGremlinClient,
     Builder,
     GremlinClient,
     GremlinResponseBuilderEdge,
@@ -16,11 +17,12 @@ from src.v0.models.issue import IssueCreate
 from src.v0.models.objective import ObjectiveCreate
 from src.v0.models.opportunity import OpportunityCreate
 from src.v0.models.project import ProjectCreate, ProjectUpdate
-from src.v0.repositories.edge import EdgeRepository, EdgeResponse
-from src.v0.repositories.issue import IssueRepository
-from src.v0.repositories.objective import ObjectiveRepository
-from src.v0.repositories.opportunity import OpportunityRepository
-from src.v0.repositories.project import ProjectRepository
+from src.v0.repositories.project import (
+    EXPORTED_VERTEX_GROUPS,
+    AsyncProjectRepository,
+    DanglingEdgeError,
+    ProjectRepository,
+)
 
 
 @pytest.fixture
@@ -142,17 +144,20 @@ def test_update_success(mock_client, project, metadata):
     mock_client.execute_query.assert_called_once()
 
 
-def test_delete_success(mock_client, project, metadata, vertex):
-    mock_client.execute_query.return_value = []
-    mock_client.execute_query.side_effect = [[vertex], [], [], [], []]
+def test_delete_success(mock_client):
+    mock_client.execute_query.side_effect = [[2], [0], [2], [2], [1], []]
     repository = ProjectRepository(mock_client)
-    repository.delete(project_uuid="1")
-    call_count = 1  # read vertex list
-    call_count += 1  # read merged vertex
-    call_count += 1  # read delete edge
-    call_count += 1  # delete vertices
+    repository.delete(project_uuid="1", batch_size=2)
+    call_count = 2  # delete merged issues, until a batch is not full
+    call_count += 3  # delete contained vertices, until a batch is not full
     call_count += 1  # delete project
     assert mock_client.execute_query.call_count == call_count
+    merged, *_, contained, project = mock_client.execute_query.call_args_list
+    assert merged.args[1]["in_edge_label"] == "merged_into"
+    assert merged.args[1]["batch_size"] == 2
+    assert "in_edge_label" not in contained.args[1]
+    assert project.args[1] == {"vertex_uuid": "1", "partition_key": "1"}
+    assert contained.args[1]["partition_key"] == "1"
 
 
 def test_filter_non_empty_fields(mock_client):
@@ -244,71 +249,55 @@ def test_filter_no_list_no_dict(mock_client):
     assert result == expected_result
 
 
-def test_export_project_success(mock_client, project, metadata, vertex, edge):
-    body = [{**project, **metadata}]
-    mock_client.execute_query.side_effect = [
-        body,
-        [vertex],
-        [vertex],
-        [vertex],
-        [vertex],
-        [edge],
-        [edge],
-        [edge],
-        [edge],
-    ]
-    repository = ProjectRepository(mock_client)
-    repository.export_project(project_uuid="1")
-    call_count = 1  # read project
-    call_count += 1  # read issue list
-    call_count += 1  # read opportunity list
-    call_count += 1  # read objective list
-    call_count += 1  # read merged issues
-    call_count += 1  # read contains edge list
-    call_count += 1  # read influences edges
-    call_count += 1  # read has_value_metric edges
-    call_count += 1  # read merged edges
-    assert mock_client.execute_query.call_count == call_count
-
-
-def test_remove_contains_edge(mock_client):
-    mock_client.execute_query.return_value = [
+@pytest.fixture
+def subgraph(project, metadata, vertex, edge):
+    return [
         {
-            "id": "1",
-            "outV": "2",
-            "inV": "3",
-            "label": "contains",
+            "project": {**project, **metadata},
+            "objectives": [vertex],
+            "opportunities": [],
+            "issues": [vertex, vertex],
+            "merged_issues": [vertex],
+            "edges": [edge, edge],
         }
     ]
-    repository = ProjectRepository(mock_client)
-    uuid = "1"
-
-    with (
-        patch.object(EdgeRepository, "read_in_edge_to_vertex") as mock_read,
-        patch.object(EdgeRepository, "delete") as mock_delete,
-    ):
-        mock_read.return_value = [
-            EdgeResponse(
-                id="1",
-                uuid="1",
-                outV="2",
-                inV="3",
-                label="contains",
-            )
-        ]
-        repository._remove_contains_edge(uuid)
-        mock_read.assert_called_once_with(edge_label="contains", vertex_uuid=uuid)
-        mock_delete.assert_called_once_with("1")
-
-
-def test_create_project_components_vertices(mock_client):
-    repository = ProjectRepository(mock_client)
-    project_uuid = "1"
-    project_json = {
+
+
+def test_export_project_success(mock_client, subgraph):
+    mock_client.execute_query.return_value = subgraph
+    exported = ProjectRepository(mock_client).export_project(project_uuid="1")
+    # the whole project subgraph is read in one query
+    mock_client.execute_query.assert_called_once()
+    assert exported["vertices"]["project"] == {
+        "id": "1",
+        "label": "project",
+        "name": "Project",
+        "tag": ["tag1", "tag2"],
+        "description": "Description",
+        "index": "0",
+        "decision_maker": "Decision Maker",
+        "decision_date": "2021-01-01",
+        "sensitivity_label": "Restricted",
+    }
+    counts = {
+        group: len(exported["vertices"][group]) for group in EXPORTED_VERTEX_GROUPS
+    }
+    assert counts == {
+        "objectives": 1,
+        "opportunities": 0,
+        "issues": 2,
+        "merged_issues": 1,
+    }
+    edge = {"version": "v0", "uuid": "x", "outV": "1", "inV": "2", "id": "x"}
+    assert exported["edges"] == [{**edge, "label": "l"}] * 2
+
+
+@pytest.fixture
+def project_json():
+    return {
         "vertices": {
-            "issues": [
-                {"id": "3", "label": "issue", "description": "Issue 1"},
-            ],
+            "project": {"name": "Project", "label": "project", "id": "1"},
+            "issues": [{"id": "3", "label": "issue", "description": "Issue 1"}],
             "opportunities": [
                 {"id": "2", "label": "opportunity", "description": "Opportunity 1"}
             ],
@@ -322,129 +311,161 @@ def test_create_project_components_vertices(mock_client):
         "edges": [
             {"outV": "1", "inV": "2", "label": "contains"},
             {"outV": "2", "inV": "3", "label": "influences"},
+            {"outV": "4", "inV": "3", "label": "merged_into"},
         ],
     }
 
-    with (
-        patch.object(ObjectiveRepository, "create") as mock_create_objective,
-        patch.object(OpportunityRepository, "create") as mock_create_opportunity,
-        patch.object(IssueRepository, "create") as mock_create_issue,
-        patch.object(
-            ProjectRepository, "_remove_contains_edge"
-        ) as mock_remove_contains_edge,
-    ):
-        mock_create_objective.return_value = MagicMock(uuid="new_uuid_5")
-        mock_create_opportunity.return_value = MagicMock(uuid="new_uuid_2")
-        mock_create_issue.side_effect = [
-            MagicMock(uuid="new_uuid_3"),
-            MagicMock(uuid="new_uuid_4"),
-        ]
-
-        for label, vertices in project_json["vertices"].items():
-            repository._create_project_components_vertices(
-                vertices, label, project_uuid, project_json
-            )
-
-        # Verify that the create methods were called with the correct arguments
-        mock_create_objective.assert_called_once_with(
-            project_uuid, ObjectiveCreate.model_validate({"description": "Objective 1"})
-        )
-        mock_create_opportunity.assert_called_once_with(
-            project_uuid,
-            OpportunityCreate.model_validate({"description": "Opportunity 1"}),
-        )
-        mock_create_issue.assert_any_call(
-            project_uuid, IssueCreate.model_validate({"description": "Issue 1"})
-        )
-        mock_create_issue.assert_any_call(
-            project_uuid, IssueCreate.model_validate({"description": "Merged Issue 1"})
-        )
 
-        # Verify that _remove_contains_edge was called for merged_issues
-        mock_remove_contains_edge.assert_called_once_with("new_uuid_4")
-
-        # Verify that the edges were updated correctly
-        assert project_json["edges"][0]["outV"] == "1"
-        assert project_json["edges"][0]["inV"] == "new_uuid_2"
-        assert project_json["edges"][1]["outV"] == "new_uuid_2"
-        assert project_json["edges"][1]["inV"] == "new_uuid_3"
+def test_import_vertices(mock_client, project_json):
+    vertices = ProjectRepository(mock_client)._import_vertices(project_json)
+    assert vertices == [
+        ("1", "project", ProjectCreate(name="Project"), False),
+        ("3", "issue", IssueCreate(description="Issue 1"), True),
+        ("2", "opportunity", OpportunityCreate(description="Opportunity 1"), True),
+        ("5", "objective", ObjectiveCreate(description="Objective 1"), True),
+        ("4", "issue", IssueCreate(description="Merged Issue 1"), False),
+    ]
+    # the exported project is left untouched
+    assert project_json["vertices"]["project"]["id"] == "1"
 
 
-def test_import_project(mock_client):
+def test_import_edges(mock_client, project_json):
     repository = ProjectRepository(mock_client)
-    project_json = {
-        "vertices": {
-            "project": {
-                "name": "Project",
-                "label": "project",
-                "id": "1",
-            },
-            "issues": [
-                {"id": "3", "label": "issue", "description": "Issue 1"},
-            ],
-            "opportunities": [
-                {"id": "2", "label": "opportunity", "description": "Opportunity 1"}
-            ],
-            "objectives": [
-                {"id": "5", "label": "objective", "description": "Objective 1"}
-            ],
-            "merged_issues": [
-                {"id": "4", "label": "merged_issues", "description": "Merged Issue 1"}
-            ],
-        },
-        "edges": [
-            {"outV": "1", "inV": "2", "label": "contains"},
-            {"outV": "2", "inV": "3", "label": "influences"},
-        ],
-    }
-    with (
-        patch.object(ProjectRepository, "create") as mock_create_project,
-        patch.object(ObjectiveRepository, "create") as mock_create_objective,
-        patch.object(OpportunityRepository, "create") as mock_create_opportunity,
-        patch.object(IssueRepository, "create") as mock_create_issue,
-        patch.object(
-            ProjectRepository, "_remove_contains_edge"
-        ) as mock_remove_contains_edge,
-        patch.object(EdgeRepository, "create") as mock_create_edge,
-    ):
-        mock_create_project.return_value = MagicMock(uuid="new_uuid_1")
-        mock_create_objective.return_value = MagicMock(uuid="new_uuid_5")
-        mock_create_opportunity.return_value = MagicMock(uuid="new_uuid_2")
-        mock_create_issue.side_effect = [
-            MagicMock(uuid="new_uuid_3"),
-            MagicMock(uuid="new_uuid_4"),
-        ]
-
-        repository.import_project(project_json)
-
-        # Verify that the create methods were called with the correct arguments
-        mock_create_project.assert_called_once_with(
-            ProjectCreate.model_validate(
-                {
-                    "name": "Project",
-                }
-            )
-        )
-        mock_create_objective.assert_called_once_with(
-            "new_uuid_1", ObjectiveCreate.model_validate({"description": "Objective 1"})
-        )
-        mock_create_opportunity.assert_called_once_with(
-            "new_uuid_1",
-            OpportunityCreate.model_validate({"description": "Opportunity 1"}),
-        )
-        mock_create_issue.assert_any_call(
-            "new_uuid_1", IssueCreate.model_validate({"description": "Issue 1"})
-        )
-        mock_create_issue.assert_any_call(
-            "new_uuid_1", IssueCreate.model_validate({"description": "Merged Issue 1"})
-        )
+    vertices = repository._import_vertices(project_json)
+    edges = repository._import_edges(
+        project_json, vertices, ["new_1", "new_3", "new_2", "new_5", "new_4"]
+    )
+    # no "contains" edge for the merged issue
+    assert edges == [
+        ("new_1", "new_3", "contains"),
+        ("new_1", "new_2", "contains"),
+        ("new_1", "new_5", "contains"),
+        ("new_2", "new_3", "influences"),
+        ("new_4", "new_3", "merged_into"),
+    ]
 
-        # Verify that _remove_contains_edge was called for merged_issues
-        mock_remove_contains_edge.assert_called_once_with("new_uuid_4")
 
-        # Verify that the edges were created correctly
-        mock_create_edge.assert_any_call(
-            edge_label="influences",
-            out_vertex_uuid="new_uuid_2",
-            in_vertex_uuid="new_uuid_3",
-        )
+def created_edges(query, bindings):
+    """Result of a query creating vertices or edges: the number of created edges"""
+    return [query.count("addE(")]
+
+
+@pytest.mark.parametrize("end", ["outV", "inV"])
+def test_import_project_dangling_edge(mock_client, project_json, end):
+    project_json["edges"].append({**project_json["edges"][1], end: "missing"})
+    with pytest.raises(DanglingEdgeError) as exc:
+        ProjectRepository(mock_client).import_project(project_json)
+    assert [edge[end] for edge in exc.value.edges] == ["missing"]
+    # nothing is created
+    mock_client.execute_query.assert_not_called()
+
+
+def test_import_project(mock_client, project_json):
+    mock_client.execute_query.side_effect = created_edges
+    ProjectRepository(mock_client).import_project(project_json, batch_size=2)
+    call_count = 1  # create the project vertex
+    call_count += 2  # create the 4 other vertices, 2 at a time
+    call_count += 3  # create 5 edges, 2 at a time
+    assert mock_client.execute_query.call_count == call_count
+    project, issues, *_ = mock_client.execute_query.call_args_list
+    project_uuid = project.args[1]["vertex_id_0"]
+    # the other vertices are in the partition of the project ("ids" property)
+    assert "property('ids', property_0_4)" in issues.args[0]
+    assert issues.args[1]["property_0_4"] == project_uuid
+    query, bindings = mock_client.execute_query.call_args_list[-1].args
+    assert query.startswith("g.inject(0).union(__.V(out_vertex_uuid_0).addE(")
+    assert bindings["edge_label_0"] == "merged_into"
+
+
+@pytest.fixture
+def mock_async_client():
+    mock_client = MagicMock(spec=AsyncGremlinClient)
+    mock_client.__aenter__.return_value = mock_client
+
+    mock_builder = MagicMock(spec=Builder)
+    mock_query = MagicMock(spec=Query)
+    mock_response = MagicMock(spec=Response)
+    mock_query.vertex = GremlinStringQueryBuilderVertex()
+    mock_response.vertex = GremlinResponseBuilderVertex()
+    mock_query.edge = GremlinStringQueryBuilderEdge()
+    mock_response.edge = GremlinResponseBuilderEdge()
+
+    mock_builder.query = mock_query
+    mock_builder.response = mock_response
+    mock_client.builder = mock_builder
+
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_async_crud_success(mock_async_client, project, metadata):
+    body = [{**project, **metadata}]
+    mock_async_client.execute_query.return_value = body
+    repository = AsyncProjectRepository(mock_async_client)
+    created = await repository.create(ProjectCreate(name="Project"))
+    assert await repository.read(project_uuid="1") == created
+    assert await repository.all() == [created]
+    await repository.update(
+        project_uuid="1", modified_fields=ProjectUpdate(description="new Description")
+    )
+    assert mock_async_client.execute_query.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_async_delete_success(mock_async_client):
+    mock_async_client.execute_query.side_effect = [[0], [2], [0], []]
+    repository = AsyncProjectRepository(mock_async_client)
+    await repository.delete(project_uuid="1", batch_size=2)
+    call_count = 1  # delete merged issues
+    call_count += 2  # delete contained vertices, until a batch is not full
+    call_count += 1  # delete project
+    assert mock_async_client.execute_query.await_count == call_count
+
+
+@pytest.mark.asyncio
+async def test_async_export_project_success(mock_client, mock_async_client, subgraph):
+    mock_async_client.execute_query.return_value = subgraph
+    mock_client.execute_query.return_value = subgraph
+    exported = await AsyncProjectRepository(mock_async_client).export_project("1")
+    assert exported == ProjectRepository(mock_client).export_project("1")
+    mock_async_client.execute_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_project_success(
+    mock_client, mock_async_client, subgraph, project, metadata, vertex, edge
+):
+    mock_async_client.execute_query.side_effect = [
+        [{**project, **metadata}],
+        [vertex],  # objectives
+        [],  # opportunities
+        [vertex, vertex],  # issues
+        [vertex],  # merged issues
+        [edge],  # contains
+        [edge],  # influences
+        [],  # merged_into
+        [],  # has_value_metric
+    ]
+    lines = [
+        line
+        async for line in AsyncProjectRepository(mock_async_client).stream_project("1")
+    ]
+    assert mock_async_client.execute_query.await_count == 9
+    # the lines hold the same vertices and edges as the JSON export
+    mock_client.execute_query.return_value = subgraph
+    exported = ProjectRepository(mock_client).export_project("1")
+    expected = [{"project": exported["vertices"]["project"]}]
+    for group in EXPORTED_VERTEX_GROUPS:
+        expected.extend({group: vertex} for vertex in exported["vertices"][group])
+    expected.extend({"edges": edge} for edge in exported["edges"])
+    assert lines == expected
+
+
+@pytest.mark.asyncio
+async def test_async_import_project(mock_async_client, project_json):
+    mock_async_client.execute_query.side_effect = created_edges
+    await AsyncProjectRepository(mock_async_client).import_project(project_json)
+    call_count = 1  # create the project vertex
+    call_count += 1  # create the other vertices
+    call_count += 1  # create all the edges
+    assert mock_async_client.execute_query.await_count == call_count
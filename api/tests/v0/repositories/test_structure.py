@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.v0.database.gremlin import (
+    Builder,
+    GremlinClient,
+    GremlinResponseBuilderEdge,
+    GremlinResponseBuilderVertex,
+    GremlinStringQueryBuilderEdge,
+    GremlinStringQueryBuilderVertex,
+    Query,
+    Response,
+)
+from src.v0.repositories.structure import StructureRepository
+from src.v0.services.structure import StructureService
+
+
+@pytest.fixture
+def mock_client():
+    # Create a mock client
+    mock_client = MagicMock(spec=GremlinClient)
+    mock_client.__enter__.return_value = mock_client
+
+    # Create mock builder and its components
+    mock_builder = MagicMock(spec=Builder)
+    mock_query = MagicMock(spec=Query)
+    mock_response = MagicMock(spec=Response)
+    mock_query.vertex = GremlinStringQueryBuilderVertex()
+    mock_query.edge = GremlinStringQueryBuilderEdge()
+    mock_response.vertex = GremlinResponseBuilderVertex()
+    mock_response.edge = GremlinResponseBuilderEdge()
+
+    # Set up the builder's query and response
+    mock_builder.query = mock_query
+    mock_builder.response = mock_response
+    mock_client.builder = mock_builder
+
+    return mock_client
+
+
+def issue(uuid, category, boundary, **fields):
+    return {
+        "shortname": [f"issue {uuid}"],
+        "description": ["an issue description"],
+        "tag": [""],
+        "index": ["0"],
+        "category": [category],
+        "keyUncertainty": [""],
+        "decisionType": [""],
+        "alternatives": [""],
+        "probabilities": [""],
+        "influenceNodeUUID": [""],
+        "boundary": [boundary],
+        "comments": [""],
+        "version": ["v0"],
+        "uuid": [uuid],
+        "timestamp": ["1234"],
+        "date": ["today"],
+        "T.id": uuid,
+        "T.label": "issue",
+        **{key: [value] for key, value in fields.items()},
+    }
+
+
+@pytest.fixture
+def influence_diagram():
+    return [
+        {
+            "vertices": [
+                issue("33-cc", "Value Metric", "in"),
+                issue("22-bb", "Decision", "on", decisionType="Focus"),
+                issue(
+                    "11-aa",
+                    "Uncertainty",
+                    "in",
+                    keyUncertainty="true",
+                    probabilities=(
+                        '{"dtype": "DiscreteUnconditionalProbability",'
+                        '"probability_function": [[0.9, 0.1]],'
+                        '"variables": {"11-aa": ["out1", "out2"]}}'
+                    ),
+                ),
+                issue(
+                    "44-dd",
+                    "Decision",
+                    "in",
+                    decisionType="Focus",
+                    alternatives='["yes", "no"]',
+                ),
+            ],
+            "edges": [
+                "e[101][11-aa-influences->44-dd]",
+                "e[102][44-dd-influences->33-cc]",
+            ],
+        }
+    ]
+
+
+def test_read_influence_diagram_single_query(mock_client, influence_diagram):
+    mock_client.execute_query.return_value = influence_diagram
+    result = StructureRepository(mock_client).read_influence_diagram("0")
+
+    # vertices and edges are read in one round trip
+    mock_client.execute_query.assert_called_once()
+    assert [v.uuid for v in result.vertices] == ["11-aa", "44-dd", "22-bb", "33-cc"]
+    assert [(e.outV, e.inV) for e in result.edges] == [
+        ("11-aa", "44-dd"),
+        ("44-dd", "33-cc"),
+    ]
+
+
+def test_read_influence_diagram_empty_project(mock_client):
+    mock_client.execute_query.return_value = [{"vertices": [], "edges": []}]
+    result = StructureRepository(mock_client).read_influence_diagram("0")
+    assert result.vertices == []
+    assert result.edges == []
+
+
+def test_create_decision_tree_single_query(mock_client, influence_diagram):
+    mock_client.execute_query.return_value = influence_diagram
+    service = StructureService(StructureRepository(mock_client))
+
+    decision_tree = service.create_decision_tree(project_uuid="0")
+    mock_client.execute_query.assert_called_once()
+    assert decision_tree.id.uuid == "11-aa"
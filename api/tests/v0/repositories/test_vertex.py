@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.v0.database.gremlin import (
+    AsyncGremlinClient,
     Builder,
     GremlinClient,
     GremlinResponseBuilderVertex,
@@ -11,7 +12,7 @@ from src.v0.database.gremlin import (
     Response,
 )
 from src.v0.models.vertex import VertexCreate, VertexUpdate
-from src.v0.repositories.vertex import VertexRepository
+from src.v0.repositories.vertex import AsyncVertexRepository, VertexRepository
 
 
 @pytest.fixture
@@ -54,6 +55,24 @@ def test_create_success(mock_client, metadata):
     mock_client.execute_query.assert_called_once()
 
 
+def test_read_out_in_vertex_success(mock_client, metadata):
+    response = [{**{"field": ["3"], "T.label": "V"}, **metadata}]
+    mock_client.execute_query.return_value = response
+    repository = VertexRepository(mock_client)
+    repository.read_out_in_vertex("1", "contains", "merged_into")
+    mock_client.execute_query.assert_called_once()
+
+
+def test_create_batch_success(mock_client):
+    mock_client.execute_query.return_value = []
+    repository = VertexRepository(mock_client)
+    uuids = repository.create_batch([("L", VertexCreate(field="3"))] * 2)
+    mock_client.execute_query.assert_called_once()
+    _, bindings = mock_client.execute_query.call_args.args
+    assert uuids == [bindings["vertex_id_0"], bindings["vertex_id_1"]]
+    assert uuids[0] != uuids[1]
+
+
 def test_read_success(mock_client, metadata):
     response = [{**{"field": ["3"], "T.label": "V"}, **metadata}]
     mock_client.execute_query.return_value = response
@@ -100,3 +119,60 @@ def test_delete_success(mock_client, metadata):
     repository = VertexRepository(mock_client)
     repository.delete(vertex_uuid="1")
     mock_client.execute_query.assert_called_once()
+
+
+def test_delete_out_vertex_batch_success(mock_client):
+    mock_client.execute_query.return_value = [3]
+    repository = VertexRepository(mock_client)
+    assert repository.delete_out_vertex_batch("1", "contains", batch_size=5) == 3
+    mock_client.execute_query.assert_called_once()
+
+
+@pytest.fixture
+def mock_async_client():
+    mock_client = MagicMock(spec=AsyncGremlinClient)
+    mock_client.__aenter__.return_value = mock_client
+
+    mock_builder = MagicMock(spec=Builder)
+    mock_query = MagicMock(spec=Query)
+    mock_response = MagicMock(spec=Response)
+    mock_query.vertex = GremlinStringQueryBuilderVertex()
+    mock_response.vertex = GremlinResponseBuilderVertex()
+
+    mock_builder.query = mock_query
+    mock_builder.response = mock_response
+    mock_client.builder = mock_builder
+
+    return mock_client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("create", {"vertex_label": "L", "vertex": VertexCreate(field="3")}),
+        ("read", {"vertex_uuid": "1"}),
+        ("read_out_vertex", {"vertex_uuid": "1", "edge_label": "V"}),
+        ("read_in_vertex", {"vertex_uuid": "1", "edge_label": "V"}),
+        (
+            "read_out_in_vertex",
+            {"vertex_uuid": "1", "out_edge_label": "V", "in_edge_label": "W"},
+        ),
+        ("all", {"vertex_label": "V"}),
+        ("update", {"vertex_uuid": "1", "modified_fields": VertexUpdate(field=4)}),
+    ],
+)
+async def test_async_repository(mock_async_client, metadata, method, kwargs):
+    response = [{**{"field": ["3"], "T.label": "V"}, **metadata}]
+    mock_async_client.execute_query.return_value = response
+    repository = AsyncVertexRepository(mock_async_client)
+    assert await getattr(repository, method)(**kwargs)
+    mock_async_client.execute_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_delete_success(mock_async_client):
+    mock_async_client.execute_query.return_value = [{None}]
+    repository = AsyncVertexRepository(mock_async_client)
+    assert await repository.delete(vertex_uuid="1") is None
+    mock_async_client.execute_query.assert_awaited_once()
@@ -15,7 +15,7 @@ client = TestClient(app)
 
 @pytest.fixture
 def mock_service():
-    with patch("src.v0.routes.edge.EdgeService") as MockService:
+    with patch("src.v0.routes.edge.AsyncEdgeService", autospec=True) as MockService:
         yield MockService
 
 
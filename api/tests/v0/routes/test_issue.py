@@ -16,7 +16,7 @@ client = TestClient(app)
 
 @pytest.fixture
 def mock_service():
-    with patch("src.v0.routes.issue.IssueService") as MockService:
+    with patch("src.v0.routes.issue.AsyncIssueService", autospec=True) as MockService:
         yield MockService
 
 
@@ -70,7 +70,7 @@ def test_create_success(mock_service, issue, metadata):
 
 def test_read_issues_all_success(mock_service, issue, metadata):
     body = {**issue, **metadata}
-    mock_service.return_value.read_issue_all.return_value = [
+    mock_service.return_value.read_issues_all.return_value = [
         IssueResponse.model_validate(body)
     ]
     project_uuid = "0"
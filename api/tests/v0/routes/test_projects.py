@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 
 from dependencies import create_versions, test_create_app
 from src.v0.models.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from src.v0.repositories.project import DanglingEdgeError
 
 from .. import database_version
 
@@ -15,7 +16,9 @@ client = TestClient(app)
 
 @pytest.fixture
 def mock_service():
-    with patch("src.v0.routes.project.ProjectService") as MockService:
+    with patch(
+        "src.v0.routes.project.AsyncProjectService", autospec=True
+    ) as MockService:
         yield MockService
 
 
@@ -74,6 +77,7 @@ def test_read_projects_all_success(mock_service, project, metadata):
 
 
 def test_delete_project_success(mock_service):
+    mock_service.return_value.delete.return_value = None
     project_uuid = "1"
     response = client.delete(f"/v{database_version}/projects/{project_uuid}")
     assert response.status_code == 200
@@ -109,6 +113,14 @@ def test_import_project_success(mock_service, project, metadata):
     mock_service.return_value.import_project.assert_called_once_with(project)
 
 
+def test_import_project_dangling_edge(mock_service, project):
+    error = DanglingEdgeError([{"outV": "1", "inV": "missing", "label": "influences"}])
+    mock_service.return_value.import_project.side_effect = error
+    response = client.post(f"/v{database_version}/projects/import", json=project)
+    assert response.status_code == 422
+    assert response.json()["detail"] == str(error)
+
+
 def test_export_project_success(mock_service, project, metadata):
     body = {**project, **metadata}
     mock_service.return_value.export_project.return_value = body
@@ -116,3 +128,20 @@ def test_export_project_success(mock_service, project, metadata):
     response = client.get(f"/v{database_version}/projects/{project_uuid}/export")
     assert response.status_code == 200
     mock_service.return_value.export_project.assert_called_once_with(project_uuid)
+
+
+def test_export_project_ndjson_success(mock_service):
+    async def lines():
+        yield '{"project": {"id": "1"}}\n'
+        yield '{"edges": {"id": "2"}}\n'
+
+    mock_service.return_value.stream_project.return_value = lines()
+    response = client.get(f"/v{database_version}/projects/1/export?format=ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.splitlines() == [
+        '{"project": {"id": "1"}}',
+        '{"edges": {"id": "2"}}',
+    ]
+    mock_service.return_value.stream_project.assert_called_once_with("1")
+    mock_service.return_value.export_project.assert_not_called()
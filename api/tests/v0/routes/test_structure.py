@@ -1,3 +1,4 @@
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import patch
 
 import pytest
@@ -6,7 +7,33 @@ from fastapi.testclient import TestClient
 from dependencies import create_versions, test_create_app
 from src.v0.models.edge import EdgeResponse
 from src.v0.models.issue import IssueResponse
-from src.v0.models.structure import InfluenceDiagramResponse
+from src.v0.models.structure import (
+    InfluenceDiagramResponse,
+    MonteCarloRequest,
+    PosteriorRequest,
+    PosteriorResponse,
+    PruningReport,
+)
+from src.v0.routes.structure import WORKER_DIED
+from src.v0.services.structure_utils.decision_diagrams.chance_network import (
+    EvidenceError,
+)
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    ArcFormatError,
+    InfluenceDiagramNotAcyclicError,
+    ProbabilityFormatError,
+)
+from src.v0.services.structure_utils.decision_diagrams.monte_carlo import (
+    StrategyError,
+)
+from src.v0.services.structure_utils.decision_diagrams.solver import (
+    InfluenceDiagramNotSolvable,
+)
+from src.v0.services.structure_utils.decision_diagrams.symmetric_decision_tree import (
+    BranchNotFound,
+    TreeTooLarge,
+)
+from src.v0.services.structure_utils.worker_pool import WorkerTimeout
 
 from .. import database_version
 
@@ -140,5 +167,418 @@ def test_convert_influence_diagram_to_decision_tree_model_success(mock_service,
     response = client.get(f"/v{database_version}/projects/{project_uuid}/decision-tree")
     assert response.status_code == 200
     mock_service.return_value.create_decision_tree.assert_called_once_with(
-        project_uuid=project_uuid
+        project_uuid=project_uuid, prune=False
+    )
+
+
+def test_stream_decision_tree_success(mock_service):
+    mock_service.return_value.stream_decision_tree.return_value = iter(
+        ['{"id":{"node_type":"UtilityNode",', '"shortname":"ut"},"children":null}']
+    )
+    project_uuid = "0"
+    response = client.get(
+        f"/v{database_version}/projects/{project_uuid}/decision-tree",
+        params={"stream": True, "prune": True},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "id": {"node_type": "UtilityNode", "shortname": "ut"},
+        "children": None,
+    }
+    mock_service.return_value.stream_decision_tree.assert_called_once_with(
+        project_uuid=project_uuid, prune=True
+    )
+    mock_service.return_value.create_decision_tree.assert_not_called()
+
+
+def test_expand_decision_tree_success(mock_service):
+    mock_service.return_value.expand_decision_tree.return_value = {
+        "id": {
+            "node_type": "UtilityNode",
+            "shortname": "ut",
+            "description": "Utility",
+            "branch_name": "no",
+            "uuid": "33-cc",
+        },
+        "node_count": 1,
+    }
+    project_uuid = "0"
+    response = client.get(
+        f"/v{database_version}/projects/{project_uuid}/decision-tree/expansion",
+        params={"path": "Issue ABC:yes", "depth": 2},
+    )
+    assert response.status_code == 200
+    assert response.json()["node_count"] == 1
+    mock_service.return_value.expand_decision_tree.assert_called_once_with(
+        project_uuid=project_uuid, path="Issue ABC:yes", depth=2, prune=False
+    )
+
+
+def test_expand_decision_tree_unknown_branch(mock_service):
+    mock_service.return_value.expand_decision_tree.side_effect = BranchNotFound("A:b")
+    response = client.get(
+        f"/v{database_version}/projects/0/decision-tree/expansion?path=A:b"
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "no branch A:b in the decision tree"}
+
+
+def test_expand_decision_tree_negative_depth(mock_service):
+    response = client.get(
+        f"/v{database_version}/projects/0/decision-tree/expansion?depth=-1"
+    )
+    assert response.status_code == 422
+    mock_service.return_value.expand_decision_tree.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "url, method",
+    [
+        ("decision-tree", "create_decision_tree"),
+        ("decision-tree?stream=true", "stream_decision_tree"),
+        ("decision-tree/expansion?depth=3", "expand_decision_tree"),
+    ],
+)
+def test_decision_tree_too_large(mock_service, url, method):
+    getattr(mock_service.return_value, method).side_effect = TreeTooLarge(13, 12)
+    response = client.get(f"/v{database_version}/projects/0/{url}")
+    assert response.status_code == 413
+    assert response.json() == {
+        "detail": {
+            "message": "decision tree of 13 nodes, more than the maximum of 12",
+            "node_count": 13,
+            "max_node_count": 12,
+        }
+    }
+
+
+def test_truncated_decision_tree(mock_service):
+    mock_service.return_value.expand_decision_tree.return_value = {
+        "id": {
+            "node_type": "DecisionNode",
+            "shortname": "Issue ABC",
+            "description": "Bla",
+            "branch_name": "",
+            "uuid": "22-bb",
+            "alternatives": ["yes", "no"],
+        },
+        "node_count": 13,
+    }
+    response = client.get(
+        f"/v{database_version}/projects/0/decision-tree?truncate=true&stream=true"
+    )
+    assert response.status_code == 200
+    assert response.json()["node_count"] == 13
+    mock_service.return_value.expand_decision_tree.assert_called_once_with(
+        project_uuid="0", depth=None, prune=False
+    )
+    mock_service.return_value.stream_decision_tree.assert_not_called()
+
+
+def test_create_decision_graph_success(mock_service):
+    leaf = {
+        "node_type": "UtilityNode",
+        "shortname": "ut",
+        "description": "Utility",
+        "branch_name": "",
+        "uuid": "33-cc",
+    }
+    graph = {"root": "0.0", "node_count": 1, "nodes": {"0.0": {"id": leaf}}}
+    mock_service.return_value.create_decision_graph.return_value = graph
+    response = client.get(f"/v{database_version}/projects/0/decision-graph?prune=1")
+    assert response.status_code == 200
+    assert response.json()["nodes"]["0.0"]["children"] is None
+    mock_service.return_value.create_decision_graph.assert_called_once_with(
+        project_uuid="0", prune=True
+    )
+
+
+def test_read_pyagrum_cache_statistics_success(mock_service):
+    statistics = {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "entries": 1,
+        "size_bytes": 5280,
+        "max_bytes": 2**20,
+    }
+    with patch("src.v0.routes.structure.pyagrum_cache") as mock_cache:
+        mock_cache.statistics.return_value = statistics
+        response = client.get(f"/v{database_version}/pyagrum-cache/statistics")
+    assert response.status_code == 200
+    assert response.json() == statistics
+    mock_service.assert_not_called()
+
+
+def test_solve_influence_diagram_success(mock_service):
+    solution = {
+        "expected_utility": 28.5,
+        "variance": 1.0,
+        "policies": [
+            {
+                "decision": "Drill",
+                "parents": ["Test"],
+                "rules": [{"parent_states": {"Test": "Wet"}, "alternative": "Yes"}],
+            }
+        ],
+    }
+    mock_service.return_value.solve_influence_diagram.return_value = solution
+    response = client.post(f"/v{database_version}/projects/0/influence-diagram/solve")
+    assert response.status_code == 200
+    assert response.json() == solution
+    mock_service.return_value.solve_influence_diagram.assert_called_once_with(
+        project_uuid="0", prune=False
+    )
+
+
+ANALYSIS_ERRORS = pytest.mark.parametrize(
+    "error, status_code",
+    [
+        (InfluenceDiagramNotSolvable("no order"), 422),
+        (InfluenceDiagramNotAcyclicError(), 422),
+        (ProbabilityFormatError("shape mismatch"), 422),
+        (ArcFormatError("no such node"), 422),
+        (BrokenProcessPool("killed"), 503),
+        (WorkerTimeout(60), 504),
+    ],
+    ids=["not solvable", "not acyclic", "probability", "arc", "worker died", "timeout"],
+)
+
+
+@ANALYSIS_ERRORS
+def test_solve_influence_diagram_fail(mock_service, error, status_code):
+    mock_service.return_value.solve_influence_diagram.side_effect = error
+    response = client.post(f"/v{database_version}/projects/0/influence-diagram/solve")
+    assert response.status_code == status_code
+    if status_code == 503:
+        assert response.json()["detail"] == WORKER_DIED
+    else:
+        assert response.json()["detail"] == str(error)
+
+
+def test_value_of_information_success(mock_service):
+    ranking = {
+        "expected_utility": 28.5,
+        "uncertainties": [
+            {"uuid": "11-aa", "shortname": "State", "expected_utility": 35, "evpi": 6.5},
+            {"uuid": "22-bb", "shortname": "Production"},
+        ],
+    }
+    mock_service.return_value.value_of_information.return_value = ranking
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/value-of-information"
+    )
+    assert response.status_code == 200
+    assert response.json()["uncertainties"][1] == {
+        "uuid": "22-bb",
+        "shortname": "Production",
+        "expected_utility": None,
+        "evpi": None,
+    }
+    mock_service.return_value.value_of_information.assert_called_once_with(
+        project_uuid="0"
+    )
+
+
+@ANALYSIS_ERRORS
+def test_value_of_information_fail(mock_service, error, status_code):
+    mock_service.return_value.value_of_information.side_effect = error
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/value-of-information"
+    )
+    assert response.status_code == status_code
+
+
+def test_probability_sensitivity_success(mock_service):
+    sensitivity = {
+        "expected_utility": 28.5,
+        "sensitivities": [
+            {
+                "uuid": "11-aa",
+                "shortname": "State",
+                "outcome": "Dry",
+                "deltas": [-0.3, 0.0, 0.3],
+                "expected_utilities": [50.0, 28.5, 12.0],
+                "changed_decisions": [["Drill"], [], []],
+                "low": 50.0,
+                "high": 12.0,
+                "swing": 38.0,
+            }
+        ],
+    }
+    mock_service.return_value.probability_sensitivity.return_value = sensitivity
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/sensitivity"
+        "?span=0.3&points=3"
+    )
+    assert response.status_code == 200
+    assert response.json() == sensitivity
+    mock_service.return_value.probability_sensitivity.assert_called_once_with(
+        project_uuid="0", span=0.3, points=3
+    )
+
+
+@pytest.mark.parametrize("query", ["span=0", "span=1.5", "points=1"])
+def test_probability_sensitivity_invalid_range(mock_service, query):
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/sensitivity?{query}"
+    )
+    assert response.status_code == 422
+    mock_service.return_value.probability_sensitivity.assert_not_called()
+
+
+@ANALYSIS_ERRORS
+def test_probability_sensitivity_fail(mock_service, error, status_code):
+    mock_service.return_value.probability_sensitivity.side_effect = error
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/sensitivity"
+    )
+    assert response.status_code == status_code
+
+
+def test_simulate_success(mock_service):
+    mock_service.return_value.simulate.return_value = iter(['{"samples":1}\n'] * 2)
+    body = {"strategy": {"Test": "Test"}, "samples": 10, "chunk_size": 5, "seed": 3}
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/simulate", json=body
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text == '{"samples":1}\n{"samples":1}\n'
+    mock_service.return_value.simulate.assert_called_once_with(
+        project_uuid="0", request=MonteCarloRequest.model_validate(body)
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"strategy": {}, "samples": 0},
+        {"strategy": {}, "percentiles": [101]},
+        {"strategy": {}, "confidence": 1},
+        {"values": {}},
+    ],
+)
+def test_simulate_invalid_request(mock_service, body):
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/simulate", json=body
+    )
+    assert response.status_code == 422
+    mock_service.return_value.simulate.assert_not_called()
+
+
+def test_simulate_invalid_strategy(mock_service):
+    mock_service.return_value.simulate.side_effect = StrategyError("Buy")
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/simulate",
+        json={"strategy": {}},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"] == str(StrategyError("Buy"))
+
+
+def test_posterior_queries_success(mock_service):
+    result = PosteriorResponse.model_validate(
+        {
+            "results": [
+                {"evidence_probability": 1, "posteriors": {"State": {"Peach": 1}}},
+                {"evidence_probability": 0, "posteriors": None},
+            ]
+        }
+    )
+    mock_service.return_value.posterior_queries.return_value = result
+    body = {"scenarios": [{}, {"State": "Lemon"}], "targets": ["State"]}
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/posteriors", json=body
+    )
+    assert response.status_code == 200
+    assert PosteriorResponse.model_validate(response.json()) == result
+    mock_service.return_value.posterior_queries.assert_called_once_with(
+        project_uuid="0", request=PosteriorRequest.model_validate(body)
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"scenarios": [], "targets": ["State"]},
+        {"scenarios": [{}], "targets": []},
+        {"scenarios": [{"State": 1}], "targets": ["State"]},
+    ],
+)
+def test_posterior_queries_invalid_request(mock_service, body):
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/posteriors", json=body
+    )
+    assert response.status_code == 422
+    mock_service.return_value.posterior_queries.assert_not_called()
+
+
+def test_posterior_queries_unknown_evidence(mock_service):
+    mock_service.return_value.posterior_queries.side_effect = EvidenceError("Buy")
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/posteriors",
+        json={"scenarios": [{}], "targets": ["Buy"]},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"] == str(EvidenceError("Buy"))
+
+
+def test_prune_influence_diagram_success(mock_service):
+    report = PruningReport.model_validate(
+        {
+            "nodes": [{"uuid": "11-aa", "shortname": "Weather"}],
+            "arcs": [
+                {
+                    "tail": {"uuid": "22-bb", "shortname": "Rumour"},
+                    "head": {"uuid": "33-cc", "shortname": "Buy"},
+                }
+            ],
+        }
+    )
+    mock_service.return_value.prune_influence_diagram.return_value = report
+    response = client.get(f"/v{database_version}/projects/0/influence-diagram/requisite")
+    assert response.status_code == 200
+    assert PruningReport.model_validate(response.json()) == report
+    mock_service.return_value.prune_influence_diagram.assert_called_once_with(
+        project_uuid="0"
+    )
+
+
+def test_prune_influence_diagram_not_acyclic(mock_service):
+    mock_service.return_value.prune_influence_diagram.side_effect = (
+        InfluenceDiagramNotAcyclicError()
+    )
+    response = client.get(f"/v{database_version}/projects/0/influence-diagram/requisite")
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ProbabilityFormatError("shape mismatch"), InfluenceDiagramNotAcyclicError()],
+    ids=["probability", "not acyclic"],
+)
+def test_simulate_invalid_diagram(mock_service, error):
+    mock_service.return_value.simulate.side_effect = error
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/simulate",
+        json={"strategy": {}},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"] == str(error)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ProbabilityFormatError("shape mismatch"), ArcFormatError("no such node")],
+    ids=["probability", "arc"],
+)
+def test_posterior_queries_invalid_diagram(mock_service, error):
+    mock_service.return_value.posterior_queries.side_effect = error
+    response = client.post(
+        f"/v{database_version}/projects/0/influence-diagram/posteriors",
+        json={"scenarios": [{}], "targets": ["State"]},
     )
+    assert response.status_code == 422
+    assert response.json()["detail"] == str(error)
@@ -17,7 +17,9 @@ client = TestClient(app)
 # Use the repository layer as service layer as there is no Vertex service layer
 @pytest.fixture
 def mock_service():
-    with patch("src.v0.routes.vertex.VertexRepository") as MockService:
+    with patch(
+        "src.v0.routes.vertex.AsyncVertexRepository", autospec=True
+    ) as MockService:
         yield MockService
 
 
@@ -48,9 +50,7 @@ def test_create_success(mock_service, metadata):
 
 def test_read_vertex_all_success(mock_service, metadata):
     body = {**{"field": "3", "T.label": "V"}, **metadata}
-    mock_service.return_value.read_vertex_all.return_value = (
-        VertexResponse.model_validate(body)
-    )
+    mock_service.return_value.all.return_value = [VertexResponse.model_validate(body)]
     vertex_label = "L"
     response = client.get(f"/v{database_version}/vertices/label/{vertex_label}")
     assert response.status_code == 200
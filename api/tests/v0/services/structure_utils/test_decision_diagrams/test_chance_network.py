@@ -0,0 +1,91 @@
+import json
+
+import pyAgrum as gum
+import pytest
+
+from src.v0.models.structure import InfluenceDiagramResponse
+from src.v0.services.structure_utils.decision_diagrams.chance_network import (
+    ChanceNetwork,
+    EvidenceError,
+)
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    InfluenceDiagram,
+)
+
+TESTDATA = "v0/services/testdata"
+
+
+@pytest.fixture
+def gum_id(copy_testdata_tmpdir, tmp_path):
+    copy_testdata_tmpdir(TESTDATA)
+    with open(tmp_path / "id_used_car_buyer.json") as f:
+        json_stream = json.load(f)
+    return InfluenceDiagram.from_db(
+        InfluenceDiagramResponse(
+            vertices=json_stream["vertices"], edges=json_stream["edges"]
+        )
+    ).to_pyagrum()
+
+
+def test_network(gum_id):
+    network = ChanceNetwork(gum_id)
+    # the buy decision informs no uncertainty
+    assert set(network.bn.names()) == {"State", "Test Result", "Test"}
+    assert network.decisions == {"Test"}
+    assert network.bn.parents("Test Result") == {
+        network.bn.idFromName("State"),
+        network.bn.idFromName("Test"),
+    }
+    assert network.bn.cpt("Test").tolist() == [0.5, 0.5]
+    # tables of 2 + 2 + 12 entries, and the clique of the three variables
+    assert network.entries == 2 + 2 + 12 + 12
+    assert gum_id.size() == 5
+
+
+def test_posteriors(gum_id):
+    network = ChanceNetwork(gum_id)
+    results = network.posteriors(
+        [{}, {"Test": "Test", "Test Result": "Lemon"}, {"Test": "Test"}],
+        ["State"],
+    )
+    assert [result["evidence_probability"] for result in results] == pytest.approx(
+        [1.0, 0.2, 1.0]
+    )
+    assert results[0]["posteriors"] == {
+        "State": pytest.approx({"Peach": 0.8, "Lemon": 0.2})
+    }
+    assert results[1]["posteriors"] == {"State": pytest.approx({"Peach": 0, "Lemon": 1})}
+    assert results[2]["posteriors"] == results[0]["posteriors"]
+
+
+def test_posteriors_impossible_evidence(gum_id):
+    network = ChanceNetwork(gum_id)
+    results = network.posteriors(
+        [{"Test": "no Test", "Test Result": "Lemon"}, {}], ["State", "Test Result"]
+    )
+    assert results[0] == {"evidence_probability": 0.0, "posteriors": None}
+    # the next scenarios are not affected
+    assert results[1]["posteriors"]["Test Result"] == pytest.approx(
+        {"no Test": 0.5, "Peach": 0.4, "Lemon": 0.1}
+    )
+
+
+@pytest.mark.parametrize(
+    "scenarios, targets, error",
+    [
+        ([{}], ["Buy"], EvidenceError("Buy")),
+        ([{"State": "Rusty"}], ["State"], EvidenceError("State", "Rusty")),
+        ([{}, {"Value": "High"}], ["State"], EvidenceError("Value")),
+    ],
+)
+def test_posteriors_unknown(gum_id, scenarios, targets, error):
+    network = ChanceNetwork(gum_id)
+    with pytest.raises(EvidenceError, match=str(error)):
+        network.posteriors(scenarios, targets)
+
+
+def test_decision_without_chance_child():
+    gum_id = gum.fastID("A->*D->$U")
+    network = ChanceNetwork(gum_id)
+    assert network.bn.names() == {"A"}
+    assert network.decisions == set()
@@ -179,6 +179,11 @@ def test_to_json(graph_as_dict):
     assert result.count("children") == 9
 
 
+def test_to_dict(graph_as_dict):
+    dt = DecisionTree.from_dict(graph_as_dict)
+    assert dt.to_dict() == json.loads(dt.to_json())
+
+
 def test_to_json_with_file(graph_as_dict):
     dt = DecisionTree.from_dict(graph_as_dict)
     with patch("builtins.open", mock_open()) as m:
@@ -1,6 +1,7 @@
 import json
 
 import networkx as nx
+import numpy as np
 import pyAgrum as gum
 import pytest
 
@@ -10,12 +11,17 @@ from src.v0.services.structure_utils.decision_diagrams.decision_tree import Deci
 from src.v0.services.structure_utils.decision_diagrams.edge import Edge
 from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
     InfluenceDiagram,
+    InfluenceDiagramNotAcyclicError,
+    ProbabilityFormatError,
 )
 from src.v0.services.structure_utils.decision_diagrams.node import (
     DecisionNode,
     UncertaintyNode,
     UtilityNode,
 )
+from src.v0.services.structure_utils.probability.discrete_conditional_probability import (  # noqa: E501
+    DiscreteConditionalProbability,
+)
 from src.v0.services.structure_utils.probability.discrete_unconditional_probability import (  # noqa: E501
     DiscreteUnconditionalProbability,
 )
@@ -227,6 +233,42 @@ def test_get_node_from_uuid(graph_as_dict):
     assert node.shortname == "d1"
 
 
+def test_get_node_from_unknown_uuid(graph_as_dict):
+    ID = InfluenceDiagram.from_dict(graph_as_dict)
+    with pytest.raises(KeyError):
+        ID.get_node_from_uuid("unknown")
+
+
+def test_remove_node(graph_as_dict):
+    ID = InfluenceDiagram.from_dict(graph_as_dict)
+    copied = ID.copy()
+    n4, n6 = graph_as_dict["nodes"][4], graph_as_dict["nodes"][6]
+    partial_order = ID.calculate_partial_order()
+
+    ID.remove_node(n4)
+    assert n4 not in ID.nx
+    assert ID.get_decision_nodes() == [n6]
+    assert ID.decision_count == 1
+    assert ID.uncertainty_count == 8
+    with pytest.raises(KeyError):
+        ID.get_node_from_uuid(n4.uuid)
+    assert ID.calculate_partial_order() != partial_order
+    # the indexes of a copy are its own
+    assert copied.get_node_from_uuid(n4.uuid) is n4
+    assert copied.decision_count == 2
+
+
+def test_nodes_with_same_uuid(graph_as_dict):
+    n4 = graph_as_dict["nodes"][4]
+    twin = DecisionNode("twin", "", uuid=n4.uuid)
+    ID = InfluenceDiagram.from_dict(graph_as_dict)
+    ID.add_node(twin)
+    assert ID.get_node_from_uuid(n4.uuid) is n4
+    ID.remove_node(n4)
+    assert ID.get_node_from_uuid(n4.uuid) is twin
+    assert ID.get_decision_nodes() == [graph_as_dict["nodes"][6], twin]
+
+
 def test_decision_elimination_order(graph_as_dict):
     ID = InfluenceDiagram.from_dict(graph_as_dict)
     result = ID.decision_elimination_order()
@@ -269,6 +311,49 @@ def test_calculate_partial_order_copy_mode(graph_as_dict):
     assert partial_order_0 != partial_order
 
 
+def test_partial_order_memoized_until_mutation(graph_as_dict):
+    ID = InfluenceDiagram.from_dict(graph_as_dict)
+    partial_order = ID.calculate_partial_order()
+    partial_order.pop()
+    assert ID.calculate_partial_order()[-1].shortname == "u8"
+    assert ID.calculate_partial_order()[0] is partial_order[0]
+    assert ID.decision_elimination_order() == ID.decision_elimination_order()
+
+    # u4 informs the first decision
+    ID.add_edge(Edge(graph_as_dict["nodes"][3], graph_as_dict["nodes"][4]))
+    result = [n.shortname for n in ID.calculate_partial_order()]
+    assert result == ["u1", "u2", "u3", "u4", "d1", "d2", "u5", "u6", "u7", "u8"]
+    ID.add_node(DecisionNode("d3", "Decision node 3"))
+    assert [n.shortname for n in ID.decision_elimination_order()] == ["d3", "d2", "d1"]
+
+
+def test_decision_elimination_order_removal_passes():
+    # d0 only loses its child d1 in the pass after the one removing u1, d1 coming
+    # after d0
+    u0, d0, d1, u1 = (
+        UncertaintyNode("u0", ""),
+        DecisionNode("d0", ""),
+        DecisionNode("d1", ""),
+        UncertaintyNode("u1", ""),
+    )
+    ID = InfluenceDiagram.from_dict(
+        {
+            "nodes": [u0, d0, d1, u1],
+            "edges": [Edge(d0, d1), Edge(d1, u1), Edge(u0, d1)],
+        }
+    )
+    assert ID.decision_elimination_order() == [d1, d0]
+    assert ID.calculate_partial_order() == [d0, u0, d1, u1]
+
+
+def test_decision_elimination_order_not_acyclic_fail(graph_as_dict, caplog):
+    ID = InfluenceDiagram.from_dict(graph_as_dict)
+    ID.add_edge(Edge(graph_as_dict["nodes"][7], graph_as_dict["nodes"][0]))
+    with pytest.raises(InfluenceDiagramNotAcyclicError):
+        ID.calculate_partial_order()
+    assert [r.msg for r in caplog.records] == ["the influence diagram is not acyclic."]
+
+
 def test_output_branches_from_node_empty_lists(graph_as_dict):
     ID = InfluenceDiagram.from_dict(graph_as_dict)
     uncertainty_node = graph_as_dict["nodes"][0]
@@ -790,6 +875,74 @@ def test_convert_to_decision_tree_simple_order_asymmetry():
         )
 
 
+@pytest.fixture
+def wide_cpt_diagram():
+    """C depends on A, B and the decision D, the axes of its CPT not in the order
+    of its parents; E is independent of its parent A"""
+    rng = np.random.default_rng(0)
+    probability_function = rng.random((4, 2, 3, 2))
+    cpt = DiscreteConditionalProbability(
+        probability_function / probability_function.sum(axis=0),
+        {"C": list("wxyz"), "The B": ["b0", "b1"], "A": list("abc"), "D": ["y", "n"]},
+    )
+    a = UncertaintyNode(
+        "A",
+        "",
+        probabilities=DiscreteUnconditionalProbability(
+            [0.2, 0.3, 0.5], {"A": list("abc")}
+        ),
+    )
+    b = UncertaintyNode(
+        "The B",
+        "",
+        probabilities=DiscreteUnconditionalProbability([0.4, 0.6], {"B": ["b0", "b1"]}),
+    )
+    c = UncertaintyNode("C", "", probabilities=cpt)
+    d = DecisionNode("D", "", alternatives=["y", "n"])
+    e = UncertaintyNode(
+        "E",
+        "",
+        probabilities=DiscreteUnconditionalProbability([0.1, 0.9], {"E": ["e0", "e1"]}),
+    )
+    return InfluenceDiagram.from_dict(
+        {
+            "nodes": [a, b, c, d, e],
+            "edges": [Edge(a, c), Edge(d, c), Edge(b, c), Edge(a, e)],
+        }
+    )
+
+
+def test_to_pyagrum_wide_cpt(wide_cpt_diagram):
+    gum_id = wide_cpt_diagram.to_pyagrum()
+    nodes = {node.shortname: node for node in wide_cpt_diagram.nx}
+    cpt = gum_id.cpt(gum_id.idFromName("C"))
+    assert cpt.names == ("C", "A", "The B", "D")
+    for a, d, b in np.ndindex(3, 2, 2):
+        np.testing.assert_allclose(
+            cpt[{"A": a, "D": d, "The B": b}],
+            nodes["C"].probabilities.get_distribution(
+                A="abc"[a], D="yn"[d], TheB=f"b{b}"
+            ),
+        )
+    np.testing.assert_allclose(
+        gum_id.cpt(gum_id.idFromName("A")).toarray(), [0.2, 0.3, 0.5]
+    )
+    # broadcast over the parent it does not depend on
+    np.testing.assert_allclose(
+        gum_id.cpt(gum_id.idFromName("E")).toarray(), [[0.1, 0.9]] * 3
+    )
+
+
+def test_to_pyagrum_cpt_variable_not_a_parent_fail(wide_cpt_diagram, caplog):
+    nodes = {node.shortname: node for node in wide_cpt_diagram.nx}
+    wide_cpt_diagram.remove_node(nodes["D"])
+    with pytest.raises(ProbabilityFormatError):
+        wide_cpt_diagram.to_pyagrum()
+    assert caplog.records[-1].msg.startswith(
+        "Input probability cannot be used in pyagrum with error:"
+    )
+
+
 def test_to_pyagrum_used_car_buyer_success(copy_testdata_tmpdir, tmp_path):
     copy_testdata_tmpdir(TESTDATA)
     with open(tmp_path / "id_used_car_buyer.json") as f:
@@ -1065,3 +1218,109 @@ def test_to_pyagrum_used_car_buyer_decision_fail(caplog, copy_testdata_tmpdir, t
 #       DT.add_edge(edge)
 
 #   assert ID.convert_to_decision_tree() == DT
+
+
+def test_content_hash(wide_cpt_diagram):
+    content_hash = wide_cpt_diagram.content_hash()
+    assert content_hash == wide_cpt_diagram.copy().content_hash()
+    nodes = {node.shortname: node for node in wide_cpt_diagram.nx}
+    wide_cpt_diagram.add_edge(Edge(nodes["The B"], nodes["E"]))
+    assert wide_cpt_diagram.content_hash() != content_hash
+
+
+def test_remove_edge(graph_as_dict):
+    ID = InfluenceDiagram.from_dict(graph_as_dict)
+    n3, n4, n6 = (graph_as_dict["nodes"][k] for k in (3, 4, 6))
+    assert [n.shortname for n in ID.calculate_partial_order()][3:6] == [
+        "d1",
+        "u4",
+        "d2",
+    ]
+    ID.remove_edge(n3, n6)
+    assert ID.get_parents(n6) == [n4]
+    assert n3 in ID.nx
+    # no longer observed before the second decision
+    assert [n.shortname for n in ID.calculate_partial_order()][3:5] == ["d1", "d2"]
+
+
+def test_prune(graph_as_dict):
+    ID = InfluenceDiagram.from_dict(graph_as_dict)
+    pruned, removed = ID.prune()
+    # the observations of d1 are d-separated from v1 by d1, d2 informs no utility
+    assert [(tail.shortname, head.shortname) for tail, head in removed["arcs"]] == [
+        ("u4", "d2"),
+        ("u1", "d1"),
+        ("u2", "d1"),
+        ("u3", "d1"),
+    ]
+    assert sorted(node.shortname for node in removed["nodes"]) == [
+        "u1",
+        "u2",
+        "u3",
+        "u4",
+        "u6",
+        "u7",
+        "u8",
+    ]
+    assert [n.shortname for n in pruned.calculate_partial_order()] == [
+        "d1",
+        "d2",
+        "u5",
+    ]
+    assert pruned.utility_count == 1
+    # the diagram itself is unchanged
+    assert ID.uncertainty_count == 8
+    assert len(ID.nx.edges) == 10
+
+
+def test_prune_requisite_observation_kept():
+    state = UncertaintyNode("State", "")
+    rumour = UncertaintyNode("Rumour", "")
+    result = UncertaintyNode("Result", "")
+    buy = DecisionNode("Buy", "")
+    value = UtilityNode("Value", "")
+    ID = InfluenceDiagram.from_dict(
+        {
+            "nodes": [state, rumour, result, buy, value],
+            "edges": [
+                Edge(state, result),
+                Edge(result, buy),
+                Edge(rumour, buy),
+                Edge(state, value),
+                Edge(buy, value),
+            ],
+        }
+    )
+    pruned, removed = ID.prune()
+    assert removed == {"nodes": [rumour], "arcs": [(rumour, buy)]}
+    assert pruned.get_parents(buy) == [result]
+
+
+def test_prune_decision_order_kept():
+    d2 = DecisionNode("d2", "")
+    u = UncertaintyNode("u", "")
+    d1 = DecisionNode("d1", "")
+    v = UtilityNode("v", "")
+    ID = InfluenceDiagram.from_dict(
+        {"nodes": [d2, u, d1, v], "edges": [Edge(d1, u), Edge(u, d2), Edge(d2, v)]}
+    )
+    # without the arc from u, d2 would be decided first
+    pruned, removed = ID.prune()
+    assert removed == {"nodes": [], "arcs": []}
+    assert [n.shortname for n in pruned.calculate_partial_order()] == ["d1", "u", "d2"]
+    assert pruned.nx.edges[u, d2]["arc_type"] == ID.nx.edges[u, d2]["arc_type"]
+
+
+def test_prune_without_utility(graph_as_dict):
+    graph_as_dict["nodes"].pop()
+    graph_as_dict["edges"].pop()
+    pruned, removed = InfluenceDiagram.from_dict(graph_as_dict).prune()
+    assert removed == {"nodes": [], "arcs": []}
+    assert pruned.uncertainty_count == 8
+
+
+def test_prune_not_acyclic_fail(graph_as_dict):
+    n4, n5 = graph_as_dict["nodes"][4], graph_as_dict["nodes"][5]
+    graph_as_dict["edges"].append(Edge(n5, n4))
+    with pytest.raises(InfluenceDiagramNotAcyclicError):
+        InfluenceDiagram.from_dict(graph_as_dict).prune()
@@ -0,0 +1,130 @@
+import json
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.v0.models.structure import InfluenceDiagramResponse
+from src.v0.services.structure_utils.decision_diagrams.edge import Edge
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    InfluenceDiagram,
+    InfluenceDiagramNotAcyclicError,
+)
+from src.v0.services.structure_utils.decision_diagrams.monte_carlo import (
+    MonteCarloSimulation,
+    RunningSummary,
+    StrategyError,
+    ValuationError,
+)
+
+TESTDATA = "v0/services/testdata"
+STRATEGY = {"Test": "Test", "Buy": "Buy with guarantee"}
+VALUES = {"State": {"Peach": 1000, "Lemon": -500}, "Test": {"Test": -25}}
+
+
+@pytest.fixture
+def influence_diagram(copy_testdata_tmpdir, tmp_path):
+    copy_testdata_tmpdir(TESTDATA)
+    with open(tmp_path / "id_used_car_buyer.json") as f:
+        json_stream = json.load(f)
+    return InfluenceDiagram.from_db(
+        InfluenceDiagramResponse(
+            vertices=json_stream["vertices"], edges=json_stream["edges"]
+        )
+    )
+
+
+def test_sample(influence_diagram):
+    simulation = MonteCarloSimulation(influence_diagram, STRATEGY, VALUES, seed=0)
+    nodes = {node.shortname: node for node in simulation.nodes}
+    assert list(nodes) == ["State", "Test", "Test Result", "Buy"]
+    states = simulation.sample(100000)
+    assert states[nodes["State"]].mean() == pytest.approx(0.2, abs=0.01)
+    # the test is perfect: the result is the state
+    np.testing.assert_array_equal(
+        states[nodes["Test Result"]], states[nodes["State"]] + 1
+    )
+    assert (states[nodes["Buy"]] == 0).all()
+    value = simulation.value(states, 100000)
+    np.testing.assert_array_equal(np.unique(value), [-525, 975])
+
+    # without the test, no result
+    strategy = {**STRATEGY, "Test": "no Test"}
+    simulation = MonteCarloSimulation(influence_diagram, strategy, {}, seed=0)
+    states = simulation.sample(1000)
+    assert (states[nodes["Test Result"]] == 0).all()
+    assert (simulation.value(states, 1000) == 0).all()
+
+
+def test_run(influence_diagram):
+    simulation = MonteCarloSimulation(influence_diagram, STRATEGY, VALUES, seed=1)
+    summaries = list(simulation.run(250000, 100000, percentiles=[10, 90]))
+    assert [summary["samples"] for summary in summaries] == [100000, 200000, 250000]
+    summary = summaries[-1]
+    low, high = summary["confidence_interval"]
+    assert low < summary["mean"] < high
+    assert low < 0.8 * 1000 - 0.2 * 500 - 25 < high
+    assert (summary["min"], summary["max"]) == (-525, 975)
+    assert summary["percentiles"] == {"10": -525, "90": 975}
+    assert summary["std"] == pytest.approx(600, rel=0.01)
+
+    # reproducible
+    simulation = MonteCarloSimulation(influence_diagram, STRATEGY, VALUES, seed=1)
+    assert list(simulation.run(250000, 100000, percentiles=[10, 90])) == summaries
+
+
+def test_running_summary():
+    values = np.random.default_rng(0).normal(size=(5, 999)).round(2)
+    summary = RunningSummary()
+    for chunk in values:
+        summary.update(chunk)
+    values = values.ravel()
+    data = summary.to_dict([0, 2.5, 50, 100], z=1.96)
+    assert data["samples"] == values.size
+    assert data["mean"] == pytest.approx(values.mean())
+    assert data["std"] == pytest.approx(values.std(ddof=1))
+    assert data["confidence_interval"] == pytest.approx(
+        values.mean() + np.array([-1.96, 1.96]) * values.std(ddof=1) / values.size**0.5
+    )
+    assert data["percentiles"] == {
+        str(q): np.percentile(values, q, method="inverted_cdf")
+        for q in [0, 2.5, 50, 100]
+    }
+    # the distinct values are kept, not the values
+    assert len(summary.distinct) < values.size
+
+    summary = RunningSummary()
+    summary.update(np.array([3.0]))
+    assert summary.to_dict([50], z=1.96)["confidence_interval"] == [3, 3]
+
+
+@pytest.mark.parametrize(
+    "strategy, message",
+    [
+        ({"Test": "Test"}, "no alternative of the decision Buy in the strategy"),
+        ({**STRATEGY, "Buy": "Steal"}, "Steal is not an alternative of Buy"),
+    ],
+)
+def test_strategy_error(influence_diagram, strategy, message):
+    with pytest.raises(StrategyError, match=message):
+        MonteCarloSimulation(influence_diagram, strategy, {})
+
+
+@pytest.mark.parametrize(
+    "values, message",
+    [
+        ({"ut": {"Test": 1}}, "no decision or uncertainty ut to value"),
+        ({"State": {"Plum": 1}}, "Plum is not a state of State"),
+    ],
+)
+def test_valuation_error(influence_diagram, values, message):
+    with pytest.raises(ValuationError, match=message):
+        MonteCarloSimulation(influence_diagram, STRATEGY, values)
+
+
+def test_not_acyclic(influence_diagram):
+    nodes = {node.shortname: node for node in influence_diagram.nx}
+    influence_diagram.add_edge(Edge(nodes["Buy"], nodes["Test"]))
+    assert not nx.is_directed_acyclic_graph(influence_diagram.nx)
+    with pytest.raises(InfluenceDiagramNotAcyclicError):
+        MonteCarloSimulation(influence_diagram, STRATEGY, {})
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from src.v0.models.structure import InfluenceDiagramResponse
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    InfluenceDiagram,
+)
+from src.v0.services.structure_utils.decision_diagrams.pyagrum_cache import (
+    NODE_OVERHEAD_BYTES,
+    PyAgrumCache,
+    estimate_network_size,
+    estimate_size,
+)
+
+TESTDATA = "v0/services/testdata"
+
+
+@pytest.fixture
+def response(copy_testdata_tmpdir, tmp_path):
+    copy_testdata_tmpdir(TESTDATA)
+    with open(tmp_path / "id_used_car_buyer.json") as f:
+        json_stream = json.load(f)
+    return InfluenceDiagramResponse(
+        vertices=json_stream["vertices"], edges=json_stream["edges"]
+    )
+
+
+@pytest.fixture
+def diagrams(response):
+    """three influence diagrams of the same size, but different descriptions"""
+    diagrams = []
+    for k in range(3):
+        response = response.model_copy(deep=True)
+        response.vertices[-1].description = f"Value {k}"
+        diagrams.append(InfluenceDiagram.from_db(response))
+    return diagrams
+
+
+def test_estimate_size(response):
+    gum_id = InfluenceDiagram.from_db(response).to_pyagrum()
+    # State (2), Test Result (3 x 2 x 2), Buy, Test, Value (2 x 3)
+    assert estimate_size(gum_id) == 8 * (2 + 12 + 6) + 5 * NODE_OVERHEAD_BYTES
+
+
+def test_hit_on_unchanged_diagram(response):
+    cache = PyAgrumCache(2**20)
+    gum_id = cache.get(InfluenceDiagram.from_db(response))
+    # read again from the database: other objects, same content
+    assert cache.get(InfluenceDiagram.from_db(response)) is gum_id
+    assert cache.statistics() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "entries": 1,
+        "size_bytes": estimate_size(gum_id),
+        "max_bytes": 2**20,
+    }
+
+
+def test_miss_on_changed_diagram(response):
+    cache = PyAgrumCache(2**20)
+    gum_id = cache.get(InfluenceDiagram.from_db(response))
+    buy = next(vertex for vertex in response.vertices if vertex.shortname == "Buy")
+    buy.alternatives = [*buy.alternatives, "Wait"]
+    changed = cache.get(InfluenceDiagram.from_db(response))
+    assert changed is not gum_id
+    assert changed.variable("Buy").domainSize() == 4
+    assert (cache.hits, cache.misses, len(cache._entries)) == (0, 2, 2)
+
+
+def test_least_recently_used_evicted(diagrams):
+    first, second, third = diagrams
+    size = estimate_size(first.to_pyagrum())
+    cache = PyAgrumCache(2 * size)
+    cache.get(first)
+    cache.get(second)
+    cache.get(first)
+    cache.get(third)
+    assert cache.evictions == 1
+    assert cache.size == 2 * size
+    assert cache.get(first) is cache.get(first)
+    assert cache.misses == 3
+    cache.get(second)
+    assert cache.misses == 4
+    assert cache.evictions == 2
+
+
+def test_larger_than_the_cache_not_cached(response):
+    cache = PyAgrumCache(100)
+    influence_diagram = InfluenceDiagram.from_db(response)
+    assert cache.get(influence_diagram) is not cache.get(influence_diagram)
+    assert (cache.misses, cache.size, cache.evictions) == (2, 0, 0)
+
+
+def test_clear(response):
+    cache = PyAgrumCache(2**20)
+    cache.get(InfluenceDiagram.from_db(response))
+    cache.clear()
+    assert cache.statistics()["entries"] == cache.misses == cache.size == 0
+
+
+def test_network_cached(response):
+    cache = PyAgrumCache(2**20)
+    network = cache.get_network(InfluenceDiagram.from_db(response))
+    # compiled from the cached pyAgrum influence diagram
+    assert cache.get_network(InfluenceDiagram.from_db(response)) is network
+    assert (cache.hits, cache.misses, len(cache._entries)) == (1, 2, 2)
+    gum_id = cache.get(InfluenceDiagram.from_db(response))
+    assert cache.size == estimate_size(gum_id) + estimate_network_size(network)
+    assert estimate_network_size(network) == (
+        8 * network.entries + 3 * NODE_OVERHEAD_BYTES
+    )
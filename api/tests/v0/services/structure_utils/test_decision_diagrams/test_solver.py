@@ -0,0 +1,150 @@
+import json
+import pickle
+
+import numpy as np
+import pyAgrum as gum
+import pytest
+
+from src.v0.models.structure import InfluenceDiagramResponse
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    InfluenceDiagram,
+)
+from src.v0.services.structure_utils.decision_diagrams.solver import (
+    InfluenceDiagramNotSolvable,
+    solve,
+    solve_with_observation,
+    sweep_probability,
+    swept_tables,
+)
+
+TESTDATA = "v0/services/testdata"
+
+
+@pytest.fixture
+def oil_wildcatter():
+    """drill (-100 if dry, 50 if wet) or walk away (0), knowing the test result"""
+    gum_id = gum.InfluenceDiagram()
+    state = gum_id.addChanceNode(gum.LabelizedVariable("State", "", ["Dry", "Wet"]))
+    test = gum_id.addChanceNode(gum.LabelizedVariable("Test", "", ["Dry", "Wet"]))
+    drill = gum_id.addDecisionNode(gum.LabelizedVariable("Drill", "", ["Yes", "No"]))
+    utility = gum_id.addUtilityNode(gum.LabelizedVariable("Profit", "", 1))
+    for tail, head in [(state, test), (test, drill), (state, utility), (drill, utility)]:
+        gum_id.addArc(tail, head)
+    gum_id.cpt(state).fillWith([0.3, 0.7])
+    # P(Test | State), the test being right 90% of the time
+    gum_id.cpt(test)[{"State": "Dry"}] = [0.9, 0.1]
+    gum_id.cpt(test)[{"State": "Wet"}] = [0.1, 0.9]
+    gum_id.utility(utility)[{"State": "Dry", "Drill": "Yes"}] = -100
+    gum_id.utility(utility)[{"State": "Wet", "Drill": "Yes"}] = 50
+    gum_id.utility(utility)[{"State": "Dry", "Drill": "No"}] = 0
+    gum_id.utility(utility)[{"State": "Wet", "Drill": "No"}] = 0
+    return gum_id
+
+
+def test_solve(oil_wildcatter):
+    solution = solve(oil_wildcatter, ["Drill"])
+    # drill when the test is wet: 0.3 * 0.1 * -100 + 0.7 * 0.9 * 50
+    assert solution["expected_utility"] == pytest.approx(28.5)
+    assert solution["policies"] == [
+        {
+            "decision": "Drill",
+            "parents": ["Test"],
+            "rules": [
+                {"parent_states": {"Test": "Dry"}, "alternative": "No"},
+                {"parent_states": {"Test": "Wet"}, "alternative": "Yes"},
+            ],
+        }
+    ]
+
+
+def test_solve_used_car_buyer(copy_testdata_tmpdir, tmp_path):
+    copy_testdata_tmpdir(TESTDATA)
+    with open(tmp_path / "id_used_car_buyer.json") as f:
+        json_stream = json.load(f)
+    influence_diagram = InfluenceDiagram.from_db(
+        InfluenceDiagramResponse(
+            vertices=json_stream["vertices"], edges=json_stream["edges"]
+        )
+    )
+    solution = solve(influence_diagram.to_pyagrum(), ["Test", "Buy"])
+    assert [policy["decision"] for policy in solution["policies"]] == ["Test", "Buy"]
+    assert solution["policies"][0]["rules"] == [
+        {"parent_states": {}, "alternative": "Test"}
+    ]
+    assert [
+        rule["parent_states"]["Test Result"] for rule in solution["policies"][1]["rules"]
+    ] == ["no Test", "Peach", "Lemon"]
+
+
+def test_solve_with_no_forgetting():
+    gum_id = gum.fastID("*D1{a|b}->$U<-*D2{c|d}")
+    solution = solve(gum_id, ["D1", "D2"])
+    # the decisions are made together: the best utility
+    assert solution["expected_utility"] == pytest.approx(
+        gum_id.utility("U").toarray().max()
+    )
+
+
+def test_not_solvable(caplog):
+    gum_id = gum.fastID("*D1{a|b}->$U<-*D2{c|d}")
+    with pytest.raises(InfluenceDiagramNotSolvable) as exc_info:
+        solve(gum_id, [])
+    assert "Some decision nodes are missing" in str(exc_info.value)
+    assert "cannot be solved" in caplog.text
+    # raised in the worker processes and pickled back
+    error = pickle.loads(pickle.dumps(exc_info.value))  # noqa: S301
+    assert str(error) == str(exc_info.value)
+
+
+def test_solve_with_observation(oil_wildcatter):
+    assert solve_with_observation(oil_wildcatter, ["Drill"], None) == pytest.approx(28.5)
+    # drill when wet
+    assert solve_with_observation(oil_wildcatter, ["Drill"], "State") == pytest.approx(
+        35
+    )
+    # already observed
+    assert solve_with_observation(oil_wildcatter, ["Drill"], "Test") == pytest.approx(
+        28.5
+    )
+    assert not oil_wildcatter.existsArc("State", "Drill")
+
+
+def test_solve_with_observation_after_decision():
+    gum_id = gum.fastID("*D{a|b}->C{x|y}->$U<-D")
+    with pytest.raises(InfluenceDiagramNotSolvable):
+        solve_with_observation(gum_id, ["D"], "C")
+
+
+def test_swept_tables():
+    table = np.array([[0.2, 0.3, 0.5], [1.0, 0.0, 0.0]])
+    tables = swept_tables(table, np.array([-0.1, 0.0, 0.2]))
+    assert tables.shape == (3, 3, 2, 3)
+    np.testing.assert_allclose(tables.sum(axis=-1), 1)
+    np.testing.assert_allclose(tables[:, 1], [table] * 3)
+    # the other states scaled, or uniform when they were all 0
+    np.testing.assert_allclose(tables[0, 0], [[0.1, 0.3375, 0.5625], [0.9, 0.05, 0.05]])
+    # clipped
+    np.testing.assert_allclose(tables[1, 2], [[1 / 7, 0.5, 2.5 / 7], [0.8, 0.2, 0.0]])
+    np.testing.assert_allclose(
+        swept_tables(np.array([0.3, 0.7]), np.array([-1.0, 1.0])),
+        [[[0.0, 1.0], [1.0, 0.0]], [[1.0, 0.0], [0.0, 1.0]]],
+    )
+
+
+def test_sweep_probability(oil_wildcatter):
+    policies = solve(oil_wildcatter, ["Drill"])["policies"]
+    state, _ = sweep_probability(
+        oil_wildcatter, ["Drill"], "State", [-0.3, 0.0, 0.3], policies
+    )
+    # never dry: drill whatever the test says
+    assert state["outcome"] == "Dry"
+    np.testing.assert_allclose(state["expected_utilities"], [50, 28.5, 12])
+    assert state["changed_decisions"] == [["Drill"], [], []]
+    # the test right when dry, wrong 40% of the time when wet
+    dry, wet = sweep_probability(oil_wildcatter, ["Drill"], "Test", [0.3], policies)
+    assert (dry["outcome"], wet["outcome"]) == ("Dry", "Wet")
+    np.testing.assert_allclose(dry["expected_utilities"], [0.7 * 0.6 * 50])
+    np.testing.assert_allclose(
+        oil_wildcatter.cpt(oil_wildcatter.idFromName("Test")).toarray(),
+        [[0.9, 0.1], [0.1, 0.9]],
+    )
@@ -0,0 +1,223 @@
+import json
+
+import pytest
+
+from src.v0.models.structure import InfluenceDiagramResponse
+from src.v0.services.structure_utils.decision_diagrams.influence_diagram import (
+    InfluenceDiagram,
+)
+from src.v0.services.structure_utils.decision_diagrams.node import (
+    DecisionNode,
+    UtilityNode,
+)
+from src.v0.services.structure_utils.decision_diagrams.symmetric_decision_tree import (
+    BranchNotFound,
+    SymmetricDecisionTree,
+    TreeIndexError,
+    TreeTooLarge,
+    expand_graph,
+)
+
+TESTDATA = "v0/services/testdata"
+
+
+@pytest.fixture
+def influence_diagram(copy_testdata_tmpdir, tmp_path):
+    copy_testdata_tmpdir(TESTDATA)
+    with open(tmp_path / "id_used_car_buyer.json") as f:
+        json_stream = json.load(f)
+    return InfluenceDiagram.from_db(
+        InfluenceDiagramResponse(
+            vertices=json_stream["vertices"], edges=json_stream["edges"]
+        )
+    )
+
+
+@pytest.fixture
+def tree():
+    return SymmetricDecisionTree(
+        [
+            DecisionNode("d1", "Decision 1", alternatives=["a", "b", "c"]),
+            DecisionNode("d2", "Decision 2", alternatives=["x", "y"]),
+        ]
+    )
+
+
+def without_copied_uuids(tree: dict, root: bool = True) -> dict:
+    """the nodes of the networkx tree are copies of the partial order ones, with new
+    uuids (except the root)"""
+    data = {"id": {k: v for k, v in tree["id"].items() if k != "uuid" or root}}
+    if "children" in tree:
+        data["children"] = [without_copied_uuids(c, False) for c in tree["children"]]
+    return data
+
+
+def test_same_tree_as_networkx_engine(influence_diagram):
+    networkx_tree = json.loads(influence_diagram.convert_to_decision_tree().to_json())
+    decision_tree = influence_diagram.convert_to_symmetric_decision_tree()
+    assert without_copied_uuids(decision_tree.to_dict()) == without_copied_uuids(
+        networkx_tree
+    )
+    assert json.loads(decision_tree.to_json()) == decision_tree.to_dict()
+    assert decision_tree.root is influence_diagram.calculate_partial_order()[0]
+    assert list(decision_tree.nx.nodes) == [decision_tree.root]
+
+
+def test_sizes(tree):
+    assert tree.state_counts == [3, 2, 0]
+    assert tree.level_sizes == [1, 3, 6]
+    assert tree.depth == 2
+    assert tree.node_count == 10
+    assert tree.leaf_count == 6
+    assert [tree.subtree_size(depth) for depth in range(3)] == [10, 3, 1]
+    assert isinstance(tree.root, DecisionNode)
+    assert isinstance(tree.node(2, 5), UtilityNode)
+
+
+def test_mixed_radix_indexing(tree):
+    assert list(tree.children(0, 0)) == [0, 1, 2]
+    assert list(tree.children(1, 2)) == [4, 5]
+    assert list(tree.children(2, 4)) == []
+    assert tree.parent(0, 0) is None
+    assert tree.parent(2, 5) == (1, 2)
+    assert tree.path(2, 5) == [2, 1]
+    assert tree.index([2, 1]) == 5
+    assert [tree.index(tree.path(2, k)) for k in range(6)] == list(range(6))
+    assert tree.node(1, 2) is tree.levels[1]
+
+
+@pytest.mark.parametrize("position", [(3, 0), (-1, 0), (1, 3), (2, 6), (0, -1)], ids=str)
+def test_node_outside_of_the_tree(tree, position):
+    with pytest.raises(TreeIndexError):
+        tree.node(*position)
+
+
+def test_state_outside_of_the_tree(tree):
+    with pytest.raises(TreeIndexError):
+        tree.index([0, 2])
+
+
+def test_to_dict(tree):
+    data = tree.to_dict()
+    assert data["id"]["branch_name"] == ""
+    assert [child["id"]["branch_name"] for child in data["children"]] == list("abc")
+    leaves = data["children"][2]["children"]
+    assert [leaf["id"]["branch_name"] for leaf in leaves] == ["x", "y"]
+    assert "children" not in leaves[0]
+    # the nodes of a level reached through the same branch share their description
+    assert data["children"][0]["children"][0]["id"] is leaves[0]["id"]
+
+
+def test_node_without_states():
+    tree = SymmetricDecisionTree(
+        [DecisionNode("d", "no alternative"), DecisionNode("e", "")]
+    )
+    assert tree.level_sizes == [1, 0, 0]
+    assert tree.node_count == tree.subtree_size(0) == 1
+    assert tree.to_dict() == {"id": tree.node_data(0)}
+
+
+def with_null_children(tree: dict) -> dict:
+    """the leaves of a serialized DecisionTreeResponse have null children"""
+    if "children" not in tree:
+        return {"id": tree["id"], "children": None}
+    return {
+        "id": tree["id"],
+        "children": list(map(with_null_children, tree["children"])),
+    }
+
+
+def test_iter_json(influence_diagram):
+    decision_tree = influence_diagram.convert_to_symmetric_decision_tree().symmetric_tree
+    chunks = list(decision_tree.iter_json(chunk_size=100))
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+    assert json.loads("".join(chunks)) == with_null_children(decision_tree.to_dict())
+
+
+def test_iter_json_encoder(tree):
+    def leaf(branch):
+        return f'{{"id":"ut {branch}","children":null}}'
+
+    def decision(branch):
+        return f'{{"id":"d2 {branch}","children":[{leaf("x")},{leaf("y")}]}}'
+
+    chunks = tree.iter_json(
+        encode=lambda data: f'"{data["shortname"]} {data["branch_name"]}"'
+    )
+    children = ",".join(map(decision, "abc"))
+    assert list(chunks) == [f'{{"id":"d1 ","children":[{children}]}}']
+
+
+def test_find(tree, influence_diagram):
+    assert tree.find("") == []
+    assert tree.find("d1:c/d2:x") == [2, 0]
+    decision_tree = influence_diagram.convert_to_symmetric_decision_tree().symmetric_tree
+    assert decision_tree.find("Test:Test/Test Result:Lemon") == [0, 2]
+
+
+@pytest.mark.parametrize("path", ["d2:x", "d1:d", "d1", "d1:a/d2:x/ut:"])
+def test_find_unknown_branch(tree, path):
+    with pytest.raises(BranchNotFound):
+        tree.find(path)
+
+
+def test_expand(tree):
+    assert tree.subtree_sizes == [10, 3, 1]
+    data = tree.expand([], depth=1)
+    assert data["node_count"] == 10
+    assert [child["node_count"] for child in data["children"]] == [3, 3, 3]
+    assert all("children" not in child for child in data["children"])
+
+    data = tree.expand([1], depth=5)
+    assert data["id"] is tree.node_data(1, 1)
+    assert [leaf["id"]["branch_name"] for leaf in data["children"]] == ["x", "y"]
+    assert data["children"][0] == {"id": tree.node_data(2, 0), "node_count": 1}
+    assert tree.expand([1, 0], depth=0) == {"id": tree.node_data(2, 0), "node_count": 1}
+    with pytest.raises(TreeIndexError):
+        tree.expand([3])
+
+
+def test_expansion_size(tree):
+    assert tree.expansion_size(0) == tree.node_count == 10
+    assert [tree.expansion_size(0, depth) for depth in range(4)] == [1, 4, 10, 10]
+    assert tree.expansion_size(1, 1) == tree.expansion_size(1) == 3
+    assert [tree.expansion_depth(0, size) for size in range(1, 12)] == (
+        [0] * 3 + [1] * 6 + [2] * 2
+    )
+    assert tree.expansion_depth(1, 3) == 1
+
+
+def test_check_size(tree):
+    tree.check_size(10)
+    tree.check_size(4, depth=1)
+    with pytest.raises(TreeTooLarge) as exc_info:
+        tree.check_size(9)
+    assert (exc_info.value.node_count, exc_info.value.max_node_count) == (10, 9)
+    assert str(exc_info.value) == (
+        "decision tree of 10 nodes, more than the maximum of 9"
+    )
+
+
+def test_to_graph(tree):
+    graph = tree.to_graph()
+    assert graph["root"] == "0.0"
+    assert graph["node_count"] == 10
+    assert list(graph["nodes"]) == ["0.0", "1.0", "1.1", "1.2", "2.0", "2.1"]
+    assert graph["nodes"]["1.2"] == {
+        "id": tree.node_data(1, 2),
+        "children": ["2.0", "2.1"],
+    }
+    assert graph["nodes"]["2.1"] == {"id": tree.node_data(2, 1)}
+
+
+def test_expand_graph(tree, influence_diagram):
+    data = expand_graph(tree.to_graph())
+    assert data == tree.to_dict()
+    # the identical subtrees are shared
+    assert data["children"][0]["children"][1] is data["children"][2]["children"][1]
+
+    decision_tree = influence_diagram.convert_to_symmetric_decision_tree().symmetric_tree
+    graph = json.loads(json.dumps(decision_tree.to_graph()))
+    assert len(graph["nodes"]) == 1 + 2 + 3 + 3 + 2
+    assert expand_graph(graph) == decision_tree.to_dict()
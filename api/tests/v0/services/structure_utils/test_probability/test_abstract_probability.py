@@ -42,5 +42,8 @@ def test_class_ProbabilityABC(monkeypatch):
     with pytest.raises(NotImplementedError):
         abstract_probability.to_pyagrum()
 
+    with pytest.raises(NotImplementedError):
+        abstract_probability.to_pyagrum_array(["A"])
+
     with pytest.raises(NotImplementedError):
         abstract_probability.to_pycid()
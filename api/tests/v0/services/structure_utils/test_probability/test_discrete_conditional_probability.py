@@ -200,6 +200,17 @@ def test_to_pyagrum_3d(cpt_3d):
     assert result == target
 
 
+def test_to_pyagrum_array(cpt_3d):
+    result = cpt_3d.to_pyagrum_array(["Test Result", "State", "Test"])
+    assert result.shape == (3, 2, 2)
+    np.testing.assert_equal(result[:, 1, 0], [0.05, 0.35, 0.60])
+    result = cpt_3d.to_pyagrum_array(["Test Result", "Test", "Other", "State"])
+    assert result.shape == (3, 2, 1, 2)
+    np.testing.assert_equal(result[:, 0, 0, 1], [0.05, 0.35, 0.60])
+    with pytest.raises(ValueError):
+        cpt_3d.to_pyagrum_array(["Test Result", "Test"])
+
+
 def test_to_pycid(cpt_2d):
     with pytest.raises(NotImplementedError):
         cpt_2d.to_pycid()
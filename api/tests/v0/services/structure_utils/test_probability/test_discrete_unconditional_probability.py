@@ -4,6 +4,7 @@ import xarray as xr
 
 from src.v0.models.issue import ProbabilityData
 from src.v0.services.structure_utils.probability.discrete_unconditional_probability import (  # noqa: E501
+    AgrumConversionError,
     DiscreteUnconditionalProbability,
 )
 
@@ -201,6 +202,14 @@ def test_to_pyagrum_1d_failed(cpt_2d):
     assert str(exc.value) == "pyAgrum only takes 1D variables in UncertaintyNode"
 
 
+def test_to_pyagrum_array(cpt_1d, cpt_2d):
+    np.testing.assert_equal(cpt_1d.to_pyagrum_array(["A"]), [0.3, 0.5, 0.2])
+    result = cpt_1d.to_pyagrum_array(["A", "B", "C"])
+    assert result.shape == (3, 1, 1)
+    with pytest.raises(AgrumConversionError):
+        cpt_2d.to_pyagrum_array(["A"])
+
+
 def test_to_pycid(cpt_2d):
     with pytest.raises(NotImplementedError):
         cpt_2d.to_pycid()
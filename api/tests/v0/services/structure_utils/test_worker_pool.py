@@ -0,0 +1,77 @@
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.v0.services.structure_utils.worker_pool import WorkerPool, WorkerTimeout
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(max_workers=1)
+    yield pool
+    pool.close()
+
+
+def test_run(pool):
+    assert not pool.is_open
+    assert pool.run(divmod, 7, 2, timeout=60) == (3, 1)
+    assert pool.is_open
+    with pytest.raises(ZeroDivisionError):
+        pool.run(divmod, 7, 0)
+
+
+def test_timeout(pool):
+    with pytest.raises(WorkerTimeout) as exc_info:
+        pool.run(time.sleep, 5, timeout=0.1)
+    assert exc_info.value.timeout == 0.1
+    assert str(exc_info.value) == "computation not finished after 0.1 seconds"
+
+
+def test_dead_worker(pool):
+    pool.open()
+    executor = pool._executor
+    with pytest.raises(BrokenProcessPool):
+        pool.run(os._exit, 1, timeout=60)
+    assert not pool.is_open
+    # a new pool for the next computations
+    assert pool.run(abs, -1, timeout=60) == 1
+    assert pool._executor is not executor
+    # a pool already replaced is not discarded
+    pool._invalidate(executor)
+    assert pool.is_open
+
+
+def test_close(pool):
+    pool.close()
+    pool.open()
+    pool.close()
+    assert not pool.is_open
+
+
+def test_map(pool):
+    assert pool.map(divmod, [(7, 2), (9, 4), (1, 1)], timeout=60) == [
+        (3, 1),
+        (2, 1),
+        (1, 0),
+    ]
+    assert pool.map(abs, []) == []
+
+
+def test_map_max_workers():
+    pool = WorkerPool(max_workers=2)
+    try:
+        start = time.monotonic()
+        pool.map(time.sleep, [(0.5,), (0.5,)], timeout=60)
+        parallel = time.monotonic() - start
+        start = time.monotonic()
+        pool.map(time.sleep, [(0.5,), (0.5,)], max_workers=1, timeout=60)
+        assert time.monotonic() - start >= 1.0 > parallel
+    finally:
+        pool.close()
+
+
+def test_map_timeout(pool):
+    with pytest.raises(WorkerTimeout):
+        pool.map(time.sleep, [(5,), (5,)], timeout=0.1)
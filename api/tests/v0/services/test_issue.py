@@ -3,50 +3,26 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.v0.database.gremlin import (
-    Builder,
-    GremlinClient,
-    GremlinResponseBuilderEdge,
-    GremlinResponseBuilderVertex,
-    GremlinStringQueryBuilderEdge,
-    GremlinStringQueryBuilderVertex,
-    Query,
-    Response,
-)
 from src.v0.models.filter import Filter
 from src.v0.models.issue import IssueCreate, IssueResponse, IssueUpdate
 from src.v0.models.meta import EdgeMetaDataResponse
-from src.v0.repositories.issue import IssueRepository
-from src.v0.services.issue import IssueService
+from src.v0.repositories.issue import AsyncIssueRepository
+from src.v0.services.issue import AsyncIssueService
 
 
 @pytest.fixture
-def mock_client():
-    # Create a mock client
-    mock_client = MagicMock(spec=GremlinClient)
-    mock_client.__enter__.return_value = mock_client
-
-    # Create mock builder and its components
-    mock_builder = MagicMock(spec=Builder)
-    mock_query = MagicMock(spec=Query)
-    mock_response = MagicMock(spec=Response)
-    mock_query.vertex = GremlinStringQueryBuilderVertex()
-    mock_query.edge = GremlinStringQueryBuilderEdge()
-    mock_response.vertex = GremlinResponseBuilderVertex()
-    mock_response.edge = GremlinResponseBuilderEdge()
-
-    # Set up the builder's query and response
-    mock_builder.query = mock_query
-    mock_builder.response = mock_response
-    mock_client.builder = mock_builder
-
-    return mock_client
+def mock_edge_repository():
+    with patch(
+        "src.v0.services.issue.AsyncEdgeRepository", autospec=True
+    ) as MockEdgeRepository:
+        yield MockEdgeRepository.return_value
 
 
 @pytest.fixture
-def mock_edge_repository():
-    with patch("src.v0.services.issue.EdgeRepository") as MockEdgeRepository:
-        yield MockEdgeRepository
+def mock_repository():
+    mock_repository = MagicMock(spec=AsyncIssueRepository)
+    mock_repository._client = MagicMock()
+    return mock_repository
 
 
 @pytest.fixture
@@ -83,58 +59,33 @@ def issue():
     return IssueResponse.model_validate({**data, **metadata})
 
 
-def test_create_success(mock_client):
-    mock_repository = MagicMock(spec=IssueRepository)
-    service = IssueService(mock_client)
-    service.repository = mock_repository
+@pytest.mark.asyncio
+async def test_crud(mock_repository):
+    service = AsyncIssueService(mock_repository)
 
-    service.create(
-        project_uuid="1",
-        issue_data=IssueCreate(description="A description", tag=["tag1", "tag2"]),
+    await service.create(
+        project_uuid="0", issue_data=IssueCreate(description="an issue")
     )
-    mock_repository.create.assert_called_once()
-
-
-def test_read_issues_all_success(mock_client):
-    mock_repository = MagicMock(spec=IssueRepository)
-    service = IssueService(mock_client)
-    service.repository = mock_repository
-
-    service.read_issues_all(
-        project_uuid="1",
+    mock_repository.create.assert_awaited_once()
+    await service.read_issues_all(project_uuid="0", filter_model=Filter())
+    mock_repository.read_issues_all.assert_awaited_once_with(
+        project_uuid="0",
+        vertex_label="issue",
+        edge_label="contains",
         filter_model=Filter(),
     )
-    mock_repository.read_issues_all.assert_called_once()
-
-
-def test_read_success(mock_client):
-    mock_repository = MagicMock(spec=IssueRepository)
-    service = IssueService(mock_client)
-    service.repository = mock_repository
-
-    service.read(issue_uuid="1")
-    mock_repository.read.assert_called_once()
-
-
-def test_update_success(mock_client):
-    mock_repository = MagicMock(spec=IssueRepository)
-    service = IssueService(mock_client)
-    service.repository = mock_repository
-
-    service.update(issue_uuid="1", modified_fields=IssueUpdate(description="D"))
-    mock_repository.update.assert_called_once()
+    await service.read(issue_uuid="1")
+    mock_repository.read.assert_awaited_once_with("1")
+    await service.update(issue_uuid="1", modified_fields=IssueUpdate())
+    mock_repository.update.assert_awaited_once()
+    await service.delete(issue_uuid="1")
+    mock_repository.delete.assert_awaited_once_with("1")
 
 
-def test_delete_success(mock_client):
-    mock_repository = MagicMock(spec=IssueRepository)
-    service = IssueService(mock_client)
-    service.repository = mock_repository
-
-    service.delete(issue_uuid="1")
-    mock_repository.delete.assert_called_once()
-
-
-def test_merge_src_merged_check_success(mock_client, mock_edge_repository, issue):
+@pytest.mark.asyncio
+async def test_merge_src_merged_check_success(
+    mock_repository, mock_edge_repository, issue
+):
     src_issue = deepcopy(issue)
     src_issue.shortname = "src"
     src_issue.uuid = "1"
@@ -153,25 +104,20 @@ def test_merge_src_merged_check_success(mock_client, mock_edge_repository, issue
     }
     merged_issue_data.comments = src_issue.comments + dst_issue.comments
 
-    mock_repository = MagicMock(spec=IssueRepository)
-    mock_repository._client = mock_client
-    service = IssueService(mock_client)
-    service.repository = mock_repository
-    mock_edge_repository.return_value.read_in_edge_to_vertex.side_effect = [
+    service = AsyncIssueService(mock_repository)
+    mock_edge_repository.read_in_edge_to_vertex.side_effect = [
         ["src"],
         [],
         [EdgeMetaDataResponse(uuid="123")],
     ]
     mock_repository.update.return_value = merged_issue_data
 
-    service.merge(project_uuid="0", source_issue=src_issue, destination_issue=dst_issue)
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
-        "1", "merged_into"
-    )
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
-        "2", "merged_into"
+    await service.merge(
+        project_uuid="0", source_issue=src_issue, destination_issue=dst_issue
     )
-    mock_repository.update.assert_called_once_with(
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await("1", "merged_into")
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await("2", "merged_into")
+    mock_repository.update.assert_awaited_once_with(
         src_issue.uuid,
         IssueCreate.model_validate(
             {
@@ -182,16 +128,19 @@ def test_merge_src_merged_check_success(mock_client, mock_edge_repository, issue
             }
         ),
     )
-    mock_edge_repository.return_value.create.assert_any_call(
+    mock_edge_repository.create.assert_any_await(
         out_vertex_uuid="2", in_vertex_uuid="5", edge_label="merged_into"
     )
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await(
         vertex_uuid="2", edge_label="contains"
     )
-    mock_edge_repository.return_value.delete.assert_called_once_with(edge_uuid="123")
+    mock_edge_repository.delete.assert_awaited_once_with(edge_uuid="123")
 
 
-def test_merge_dst_merged_check_success(mock_client, mock_edge_repository, issue):
+@pytest.mark.asyncio
+async def test_merge_dst_merged_check_success(
+    mock_repository, mock_edge_repository, issue
+):
     src_issue = deepcopy(issue)
     src_issue.shortname = "src"
     src_issue.uuid = "1"
@@ -210,25 +159,20 @@ def test_merge_dst_merged_check_success(mock_client, mock_edge_repository, issue
     }
     merged_issue_data.comments = src_issue.comments + dst_issue.comments
 
-    mock_repository = MagicMock(spec=IssueRepository)
-    mock_repository._client = mock_client
-    service = IssueService(mock_client)
-    service.repository = mock_repository
-    mock_edge_repository.return_value.read_in_edge_to_vertex.side_effect = [
+    service = AsyncIssueService(mock_repository)
+    mock_edge_repository.read_in_edge_to_vertex.side_effect = [
         [],
         ["dst"],
         [EdgeMetaDataResponse(uuid="123")],
     ]
     mock_repository.update.return_value = merged_issue_data
 
-    service.merge(project_uuid="0", source_issue=src_issue, destination_issue=dst_issue)
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
-        "1", "merged_into"
-    )
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
-        "2", "merged_into"
+    await service.merge(
+        project_uuid="0", source_issue=src_issue, destination_issue=dst_issue
     )
-    mock_repository.update.assert_called_once_with(
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await("1", "merged_into")
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await("2", "merged_into")
+    mock_repository.update.assert_awaited_once_with(
         dst_issue.uuid,
         IssueCreate.model_validate(
             {
@@ -239,17 +183,18 @@ def test_merge_dst_merged_check_success(mock_client, mock_edge_repository, issue
             }
         ),
     )
-    mock_edge_repository.return_value.create.assert_any_call(
+    mock_edge_repository.create.assert_any_await(
         out_vertex_uuid="1", in_vertex_uuid="5", edge_label="merged_into"
     )
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await(
         vertex_uuid="1", edge_label="contains"
     )
-    mock_edge_repository.return_value.delete.assert_called_once_with(edge_uuid="123")
+    mock_edge_repository.delete.assert_awaited_once_with(edge_uuid="123")
 
 
-def test_merge_no_src_no_dst_merged_check_success(
-    mock_client, mock_edge_repository, issue
+@pytest.mark.asyncio
+async def test_merge_no_src_no_dst_merged_check_success(
+    mock_repository, mock_edge_repository, issue
 ):
     src_issue = deepcopy(issue)
     src_issue.shortname = "src"
@@ -269,11 +214,8 @@ def test_merge_no_src_no_dst_merged_check_success(
     }
     merged_issue_data.comments = src_issue.comments + dst_issue.comments
 
-    mock_repository = MagicMock(spec=IssueRepository)
-    mock_repository._client = mock_client
-    service = IssueService(mock_client)
-    service.repository = mock_repository
-    mock_edge_repository.return_value.read_in_edge_to_vertex.side_effect = [
+    service = AsyncIssueService(mock_repository)
+    mock_edge_repository.read_in_edge_to_vertex.side_effect = [
         [],
         [],
         [EdgeMetaDataResponse(uuid="123")],
@@ -281,14 +223,12 @@ def test_merge_no_src_no_dst_merged_check_success(
     ]
     mock_repository.create.return_value = merged_issue_data
 
-    service.merge(project_uuid="0", source_issue=src_issue, destination_issue=dst_issue)
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
-        "1", "merged_into"
-    )
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
-        "2", "merged_into"
+    await service.merge(
+        project_uuid="0", source_issue=src_issue, destination_issue=dst_issue
     )
-    mock_repository.create.assert_called_once_with(
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await("1", "merged_into")
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await("2", "merged_into")
+    mock_repository.create.assert_awaited_once_with(
         project_uuid="0",
         issue_data=IssueCreate.model_validate(
             {
@@ -299,40 +239,48 @@ def test_merge_no_src_no_dst_merged_check_success(
             }
         ),
     )
-    mock_edge_repository.return_value.create.assert_any_call(
+    mock_edge_repository.create.assert_any_await(
         out_vertex_uuid="1", in_vertex_uuid="5", edge_label="merged_into"
     )
-    mock_edge_repository.return_value.create.assert_any_call(
+    mock_edge_repository.create.assert_any_await(
         out_vertex_uuid="2", in_vertex_uuid="5", edge_label="merged_into"
     )
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await(
         vertex_uuid="1", edge_label="contains"
     )
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_any_call(
+    mock_edge_repository.read_in_edge_to_vertex.assert_any_await(
         vertex_uuid="2", edge_label="contains"
     )
-    mock_edge_repository.return_value.delete.assert_any_call(edge_uuid="123")
-    mock_edge_repository.return_value.delete.assert_any_call(edge_uuid="124")
+    mock_edge_repository.delete.assert_any_await(edge_uuid="123")
+    mock_edge_repository.delete.assert_any_await(edge_uuid="124")
 
 
-def test_unmerge_success(mock_client, mock_edge_repository):
-    mock_repository = MagicMock(spec=IssueRepository)
-    mock_repository._client = mock_client
-    service = IssueService(mock_client)
-    service.repository = mock_repository
-    mock_edge_repository.return_value.read_in_edge_to_vertex.return_value = [
+@pytest.mark.asyncio
+async def test_unmerge_success(mock_repository, mock_edge_repository):
+    service = AsyncIssueService(mock_repository)
+    mock_edge_repository.read_in_edge_to_vertex.return_value = [
         MagicMock(outV="1"),
         MagicMock(outV="2"),
     ]
 
-    service.un_merge(project_uuid="0", merged_issue_uuid="1")
-    mock_edge_repository.return_value.read_in_edge_to_vertex.assert_called_once_with(
+    await service.un_merge(project_uuid="0", merged_issue_uuid="1")
+    mock_edge_repository.read_in_edge_to_vertex.assert_awaited_once_with(
         "1", "merged_into"
     )
-    mock_edge_repository.return_value.create.assert_any_call(
+    mock_edge_repository.create.assert_any_await(
         out_vertex_uuid="0", in_vertex_uuid="1", edge_label="contains"
     )
-    mock_edge_repository.return_value.create.assert_any_call(
+    mock_edge_repository.create.assert_any_await(
         out_vertex_uuid="0", in_vertex_uuid="2", edge_label="contains"
     )
-    mock_repository.delete.assert_called_once_with("1")
+    mock_repository.delete.assert_awaited_once_with("1")
+
+
+@pytest.mark.asyncio
+async def test_unmerge_not_merged(mock_repository, mock_edge_repository):
+    mock_edge_repository.read_in_edge_to_vertex.return_value = []
+    service = AsyncIssueService(mock_repository)
+
+    assert await service.un_merge(project_uuid="0", merged_issue_uuid="1") == []
+    mock_edge_repository.create.assert_not_awaited()
+    mock_repository.delete.assert_not_awaited()
@@ -2,104 +2,43 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from src.v0.database.gremlin import (
-    Builder,
-    GremlinClient,
-    GremlinResponseBuilderEdge,
-    GremlinResponseBuilderVertex,
-    GremlinStringQueryBuilderEdge,
-    GremlinStringQueryBuilderVertex,
-    Query,
-    Response,
-)
 from src.v0.models.project import ProjectCreate, ProjectUpdate
-from src.v0.repositories.project import ProjectRepository
-from src.v0.services.project import ProjectService
-
-
-@pytest.fixture
-def mock_client():
-    # Create a mock client
-    mock_client = MagicMock(spec=GremlinClient)
-    mock_client.__enter__.return_value = mock_client
-
-    # Create mock builder and its components
-    mock_builder = MagicMock(spec=Builder)
-    mock_query = MagicMock(spec=Query)
-    mock_response = MagicMock(spec=Response)
-    mock_query.vertex = GremlinStringQueryBuilderVertex()
-    mock_query.edge = GremlinStringQueryBuilderEdge()
-    mock_response.vertex = GremlinResponseBuilderVertex()
-    mock_response.edge = GremlinResponseBuilderEdge()
-
-    # Set up the builder's query and response
-    mock_builder.query = mock_query
-    mock_builder.response = mock_response
-    mock_client.builder = mock_builder
-
-    return mock_client
-
-
-def test_create_success(mock_client):
-    mock_repository = MagicMock(spec=ProjectRepository)
-    service = ProjectService(mock_client)
-    service.repository = mock_repository
-
-    service.create(
-        project_data=ProjectCreate(name="A description"),
-    )
-    mock_repository.create.assert_called_once()
-
-
-def test_read_projects_all_success(mock_client):
-    mock_repository = MagicMock(spec=ProjectRepository)
-    service = ProjectService(mock_client)
-    service.repository = mock_repository
-
-    service.read_projects_all()
-    mock_repository.all.assert_called_once()
-
-
-def test_read_success(mock_client):
-    mock_repository = MagicMock(spec=ProjectRepository)
-    service = ProjectService(mock_client)
-    service.repository = mock_repository
-
-    service.read(project_uuid="1")
-    mock_repository.read.assert_called_once()
-
-
-def test_export_project_success(mock_client):
-    mock_repository = MagicMock(spec=ProjectRepository)
-    service = ProjectService(mock_client)
-    service.repository = mock_repository
-
-    service.export_project(project_uuid="1")
-    mock_repository.export_project.assert_called_once()
-
-
-def test_import_project_success(mock_client):
-    mock_repository = MagicMock(spec=ProjectRepository)
-    service = ProjectService(mock_client)
-    service.repository = mock_repository
-
-    service.import_project(project_json={})
-    mock_repository.import_project.assert_called_once()
-
+from src.v0.repositories.project import AsyncProjectRepository
+from src.v0.services.project import AsyncProjectService
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, repository_method, args",
+    [
+        ("create", "create", (ProjectCreate(name="Project"),)),
+        ("read_projects_all", "all", ()),
+        ("read", "read", ("1",)),
+        ("export_project", "export_project", ("1",)),
+        ("import_project", "import_project", ({"vertices": {}, "edges": []},)),
+        ("update", "update", ("1", ProjectUpdate(description="new Description"))),
+        ("delete", "delete", ("1",)),
+    ],
+)
+async def test_async_service(method, repository_method, args):
+    mock_repository = MagicMock(spec=AsyncProjectRepository)
+    service = AsyncProjectService(mock_repository)
 
-def test_delete_success(mock_client):
-    mock_repository = MagicMock(spec=ProjectRepository)
-    service = ProjectService(mock_client)
-    service.repository = mock_repository
+    await getattr(service, method)(*args)
+    getattr(mock_repository, repository_method).assert_awaited_once_with(*args)
 
-    service.delete(project_uuid="1")
-    mock_repository.delete.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_async_stream_project():
+    async def stream_project(project_uuid):
+        yield {"project": {"id": project_uuid}}
+        yield {"edges": {"id": "2"}}
 
-def test_update_success(mock_client):
-    mock_repository = MagicMock(spec=ProjectRepository)
-    service = ProjectService(mock_client)
-    service.repository = mock_repository
+    mock_repository = MagicMock(spec=AsyncProjectRepository)
+    mock_repository.stream_project = stream_project
+    service = AsyncProjectService(mock_repository)
 
-    service.update(project_uuid="1", modified_fields=ProjectUpdate(name="New"))
-    mock_repository.update.assert_called_once()
+    assert [line async for line in service.stream_project("1")] == [
+        '{"project": {"id": "1"}}\n',
+        '{"edges": {"id": "2"}}\n',
+    ]
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,9 +15,40 @@ from src.v0.database.gremlin import (
 )
 from src.v0.models.edge import EdgeResponse
 from src.v0.models.issue import IssueResponse
-from src.v0.models.structure import InfluenceDiagramResponse
-from src.v0.repositories.vertex import VertexRepository
+from src.v0.models.structure import (
+    DecisionGraphResponse,
+    DecisionTreeExpansionResponse,
+    DecisionTreeResponse,
+    InfluenceDiagramResponse,
+    InfluenceDiagramSolution,
+    MonteCarloRequest,
+    PosteriorRequest,
+    PosteriorResponse,
+    PruningReport,
+    SensitivityResponse,
+    ValueOfInformationResponse,
+)
+from src.v0.repositories.structure import StructureRepository
 from src.v0.services.structure import StructureService
+from src.v0.services.structure_utils.decision_diagrams.chance_network import (
+    EvidenceError,
+)
+from src.v0.services.structure_utils.decision_diagrams.monte_carlo import (
+    StrategyError,
+)
+from src.v0.services.structure_utils.decision_diagrams.pyagrum_cache import (
+    PyAgrumCache,
+)
+from src.v0.services.structure_utils.decision_diagrams.solver import (
+    solve,
+    solve_with_observation,
+    sweep_probability,
+)
+from src.v0.services.structure_utils.decision_diagrams.symmetric_decision_tree import (
+    TreeTooLarge,
+    expand_graph,
+)
+from src.v0.services.structure_utils.worker_pool import WorkerPool, WorkerTimeout
 
 
 @pytest.fixture
@@ -42,12 +74,6 @@ def mock_client():
     return mock_client
 
 
-@pytest.fixture
-def mock_edge_repository():
-    with patch("src.v0.services.structure.EdgeRepository") as MockEdgeRepository:
-        yield MockEdgeRepository
-
-
 @pytest.fixture
 def graph():
     uncertainty = {
@@ -122,47 +148,16 @@ def graph():
     return data
 
 
-def test_read_influence_diagram_success(mock_client, mock_edge_repository, graph):
-    vertices = [
-        [IssueResponse.model_validate(graph[0])],
-        [IssueResponse.model_validate(graph[1])],
-        [IssueResponse.model_validate(graph[2])],
-    ]
-    edges = [
-        EdgeResponse(
-            uuid="101",
-            id="101",
-            outV="11-aa",
-            inV="22-bb",
-            label="influences",
-        ),
-        EdgeResponse(
-            uuid="102",
-            id="102",
-            outV="22-bb",
-            inV="33-cc",
-            label="influences",
-        ),
-    ]
-
-    mock_repository = MagicMock(spec=VertexRepository)
-    mock_repository._client = mock_client
-    service = StructureService(mock_client)
-    service.repository = mock_repository
-    mock_repository.read_out_vertex.side_effect = [
-        vertices[0],
-        [],
-        vertices[1],
-        [],
-        vertices[2],
-        [],
-    ]
-    mock_edge_repository.return_value.read_all_edges_from_sub_project.return_value = (
-        edges
+def test_read_influence_diagram_success(graph):
+    mock_repository = MagicMock(spec=StructureRepository)
+    mock_repository.read_influence_diagram.return_value = InfluenceDiagramResponse(
+        vertices=[IssueResponse.model_validate(vertex) for vertex in graph], edges=[]
     )
+    service = StructureService(mock_repository)
 
     result = service.read_influence_diagram(project_uuid="0")
     assert isinstance(result, InfluenceDiagramResponse)
+    mock_repository.read_influence_diagram.assert_called_once_with("0")
 
 
 def test_create_decision_tree_success(mock_client, graph):
@@ -188,7 +183,7 @@ def test_create_decision_tree_success(mock_client, graph):
         ),
     ]
 
-    mock_repository = MagicMock(spec=VertexRepository)
+    mock_repository = MagicMock(spec=StructureRepository)
     mock_repository._client = mock_client
     service = StructureService(mock_client)
     service.repository = mock_repository
@@ -216,3 +211,392 @@ def test_create_decision_tree_success(mock_client, graph):
         "utility": None,
         "uuid": "11-aa",
     }
+
+
+@pytest.fixture
+def mock_repository(graph):
+    """repository of a decision tree of 13 nodes"""
+    mock_repository = MagicMock(spec=StructureRepository)
+    mock_repository.read_influence_diagram.return_value = InfluenceDiagramResponse(
+        vertices=[IssueResponse.model_validate(vertex) for vertex in graph],
+        edges=[
+            EdgeResponse(
+                uuid="101", id="101", outV="11-aa", inV="22-bb", label="influences"
+            )
+        ],
+    )
+    return mock_repository
+
+
+def test_stream_decision_tree_success(mock_repository):
+    service = StructureService(mock_repository)
+
+    chunks = service.stream_decision_tree(project_uuid="0")
+    mock_repository.read_influence_diagram.assert_called_once_with("0")
+    streamed = "".join(chunks)
+    expected = service.create_decision_tree(project_uuid="0")
+    # each conversion creates a utility node of its own uuid for the leaves
+    leaf = expected.children[0].children[0].id
+    assert leaf.node_type == "UtilityNode"
+    streamed_leaf = DecisionTreeResponse.model_validate_json(streamed).children[0]
+    assert streamed == expected.model_dump_json().replace(
+        leaf.uuid, streamed_leaf.children[0].id.uuid
+    )
+
+
+def test_expand_decision_tree_success(mock_repository):
+    service = StructureService(mock_repository)
+
+    result = service.expand_decision_tree(project_uuid="0", path="Issue ABC:out2-in1")
+    mock_repository.read_influence_diagram.assert_called_once_with("0")
+    assert isinstance(result, DecisionTreeExpansionResponse)
+    assert result.id.branch_name == "out2-in1"
+    assert result.node_count == 3
+    assert [child.node_count for child in result.children] == [1, 1]
+    assert result.children[0].children is None
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("create_decision_tree", {}),
+        ("stream_decision_tree", {}),
+        ("expand_decision_tree", {"depth": 2}),
+        ("expand_decision_tree", {"path": "Issue ABC:out1-in1", "depth": 1}),
+    ],
+)
+def test_decision_tree_too_large(mock_repository, method, kwargs):
+    service = StructureService(mock_repository, max_node_count=2)
+    with pytest.raises(TreeTooLarge):
+        getattr(service, method)(project_uuid="0", **kwargs)
+
+
+def test_truncated_decision_tree(mock_repository):
+    service = StructureService(mock_repository, max_node_count=12)
+    result = service.expand_decision_tree(project_uuid="0", depth=None)
+    assert result.node_count == 13
+    assert len(result.children) == 4
+    assert all(child.children is None for child in result.children)
+    assert [child.node_count for child in result.children] == [3] * 4
+
+
+def test_create_decision_graph_success(mock_repository):
+    service = StructureService(mock_repository, max_node_count=2)
+    result = service.create_decision_graph(project_uuid="0")
+    mock_repository.read_influence_diagram.assert_called_once_with("0")
+    assert isinstance(result, DecisionGraphResponse)
+    assert result.node_count == 13
+    assert len(result.nodes) == 1 + 4 + 2
+    tree = DecisionTreeResponse.model_validate(expand_graph(result.model_dump()))
+    assert len(tree.children) == 4
+    assert tree.children[3].children[1].id.branch_name == "no"
+
+
+@pytest.fixture
+def used_car_buyer_repository(copy_testdata_tmpdir, tmp_path):
+    copy_testdata_tmpdir("v0/services/testdata")
+    with open(tmp_path / "id_used_car_buyer.json") as f:
+        json_stream = json.load(f)
+    mock_repository = MagicMock(spec=StructureRepository)
+    mock_repository.read_influence_diagram.return_value = InfluenceDiagramResponse(
+        vertices=json_stream["vertices"], edges=json_stream["edges"]
+    )
+    return mock_repository
+
+
+def test_compile_influence_diagram_cached(used_car_buyer_repository):
+    mock_repository = used_car_buyer_repository
+    cache = PyAgrumCache(2**20)
+    service = StructureService(mock_repository, cache=cache)
+
+    gum_id = service.compile_influence_diagram(project_uuid="0")
+    assert service.compile_influence_diagram(project_uuid="0") is gum_id
+    assert mock_repository.read_influence_diagram.call_count == 2
+    statistics = cache.statistics()
+    assert (statistics["hits"], statistics["misses"], statistics["entries"]) == (1, 1, 1)
+
+
+def test_solve_influence_diagram_success(used_car_buyer_repository):
+    cache = PyAgrumCache(2**20)
+    worker_pool = MagicMock(spec=WorkerPool)
+    worker_pool.run.side_effect = lambda func, *args, timeout: func(*args)
+    service = StructureService(
+        used_car_buyer_repository,
+        cache=cache,
+        worker_pool=worker_pool,
+        solve_timeout=5,
+    )
+
+    result = service.solve_influence_diagram(project_uuid="0")
+    assert isinstance(result, InfluenceDiagramSolution)
+    assert [policy.decision for policy in result.policies] == ["Test", "Buy"]
+    func, gum_id, decision_order = worker_pool.run.call_args.args
+    assert func is solve
+    assert gum_id is service.compile_influence_diagram(project_uuid="0")
+    assert decision_order == ["Test", "Buy"]
+    assert worker_pool.run.call_args.kwargs == {"timeout": 5}
+
+
+def test_value_of_information_success(used_car_buyer_repository):
+    worker_pool = MagicMock(spec=WorkerPool)
+    worker_pool.map.side_effect = lambda func, arguments, **kwargs: [
+        func(*args) for args in arguments
+    ]
+    service = StructureService(
+        used_car_buyer_repository,
+        cache=PyAgrumCache(2**20),
+        worker_pool=worker_pool,
+        analysis_cpu_budget=3,
+        analysis_timeout=5,
+    )
+
+    result = service.value_of_information(project_uuid="0")
+    assert isinstance(result, ValueOfInformationResponse)
+    assert result.expected_utility == 0
+    # the test result descends from the test decision
+    assert [(row.shortname, row.evpi) for row in result.uncertainties] == [
+        ("State", 0),
+        ("Test Result", None),
+    ]
+    func, arguments = worker_pool.map.call_args.args
+    assert func is solve_with_observation
+    assert [args[1:] for args in arguments] == [
+        (["Test", "Buy"], None),
+        (["Test", "Buy"], "State"),
+    ]
+    assert worker_pool.map.call_args.kwargs == {"max_workers": 3, "timeout": 5}
+
+
+def test_probability_sensitivity_success(used_car_buyer_repository):
+    worker_pool = MagicMock(spec=WorkerPool)
+    worker_pool.run.side_effect = lambda func, *args, timeout: func(*args)
+    worker_pool.map.side_effect = lambda func, arguments, **kwargs: [
+        func(*args) for args in arguments
+    ]
+    service = StructureService(
+        used_car_buyer_repository,
+        cache=PyAgrumCache(2**20),
+        worker_pool=worker_pool,
+        analysis_cpu_budget=3,
+        analysis_timeout=5,
+    )
+
+    result = service.probability_sensitivity(project_uuid="0", span=0.2, points=3)
+    assert isinstance(result, SensitivityResponse)
+    # State: Peach, Lemon; Test Result: no Test, Peach, Lemon
+    assert [(row.shortname, row.outcome) for row in result.sensitivities] == [
+        ("State", "Peach"),
+        ("State", "Lemon"),
+        ("Test Result", "no Test"),
+        ("Test Result", "Peach"),
+        ("Test Result", "Lemon"),
+    ]
+    row = result.sensitivities[0]
+    assert row.deltas == pytest.approx([-0.2, 0, 0.2])
+    assert row.expected_utilities == [0, 0, 0]
+    assert (row.low, row.high, row.swing) == (0, 0, 0)
+    func, arguments = worker_pool.map.call_args.args
+    assert func is sweep_probability
+    assert [args[2] for args in arguments] == ["State", "Test Result"]
+    assert worker_pool.run.call_args.kwargs == {"timeout": 5}
+    # the sweeps only get the time left by the base solution
+    kwargs = worker_pool.map.call_args.kwargs
+    assert kwargs["max_workers"] == 3
+    assert 0 < kwargs["timeout"] <= 5
+
+
+@pytest.fixture
+def sensitivity_worker_pool():
+    worker_pool = MagicMock(spec=WorkerPool)
+    worker_pool.run.side_effect = lambda func, *args, timeout: func(*args)
+    worker_pool.map.return_value = [[], []]
+    return worker_pool
+
+
+def test_probability_sensitivity_shares_timeout(
+    used_car_buyer_repository, sensitivity_worker_pool
+):
+    service = StructureService(
+        used_car_buyer_repository,
+        cache=PyAgrumCache(2**20),
+        worker_pool=sensitivity_worker_pool,
+        analysis_timeout=5,
+    )
+    with patch("src.v0.services.structure.time.monotonic", side_effect=[100, 102]):
+        service.probability_sensitivity(project_uuid="0")
+    assert sensitivity_worker_pool.map.call_args.kwargs["timeout"] == 3
+
+
+def test_probability_sensitivity_no_time_left(
+    used_car_buyer_repository, sensitivity_worker_pool
+):
+    service = StructureService(
+        used_car_buyer_repository,
+        cache=PyAgrumCache(2**20),
+        worker_pool=sensitivity_worker_pool,
+        analysis_timeout=5,
+    )
+    with patch("src.v0.services.structure.time.monotonic", side_effect=[100, 105]):
+        with pytest.raises(WorkerTimeout) as exc:
+            service.probability_sensitivity(project_uuid="0")
+    assert exc.value.timeout == 5
+    sensitivity_worker_pool.map.assert_not_called()
+
+
+def test_probability_sensitivity_sweeps_timeout(
+    used_car_buyer_repository, sensitivity_worker_pool
+):
+    sensitivity_worker_pool.map.side_effect = WorkerTimeout(4)
+    service = StructureService(
+        used_car_buyer_repository,
+        cache=PyAgrumCache(2**20),
+        worker_pool=sensitivity_worker_pool,
+        analysis_timeout=5,
+    )
+    with patch("src.v0.services.structure.time.monotonic", side_effect=[100, 101]):
+        with pytest.raises(WorkerTimeout) as exc:
+            service.probability_sensitivity(project_uuid="0")
+    # reported against the timeout of the whole request
+    assert exc.value.timeout == 5
+
+
+def test_probability_sensitivity_ranked(used_car_buyer_repository):
+    sweeps = {
+        "State": [
+            {"outcome": "Peach", "expected_utilities": [1, 2], "changed_decisions": []}
+        ],
+        "Test Result": [
+            {"outcome": "Peach", "expected_utilities": [5, 1], "changed_decisions": []}
+        ],
+    }
+    worker_pool = MagicMock(spec=WorkerPool)
+    worker_pool.run.return_value = {"expected_utility": 1.5, "policies": []}
+    worker_pool.map.side_effect = lambda func, arguments, **kwargs: [
+        sweeps[args[2]] for args in arguments
+    ]
+    service = StructureService(
+        used_car_buyer_repository, cache=PyAgrumCache(2**20), worker_pool=worker_pool
+    )
+
+    result = service.probability_sensitivity(project_uuid="0", points=2)
+    assert [(row.shortname, row.swing) for row in result.sensitivities] == [
+        ("Test Result", 4),
+        ("State", 1),
+    ]
+    assert (result.sensitivities[0].low, result.sensitivities[0].high) == (5, 1)
+
+
+def test_simulate_success(used_car_buyer_repository):
+    service = StructureService(used_car_buyer_repository)
+    request = MonteCarloRequest(
+        strategy={"Test": "Test", "Buy": "Do not buy"},
+        values={"State": {"Peach": 1000, "Lemon": -500}},
+        samples=2500,
+        chunk_size=1000,
+        seed=0,
+        percentiles=[50],
+    )
+
+    lines = list(service.simulate(project_uuid="0", request=request))
+    assert all(line.endswith("\n") for line in lines)
+    summaries = [json.loads(line) for line in lines]
+    assert [summary["samples"] for summary in summaries] == [1000, 2000, 2500]
+    assert summaries[-1]["percentiles"] == {"50.0": 1000}
+    assert list(service.simulate(project_uuid="0", request=request)) == lines
+
+
+def test_simulate_invalid_strategy(used_car_buyer_repository):
+    service = StructureService(used_car_buyer_repository)
+    request = MonteCarloRequest(strategy={"Test": "Test"})
+    with pytest.raises(StrategyError):
+        service.simulate(project_uuid="0", request=request)
+
+
+def test_posterior_queries_success(used_car_buyer_repository):
+    cache = PyAgrumCache(2**20)
+    service = StructureService(used_car_buyer_repository, cache=cache)
+    request = PosteriorRequest(
+        scenarios=[{}, {"Test": "Test", "Test Result": "Lemon"}], targets=["State"]
+    )
+
+    result = service.posterior_queries(project_uuid="0", request=request)
+    assert isinstance(result, PosteriorResponse)
+    assert [row.evidence_probability for row in result.results] == pytest.approx(
+        [1, 0.2]
+    )
+    assert result.results[1].posteriors == {
+        "State": pytest.approx({"Peach": 0, "Lemon": 1})
+    }
+    # the junction tree is compiled once
+    assert service.posterior_queries(project_uuid="0", request=request) == result
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_posterior_queries_unknown_state(used_car_buyer_repository):
+    service = StructureService(used_car_buyer_repository, cache=PyAgrumCache(2**20))
+    request = PosteriorRequest(scenarios=[{"State": "Rusty"}], targets=["State"])
+    with pytest.raises(EvidenceError):
+        service.posterior_queries(project_uuid="0", request=request)
+
+
+@pytest.fixture
+def weather_repository(used_car_buyer_repository):
+    """the used car buyer, the weather being observed before buying"""
+    response = used_car_buyer_repository.read_influence_diagram.return_value
+    state = response.vertices[0]
+    weather = state.model_copy(
+        update={
+            "uuid": "c0ffee00-0000-4000-8000-000000000000",
+            "shortname": "Weather",
+            "alternatives": ["Sun", "Rain"],
+            "probabilities": state.probabilities.model_copy(
+                update={"variables": {"Weather": ["Sun", "Rain"]}}
+            ),
+        }
+    )
+    buy = next(vertex for vertex in response.vertices if vertex.shortname == "Buy")
+    edge = response.edges[0].model_copy(update={"outV": weather.uuid, "inV": buy.uuid})
+    response.vertices.append(weather)
+    response.edges.append(edge)
+    return used_car_buyer_repository
+
+
+def test_prune_influence_diagram_success(weather_repository):
+    service = StructureService(weather_repository)
+    result = service.prune_influence_diagram(project_uuid="0")
+    assert isinstance(result, PruningReport)
+    assert [node.shortname for node in result.nodes] == ["Weather"]
+    assert [(arc.tail.shortname, arc.head.shortname) for arc in result.arcs] == [
+        ("Weather", "Buy")
+    ]
+    assert result.arcs[0].tail.uuid == "c0ffee00-0000-4000-8000-000000000000"
+
+
+def test_pruned_decision_tree(weather_repository):
+    service = StructureService(weather_repository, max_node_count=10)
+    # Test, Test Result, (Weather,) Buy, State and the leaves: the weather is no
+    # longer a level of the tree
+    node_count = 1 + 2 + 2 * 3 + 2 * 3 * 2 + 2 * 3 * 2 * 3 + 2 * 3 * 2 * 3 * 2
+    pruned_node_count = 1 + 2 + 2 * 3 + 2 * 3 * 3 + 2 * 3 * 3 * 2
+    for prune, expected in [(False, node_count), (True, pruned_node_count)]:
+        expansion = service.expand_decision_tree(project_uuid="0", depth=0, prune=prune)
+        assert expansion.node_count == expected
+        for method in [service.create_decision_tree, service.stream_decision_tree]:
+            with pytest.raises(TreeTooLarge) as exc_info:
+                method(project_uuid="0", prune=prune)
+            assert exc_info.value.node_count == expected
+
+
+def test_solve_pruned_influence_diagram(weather_repository):
+    worker_pool = MagicMock(spec=WorkerPool)
+    worker_pool.run.side_effect = lambda func, *args, timeout: func(*args)
+    service = StructureService(
+        weather_repository, cache=PyAgrumCache(2**20), worker_pool=worker_pool
+    )
+
+    result = service.solve_influence_diagram(project_uuid="0", prune=True)
+    assert result == service.solve_influence_diagram(project_uuid="0")
+    gum_id = service.compile_influence_diagram(project_uuid="0", prune=True)
+    assert worker_pool.run.call_args_list[0].args[1] is gum_id
+    assert not gum_id.exists("Weather")
+    assert service.compile_influence_diagram(project_uuid="0").exists("Weather")